@@ -0,0 +1,171 @@
+"""
+job 状态迁移微基准：对比旧实现（load + 修改 + commit + refresh）与单条 UPDATE ... RETURNING。
+
+用法（在 backend 目录下）：
+
+    PYTHONPATH=src python benchmarks/job_transitions.py
+    PYTHONPATH=src python benchmarks/job_transitions.py --database-url postgresql+psycopg://... --jobs 500
+
+默认使用临时目录下的 SQLite 文件库；传入 Postgres 地址时会在该库中建表并写入测试 job。
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+from sqlalchemy import create_engine, delete, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session as OrmSession
+from sqlalchemy.orm import sessionmaker
+
+from lsl.core.db import Base
+from lsl.modules.job.model import JobModel
+from lsl.modules.job.repo import JobRepository
+from lsl.modules.job.types import JobStatus
+
+
+def _legacy_mark_running(factory: sessionmaker[OrmSession], job_id: str) -> dict[str, Any]:
+    # 旧实现：get -> 修改 -> commit -> refresh，至少 3 次往返。
+    with factory() as db:
+        model = db.get(JobModel, job_id)
+        assert model is not None
+        model.status = int(JobStatus.RUNNING)
+        model.progress = 50
+        model.next_run_at = datetime.now(timezone.utc) + timedelta(seconds=5)
+        model.locked_by = None
+        model.locked_until = None
+        model.error_code = None
+        model.error_message = None
+        db.commit()
+        db.refresh(model)
+        return JobRepository._to_row(model)
+
+
+def _legacy_mark_completed(factory: sessionmaker[OrmSession], job_id: str) -> dict[str, Any]:
+    with factory() as db:
+        model = db.get(JobModel, job_id)
+        assert model is not None
+        model.status = int(JobStatus.COMPLETED)
+        model.progress = 100
+        model.result_json = {"ok": True}
+        model.error_code = None
+        model.error_message = None
+        model.locked_by = None
+        model.locked_until = None
+        model.next_run_at = None
+        model.finished_at = datetime.now(timezone.utc)
+        db.commit()
+        db.refresh(model)
+        return JobRepository._to_row(model)
+
+
+def _seed_jobs(factory: sessionmaker[OrmSession], count: int) -> list[str]:
+    job_ids = [uuid.uuid4().hex for _ in range(count)]
+    with factory() as db:
+        db.add_all(
+            JobModel(
+                job_id=job_id,
+                job_type="bench.transition",
+                status=int(JobStatus.RUNNING),
+                priority=0,
+                progress=0,
+                attempts=1,
+                max_attempts=3,
+                payload_json={},
+                locked_by="bench-worker",
+            )
+            for job_id in job_ids
+        )
+        db.commit()
+    return job_ids
+
+
+def _measure(
+    engine: Engine,
+    factory: sessionmaker[OrmSession],
+    *,
+    jobs: int,
+    transition: Callable[[str], Any],
+) -> tuple[float, float, float]:
+    job_ids = _seed_jobs(factory, jobs)
+    statements = 0
+
+    def _count(*_: Any) -> None:
+        nonlocal statements
+        statements += 1
+
+    event.listen(engine, "before_cursor_execute", _count)
+    latencies: list[float] = []
+    try:
+        for job_id in job_ids:
+            started_at = time.perf_counter()
+            transition(job_id)
+            latencies.append((time.perf_counter() - started_at) * 1000)
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    with factory() as db:
+        db.execute(delete(JobModel).where(JobModel.job_type == "bench.transition"))
+        db.commit()
+    latencies.sort()
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    return statements / jobs, statistics.mean(latencies), p95
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default="")
+    parser.add_argument("--jobs", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database_url = args.database_url or f"sqlite:///{Path(tmp_dir) / 'bench.db'}"
+        engine = create_engine(database_url)
+        Base.metadata.create_all(engine, tables=[JobModel.__table__])
+        factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=OrmSession)
+        repository = JobRepository(factory)
+
+        cases: list[tuple[str, Callable[[str], Any]]] = [
+            ("mark_running (legacy)", lambda job_id: _legacy_mark_running(factory, job_id)),
+            (
+                "mark_running (update returning)",
+                lambda job_id: repository.mark_running(
+                    job_id=job_id,
+                    progress=50,
+                    next_run_at=datetime.now(timezone.utc) + timedelta(seconds=5),
+                    entity_type=None,
+                    entity_id=None,
+                    worker_id="bench-worker",
+                ),
+            ),
+            ("mark_completed (legacy)", lambda job_id: _legacy_mark_completed(factory, job_id)),
+            (
+                "mark_completed (update returning)",
+                lambda job_id: repository.mark_completed(
+                    job_id=job_id,
+                    progress=100,
+                    result={"ok": True},
+                    entity_type=None,
+                    entity_id=None,
+                    worker_id="bench-worker",
+                ),
+            ),
+        ]
+
+        print(f"database={engine.dialect.name} jobs={args.jobs}")
+        print(f"{'transition':<36}{'statements/op':>15}{'mean_ms':>10}{'p95_ms':>10}")
+        for name, transition in cases:
+            statements, mean_ms, p95_ms = _measure(engine, factory, jobs=args.jobs, transition=transition)
+            print(f"{name:<36}{statements:>15.2f}{mean_ms:>10.3f}{p95_ms:>10.3f}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""
+transcript 完成写入微基准：对比旧实现（逐个 db.add ORM 对象 + 回读全部 utterance）、
+批量 INSERT 整表替换，以及只改动变化行的 diff 模式。
+
+用法（在 backend 目录下）：
+
+    PYTHONPATH=src python benchmarks/transcript_utterances.py
+    PYTHONPATH=src python benchmarks/transcript_utterances.py --database-url postgresql+psycopg://... --utterances 5000
+
+默认使用临时目录下的 SQLite 文件库、5000 条 utterance；diff 场景在已完成的 transcript 上修改 1% 的行。
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable
+
+from sqlalchemy import create_engine, delete, event, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session as OrmSession
+from sqlalchemy.orm import sessionmaker
+
+from lsl.core.db import Base
+from lsl.modules.transcript.model import TranscriptModel, TranscriptRawResultModel, TranscriptUtteranceModel
+from lsl.modules.transcript.repo import TranscriptRepository
+from lsl.modules.transcript.types import TranscriptStatus
+
+
+def _legacy_mark_completed(
+    factory: sessionmaker[OrmSession],
+    transcript_id: str,
+    utterances: list[dict[str, Any]],
+) -> dict[str, Any]:
+    # 旧实现：删除后逐个 db.add，commit 后再把刚写入的行全部读回来。
+    with factory() as db:
+        model = db.get(TranscriptModel, transcript_id)
+        assert model is not None
+        model.status = int(TranscriptStatus.COMPLETED)
+        db.execute(delete(TranscriptUtteranceModel).where(TranscriptUtteranceModel.transcript_id == transcript_id))
+        for item in utterances:
+            db.add(
+                TranscriptUtteranceModel(
+                    transcript_id=transcript_id,
+                    seq=int(item["seq"]),
+                    text=item["text"],
+                    speaker=item.get("speaker"),
+                    start_time=int(item["start_time"]),
+                    end_time=int(item["end_time"]),
+                    additions_json=item.get("additions") or {},
+                )
+            )
+        db.commit()
+        db.refresh(model)
+        loaded = list(
+            db.execute(
+                select(TranscriptUtteranceModel)
+                .where(TranscriptUtteranceModel.transcript_id == transcript_id)
+                .order_by(TranscriptUtteranceModel.seq.asc())
+            )
+            .scalars()
+            .all()
+        )
+        return {"transcript_id": transcript_id, "utterances": len(loaded)}
+
+
+def _build_utterances(count: int, *, edited_every: int = 0) -> list[dict[str, Any]]:
+    return [
+        {
+            "seq": index,
+            "text": f"utterance {index} edited" if edited_every and index % edited_every == 0 else f"utterance {index}",
+            "speaker": "A" if index % 2 == 0 else "B",
+            "start_time": index * 2000,
+            "end_time": index * 2000 + 1800,
+            "additions": {"emotion": "neutral"},
+        }
+        for index in range(count)
+    ]
+
+
+def _seed_transcript(factory: sessionmaker[OrmSession]) -> str:
+    transcript_id = uuid.uuid4().hex
+    with factory() as db:
+        db.add(
+            TranscriptModel(
+                transcript_id=transcript_id,
+                source_type="bench",
+                status=int(TranscriptStatus.PENDING),
+            )
+        )
+        db.commit()
+    return transcript_id
+
+
+def _cleanup(factory: sessionmaker[OrmSession]) -> None:
+    with factory() as db:
+        db.execute(delete(TranscriptUtteranceModel))
+        db.execute(delete(TranscriptRawResultModel))
+        db.execute(delete(TranscriptModel).where(TranscriptModel.source_type == "bench"))
+        db.commit()
+
+
+def _measure(
+    engine: Engine,
+    factory: sessionmaker[OrmSession],
+    *,
+    rounds: int,
+    prepare: Callable[[str], None],
+    complete: Callable[[str], Any],
+) -> tuple[float, float, float]:
+    statements: list[int] = []
+    latencies: list[float] = []
+    for _ in range(rounds):
+        transcript_id = _seed_transcript(factory)
+        prepare(transcript_id)
+        count = 0
+
+        def _count(*_: Any) -> None:
+            nonlocal count
+            count += 1
+
+        event.listen(engine, "before_cursor_execute", _count)
+        try:
+            started_at = time.perf_counter()
+            complete(transcript_id)
+            latencies.append((time.perf_counter() - started_at) * 1000)
+        finally:
+            event.remove(engine, "before_cursor_execute", _count)
+        statements.append(count)
+        _cleanup(factory)
+    return statistics.mean(statements), statistics.mean(latencies), max(latencies)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default="")
+    parser.add_argument("--utterances", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database_url = args.database_url or f"sqlite:///{Path(tmp_dir) / 'bench.db'}"
+        engine = create_engine(database_url)
+        Base.metadata.create_all(
+            engine,
+            tables=[TranscriptModel.__table__, TranscriptRawResultModel.__table__, TranscriptUtteranceModel.__table__],
+        )
+        factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=OrmSession)
+        repository = TranscriptRepository(factory)
+        original = _build_utterances(args.utterances)
+        edited = _build_utterances(args.utterances, edited_every=100)
+
+        def _complete(utterances: list[dict[str, Any]], **options: Any) -> Callable[[str], Any]:
+            return lambda transcript_id: repository.mark_completed(
+                transcript_id=transcript_id,
+                duration_ms=None,
+                full_text=None,
+                raw_result_json=None,
+                utterances=utterances,
+                **options,
+            )
+
+        def _no_prepare(transcript_id: str) -> None:
+            return None
+
+        def _prepare_completed(transcript_id: str) -> None:
+            _complete(original)(transcript_id)
+
+        cases: list[tuple[str, Callable[[str], None], Callable[[str], Any]]] = [
+            ("complete (legacy)", _no_prepare, lambda transcript_id: _legacy_mark_completed(factory, transcript_id, original)),
+            ("complete (bulk insert)", _no_prepare, _complete(original)),
+            ("complete (bulk, no utterances)", _no_prepare, _complete(original, include_utterances=False)),
+            ("re-complete 1% (legacy)", _prepare_completed, lambda transcript_id: _legacy_mark_completed(factory, transcript_id, edited)),
+            ("re-complete 1% (bulk replace)", _prepare_completed, _complete(edited)),
+            ("re-complete 1% (diff)", _prepare_completed, _complete(edited, diff=True, include_utterances=False)),
+        ]
+
+        print(f"database={engine.dialect.name} utterances={args.utterances} rounds={args.rounds}")
+        print(f"{'case':<34}{'statements':>12}{'mean_ms':>10}{'max_ms':>10}")
+        for name, prepare, complete in cases:
+            statements, mean_ms, max_ms = _measure(
+                engine,
+                factory,
+                rounds=args.rounds,
+                prepare=prepare,
+                complete=complete,
+            )
+            print(f"{name:<34}{statements:>12.1f}{mean_ms:>10.1f}{max_ms:>10.1f}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
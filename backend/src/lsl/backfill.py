@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import argparse
+import logging
+
+from lsl.bootstrap import build_app_services, close_app_services
+from lsl.core import Settings, configure_logging
+
+logger = logging.getLogger(__name__)
+
+
+def _build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m lsl.backfill",
+        description="Recompute denormalized data for existing rows.",
+    )
+    subparsers = parser.add_subparsers(dest="target", required=True)
+    pipeline_parser = subparsers.add_parser(
+        "session-pipeline",
+        help="Recompute pipeline status columns on session_sessions from transcript, revision, TTS and translation.",
+    )
+    pipeline_parser.add_argument("--batch-size", type=int, default=500, help="Sessions updated per transaction.")
+    return parser
+
+
+def run_session_pipeline_backfill(settings: Settings, *, batch_size: int) -> int:
+    services = build_app_services(settings)
+    try:
+        session_service = services.session_service
+        if session_service is None:
+            raise RuntimeError("DATABASE_URL is required to backfill session pipeline status")
+        return session_service.backfill_pipeline_status(batch_size=batch_size)
+    finally:
+        close_app_services(services)
+
+
+def main(argv: list[str] | None = None) -> None:
+    configure_logging()
+    settings = Settings.from_env()
+    args = _build_arg_parser().parse_args(argv)
+
+    if args.target == "session-pipeline":
+        if args.batch_size <= 0:
+            raise SystemExit("--batch-size must be greater than 0")
+        count = run_session_pipeline_backfill(settings, batch_size=args.batch_size)
+        logger.info("Session pipeline backfill finished sessions=%s", count)
+
+
+if __name__ == "__main__":
+    main()
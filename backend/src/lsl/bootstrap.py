@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from lsl.core import DatabaseResources, Settings, close_database_resources, create_database_resources
+from lsl.core.http import close_http_clients, configure_http_clients
+from lsl.modules.asr import AsrJobHandler, AsrRepository, AsrService, create_asr_provider
+from lsl.modules.auth import AuthService, UserRepository
+from lsl.modules.asset import AssetRepository, AssetService, create_storage_provider
+from lsl.modules.event import EventBroadcaster, create_event_broadcaster
+from lsl.modules.job import JobRepository, JobService, create_job_notifier
+from lsl.modules.job.metrics import bind_job_queue_metrics
+from lsl.modules.overview import SessionOverviewRepository, SessionOverviewService
+from lsl.modules.revision import RevisionJobHandler, RevisionRepository, RevisionService, create_revision_generator
+from lsl.modules.script import ScriptJobHandler, ScriptRepository, ScriptService, create_script_generator
+from lsl.modules.search import SearchIndexer, SearchRepository, SearchService
+from lsl.modules.session import SessionRepository, SessionService
+from lsl.modules.session.pipeline import SessionPipelineTracker
+from lsl.modules.transcript import TranscriptRepository, TranscriptService
+from lsl.modules.translation import TranslationJobHandler, TranslationRepository, TranslationService, create_translation_generator
+from lsl.modules.tts import TtsCache, TtsJobHandler, TtsRepository, TtsService, create_tts_provider
+
+
+@dataclass(slots=True)
+class AppServices:
+    """API 进程和独立 worker 进程共用的服务组合结果。"""
+
+    settings: Settings
+    db_resources: DatabaseResources
+    auth_service: AuthService
+    asset_service: AssetService
+    event_broadcaster: EventBroadcaster
+    job_service: JobService | None
+    transcript_service: TranscriptService | None
+    asr_service: AsrService | None
+    session_service: SessionService | None
+    revision_service: RevisionService | None
+    translation_service: TranslationService | None
+    tts_service: TtsService | None
+    script_service: ScriptService | None
+    search_service: SearchService | None
+    session_overview_service: SessionOverviewService | None
+
+
+def build_app_services(settings: Settings) -> AppServices:
+    configure_http_clients(settings)
+    db_resources = create_database_resources(settings)
+    search_indexer = SearchIndexer() if settings.SEARCH_INDEX_ENABLED else None
+    session_pipeline = SessionPipelineTracker()
+
+    asset_repository = (
+        AssetRepository(db_resources.session_factory)
+        if db_resources.session_factory is not None
+        else None
+    )
+    transcript_repository = (
+        TranscriptRepository(
+            db_resources.session_factory,
+            search_indexer=search_indexer,
+            session_pipeline=session_pipeline,
+        )
+        if db_resources.session_factory is not None
+        else None
+    )
+    job_repository = (
+        JobRepository(db_resources.session_factory)
+        if db_resources.session_factory is not None
+        else None
+    )
+    asr_repository = (
+        AsrRepository(db_resources.session_factory)
+        if db_resources.session_factory is not None
+        else None
+    )
+    session_repository = (
+        SessionRepository(db_resources.session_factory, session_pipeline=session_pipeline)
+        if db_resources.session_factory is not None
+        else None
+    )
+    revision_repository = (
+        RevisionRepository(
+            db_resources.session_factory,
+            search_indexer=search_indexer,
+            session_pipeline=session_pipeline,
+        )
+        if db_resources.session_factory is not None
+        else None
+    )
+    tts_repository = (
+        TtsRepository(db_resources.session_factory, session_pipeline=session_pipeline)
+        if db_resources.session_factory is not None
+        else None
+    )
+    script_repository = (
+        ScriptRepository(db_resources.session_factory)
+        if db_resources.session_factory is not None
+        else None
+    )
+    translation_repository = (
+        TranslationRepository(db_resources.session_factory, session_pipeline=session_pipeline)
+        if db_resources.session_factory is not None
+        else None
+    )
+    search_repository = (
+        SearchRepository(db_resources.session_factory)
+        if db_resources.session_factory is not None
+        else None
+    )
+    session_overview_repository = (
+        SessionOverviewRepository(db_resources.session_factory)
+        if db_resources.session_factory is not None
+        else None
+    )
+    user_repository = (
+        UserRepository(db_resources.session_factory)
+        if db_resources.session_factory is not None
+        else None
+    )
+
+    asset_service = AssetService(
+        settings=settings,
+        storage=create_storage_provider(settings),
+        repository=asset_repository,
+    )
+    # 独立 worker 与 API 共用同一 Postgres 通道，worker 中的 job 进度也能推到 API 副本的 SSE 连接。
+    event_broadcaster = create_event_broadcaster(settings, db_resources.engine)
+    job_service = (
+        JobService(
+            repository=job_repository,
+            notifier=create_job_notifier(settings, db_resources.engine),
+            lock_ttl_seconds=settings.JOB_LOCK_TTL_SECONDS,
+            priority_aging_seconds=settings.JOB_PRIORITY_AGING_SECONDS,
+            dedup_window_seconds=settings.JOB_DEDUP_WINDOW_SECONDS,
+            event_broadcaster=event_broadcaster,
+        )
+        if job_repository is not None
+        else None
+    )
+    transcript_service = (
+        TranscriptService(repository=transcript_repository)
+        if transcript_repository is not None
+        else None
+    )
+    session_service = (
+        SessionService(
+            repository=session_repository,
+            asset_service=asset_service,
+            transcript_service=transcript_service,
+            session_pipeline=session_pipeline,
+        )
+        if session_repository is not None and transcript_service is not None
+        else None
+    )
+    translation_service = (
+        TranslationService(
+            repository=translation_repository,
+            generator=create_translation_generator(settings),
+            transcript_service=transcript_service,
+            revision_repository=revision_repository,
+            job_service=job_service,
+            default_target_language=settings.TRANSLATION_DEFAULT_TARGET_LANGUAGE,
+            event_broadcaster=event_broadcaster,
+        )
+        if translation_repository is not None
+        and transcript_service is not None
+        and revision_repository is not None
+        and job_service is not None
+        else None
+    )
+    asr_service = (
+        AsrService(
+            repository=asr_repository,
+            transcript_service=transcript_service,
+            job_service=job_service,
+            provider=create_asr_provider(settings),
+            translation_service=translation_service,
+            event_broadcaster=event_broadcaster,
+            asset_service=asset_service,
+            poll_concurrency=settings.ASR_POLL_CONCURRENCY,
+            poll_window_seconds=settings.ASR_POLL_WINDOW_SECONDS,
+            callback_url=settings.ASR_CALLBACK_URL,
+            callback_secret=settings.ASR_CALLBACK_SECRET,
+            callback_fallback_poll_seconds=settings.ASR_CALLBACK_FALLBACK_POLL_SECONDS,
+            chunk_threshold_seconds=settings.ASR_CHUNK_THRESHOLD_SECONDS,
+            chunk_seconds=settings.ASR_CHUNK_SECONDS,
+            chunk_overlap_seconds=settings.ASR_CHUNK_OVERLAP_SECONDS,
+            audio_download_timeout=settings.ASR_AUDIO_DOWNLOAD_TIMEOUT,
+            audio_download_max_bytes=settings.ASR_AUDIO_DOWNLOAD_MAX_MB * 1024 * 1024,
+        )
+        if asr_repository is not None and transcript_service is not None and job_service is not None
+        else None
+    )
+    revision_service = (
+        RevisionService(
+            repository=revision_repository,
+            generator=create_revision_generator(settings),
+            session_service=session_service,
+            transcript_service=transcript_service,
+            job_service=job_service,
+            translation_service=translation_service,
+            event_broadcaster=event_broadcaster,
+        )
+        if revision_repository is not None and session_service is not None and transcript_service is not None
+        else None
+    )
+    tts_service = (
+        TtsService(
+            repository=tts_repository,
+            provider=create_tts_provider(settings),
+            cache=TtsCache(
+                redis_url=settings.TTS_REDIS_URL,
+                ttl_seconds=settings.TTS_CACHE_TTL_SECONDS,
+            ),
+            session_service=session_service,
+            revision_service=revision_service,
+            asset_service=asset_service,
+            job_service=job_service,
+            settings=settings,
+            event_broadcaster=event_broadcaster,
+        )
+        if tts_repository is not None and session_service is not None and revision_service is not None and job_service is not None
+        else None
+    )
+    script_service = (
+        ScriptService(
+            repository=script_repository,
+            generator=create_script_generator(settings),
+            session_service=session_service,
+            transcript_service=transcript_service,
+            revision_service=revision_service,
+            job_service=job_service,
+        )
+        if script_repository is not None
+        and session_service is not None
+        and transcript_service is not None
+        and revision_service is not None
+        and job_service is not None
+        else None
+    )
+    search_service = SearchService(repository=search_repository) if search_repository is not None else None
+    session_overview_service = (
+        SessionOverviewService(repository=session_overview_repository, asset_service=asset_service)
+        if session_overview_repository is not None
+        else None
+    )
+    auth_service = AuthService(settings=settings, repository=user_repository)
+
+    if job_service is not None:
+        if asr_service is not None:
+            job_service.register_handler(AsrJobHandler(asr_service=asr_service))
+        if script_service is not None:
+            job_service.register_handler(ScriptJobHandler(script_service=script_service))
+        if revision_service is not None:
+            # Revision job flow 4/5: register the handler that consumes revision_generation jobs.
+            job_service.register_handler(RevisionJobHandler(revision_service=revision_service))
+        if tts_service is not None:
+            job_service.register_handler(TtsJobHandler(tts_service=tts_service))
+        if translation_service is not None:
+            job_service.register_handler(TranslationJobHandler(translation_service=translation_service))
+        if settings.JOB_PIPELINE_ENABLED:
+            # 上游 job 完成时在同一事务内排队下一步：ASR -> revision -> TTS。
+            if asr_service is not None and revision_service is not None:
+                job_service.register_follow_up(AsrJobHandler.job_type, revision_service.build_asr_follow_ups)
+            if revision_service is not None and tts_service is not None:
+                job_service.register_follow_up(RevisionJobHandler.job_type, tts_service.build_revision_follow_ups)
+    # /metrics 抓取时从该 JobService 读取队列深度和 lag。
+    bind_job_queue_metrics(job_service)
+
+    return AppServices(
+        settings=settings,
+        db_resources=db_resources,
+        auth_service=auth_service,
+        asset_service=asset_service,
+        event_broadcaster=event_broadcaster,
+        job_service=job_service,
+        transcript_service=transcript_service,
+        asr_service=asr_service,
+        session_service=session_service,
+        revision_service=revision_service,
+        translation_service=translation_service,
+        tts_service=tts_service,
+        script_service=script_service,
+        search_service=search_service,
+        session_overview_service=session_overview_service,
+    )
+
+
+def close_app_services(services: AppServices) -> None:
+    if services.tts_service is not None:
+        services.tts_service.shutdown()
+    if services.revision_service is not None:
+        services.revision_service.shutdown()
+    if services.job_service is not None:
+        bind_job_queue_metrics(None)
+        services.job_service.close()
+    services.event_broadcaster.close()
+    close_http_clients()
+    close_database_resources(services.db_resources)
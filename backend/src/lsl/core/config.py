@@ -81,14 +81,77 @@ class Settings:
     # 7. 后端请求 Casdoor token/userinfo 接口的 HTTP 超时时间，单位秒。
     CASDOOR_HTTP_TIMEOUT: float = 15.0
 
+    # 是否暴露 Prometheus 格式的 GET /metrics。
+    METRICS_ENABLED: bool = True
+
+    # 出站 HTTP（ASR / TTS / LLM / 对象存储 / Casdoor）共享连接池：每个 provider 最多同时打开的连接数。
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 100
+    # 每个 provider 保持 keep-alive 的空闲连接数；必须小于等于 HTTP_CLIENT_MAX_CONNECTIONS。
+    HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    # 空闲 keep-alive 连接的保留时间，单位秒；需小于上游的空闲断开时间。
+    HTTP_CLIENT_KEEPALIVE_EXPIRY: float = 30.0
+    # 建立连接（含 TLS 握手）的超时时间，单位秒；读写超时仍使用各 provider 的 *_HTTP_TIMEOUT。
+    HTTP_CLIENT_CONNECT_TIMEOUT: float = 10.0
+    # 是否启用 HTTP/2；需要额外安装 h2，未安装时退化为 HTTP/1.1。
+    HTTP_CLIENT_HTTP2: bool = False
+
+    # 是否开启 GET /events（SSE）推送 job 状态 / 进度和实体变更，前端据此替代轮询。
+    EVENT_STREAM_ENABLED: bool = True
+    # 每个进程保留的最近事件条数，断线重连时按 Last-Event-ID 补发；超出后前端整页重新拉取。
+    EVENT_STREAM_BUFFER_SIZE: int = 1000
+    # 无事件时的心跳间隔，单位秒；需小于反向代理的 read timeout。
+    EVENT_STREAM_HEARTBEAT_SECONDS: float = 15.0
+    # 单个 SSE 连接待发送事件的队列上限；客户端消费过慢溢出时断开，由浏览器重连续传。
+    EVENT_STREAM_QUEUE_SIZE: int = 256
+    # Postgres 下事件 NOTIFY 的合并窗口，单位秒；窗口内同一 job / 实体只广播最新一条，整批共用一个事务。
+    EVENT_NOTIFY_FLUSH_SECONDS: float = 0.05
+
     # 是否在 FastAPI lifespan 中启动后台 job runner。
     JOB_RUNNER_ENABLED: bool = True
-    # job runner 轮询 due jobs 的间隔，单位秒。
-    JOB_RUNNER_INTERVAL_SECONDS: float = 1.0
+    # job runner 兜底轮询 due jobs 的间隔，单位秒；新 job 通过 notify 立即唤醒 runner。
+    JOB_RUNNER_INTERVAL_SECONDS: float = 15.0
     # 每轮最多 claim 的 job 数。
     JOB_RUNNER_BATCH_SIZE: int = 10
     # job runner 同时执行 job 的最大线程数。
     JOB_RUNNER_MAX_WORKERS: int = 4
+    # interactive lane 处理的短任务 job_type，逗号分隔；使用独立线程池，不会被长任务占满。
+    JOB_RUNNER_INTERACTIVE_JOB_TYPES: str = "asr_recognition"
+    # interactive lane 线程数；0 表示不拆分 lane。
+    JOB_RUNNER_INTERACTIVE_MAX_WORKERS: int = 2
+    # 实现 run_async 的 handler（如 ASR 轮询）在事件循环上同时执行的最大 job 数；0 表示仍走线程池。
+    JOB_RUNNER_ASYNC_MAX_CONCURRENCY: int = 100
+    # 单进程内每个 job_type 的并发上限，例如 tts_synthesis=2,revision_generation=2；空值表示不限制。
+    JOB_RUNNER_TYPE_CONCURRENCY: str = ""
+    # 优先级老化：job 每等待多少秒有效优先级 +1，避免低优先级 job 饿死；0 表示关闭。
+    JOB_PRIORITY_AGING_SECONDS: int = 60
+    # job 锁（lease）有效期，单位秒；超过后未续约的 job 可被其他 worker 重新 claim。
+    JOB_LOCK_TTL_SECONDS: int = 300
+    # runner 为在途 job 自动续约的间隔，单位秒；必须小于 JOB_LOCK_TTL_SECONDS，0 表示关闭自动续约。
+    JOB_HEARTBEAT_INTERVAL_SECONDS: float = 60.0
+    # runner 每次兜底轮询时预加载到进程内定时器的即将到期 job 数，到期后按 job_id 定向 claim；0 表示不预加载。
+    JOB_RUNNER_TIMER_PREFETCH_LIMIT: int = 500
+    # job 去重窗口，单位秒：窗口内相同 dedup_key 的重复创建复用已有 queued / running job；0 表示不限时。
+    JOB_DEDUP_WINDOW_SECONDS: int = 600
+    # 服务端流水线：ASR 完成后自动排队 revision，自动 revision 完成后自动排队 TTS，不再等前端轮询触发。
+    JOB_PIPELINE_ENABLED: bool = True
+    # 独立 worker 进程（python -m lsl.worker）同时执行 job 的最大线程数。
+    JOB_WORKER_MAX_WORKERS: int = 8
+    # 独立 worker 进程每轮最多 claim 的 job 数。
+    JOB_WORKER_BATCH_SIZE: int = 20
+    # 独立 worker 进程只处理的 job_type，逗号分隔；空值表示处理所有已注册的 job_type。
+    JOB_WORKER_JOB_TYPES: str = ""
+    # 独立 worker 进程暴露 /metrics 的端口；0 表示不启动。
+    JOB_WORKER_METRICS_PORT: int = 9101
+    # 是否随 job runner 周期性清理过期的终态 job。
+    JOB_RETENTION_ENABLED: bool = True
+    # 终态 job 在 job_jobs 中保留的天数，超过后归档或删除。
+    JOB_RETENTION_DAYS: int = 30
+    # true 表示搬入 job_jobs_archive；false 表示直接删除。
+    JOB_RETENTION_ARCHIVE: bool = True
+    # 每批（一个事务）清理的 job 数。
+    JOB_RETENTION_BATCH_SIZE: int = 500
+    # 两轮清理之间的间隔，单位秒。
+    JOB_RETENTION_INTERVAL_SECONDS: float = 3600.0
 
     # 阿里云 OSS region，例如 cn-hangzhou。
     OSS_REGION: str = "cn-hangzhou"
@@ -117,6 +180,28 @@ class Settings:
     VOLC_UID: str = "lsl_user"
     # 火山 ASR HTTP 超时时间，单位秒。
     VOLC_HTTP_TIMEOUT: float = 90.0
+    # 批量轮询时同时在途的 provider query 数。
+    ASR_POLL_CONCURRENCY: int = 16
+    # 下次轮询时间向上对齐的窗口，单位秒；同一窗口内到期的 recognition 合成一批查询。0 表示不对齐。
+    ASR_POLL_WINDOW_SECONDS: float = 2.0
+    # ASR 回调地址前缀，需公网可访问，例如 https://api.example.com/asr/callbacks；为空时只靠轮询。
+    ASR_CALLBACK_URL: str = ""
+    # 回调 URL 中 token 的 HMAC 签名密钥；配置 ASR_CALLBACK_URL 时必填。
+    ASR_CALLBACK_SECRET: str = ""
+    # 启用回调后的兜底轮询间隔，单位秒；只用于补偿丢失的回调。
+    ASR_CALLBACK_FALLBACK_POLL_SECONDS: float = 60.0
+    # MP3 时长超过该值（秒）时按帧切段并发识别，再拼回一条 transcript；0 表示关闭。
+    ASR_CHUNK_THRESHOLD_SECONDS: float = 1200.0
+    # 分段识别每段的目标时长，单位秒。
+    ASR_CHUNK_SECONDS: float = 300.0
+    # 相邻两段的重叠时长，单位秒；拼接时以重叠区中点为界去重。
+    ASR_CHUNK_OVERLAP_SECONDS: float = 5.0
+    # 分段前下载原音频的超时时间，单位秒。
+    ASR_AUDIO_DOWNLOAD_TIMEOUT: float = 120.0
+    # 分段前下载原音频的大小上限，单位 MB；切段需要整段音频在内存里，超过上限时不切段，照常整段提交。
+    ASR_AUDIO_DOWNLOAD_MAX_MB: int = 256
+    # 全文检索：transcript / revision 写入时在同一事务内维护 search_documents；关闭后 /search 只能查到已有索引。
+    SEARCH_INDEX_ENABLED: bool = True
 
     # Revision provider。本地联调用 fake；真实改写使用 llm。
     REVISION_PROVIDER: str = "fake"
@@ -196,6 +281,21 @@ class Settings:
         db_pool_timeout = _get_env_float("DB_POOL_TIMEOUT", cls.DB_POOL_TIMEOUT)
         auth_cookie_secure = _get_env_bool("AUTH_COOKIE_SECURE", cls.AUTH_COOKIE_SECURE)
         casdoor_http_timeout = _get_env_float("CASDOOR_HTTP_TIMEOUT", cls.CASDOOR_HTTP_TIMEOUT)
+        metrics_enabled = _get_env_bool("METRICS_ENABLED", cls.METRICS_ENABLED)
+        http_client_max_connections = _get_env_int("HTTP_CLIENT_MAX_CONNECTIONS", cls.HTTP_CLIENT_MAX_CONNECTIONS)
+        http_client_max_keepalive_connections = _get_env_int(
+            "HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS",
+            cls.HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS,
+        )
+        http_client_keepalive_expiry = _get_env_float("HTTP_CLIENT_KEEPALIVE_EXPIRY", cls.HTTP_CLIENT_KEEPALIVE_EXPIRY)
+        http_client_connect_timeout = _get_env_float("HTTP_CLIENT_CONNECT_TIMEOUT", cls.HTTP_CLIENT_CONNECT_TIMEOUT)
+        event_stream_buffer_size = _get_env_int("EVENT_STREAM_BUFFER_SIZE", cls.EVENT_STREAM_BUFFER_SIZE)
+        event_stream_heartbeat_seconds = _get_env_float(
+            "EVENT_STREAM_HEARTBEAT_SECONDS",
+            cls.EVENT_STREAM_HEARTBEAT_SECONDS,
+        )
+        event_stream_queue_size = _get_env_int("EVENT_STREAM_QUEUE_SIZE", cls.EVENT_STREAM_QUEUE_SIZE)
+        event_notify_flush_seconds = _get_env_float("EVENT_NOTIFY_FLUSH_SECONDS", cls.EVENT_NOTIFY_FLUSH_SECONDS)
         job_runner_enabled = _get_env_bool("JOB_RUNNER_ENABLED", cls.JOB_RUNNER_ENABLED)
         job_runner_interval_seconds = _get_env_float(
             "JOB_RUNNER_INTERVAL_SECONDS",
@@ -203,7 +303,48 @@ class Settings:
         )
         job_runner_batch_size = _get_env_int("JOB_RUNNER_BATCH_SIZE", cls.JOB_RUNNER_BATCH_SIZE)
         job_runner_max_workers = _get_env_int("JOB_RUNNER_MAX_WORKERS", cls.JOB_RUNNER_MAX_WORKERS)
+        job_runner_interactive_max_workers = _get_env_int(
+            "JOB_RUNNER_INTERACTIVE_MAX_WORKERS",
+            cls.JOB_RUNNER_INTERACTIVE_MAX_WORKERS,
+        )
+        job_runner_async_max_concurrency = _get_env_int(
+            "JOB_RUNNER_ASYNC_MAX_CONCURRENCY",
+            cls.JOB_RUNNER_ASYNC_MAX_CONCURRENCY,
+        )
+        job_priority_aging_seconds = _get_env_int("JOB_PRIORITY_AGING_SECONDS", cls.JOB_PRIORITY_AGING_SECONDS)
+        job_lock_ttl_seconds = _get_env_int("JOB_LOCK_TTL_SECONDS", cls.JOB_LOCK_TTL_SECONDS)
+        job_heartbeat_interval_seconds = _get_env_float(
+            "JOB_HEARTBEAT_INTERVAL_SECONDS",
+            cls.JOB_HEARTBEAT_INTERVAL_SECONDS,
+        )
+        job_runner_timer_prefetch_limit = _get_env_int(
+            "JOB_RUNNER_TIMER_PREFETCH_LIMIT",
+            cls.JOB_RUNNER_TIMER_PREFETCH_LIMIT,
+        )
+        job_dedup_window_seconds = _get_env_int("JOB_DEDUP_WINDOW_SECONDS", cls.JOB_DEDUP_WINDOW_SECONDS)
+        job_worker_max_workers = _get_env_int("JOB_WORKER_MAX_WORKERS", cls.JOB_WORKER_MAX_WORKERS)
+        job_worker_batch_size = _get_env_int("JOB_WORKER_BATCH_SIZE", cls.JOB_WORKER_BATCH_SIZE)
+        job_worker_metrics_port = _get_env_int("JOB_WORKER_METRICS_PORT", cls.JOB_WORKER_METRICS_PORT)
+        job_retention_days = _get_env_int("JOB_RETENTION_DAYS", cls.JOB_RETENTION_DAYS)
+        job_retention_batch_size = _get_env_int("JOB_RETENTION_BATCH_SIZE", cls.JOB_RETENTION_BATCH_SIZE)
+        job_retention_interval_seconds = _get_env_float(
+            "JOB_RETENTION_INTERVAL_SECONDS",
+            cls.JOB_RETENTION_INTERVAL_SECONDS,
+        )
         volc_http_timeout = _get_env_float("VOLC_HTTP_TIMEOUT", cls.VOLC_HTTP_TIMEOUT)
+        asr_poll_concurrency = _get_env_int("ASR_POLL_CONCURRENCY", cls.ASR_POLL_CONCURRENCY)
+        asr_poll_window_seconds = _get_env_float("ASR_POLL_WINDOW_SECONDS", cls.ASR_POLL_WINDOW_SECONDS)
+        asr_callback_url = _get_env_str("ASR_CALLBACK_URL", cls.ASR_CALLBACK_URL).rstrip("/")
+        asr_callback_secret = _get_env_str("ASR_CALLBACK_SECRET", cls.ASR_CALLBACK_SECRET)
+        asr_callback_fallback_poll_seconds = _get_env_float(
+            "ASR_CALLBACK_FALLBACK_POLL_SECONDS",
+            cls.ASR_CALLBACK_FALLBACK_POLL_SECONDS,
+        )
+        asr_chunk_threshold_seconds = _get_env_float("ASR_CHUNK_THRESHOLD_SECONDS", cls.ASR_CHUNK_THRESHOLD_SECONDS)
+        asr_chunk_seconds = _get_env_float("ASR_CHUNK_SECONDS", cls.ASR_CHUNK_SECONDS)
+        asr_chunk_overlap_seconds = _get_env_float("ASR_CHUNK_OVERLAP_SECONDS", cls.ASR_CHUNK_OVERLAP_SECONDS)
+        asr_audio_download_timeout = _get_env_float("ASR_AUDIO_DOWNLOAD_TIMEOUT", cls.ASR_AUDIO_DOWNLOAD_TIMEOUT)
+        asr_audio_download_max_mb = _get_env_int("ASR_AUDIO_DOWNLOAD_MAX_MB", cls.ASR_AUDIO_DOWNLOAD_MAX_MB)
         revision_llm_http_timeout = _get_env_float(
             "REVISION_LLM_HTTP_TIMEOUT",
             cls.REVISION_LLM_HTTP_TIMEOUT,
@@ -236,10 +377,74 @@ class Settings:
             raise ValueError("JOB_RUNNER_INTERVAL_SECONDS must be greater than 0")
         if job_runner_batch_size <= 0:
             raise ValueError("JOB_RUNNER_BATCH_SIZE must be greater than 0")
+        if http_client_max_connections <= 0:
+            raise ValueError("HTTP_CLIENT_MAX_CONNECTIONS must be greater than 0")
+        if http_client_max_keepalive_connections < 0:
+            raise ValueError("HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS must be greater than or equal to 0")
+        if http_client_max_keepalive_connections > http_client_max_connections:
+            raise ValueError("HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS must be less than or equal to HTTP_CLIENT_MAX_CONNECTIONS")
+        if http_client_keepalive_expiry <= 0:
+            raise ValueError("HTTP_CLIENT_KEEPALIVE_EXPIRY must be greater than 0")
+        if http_client_connect_timeout <= 0:
+            raise ValueError("HTTP_CLIENT_CONNECT_TIMEOUT must be greater than 0")
+        if event_stream_buffer_size <= 0:
+            raise ValueError("EVENT_STREAM_BUFFER_SIZE must be greater than 0")
+        if event_stream_heartbeat_seconds <= 0:
+            raise ValueError("EVENT_STREAM_HEARTBEAT_SECONDS must be greater than 0")
+        if event_stream_queue_size <= 0:
+            raise ValueError("EVENT_STREAM_QUEUE_SIZE must be greater than 0")
+        if event_notify_flush_seconds <= 0:
+            raise ValueError("EVENT_NOTIFY_FLUSH_SECONDS must be greater than 0")
         if job_runner_max_workers <= 0:
             raise ValueError("JOB_RUNNER_MAX_WORKERS must be greater than 0")
+        if job_runner_interactive_max_workers < 0:
+            raise ValueError("JOB_RUNNER_INTERACTIVE_MAX_WORKERS must be greater than or equal to 0")
+        if job_runner_async_max_concurrency < 0:
+            raise ValueError("JOB_RUNNER_ASYNC_MAX_CONCURRENCY must be greater than or equal to 0")
+        if job_priority_aging_seconds < 0:
+            raise ValueError("JOB_PRIORITY_AGING_SECONDS must be greater than or equal to 0")
+        if job_lock_ttl_seconds <= 0:
+            raise ValueError("JOB_LOCK_TTL_SECONDS must be greater than 0")
+        if job_heartbeat_interval_seconds < 0:
+            raise ValueError("JOB_HEARTBEAT_INTERVAL_SECONDS must be greater than or equal to 0")
+        if job_heartbeat_interval_seconds >= job_lock_ttl_seconds:
+            raise ValueError("JOB_HEARTBEAT_INTERVAL_SECONDS must be less than JOB_LOCK_TTL_SECONDS")
+        if job_runner_timer_prefetch_limit < 0:
+            raise ValueError("JOB_RUNNER_TIMER_PREFETCH_LIMIT must be greater than or equal to 0")
+        if job_dedup_window_seconds < 0:
+            raise ValueError("JOB_DEDUP_WINDOW_SECONDS must be greater than or equal to 0")
+        if job_worker_max_workers <= 0:
+            raise ValueError("JOB_WORKER_MAX_WORKERS must be greater than 0")
+        if job_worker_batch_size <= 0:
+            raise ValueError("JOB_WORKER_BATCH_SIZE must be greater than 0")
+        if not 0 <= job_worker_metrics_port <= 65535:
+            raise ValueError("JOB_WORKER_METRICS_PORT must be between 0 and 65535")
+        if job_retention_days <= 0:
+            raise ValueError("JOB_RETENTION_DAYS must be greater than 0")
+        if job_retention_batch_size <= 0:
+            raise ValueError("JOB_RETENTION_BATCH_SIZE must be greater than 0")
+        if job_retention_interval_seconds <= 0:
+            raise ValueError("JOB_RETENTION_INTERVAL_SECONDS must be greater than 0")
         if volc_http_timeout <= 0:
             raise ValueError("VOLC_HTTP_TIMEOUT must be greater than 0")
+        if asr_poll_concurrency <= 0:
+            raise ValueError("ASR_POLL_CONCURRENCY must be greater than 0")
+        if asr_poll_window_seconds < 0:
+            raise ValueError("ASR_POLL_WINDOW_SECONDS must be greater than or equal to 0")
+        if asr_callback_url and not asr_callback_secret:
+            raise ValueError("ASR_CALLBACK_SECRET is required when ASR_CALLBACK_URL is set")
+        if asr_callback_fallback_poll_seconds <= 0:
+            raise ValueError("ASR_CALLBACK_FALLBACK_POLL_SECONDS must be greater than 0")
+        if asr_chunk_threshold_seconds < 0:
+            raise ValueError("ASR_CHUNK_THRESHOLD_SECONDS must be greater than or equal to 0")
+        if asr_chunk_overlap_seconds < 0:
+            raise ValueError("ASR_CHUNK_OVERLAP_SECONDS must be greater than or equal to 0")
+        if asr_chunk_seconds <= asr_chunk_overlap_seconds:
+            raise ValueError("ASR_CHUNK_SECONDS must be greater than ASR_CHUNK_OVERLAP_SECONDS")
+        if asr_audio_download_timeout <= 0:
+            raise ValueError("ASR_AUDIO_DOWNLOAD_TIMEOUT must be greater than 0")
+        if asr_audio_download_max_mb <= 0:
+            raise ValueError("ASR_AUDIO_DOWNLOAD_MAX_MB must be greater than 0")
         if revision_llm_http_timeout <= 0:
             raise ValueError("REVISION_LLM_HTTP_TIMEOUT must be greater than 0")
         if script_llm_http_timeout <= 0:
@@ -296,10 +501,43 @@ class Settings:
             CASDOOR_CLIENT_SECRET=_get_env_str("CASDOOR_CLIENT_SECRET", cls.CASDOOR_CLIENT_SECRET),
             CASDOOR_REDIRECT_URI=_get_env_str("CASDOOR_REDIRECT_URI", cls.CASDOOR_REDIRECT_URI),
             CASDOOR_HTTP_TIMEOUT=casdoor_http_timeout,
+            METRICS_ENABLED=metrics_enabled,
+            HTTP_CLIENT_MAX_CONNECTIONS=http_client_max_connections,
+            HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS=http_client_max_keepalive_connections,
+            HTTP_CLIENT_KEEPALIVE_EXPIRY=http_client_keepalive_expiry,
+            HTTP_CLIENT_CONNECT_TIMEOUT=http_client_connect_timeout,
+            HTTP_CLIENT_HTTP2=_get_env_bool("HTTP_CLIENT_HTTP2", cls.HTTP_CLIENT_HTTP2),
+            EVENT_STREAM_ENABLED=_get_env_bool("EVENT_STREAM_ENABLED", cls.EVENT_STREAM_ENABLED),
+            EVENT_STREAM_BUFFER_SIZE=event_stream_buffer_size,
+            EVENT_STREAM_HEARTBEAT_SECONDS=event_stream_heartbeat_seconds,
+            EVENT_STREAM_QUEUE_SIZE=event_stream_queue_size,
+            EVENT_NOTIFY_FLUSH_SECONDS=event_notify_flush_seconds,
             JOB_RUNNER_ENABLED=job_runner_enabled,
             JOB_RUNNER_INTERVAL_SECONDS=job_runner_interval_seconds,
             JOB_RUNNER_BATCH_SIZE=job_runner_batch_size,
             JOB_RUNNER_MAX_WORKERS=job_runner_max_workers,
+            JOB_RUNNER_INTERACTIVE_JOB_TYPES=os.getenv(
+                "JOB_RUNNER_INTERACTIVE_JOB_TYPES",
+                cls.JOB_RUNNER_INTERACTIVE_JOB_TYPES,
+            ).strip(),
+            JOB_RUNNER_INTERACTIVE_MAX_WORKERS=job_runner_interactive_max_workers,
+            JOB_RUNNER_ASYNC_MAX_CONCURRENCY=job_runner_async_max_concurrency,
+            JOB_RUNNER_TYPE_CONCURRENCY=_get_env_str("JOB_RUNNER_TYPE_CONCURRENCY", cls.JOB_RUNNER_TYPE_CONCURRENCY),
+            JOB_PRIORITY_AGING_SECONDS=job_priority_aging_seconds,
+            JOB_LOCK_TTL_SECONDS=job_lock_ttl_seconds,
+            JOB_HEARTBEAT_INTERVAL_SECONDS=job_heartbeat_interval_seconds,
+            JOB_RUNNER_TIMER_PREFETCH_LIMIT=job_runner_timer_prefetch_limit,
+            JOB_DEDUP_WINDOW_SECONDS=job_dedup_window_seconds,
+            JOB_PIPELINE_ENABLED=_get_env_bool("JOB_PIPELINE_ENABLED", cls.JOB_PIPELINE_ENABLED),
+            JOB_WORKER_MAX_WORKERS=job_worker_max_workers,
+            JOB_WORKER_BATCH_SIZE=job_worker_batch_size,
+            JOB_WORKER_JOB_TYPES=_get_env_str("JOB_WORKER_JOB_TYPES", cls.JOB_WORKER_JOB_TYPES),
+            JOB_WORKER_METRICS_PORT=job_worker_metrics_port,
+            JOB_RETENTION_ENABLED=_get_env_bool("JOB_RETENTION_ENABLED", cls.JOB_RETENTION_ENABLED),
+            JOB_RETENTION_DAYS=job_retention_days,
+            JOB_RETENTION_ARCHIVE=_get_env_bool("JOB_RETENTION_ARCHIVE", cls.JOB_RETENTION_ARCHIVE),
+            JOB_RETENTION_BATCH_SIZE=job_retention_batch_size,
+            JOB_RETENTION_INTERVAL_SECONDS=job_retention_interval_seconds,
             OSS_REGION=region,
             OSS_BUCKET=bucket,
             OSS_ACCESS_KEY_ID=os.getenv("OSS_ACCESS_KEY_ID", cls.OSS_ACCESS_KEY_ID).strip(),
@@ -313,6 +551,17 @@ class Settings:
             VOLC_MODEL_NAME=_get_env_str("VOLC_MODEL_NAME", cls.VOLC_MODEL_NAME),
             VOLC_UID=_get_env_str("VOLC_UID", cls.VOLC_UID),
             VOLC_HTTP_TIMEOUT=volc_http_timeout,
+            ASR_POLL_CONCURRENCY=asr_poll_concurrency,
+            ASR_POLL_WINDOW_SECONDS=asr_poll_window_seconds,
+            ASR_CALLBACK_URL=asr_callback_url,
+            ASR_CALLBACK_SECRET=asr_callback_secret,
+            ASR_CALLBACK_FALLBACK_POLL_SECONDS=asr_callback_fallback_poll_seconds,
+            ASR_CHUNK_THRESHOLD_SECONDS=asr_chunk_threshold_seconds,
+            ASR_CHUNK_SECONDS=asr_chunk_seconds,
+            ASR_CHUNK_OVERLAP_SECONDS=asr_chunk_overlap_seconds,
+            ASR_AUDIO_DOWNLOAD_TIMEOUT=asr_audio_download_timeout,
+            ASR_AUDIO_DOWNLOAD_MAX_MB=asr_audio_download_max_mb,
+            SEARCH_INDEX_ENABLED=_get_env_bool("SEARCH_INDEX_ENABLED", cls.SEARCH_INDEX_ENABLED),
             REVISION_PROVIDER=revision_provider,
             REVISION_LLM_API_KEY=revision_llm_api_key,
             REVISION_LLM_BASE_URL=revision_llm_base_url,
@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Iterator
+
+import httpx
+
+from lsl.core.config import Settings
+from lsl.core.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+# TTS 流式合成可达数分钟，total bucket 覆盖到 5 分钟。
+HTTP_DURATION_BUCKETS: tuple[float, ...] = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+HTTP_CLIENT_DURATION = REGISTRY.histogram(
+    "lsl_http_client_duration_seconds",
+    "Outbound provider request latency by phase: connect (new connections only), ttfb, total.",
+    ("provider", "phase"),
+    buckets=HTTP_DURATION_BUCKETS,
+)
+HTTP_CLIENT_REQUESTS = REGISTRY.counter(
+    "lsl_http_client_requests_total",
+    "Outbound provider requests by status class (2xx/4xx/5xx) or transport error.",
+    ("provider", "status"),
+)
+HTTP_CLIENT_CONNECTIONS = REGISTRY.counter(
+    "lsl_http_client_connections_total",
+    "New connections opened per provider; requests minus connections were served by keep-alive.",
+    ("provider",),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class HttpClientConfig:
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    connect_timeout: float = 10.0
+    http2: bool = False
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> HttpClientConfig:
+        return cls(
+            max_connections=settings.HTTP_CLIENT_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.HTTP_CLIENT_KEEPALIVE_EXPIRY,
+            connect_timeout=settings.HTTP_CLIENT_CONNECT_TIMEOUT,
+            http2=settings.HTTP_CLIENT_HTTP2,
+        )
+
+
+class _RequestTiming:
+    """根据 httpcore 的 trace 事件记录一次请求的 connect / ttfb / total。"""
+
+    def __init__(self, *, provider: str, tls: bool) -> None:
+        self._provider = provider
+        self._tls = tls
+        self._started_at = time.monotonic()
+        self._connect_started_at: float | None = None
+        self._finished = False
+
+    def on_trace(self, name: str, info: dict[str, Any]) -> None:
+        if name.endswith("connect_tcp.started"):
+            self._connect_started_at = time.monotonic()
+            HTTP_CLIENT_CONNECTIONS.inc(provider=self._provider)
+            return
+        if self._connect_started_at is None:
+            return
+        # HTTPS 的 connect 覆盖到 TLS 握手完成。
+        connected_event = "start_tls.complete" if self._tls else "connect_tcp.complete"
+        if name.endswith(connected_event):
+            self._observe("connect", self._connect_started_at)
+            self._connect_started_at = None
+
+    async def on_trace_async(self, name: str, info: dict[str, Any]) -> None:
+        self.on_trace(name, info)
+
+    def headers_received(self, status_code: int) -> None:
+        self._observe("ttfb", self._started_at)
+        HTTP_CLIENT_REQUESTS.inc(provider=self._provider, status=f"{status_code // 100}xx")
+
+    def failed(self) -> None:
+        HTTP_CLIENT_REQUESTS.inc(provider=self._provider, status="error")
+        self.finish()
+
+    def finish(self) -> None:
+        if self._finished:
+            return
+        self._finished = True
+        self._observe("total", self._started_at)
+
+    def _observe(self, phase: str, started_at: float) -> None:
+        HTTP_CLIENT_DURATION.observe(time.monotonic() - started_at, provider=self._provider, phase=phase)
+
+
+class _TimedSyncStream(httpx.SyncByteStream):
+    def __init__(self, stream: httpx.SyncByteStream, timing: _RequestTiming) -> None:
+        self._stream = stream
+        self._timing = timing
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._timing.finish()
+
+
+class _TimedAsyncStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, timing: _RequestTiming) -> None:
+        self._stream = stream
+        self._timing = timing
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._timing.finish()
+
+
+class _InstrumentedTransport(httpx.BaseTransport):
+    # total 在响应体关闭时记录，流式响应（TTS）也能得到完整耗时。
+    def __init__(self, transport: httpx.BaseTransport, *, provider: str) -> None:
+        self._transport = transport
+        self._provider = provider
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        timing = _RequestTiming(provider=self._provider, tls=request.url.scheme == "https")
+        request.extensions = {**request.extensions, "trace": timing.on_trace}
+        try:
+            response = self._transport.handle_request(request)
+        except Exception:
+            timing.failed()
+            raise
+        timing.headers_received(response.status_code)
+        assert isinstance(response.stream, httpx.SyncByteStream)
+        response.stream = _TimedSyncStream(response.stream, timing)
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class _AsyncInstrumentedTransport(httpx.AsyncBaseTransport):
+    def __init__(self, transport: httpx.AsyncBaseTransport, *, provider: str) -> None:
+        self._transport = transport
+        self._provider = provider
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        timing = _RequestTiming(provider=self._provider, tls=request.url.scheme == "https")
+        request.extensions = {**request.extensions, "trace": timing.on_trace_async}
+        try:
+            response = await self._transport.handle_async_request(request)
+        except Exception:
+            timing.failed()
+            raise
+        timing.headers_received(response.status_code)
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        response.stream = _TimedAsyncStream(response.stream, timing)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+_ClientKey = tuple[str, float, bool]
+
+
+class HttpClientRegistry:
+    """
+    进程内共享的出站 HTTP client：
+    - 按 (provider, timeout, trust_env) 缓存 httpx.Client，连接池按 host 复用 keep-alive 连接，不再每次请求新建 TCP/TLS
+    - 连接池上限、keep-alive 过期时间、connect 超时和 HTTP/2 来自 HTTP_CLIENT_* 配置，读写超时由各 provider 指定
+    - HTTP/2 依赖 h2 包，未安装时退化为 HTTP/1.1
+    - AsyncClient 的连接池绑定事件循环，换循环（如测试）时重建
+    - transport 仅供测试注入（如 httpx.MockTransport）
+    """
+
+    def __init__(
+        self,
+        config: HttpClientConfig | None = None,
+        *,
+        transport: httpx.BaseTransport | httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self._lock = threading.Lock()
+        self._config = config or HttpClientConfig()
+        self._transport = transport
+        self._clients: dict[_ClientKey, httpx.Client] = {}
+        self._async_clients: dict[_ClientKey, tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+        self._http2 = self._resolve_http2(self._config.http2)
+
+    def configure(self, config: HttpClientConfig) -> None:
+        self.close()
+        with self._lock:
+            self._config = config
+            self._http2 = self._resolve_http2(config.http2)
+
+    def client(self, provider: str, *, timeout: float, trust_env: bool = True) -> httpx.Client:
+        key = (provider, float(timeout), trust_env)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None or client.is_closed:
+                client = httpx.Client(
+                    timeout=self._timeout(timeout),
+                    trust_env=trust_env,
+                    transport=_InstrumentedTransport(self._sync_transport(trust_env), provider=provider),
+                )
+                self._clients[key] = client
+            return client
+
+    def async_client(self, provider: str, *, timeout: float, trust_env: bool = True) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        key = (provider, float(timeout), trust_env)
+        with self._lock:
+            cached = self._async_clients.get(key)
+            if cached is not None and cached[0] is loop and not cached[1].is_closed:
+                return cached[1]
+            client = httpx.AsyncClient(
+                timeout=self._timeout(timeout),
+                trust_env=trust_env,
+                transport=_AsyncInstrumentedTransport(self._async_transport(trust_env), provider=provider),
+            )
+            self._async_clients[key] = (loop, client)
+            return client
+
+    def close(self) -> None:
+        with self._lock:
+            clients = list(self._clients.values())
+            async_clients = list(self._async_clients.values())
+            self._clients.clear()
+            self._async_clients.clear()
+        for client in clients:
+            try:
+                client.close()
+            except Exception:
+                logger.exception("Failed to close http client")
+        for loop, async_client in async_clients:
+            # 只能在所属事件循环中关闭；循环已停止时连接随进程退出释放。
+            if loop.is_running() and not loop.is_closed():
+                asyncio.run_coroutine_threadsafe(async_client.aclose(), loop)
+
+    def _timeout(self, timeout: float) -> httpx.Timeout:
+        return httpx.Timeout(timeout, connect=min(timeout, self._config.connect_timeout))
+
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self._config.max_connections,
+            max_keepalive_connections=self._config.max_keepalive_connections,
+            keepalive_expiry=self._config.keepalive_expiry,
+        )
+
+    def _sync_transport(self, trust_env: bool) -> httpx.BaseTransport:
+        if isinstance(self._transport, httpx.BaseTransport):
+            return self._transport
+        return httpx.HTTPTransport(limits=self._limits(), http2=self._http2, trust_env=trust_env)
+
+    def _async_transport(self, trust_env: bool) -> httpx.AsyncBaseTransport:
+        if isinstance(self._transport, httpx.AsyncBaseTransport):
+            return self._transport
+        return httpx.AsyncHTTPTransport(limits=self._limits(), http2=self._http2, trust_env=trust_env)
+
+    @staticmethod
+    def _resolve_http2(requested: bool) -> bool:
+        if requested and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP_CLIENT_HTTP2=true but the h2 package is not installed, falling back to HTTP/1.1")
+            return False
+        return requested
+
+
+HTTP_CLIENTS = HttpClientRegistry()
+
+
+def configure_http_clients(settings: Settings) -> None:
+    HTTP_CLIENTS.configure(HttpClientConfig.from_settings(settings))
+
+
+def close_http_clients() -> None:
+    HTTP_CLIENTS.close()
+
+
+def get_http_client(provider: str, *, timeout: float, trust_env: bool = True) -> httpx.Client:
+    return HTTP_CLIENTS.client(provider, timeout=timeout, trust_env=trust_env)
+
+
+def get_async_http_client(provider: str, *, timeout: float, trust_env: bool = True) -> httpx.AsyncClient:
+    return HTTP_CLIENTS.async_client(provider, timeout=timeout, trust_env=trust_env)
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import json
 import uuid
+import zlib
 from typing import Any
 
-from sqlalchemy import String, Text
+from sqlalchemy import LargeBinary, String, Text
 from sqlalchemy.types import TypeDecorator
 
 
@@ -46,3 +47,27 @@ class JSONString(TypeDecorator[Any]):
         except json.JSONDecodeError:
             return value
 
+
+class CompressedJSON(TypeDecorator[Any]):
+    """
+    zlib 压缩后的 JSON，用于 provider 原始结果这类大而冷的数据。
+    读取时也兼容未压缩的 UTF-8 JSON 字节（由 SQL 直接迁移过来的旧数据）。
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Any) -> bytes | None:
+        if value is None:
+            return None
+        return zlib.compress(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+    def process_result_value(self, value: Any, dialect: Any) -> Any:
+        if value is None:
+            return None
+        data = bytes(value)
+        if not data:
+            return None
+        if data[:1] == b"\x78":
+            data = zlib.decompress(data)
+        return json.loads(data.decode("utf-8"))
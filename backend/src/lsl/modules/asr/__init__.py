@@ -1,5 +1,5 @@
 from lsl.modules.asr import model as _model
-from lsl.modules.asr.api import router
+from lsl.modules.asr.api import callback_router, router
 from lsl.modules.asr.provider import create_asr_provider
 from lsl.modules.asr.repo import AsrRepository
 from lsl.modules.asr.service import AsrJobHandler, AsrService
@@ -8,6 +8,7 @@ __all__ = [
     "AsrJobHandler",
     "AsrRepository",
     "AsrService",
+    "callback_router",
     "create_asr_provider",
     "router",
 ]
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typing import cast
+from typing import Any, cast
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Body, Depends, HTTPException, Request
 
 from lsl.modules.asr.schema import (
     ApiResponse,
@@ -14,6 +14,8 @@ from lsl.modules.asr.schema import (
 from lsl.modules.asr.service import AsrService
 
 router = APIRouter(prefix="/asr", tags=["asr"])
+# provider 回调不带登录态，单独挂载、不走 require_auth_user，改用回调 URL 中的签名 token 校验。
+callback_router = APIRouter(prefix="/asr", tags=["asr"])
 
 
 def get_asr_service(request: Request) -> AsrService:
@@ -68,3 +70,23 @@ def get_recognition(
     except RuntimeError as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
     return ApiResponse(data=data)
+
+
+@callback_router.post("/callbacks/{recognition_id}", response_model=ApiResponse[AsrRecognitionData])
+def receive_callback(
+    recognition_id: str,
+    token: str = "",
+    payload: dict[str, Any] = Body(default_factory=dict),
+    asr_service: AsrService = Depends(get_asr_service),
+):
+    if not asr_service.callback_enabled:
+        raise HTTPException(status_code=404, detail="ASR callback is not enabled")
+    if not asr_service.verify_callback_token(recognition_id=recognition_id, token=token):
+        raise HTTPException(status_code=403, detail="invalid callback token")
+    try:
+        data = asr_service.handle_callback(recognition_id=recognition_id, payload=payload)
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except RuntimeError as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+    return ApiResponse(data=data)
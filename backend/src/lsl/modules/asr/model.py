@@ -15,6 +15,8 @@ class AsrRecognitionModel(Base):
         Index("idx_asr_recognitions_transcript_id", "transcript_id"),
         Index("idx_asr_recognitions_status_created_at", "x_status", "created_at"),
         Index("idx_asr_recognitions_object_key", "object_key"),
+        Index("idx_asr_recognitions_fingerprint", "audio_fingerprint", "target_language", "x_status"),
+        Index("idx_asr_recognitions_parent", "parent_recognition_id", "chunk_index"),
     )
 
     recognition_id: Mapped[str] = mapped_column(UUIDHexString(), primary_key=True)
@@ -23,6 +25,17 @@ class AsrRecognitionModel(Base):
     object_key: Mapped[str] = mapped_column(Text, nullable=False)
     audio_url: Mapped[str] = mapped_column(Text, nullable=False)
     target_language: Mapped[str | None] = mapped_column(String(16), nullable=True)
+    # 音频内容指纹（来自 asset），与 target_language 一起决定能否复用已完成的识别。
+    audio_fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    # 复用结果时指向被复用的 recognition，本条没有调用 provider。
+    reused_from_recognition_id: Mapped[str | None] = mapped_column(UUIDHexString(), nullable=True)
+    # 长音频分段识别：父 recognition 记录段数，不调用 provider；每段是一条子 recognition，带自己的 transcript 和 job。
+    chunk_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    parent_recognition_id: Mapped[str | None] = mapped_column(UUIDHexString(), nullable=True)
+    chunk_index: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # 子 recognition 在原音频中的起止时间，单位毫秒。
+    chunk_start_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    chunk_end_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
     provider: Mapped[str] = mapped_column("x_provider", String(32), nullable=False)
     status: Mapped[int] = mapped_column("x_status", SmallInteger, nullable=False, server_default=text("0"))
     provider_request_id: Mapped[str | None] = mapped_column("x_provider_request_id", String(128), nullable=True)
@@ -35,6 +48,8 @@ class AsrRecognitionModel(Base):
     poll_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
     last_polled_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     next_poll_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # 回调到达时 job 正被轮询占用，先记下；轮询写回“仍在识别”时据此立即再查一次，不等兜底间隔。
+    callback_received_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -36,7 +36,13 @@ class FakeAsrProvider:
         )
 
     def query(self, ref: AsrJobRef) -> AsrQueryResult:
-        raw_result = self._fixture
+        return self._succeeded(self._fixture, x_tt_logid=ref.x_tt_logid or f"fake-{ref.provider_request_id}")
+
+    def parse_callback(self, payload: dict[str, Any]) -> AsrQueryResult:
+        # 回调请求体直接是识别结果（与 result.json 结构相同）。
+        return self._succeeded(payload, x_tt_logid=None)
+
+    def _succeeded(self, raw_result: dict[str, Any], *, x_tt_logid: str | None) -> AsrQueryResult:
         return AsrQueryResult(
             status=AsrJobStatus.SUCCEEDED,
             provider_status_code="20000000",
@@ -45,9 +51,12 @@ class FakeAsrProvider:
             full_text=self._extract_full_text(raw_result),
             utterances=self._extract_utterances(raw_result),
             raw_result=raw_result,
-            x_tt_logid=ref.x_tt_logid or f"fake-{ref.provider_request_id}",
+            x_tt_logid=x_tt_logid,
         )
 
+    async def query_async(self, ref: AsrJobRef) -> AsrQueryResult:
+        return self.query(ref)
+
     @staticmethod
     def _extract_duration_ms(payload: dict[str, Any]) -> int | None:
         audio_info = payload.get("audio_info", {})
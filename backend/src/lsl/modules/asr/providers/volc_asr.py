@@ -3,9 +3,10 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-import requests
+import httpx
 
 from lsl.core.config import Settings
+from lsl.core.http import get_async_http_client, get_http_client
 from lsl.modules.asr.types import (
     AsrJobRef,
     AsrJobStatus,
@@ -36,6 +37,48 @@ class VolcAsrProvider:
         self._validate_settings()
 
     def submit(self, req: AsrSubmitRequest) -> AsrJobRef:
+        headers, payload = self._build_submit_request(req)
+        response = self._post_json(
+            url=self._submit_url,
+            payload=payload,
+            headers=headers,
+            action="submit",
+            request_id=req.recognition_id,
+        )
+        return self._parse_submit_response(req, response)
+
+    async def submit_async(self, req: AsrSubmitRequest) -> AsrJobRef:
+        headers, payload = self._build_submit_request(req)
+        response = await self._post_json_async(
+            url=self._submit_url,
+            payload=payload,
+            headers=headers,
+            action="submit",
+            request_id=req.recognition_id,
+        )
+        return self._parse_submit_response(req, response)
+
+    def query(self, ref: AsrJobRef) -> AsrQueryResult:
+        response = self._post_json(
+            url=self._query_url,
+            payload={},
+            headers=self._build_query_headers(ref),
+            action="query",
+            request_id=ref.provider_request_id,
+        )
+        return self._parse_query_response(ref, response)
+
+    async def query_async(self, ref: AsrJobRef) -> AsrQueryResult:
+        response = await self._post_json_async(
+            url=self._query_url,
+            payload={},
+            headers=self._build_query_headers(ref),
+            action="query",
+            request_id=ref.provider_request_id,
+        )
+        return self._parse_query_response(ref, response)
+
+    def _build_submit_request(self, req: AsrSubmitRequest) -> tuple[dict[str, str], dict[str, Any]]:
         headers = {
             "X-Api-App-Key": self._app_key,
             "X-Api-Access-Key": self._access_key,
@@ -60,14 +103,12 @@ class VolcAsrProvider:
                 "enable_gender_detection": True,
             },
         }
+        if req.callback_url:
+            payload["callback"] = req.callback_url
+            payload["callback_data"] = req.recognition_id
+        return headers, payload
 
-        response = self._post_json(
-            url=self._submit_url,
-            payload=payload,
-            headers=headers,
-            action="submit",
-            request_id=req.recognition_id,
-        )
+    def _parse_submit_response(self, req: AsrSubmitRequest, response: Any) -> AsrJobRef:
         status_code = self._header(response.headers, "X-Api-Status-Code")
         message = self._header(response.headers, "X-Api-Message")
         x_tt_logid = self._header(response.headers, "X-Tt-Logid")
@@ -90,7 +131,7 @@ class VolcAsrProvider:
             x_tt_logid=x_tt_logid,
         )
 
-    def query(self, ref: AsrJobRef) -> AsrQueryResult:
+    def _build_query_headers(self, ref: AsrJobRef) -> dict[str, str]:
         headers = {
             "X-Api-App-Key": self._app_key,
             "X-Api-Access-Key": self._access_key,
@@ -100,19 +141,50 @@ class VolcAsrProvider:
         }
         if ref.x_tt_logid:
             headers["X-Tt-Logid"] = ref.x_tt_logid
-
-        response = self._post_json(
-            url=self._query_url,
-            payload={},
-            headers=headers,
-            action="query",
-            request_id=ref.provider_request_id,
+        return headers
+
+    def parse_callback(self, payload: dict[str, Any]) -> AsrQueryResult:
+        """
+        回调请求体与 query 成功时的响应体结构相同；状态码在 `code` 或 `resp.code` 中，
+        缺失但带有 result 时按成功处理。
+        """
+        resp = payload.get("resp") if isinstance(payload.get("resp"), dict) else {}
+        code = payload.get("code", resp.get("code"))
+        message = payload.get("message", resp.get("message"))
+        if code is None and isinstance(payload.get("result"), dict):
+            code = self._STATUS_SUCCEEDED
+        return self._build_query_result(
+            request_id=str(payload.get("callback_data") or ""),
+            status_code=str(code) if code is not None else None,
+            message=str(message) if message is not None else None,
+            x_tt_logid=None,
+            payload=payload,
+            response_body=str(payload)[:1200],
         )
 
+    def _parse_query_response(self, ref: AsrJobRef, response: Any) -> AsrQueryResult:
         status_code = self._header(response.headers, "X-Api-Status-Code")
         message = self._header(response.headers, "X-Api-Message")
         x_tt_logid = self._header(response.headers, "X-Tt-Logid")
+        return self._build_query_result(
+            request_id=ref.provider_request_id,
+            status_code=status_code,
+            message=message,
+            x_tt_logid=x_tt_logid,
+            payload=response.json() if status_code == self._STATUS_SUCCEEDED else None,
+            response_body=self._safe_response_text(response),
+        )
 
+    def _build_query_result(
+        self,
+        *,
+        request_id: str,
+        status_code: str | None,
+        message: str | None,
+        x_tt_logid: str | None,
+        payload: Any,
+        response_body: str,
+    ) -> AsrQueryResult:
         if status_code == self._STATUS_QUEUED:
             return AsrQueryResult(
                 status=AsrJobStatus.QUEUED,
@@ -130,11 +202,11 @@ class VolcAsrProvider:
         if status_code != self._STATUS_SUCCEEDED:
             logger.error(
                 "Volc query business failed: request_id=%s status_code=%s message=%s x_tt_logid=%s response_body=%s",
-                ref.provider_request_id,
+                request_id,
                 status_code,
                 message,
                 x_tt_logid,
-                self._safe_response_text(response),
+                response_body,
             )
             return AsrQueryResult(
                 status=AsrJobStatus.FAILED,
@@ -145,7 +217,6 @@ class VolcAsrProvider:
                 x_tt_logid=x_tt_logid,
             )
 
-        payload = response.json()
         return AsrQueryResult(
             status=AsrJobStatus.SUCCEEDED,
             provider_status_code=status_code,
@@ -175,10 +246,14 @@ class VolcAsrProvider:
         headers: dict[str, str],
         action: str,
         request_id: str,
-    ) -> requests.Response:
+    ) -> httpx.Response:
         try:
-            response = requests.post(url, json=payload, headers=headers, timeout=self._timeout)
-        except requests.RequestException as exc:
+            response = get_http_client("volc_asr", timeout=self._timeout).post(
+                url,
+                json=payload,
+                headers=headers,
+            )
+        except httpx.HTTPError as exc:
             logger.exception(
                 "Volc %s transport error: request_id=%s url=%s headers=%s payload=%s",
                 action,
@@ -189,21 +264,63 @@ class VolcAsrProvider:
             )
             raise RuntimeError(f"Volc {action} request failed: {exc}") from exc
 
-        if response.status_code < 200 or response.status_code >= 300:
-            logger.error(
-                "Volc %s http failed: request_id=%s url=%s status=%s headers=%s payload=%s response_headers=%s response_body=%s",
+        self._raise_for_http_status(response, url=url, headers=headers, payload=payload, action=action, request_id=request_id)
+        return response
+
+    async def _post_json_async(
+        self,
+        *,
+        url: str,
+        payload: dict[str, Any],
+        headers: dict[str, str],
+        action: str,
+        request_id: str,
+    ) -> httpx.Response:
+        try:
+            response = await get_async_http_client("volc_asr", timeout=self._timeout).post(
+                url,
+                json=payload,
+                headers=headers,
+            )
+        except httpx.HTTPError as exc:
+            logger.exception(
+                "Volc %s transport error: request_id=%s url=%s headers=%s payload=%s",
                 action,
                 request_id,
                 url,
-                response.status_code,
                 self._safe_headers(headers),
                 payload,
-                dict(response.headers),
-                self._safe_response_text(response),
             )
-            raise RuntimeError(f"Volc {action} http failed: status={response.status_code}")
+            raise RuntimeError(f"Volc {action} request failed: {exc}") from exc
+
+        self._raise_for_http_status(response, url=url, headers=headers, payload=payload, action=action, request_id=request_id)
         return response
 
+    def _raise_for_http_status(
+        self,
+        response: Any,
+        *,
+        url: str,
+        headers: dict[str, str],
+        payload: dict[str, Any],
+        action: str,
+        request_id: str,
+    ) -> None:
+        if 200 <= response.status_code < 300:
+            return
+        logger.error(
+            "Volc %s http failed: request_id=%s url=%s status=%s headers=%s payload=%s response_headers=%s response_body=%s",
+            action,
+            request_id,
+            url,
+            response.status_code,
+            self._safe_headers(headers),
+            payload,
+            dict(response.headers),
+            self._safe_response_text(response),
+        )
+        raise RuntimeError(f"Volc {action} http failed: status={response.status_code}")
+
     @staticmethod
     def _header(headers: Any, key: str) -> str | None:
         value = headers.get(key)
@@ -218,7 +335,7 @@ class VolcAsrProvider:
         return safe
 
     @staticmethod
-    def _safe_response_text(response: requests.Response, limit: int = 1200) -> str:
+    def _safe_response_text(response: Any, limit: int = 1200) -> str:
         text = response.text or ""
         if len(text) <= limit:
             return text
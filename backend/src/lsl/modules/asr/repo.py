@@ -3,15 +3,15 @@ from __future__ import annotations
 import uuid
 from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Any, Iterator
+from typing import Any, Iterator, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, select, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session as OrmSession
 from sqlalchemy.orm import sessionmaker
 
 from lsl.modules.asr.model import AsrRecognitionModel
-from lsl.modules.asr.types import AsrRecognitionStatus, asr_recognition_status_to_name
+from lsl.modules.asr.types import AsrPollUpdate, AsrRecognitionStatus, asr_recognition_status_to_name
 
 
 class AsrRepository:
@@ -35,6 +35,11 @@ class AsrRepository:
         audio_url: str,
         target_language: str | None,
         provider: str,
+        audio_fingerprint: str | None = None,
+        parent_recognition_id: str | None = None,
+        chunk_index: int | None = None,
+        chunk_start_ms: int | None = None,
+        chunk_end_ms: int | None = None,
     ) -> dict[str, Any]:
         normalized_recognition_id = self._require_uuid(recognition_id, field_name="recognition_id")
         model = AsrRecognitionModel(
@@ -43,6 +48,15 @@ class AsrRepository:
             object_key=object_key,
             audio_url=audio_url,
             target_language=target_language,
+            audio_fingerprint=audio_fingerprint,
+            parent_recognition_id=(
+                self._require_uuid(parent_recognition_id, field_name="parent_recognition_id")
+                if parent_recognition_id is not None
+                else None
+            ),
+            chunk_index=chunk_index,
+            chunk_start_ms=chunk_start_ms,
+            chunk_end_ms=chunk_end_ms,
             provider=provider,
             status=int(AsrRecognitionStatus.PENDING),
         )
@@ -76,8 +90,66 @@ class AsrRepository:
         except SQLAlchemyError as exc:  # pragma: no cover
             raise RuntimeError(f"Failed to query ASR recognition: {exc}") from exc
 
+    def get_recognitions_by_ids(self, recognition_ids: Sequence[str]) -> dict[str, dict[str, Any]]:
+        """一次查询读出多条 recognition，按调用方传入的 recognition_id 返回；不存在的不在结果里。"""
+        normalized = {value: self._parse_uuid_str(value) for value in recognition_ids}
+        hex_ids = sorted({item for item in normalized.values() if item is not None})
+        if not hex_ids:
+            return {}
+        stmt = select(AsrRecognitionModel).where(AsrRecognitionModel.recognition_id.in_(hex_ids))
+        try:
+            with self._session_scope() as db:
+                rows = {model.recognition_id: self._to_row(model) for model in db.execute(stmt).scalars().all()}
+        except SQLAlchemyError as exc:  # pragma: no cover
+            raise RuntimeError(f"Failed to query ASR recognitions: {exc}") from exc
+        return {value: rows[hex_id] for value, hex_id in normalized.items() if hex_id in rows}
+
+    def find_completed_by_fingerprint(
+        self,
+        *,
+        audio_fingerprint: str,
+        target_language: str | None,
+    ) -> dict[str, Any] | None:
+        """同一音频指纹、同一目标语言下最近完成的 recognition。"""
+        language_filter = (
+            AsrRecognitionModel.target_language.is_(None)
+            if target_language is None
+            else AsrRecognitionModel.target_language == target_language
+        )
+        stmt = (
+            select(AsrRecognitionModel)
+            .where(AsrRecognitionModel.audio_fingerprint == audio_fingerprint)
+            .where(language_filter)
+            .where(AsrRecognitionModel.status == int(AsrRecognitionStatus.COMPLETED))
+            .order_by(AsrRecognitionModel.created_at.desc())
+            .limit(1)
+        )
+        try:
+            with self._session_scope() as db:
+                model = db.execute(stmt).scalar_one_or_none()
+                return self._to_row(model) if model is not None else None
+        except SQLAlchemyError as exc:  # pragma: no cover
+            raise RuntimeError(f"Failed to query ASR recognition by fingerprint: {exc}") from exc
+
+    def list_chunks(self, parent_recognition_id: str) -> list[dict[str, Any]]:
+        """长音频的各段子 recognition，按段序返回。"""
+        normalized = self._parse_uuid_str(parent_recognition_id)
+        if normalized is None:
+            return []
+        stmt = (
+            select(AsrRecognitionModel)
+            .where(AsrRecognitionModel.parent_recognition_id == normalized)
+            .order_by(AsrRecognitionModel.chunk_index.asc())
+        )
+        try:
+            with self._session_scope() as db:
+                return [self._to_row(model) for model in db.execute(stmt).scalars().all()]
+        except SQLAlchemyError as exc:  # pragma: no cover
+            raise RuntimeError(f"Failed to list ASR recognition chunks: {exc}") from exc
+
     def list_recognitions(self, *, limit: int, status: int | None = None) -> list[dict[str, Any]]:
-        stmt = select(AsrRecognitionModel)
+        # 分段识别的子 recognition 只是父 recognition 的内部步骤，不出现在列表里。
+        stmt = select(AsrRecognitionModel).where(AsrRecognitionModel.parent_recognition_id.is_(None))
         if status is not None:
             stmt = stmt.where(AsrRecognitionModel.status == int(status))
         stmt = stmt.order_by(AsrRecognitionModel.created_at.desc()).limit(limit)
@@ -113,6 +185,23 @@ class AsrRepository:
         except SQLAlchemyError as exc:  # pragma: no cover
             raise RuntimeError(f"Failed to mark ASR recognition submitted: {exc}") from exc
 
+    def mark_chunked(self, *, recognition_id: str, chunk_count: int, job_id: str) -> dict[str, Any]:
+        """长音频已拆成 chunk_count 段子 recognition，父 recognition 进入处理中，job_id 换成依赖各段的汇总 job。"""
+        try:
+            with self._session_scope() as db:
+                model = self._get_required_recognition(db, recognition_id)
+                model.status = int(AsrRecognitionStatus.PROCESSING)
+                model.chunk_count = int(chunk_count)
+                model.job_id = self._require_uuid(job_id, field_name="job_id")
+                model.next_poll_at = None
+                model.error_code = None
+                model.error_message = None
+                db.commit()
+                db.refresh(model)
+                return self._to_row(model)
+        except SQLAlchemyError as exc:  # pragma: no cover
+            raise RuntimeError(f"Failed to mark ASR recognition chunked: {exc}") from exc
+
     def mark_processing(
         self,
         *,
@@ -132,12 +221,102 @@ class AsrRepository:
                 model.poll_count = int(model.poll_count) + 1
                 model.last_polled_at = datetime.now(timezone.utc)
                 model.next_poll_at = next_poll_at
+                if model.callback_received_at is not None:
+                    # 轮询期间回调已到：provider 已有结果，立即再查一次，标记只消费一次。
+                    model.next_poll_at = model.last_polled_at
+                    model.callback_received_at = None
                 db.commit()
                 db.refresh(model)
                 return self._to_row(model)
         except SQLAlchemyError as exc:  # pragma: no cover
             raise RuntimeError(f"Failed to mark ASR recognition processing: {exc}") from exc
 
+    def mark_processing_many(self, *, items: Sequence[AsrPollUpdate]) -> set[str]:
+        """
+        批量轮询后仍在排队 / 识别中的 recognition：一条 executemany UPDATE 写回，poll_count 在库内自增。
+        返回轮询期间已收到回调的 recognition_id，这些条目的 next_poll_at 改为现在，调用方据此立即重跑。
+        """
+        params = [
+            {
+                "b_recognition_id": self._require_uuid(item.recognition_id, field_name="recognition_id"),
+                "b_provider_status_code": item.provider_status_code,
+                "b_provider_message": item.provider_message,
+                "b_x_tt_logid": item.x_tt_logid,
+                "b_next_poll_at": item.next_poll_at,
+            }
+            for item in items
+        ]
+        if not params:
+            return set()
+        now = datetime.now(timezone.utc)
+        # Core 语句做 executemany；列名带 x_ 前缀，用 ORM 属性作为 key 映射到真实列。
+        stmt = (
+            update(AsrRecognitionModel.__table__)
+            .where(AsrRecognitionModel.recognition_id == bindparam("b_recognition_id"))
+            .values(
+                {
+                    AsrRecognitionModel.status: int(AsrRecognitionStatus.PROCESSING),
+                    AsrRecognitionModel.provider_status_code: bindparam("b_provider_status_code"),
+                    AsrRecognitionModel.provider_message: bindparam("b_provider_message"),
+                    AsrRecognitionModel.x_tt_logid: func.coalesce(
+                        bindparam("b_x_tt_logid"),
+                        AsrRecognitionModel.x_tt_logid,
+                    ),
+                    AsrRecognitionModel.poll_count: AsrRecognitionModel.poll_count + 1,
+                    AsrRecognitionModel.last_polled_at: now,
+                    AsrRecognitionModel.next_poll_at: bindparam("b_next_poll_at"),
+                    AsrRecognitionModel.updated_at: now,
+                }
+            )
+        )
+        recognition_ids = [item["b_recognition_id"] for item in params]
+        try:
+            with self._session_scope() as db:
+                db.execute(stmt, params)
+                # 轮询期间到达的回调：只消费本次读到的标记，之后到达的留给下一轮。
+                called_back = set(
+                    db.scalars(
+                        select(AsrRecognitionModel.recognition_id)
+                        .where(AsrRecognitionModel.recognition_id.in_(recognition_ids))
+                        .where(AsrRecognitionModel.callback_received_at.is_not(None))
+                    ).all()
+                )
+                if called_back:
+                    db.execute(
+                        update(AsrRecognitionModel)
+                        .where(AsrRecognitionModel.recognition_id.in_(called_back))
+                        .values(callback_received_at=None, next_poll_at=now)
+                        .execution_options(synchronize_session=False)
+                    )
+                db.commit()
+                return called_back
+        except SQLAlchemyError as exc:  # pragma: no cover
+            raise RuntimeError(f"Failed to mark ASR recognitions processing: {exc}") from exc
+
+    def mark_callback_received(self, *, recognition_id: str) -> bool:
+        """记下 job 被占用时到达的回调；recognition 已结束时不记，返回是否写入。"""
+        normalized_id = self._parse_uuid_str(recognition_id)
+        if normalized_id is None:
+            return False
+        stmt = (
+            update(AsrRecognitionModel)
+            .where(AsrRecognitionModel.recognition_id == normalized_id)
+            .where(
+                AsrRecognitionModel.status.not_in(
+                    [int(AsrRecognitionStatus.COMPLETED), int(AsrRecognitionStatus.FAILED)]
+                )
+            )
+            .values(callback_received_at=datetime.now(timezone.utc))
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            with self._session_scope() as db:
+                updated = db.execute(stmt).rowcount
+                db.commit()
+                return bool(updated)
+        except SQLAlchemyError as exc:  # pragma: no cover
+            raise RuntimeError(f"Failed to mark ASR callback received: {exc}") from exc
+
     def mark_completed(
         self,
         *,
@@ -163,6 +342,27 @@ class AsrRepository:
         except SQLAlchemyError as exc:  # pragma: no cover
             raise RuntimeError(f"Failed to mark ASR recognition completed: {exc}") from exc
 
+    def mark_reused(self, *, recognition_id: str, source: dict[str, Any]) -> dict[str, Any]:
+        """直接以 source（已完成的 recognition）的结果完成本条，不经过 provider。"""
+        try:
+            with self._session_scope() as db:
+                model = self._get_required_recognition(db, recognition_id)
+                model.status = int(AsrRecognitionStatus.COMPLETED)
+                model.reused_from_recognition_id = self._require_uuid(
+                    str(source["recognition_id"]),
+                    field_name="reused_from_recognition_id",
+                )
+                model.provider_status_code = source.get("provider_status_code")
+                model.provider_message = source.get("provider_message")
+                model.error_code = None
+                model.error_message = None
+                model.next_poll_at = None
+                db.commit()
+                db.refresh(model)
+                return self._to_row(model)
+        except SQLAlchemyError as exc:  # pragma: no cover
+            raise RuntimeError(f"Failed to mark ASR recognition reused: {exc}") from exc
+
     def mark_failed(
         self,
         *,
@@ -207,6 +407,13 @@ class AsrRepository:
             "object_key": model.object_key,
             "audio_url": model.audio_url,
             "target_language": model.target_language,
+            "audio_fingerprint": model.audio_fingerprint,
+            "reused_from_recognition_id": model.reused_from_recognition_id,
+            "chunk_count": int(model.chunk_count or 0),
+            "parent_recognition_id": model.parent_recognition_id,
+            "chunk_index": model.chunk_index,
+            "chunk_start_ms": model.chunk_start_ms,
+            "chunk_end_ms": model.chunk_end_ms,
             "provider": model.provider,
             "status": status,
             "status_name": asr_recognition_status_to_name(status),
@@ -220,6 +427,7 @@ class AsrRepository:
             "poll_count": int(model.poll_count),
             "last_polled_at": model.last_polled_at,
             "next_poll_at": model.next_poll_at,
+            "callback_received_at": model.callback_received_at,
             "created_at": model.created_at,
             "updated_at": model.updated_at,
         }
@@ -47,6 +47,13 @@ class AsrRecognitionData(BaseModel):
     object_key: str
     audio_url: str
     target_language: str | None = None
+    audio_fingerprint: str | None = None
+    reused_from_recognition_id: str | None = None
+    chunk_count: int = 0
+    parent_recognition_id: str | None = None
+    chunk_index: int | None = None
+    chunk_start_ms: int | None = None
+    chunk_end_ms: int | None = None
     provider: str
     status: int
     status_name: str
@@ -60,6 +67,7 @@ class AsrRecognitionData(BaseModel):
     poll_count: int
     last_polled_at: datetime | None = None
     next_poll_at: datetime | None = None
+    callback_received_at: datetime | None = None
     created_at: datetime
     updated_at: datetime
 
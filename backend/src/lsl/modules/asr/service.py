@@ -1,25 +1,36 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import hmac
+import math
 import uuid
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Sequence
 
+from lsl.core.http import get_http_client
 from lsl.modules.asr.repo import AsrRepository
 from lsl.modules.asr.schema import AsrRecognitionData, CreateAsrRecognitionData
 from lsl.modules.asr.types import (
     AsrJobRef,
     AsrJobStatus,
+    AsrPollUpdate,
     AsrProvider,
+    AsrQueryResult,
     AsrRecognitionStatus,
     AsrSubmitRequest,
 )
+from lsl.modules.event.broadcaster import EventBroadcaster
 from lsl.modules.job.service import JobService
 from lsl.modules.job.types import JobData, JobHandler, JobRunResult, JobStatus
+from lsl.modules.transcript.schema import TranscriptData
 from lsl.modules.transcript.service import TranscriptService
-from lsl.modules.transcript.types import TranscriptStatus, TranscriptUtterance
+from lsl.modules.transcript.types import TranscriptChunk, TranscriptStatus, TranscriptUtterance
+from lsl.modules.tts.audio_duration import Mp3Chunk, split_mp3
 
 if TYPE_CHECKING:
+    from lsl.modules.asset.service import AssetService
     from lsl.modules.translation.service import TranslationService
 
 logger = logging.getLogger(__name__)
@@ -34,11 +45,39 @@ class AsrService:
         job_service: JobService,
         provider: AsrProvider,
         translation_service: TranslationService | None = None,
+        event_broadcaster: EventBroadcaster | None = None,
+        asset_service: AssetService | None = None,
+        poll_concurrency: int = 16,
+        poll_window_seconds: float = 0.0,
+        callback_url: str = "",
+        callback_secret: str = "",
+        callback_fallback_poll_seconds: float = 60.0,
+        chunk_threshold_seconds: float = 0.0,
+        chunk_seconds: float = 300.0,
+        chunk_overlap_seconds: float = 5.0,
+        audio_download_timeout: float = 120.0,
+        audio_download_max_bytes: int = 256 * 1024 * 1024,
     ) -> None:
         self._repository = repository
+        self._event_broadcaster = event_broadcaster
         self._transcript_service = transcript_service
         self._job_service = job_service
         self._provider = provider
+        # 提供音频内容指纹；相同音频 + 相同语言的识别直接复用已完成的结果。
+        self._asset_service = asset_service
+        self._poll_concurrency = max(1, int(poll_concurrency))
+        self._poll_window_seconds = max(0.0, float(poll_window_seconds))
+        # 配置回调后 submit 时带上回调地址，轮询只作为丢失回调的兜底。
+        self._callback_url = callback_url.rstrip("/")
+        self._callback_secret = callback_secret
+        self._callback_fallback_poll_seconds = max(1.0, float(callback_fallback_poll_seconds))
+        # 超过阈值的 MP3 按帧切段并发识别，再拼回一条 transcript；阈值为 0 时关闭。
+        self._chunk_threshold_ms = max(0, int(chunk_threshold_seconds * 1000))
+        self._chunk_ms = max(1, int(chunk_seconds * 1000))
+        self._chunk_overlap_ms = max(0, int(chunk_overlap_seconds * 1000))
+        self._audio_download_timeout = float(audio_download_timeout)
+        # 切段需要整段音频在内存里，超过上限的音频不切段，照常整段提交。
+        self._audio_download_max_bytes = max(1, int(audio_download_max_bytes))
 
     def create_recognition(
         self,
@@ -54,8 +93,30 @@ class AsrService:
         if not normalized_audio_url:
             raise ValueError("audio_url is required")
 
-        transcript = self._transcript_service.create_pending_transcript(
+        recognition, transcript, job = self._create_recognition_with_job(
             source_type="asr",
+            object_key=normalized_object_key,
+            audio_url=normalized_audio_url,
+            target_language=target_language,
+            audio_fingerprint=(
+                self._asset_service.get_content_fingerprint(object_key=normalized_object_key)
+                if self._asset_service is not None
+                else None
+            ),
+        )
+        return CreateAsrRecognitionData(recognition=recognition, transcript=transcript, job=job)
+
+    def _create_recognition_with_job(
+        self,
+        *,
+        source_type: str,
+        object_key: str,
+        audio_url: str,
+        target_language: str | None,
+        **recognition_fields: Any,
+    ) -> tuple[AsrRecognitionData, TranscriptData, JobData]:
+        transcript = self._transcript_service.create_pending_transcript(
+            source_type=source_type,
             source_entity_id=None,
             language=target_language,
         )
@@ -63,10 +124,11 @@ class AsrService:
         row = self._repository.create_recognition(
             recognition_id=recognition_id,
             transcript_id=transcript.transcript_id,
-            object_key=normalized_object_key,
-            audio_url=normalized_audio_url,
+            object_key=object_key,
+            audio_url=audio_url,
             target_language=target_language,
             provider=self._provider_name(),
+            **recognition_fields,
         )
         recognition = AsrRecognitionData.from_row(row)
         self._transcript_service.update_source_entity(
@@ -82,7 +144,7 @@ class AsrService:
         self._repository.set_job_id(recognition_id=recognition.recognition_id, job_id=job.job_id)
         recognition = self.get_recognition(recognition_id=recognition.recognition_id)
         transcript = self._transcript_service.get_transcript(transcript_id=transcript.transcript_id)
-        return CreateAsrRecognitionData(recognition=recognition, transcript=transcript, job=job)
+        return recognition, transcript, job
 
     def get_recognition(self, *, recognition_id: str) -> AsrRecognitionData:
         row = self._repository.get_recognition_by_id(recognition_id)
@@ -100,10 +162,52 @@ class AsrService:
             for row in self._repository.list_recognitions(limit=limit, status=status)
         ]
 
+    @property
+    def callback_enabled(self) -> bool:
+        return bool(self._callback_url and self._callback_secret)
+
+    def verify_callback_token(self, *, recognition_id: str, token: str) -> bool:
+        if not self._callback_secret or not token:
+            return False
+        return hmac.compare_digest(self._callback_token(recognition_id), token)
+
+    def handle_callback(self, *, recognition_id: str, payload: dict[str, Any]) -> AsrRecognitionData:
+        """
+        provider 识别完成的回调：以 recognition 对应 job 的身份直接写入结果，claim 保证与轮询互斥；
+        回调内容无法解析时立即查询一次。job 正在被轮询时先在 recognition 上记下回调，再尝试一次 claim：
+        轮询已放手就直接处理回调；仍在轮询中则由这次轮询看到标记后立即重查，不等兜底间隔。
+        """
+        recognition = self.get_recognition(recognition_id=recognition_id)
+        if recognition.job_id is None or self._is_terminal(recognition):
+            return recognition
+
+        callback_result: AsrQueryResult | None = None
+        parse_callback = getattr(self._provider, "parse_callback", None)
+        if parse_callback is not None:
+            try:
+                callback_result = parse_callback(payload)
+            except Exception:
+                logger.exception("Failed to parse ASR callback recognition_id=%s", recognition_id)
+        if callback_result is not None and callback_result.status in (AsrJobStatus.QUEUED, AsrJobStatus.PROCESSING):
+            return recognition
+
+        def _runner(job: JobData) -> JobRunResult:
+            current = self.get_recognition(recognition_id=recognition_id)
+            if callback_result is None or not current.provider_request_id or self._is_terminal(current):
+                return self.run_recognition_job(recognition_id=recognition_id)
+            return self._apply_query_result(current, callback_result)
+
+        job = self._job_service.run_job_with(job_id=recognition.job_id, runner=_runner)
+        if job is None and self._repository.mark_callback_received(recognition_id=recognition_id):
+            job = self._job_service.run_job_with(job_id=recognition.job_id, runner=_runner)
+            if job is None:
+                logger.info("ASR callback deferred to the running poll recognition_id=%s", recognition_id)
+        return self.get_recognition(recognition_id=recognition_id)
+
     def run_recognition_job(self, *, recognition_id: str) -> JobRunResult:
         recognition = self.get_recognition(recognition_id=recognition_id)
         if recognition.status == int(AsrRecognitionStatus.COMPLETED):
-            return JobRunResult(status=JobStatus.COMPLETED, progress=100)
+            return JobRunResult(status=JobStatus.COMPLETED, progress=100, result={"transcript_id": recognition.transcript_id})
         if recognition.status == int(AsrRecognitionStatus.FAILED):
             return JobRunResult(
                 status=JobStatus.FAILED,
@@ -111,43 +215,32 @@ class AsrService:
                 error_message=recognition.error_message,
             )
 
+        if recognition.chunk_count:
+            return self._collect_chunks(recognition)
         if not recognition.provider_request_id:
             return self._submit_recognition(recognition)
         return self._query_recognition(recognition)
 
     def _submit_recognition(self, recognition: AsrRecognitionData) -> JobRunResult:
+        reused = self._reuse_recognition(recognition)
+        if reused is not None:
+            return reused
+        chunked = self._submit_chunks(recognition)
+        if chunked is not None:
+            return chunked
         try:
             submit_result = self._provider.submit(
                 AsrSubmitRequest(
                     recognition_id=recognition.recognition_id,
                     audio_url=recognition.audio_url,
                     language=recognition.target_language,
+                    callback_url=self._callback_url_for(recognition.recognition_id),
                 )
             )
         except NotImplementedError as exc:
-            self._repository.mark_failed(
-                recognition_id=recognition.recognition_id,
-                error_code="PROVIDER_NOT_IMPLEMENTED",
-                error_message=str(exc),
-            )
-            self._transcript_service.mark_failed(
-                transcript_id=recognition.transcript_id,
-                error_code="PROVIDER_NOT_IMPLEMENTED",
-                error_message=str(exc),
-            )
-            return JobRunResult(status=JobStatus.FAILED, error_code="PROVIDER_NOT_IMPLEMENTED", error_message=str(exc))
+            return self._mark_recognition_failed(recognition, error_code="PROVIDER_NOT_IMPLEMENTED", error_message=str(exc))
         except Exception as exc:
-            self._repository.mark_failed(
-                recognition_id=recognition.recognition_id,
-                error_code="PROVIDER_SUBMIT_ERROR",
-                error_message=str(exc),
-            )
-            self._transcript_service.mark_failed(
-                transcript_id=recognition.transcript_id,
-                error_code="PROVIDER_SUBMIT_ERROR",
-                error_message=str(exc),
-            )
-            return JobRunResult(status=JobStatus.FAILED, error_code="PROVIDER_SUBMIT_ERROR", error_message=str(exc))
+            return self._mark_recognition_failed(recognition, error_code="PROVIDER_SUBMIT_ERROR", error_message=str(exc))
 
         self._repository.mark_submitted(
             recognition_id=recognition.recognition_id,
@@ -158,74 +251,399 @@ class AsrService:
         )
         return JobRunResult(status=JobStatus.RUNNING, progress=10, next_run_at=self._next_poll_time(poll_count=0))
 
+    def _reuse_recognition(self, recognition: AsrRecognitionData) -> JobRunResult | None:
+        """同一音频指纹、同一目标语言已有完成的识别时，在库内复制其 transcript，不再调用 provider。"""
+        if not recognition.audio_fingerprint:
+            return None
+        source = self._repository.find_completed_by_fingerprint(
+            audio_fingerprint=recognition.audio_fingerprint,
+            target_language=recognition.target_language,
+        )
+        if source is None:
+            return None
+        transcript = self._transcript_service.copy_completed(
+            source_transcript_id=str(source["transcript_id"]),
+            transcript_id=recognition.transcript_id,
+            include_utterances=False,
+        )
+        if transcript is None:
+            return None
+        self._repository.mark_reused(recognition_id=recognition.recognition_id, source=source)
+        self._publish_transcript_changed(recognition.transcript_id)
+        logger.info(
+            "ASR recognition reused recognition_id=%s source_recognition_id=%s",
+            recognition.recognition_id,
+            source["recognition_id"],
+        )
+        return JobRunResult(status=JobStatus.COMPLETED, progress=100, result={"transcript_id": recognition.transcript_id})
+
+    def _submit_chunks(self, recognition: AsrRecognitionData) -> JobRunResult | None:
+        """
+        长 MP3 分段识别：下载音频、按帧边界切成带重叠的片段并上传，每段建一条子 recognition 和 job 并发识别，
+        再建一个依赖全部分段 job 的汇总 job，分段全部完成后由依赖释放唤醒，不轮询；本 job 随即结束。
+        未开启、不是 MP3、不够长、超过下载上限或下载 / 解析失败时返回 None，照常整段提交。
+        """
+        if (
+            self._chunk_threshold_ms <= 0
+            or self._asset_service is None
+            or recognition.parent_recognition_id is not None
+            or not recognition.object_key.lower().endswith(".mp3")
+        ):
+            return None
+        try:
+            audio = self._download_audio(recognition.audio_url)
+            chunks = split_mp3(audio, chunk_ms=self._chunk_ms, overlap_ms=self._chunk_overlap_ms) if audio else []
+        except Exception:
+            logger.exception(
+                "Failed to load ASR audio for chunking, submitting as a whole recognition_id=%s",
+                recognition.recognition_id,
+            )
+            return None
+        if len(chunks) < 2 or chunks[-1].end_ms <= self._chunk_threshold_ms:
+            return None
+
+        # 上一次执行中途失败时，已建好的段不再重复创建。
+        existing = {row["chunk_index"] for row in self._repository.list_chunks(recognition.recognition_id)}
+        for index, chunk in enumerate(chunks):
+            if index not in existing:
+                self._create_chunk_recognition(recognition, index=index, chunk=chunk)
+        chunk_job_ids = [str(row["job_id"]) for row in self._repository.list_chunks(recognition.recognition_id)]
+        collect_payload = {"recognition_id": recognition.recognition_id, "collect_chunks": True}
+        collect_job = self._job_service.create_job(
+            job_type=AsrJobHandler.job_type,
+            entity_type="asr_recognition",
+            entity_id=recognition.recognition_id,
+            payload=collect_payload,
+            dedup_key=JobService.build_dedup_key(
+                job_type=AsrJobHandler.job_type,
+                entity_type="asr_recognition",
+                entity_id=recognition.recognition_id,
+                payload=collect_payload,
+            ),
+            depends_on=chunk_job_ids,
+        )
+        chunked = AsrRecognitionData.from_row(
+            self._repository.mark_chunked(
+                recognition_id=recognition.recognition_id,
+                chunk_count=len(chunks),
+                job_id=collect_job.job_id,
+            )
+        )
+        logger.info(
+            "ASR recognition split into chunks recognition_id=%s chunk_count=%s duration_ms=%s collect_job_id=%s",
+            recognition.recognition_id,
+            len(chunks),
+            chunks[-1].end_ms,
+            collect_job.job_id,
+        )
+        # 标记分段之前已经失败的段不会回写父 recognition，这里补一次；之后失败的段由 _fail_chunk_parent 处理。
+        failed = self._first_failed_chunk(chunked)
+        if failed is not None:
+            self._fail_chunk_parent(failed)
+        # 不带 transcript_id：识别完成的 follow-up（自动 revision）由汇总 job 完成时触发。
+        return JobRunResult(
+            status=JobStatus.COMPLETED,
+            progress=100,
+            result={"chunk_count": len(chunks), "collect_job_id": collect_job.job_id},
+        )
+
+    def _download_audio(self, audio_url: str) -> bytes | None:
+        """流式下载原音频，超过 audio_download_max_bytes 时中止并返回 None。"""
+        client = get_http_client("asr_audio", timeout=self._audio_download_timeout)
+        with client.stream("GET", audio_url) as response:
+            response.raise_for_status()
+            content_length = int(response.headers.get("content-length") or 0)
+            if content_length > self._audio_download_max_bytes:
+                return None
+            parts: list[bytes] = []
+            received = 0
+            for part in response.iter_bytes():
+                received += len(part)
+                if received > self._audio_download_max_bytes:
+                    return None
+                parts.append(part)
+        return b"".join(parts)
+
+    def _create_chunk_recognition(self, recognition: AsrRecognitionData, *, index: int, chunk: Mp3Chunk) -> None:
+        assert self._asset_service is not None
+        asset = self._asset_service.save_generated_asset(
+            category="asr_chunk",
+            entity_id=recognition.recognition_id,
+            filename=f"chunk-{index:03d}.mp3",
+            content_type="audio/mpeg",
+            data=chunk.data,
+        )
+        self._create_recognition_with_job(
+            source_type="asr_chunk",
+            object_key=str(asset["object_key"]),
+            audio_url=str(asset["asset_url"]),
+            target_language=recognition.target_language,
+            parent_recognition_id=recognition.recognition_id,
+            chunk_index=index,
+            chunk_start_ms=chunk.start_ms,
+            chunk_end_ms=chunk.end_ms,
+        )
+
+    def _collect_chunks(self, recognition: AsrRecognitionData) -> JobRunResult:
+        """
+        汇总 job：依赖全部分段 job，分段全部完成后才会被 claim。按时间偏移拼接、去掉重叠区的重复 utterance。
+        拆分 job 在标记分段后被重试时也会走到这里，此时分段尚未完成，直接结束，汇总仍交给汇总 job。
+        """
+        chunks = [AsrRecognitionData.from_row(row) for row in self._repository.list_chunks(recognition.recognition_id)]
+        failed = next((item for item in chunks if item.status == int(AsrRecognitionStatus.FAILED)), None)
+        if failed is not None:
+            return self._mark_recognition_failed(
+                recognition,
+                error_code="CHUNK_RECOGNITION_FAILED",
+                error_message=f"chunk {failed.chunk_index} failed: {failed.error_code}: {failed.error_message}",
+            )
+        completed = sum(1 for item in chunks if item.status == int(AsrRecognitionStatus.COMPLETED))
+        if completed < recognition.chunk_count:
+            return JobRunResult(status=JobStatus.COMPLETED, progress=100, result={"chunk_count": recognition.chunk_count})
+
+        try:
+            self._transcript_service.mark_completed_from_chunks(
+                transcript_id=recognition.transcript_id,
+                chunks=[
+                    TranscriptChunk(
+                        transcript_id=item.transcript_id,
+                        start_ms=item.chunk_start_ms or 0,
+                        end_ms=item.chunk_end_ms or 0,
+                    )
+                    for item in chunks
+                ],
+                raw_result={
+                    "chunks": [
+                        {
+                            "recognition_id": item.recognition_id,
+                            "transcript_id": item.transcript_id,
+                            "start_ms": item.chunk_start_ms,
+                            "end_ms": item.chunk_end_ms,
+                        }
+                        for item in chunks
+                    ]
+                },
+            )
+        except ValueError as exc:
+            return self._mark_recognition_failed(recognition, error_code="CHUNK_STITCH_FAILED", error_message=str(exc))
+        self._repository.mark_completed(
+            recognition_id=recognition.recognition_id,
+            provider_status_code=None,
+            provider_message=f"{len(chunks)} chunks completed",
+            x_tt_logid=None,
+        )
+        self._publish_transcript_changed(recognition.transcript_id)
+        return JobRunResult(status=JobStatus.COMPLETED, progress=100, result={"transcript_id": recognition.transcript_id})
+
+    def _mark_recognition_failed(
+        self,
+        recognition: AsrRecognitionData,
+        *,
+        error_code: str,
+        error_message: str | None,
+        provider_status_code: str | None = None,
+        provider_message: str | None = None,
+        x_tt_logid: str | None = None,
+    ) -> JobRunResult:
+        self._repository.mark_failed(
+            recognition_id=recognition.recognition_id,
+            error_code=error_code,
+            error_message=error_message,
+            provider_status_code=provider_status_code,
+            provider_message=provider_message,
+            x_tt_logid=x_tt_logid,
+        )
+        self._transcript_service.mark_failed(
+            transcript_id=recognition.transcript_id,
+            error_code=error_code,
+            error_message=error_message,
+        )
+        self._publish_transcript_changed(recognition.transcript_id)
+        if recognition.parent_recognition_id:
+            self._fail_chunk_parent(
+                recognition.model_copy(update={"error_code": error_code, "error_message": error_message})
+            )
+        return JobRunResult(status=JobStatus.FAILED, error_code=error_code, error_message=error_message)
+
+    def _fail_chunk_parent(self, chunk: AsrRecognitionData) -> None:
+        """
+        任一段失败则整条失败：汇总 job 的上游失败后会被级联取消，不会再执行，父 recognition 在这里直接标记失败。
+        父 recognition 还没标记分段时跳过，由 _submit_chunks 标记后补查。
+        """
+        row = self._repository.get_recognition_by_id(str(chunk.parent_recognition_id))
+        if row is None:
+            return
+        parent = AsrRecognitionData.from_row(row)
+        if not parent.chunk_count or self._is_terminal(parent):
+            return
+        self._mark_recognition_failed(
+            parent,
+            error_code="CHUNK_RECOGNITION_FAILED",
+            error_message=f"chunk {chunk.chunk_index} failed: {chunk.error_code}: {chunk.error_message}",
+        )
+
+    def _first_failed_chunk(self, recognition: AsrRecognitionData) -> AsrRecognitionData | None:
+        for row in self._repository.list_chunks(recognition.recognition_id):
+            if int(row["status"]) == int(AsrRecognitionStatus.FAILED):
+                return AsrRecognitionData.from_row(row)
+        return None
+
+    async def run_recognition_job_async(self, *, recognition_id: str) -> JobRunResult:
+        """
+        异步版本：只有 provider 查询在事件循环上等待，数据库读写仍放到线程里，
+        轮询中的 recognition 不再长时间占用 job-runner 线程。
+        """
+        recognition = await asyncio.to_thread(self.get_recognition, recognition_id=recognition_id)
+        if self._is_terminal(recognition):
+            return await asyncio.to_thread(self.run_recognition_job, recognition_id=recognition_id)
+        if recognition.chunk_count:
+            return await asyncio.to_thread(self._collect_chunks, recognition)
+        if not recognition.provider_request_id:
+            return await asyncio.to_thread(self._submit_recognition, recognition)
+
+        try:
+            query_result = await self._query_provider_async(self._build_query_ref(recognition))
+        except Exception as exc:
+            return await asyncio.to_thread(self._mark_query_error, recognition, exc)
+        return await asyncio.to_thread(self._apply_query_result, recognition, query_result)
+
+    async def run_recognition_jobs_async(self, *, recognition_ids: Sequence[str]) -> list[JobRunResult]:
+        """
+        批量轮询：一次读出全部 recognition，provider 查询在事件循环上并发（最多 poll_concurrency 个，
+        共享连接池），仍在排队 / 识别中的结果用一条批量 UPDATE 写回；提交、完成、失败等少数情况逐条处理。
+        返回结果与 recognition_ids 一一对应。
+        """
+        rows = await asyncio.to_thread(self._repository.get_recognitions_by_ids, recognition_ids)
+        results: dict[int, JobRunResult] = {}
+        pollable: list[tuple[int, AsrRecognitionData]] = []
+        individual: list[int] = []
+        for index, recognition_id in enumerate(recognition_ids):
+            row = rows.get(recognition_id)
+            recognition = AsrRecognitionData.from_row(row) if row is not None else None
+            if recognition is None or not recognition.provider_request_id or self._is_terminal(recognition):
+                individual.append(index)
+            else:
+                pollable.append((index, recognition))
+
+        semaphore = asyncio.Semaphore(self._poll_concurrency)
+
+        async def _run_one(recognition_id: str) -> JobRunResult:
+            # 批内单条出错只影响这一条，不让整批 job 失败。
+            async with semaphore:
+                try:
+                    return await self.run_recognition_job_async(recognition_id=recognition_id)
+                except Exception as exc:
+                    logger.exception("ASR recognition job failed recognition_id=%s", recognition_id)
+                    return JobRunResult(status=JobStatus.FAILED, error_code="JOB_HANDLER_ERROR", error_message=str(exc))
+
+        individual_results = await asyncio.gather(*(_run_one(recognition_ids[index]) for index in individual))
+        results.update(zip(individual, individual_results))
+
+        async def _query(recognition: AsrRecognitionData) -> AsrQueryResult | Exception:
+            async with semaphore:
+                try:
+                    return await self._query_provider_async(self._build_query_ref(recognition))
+                except Exception as exc:
+                    return exc
+
+        outcomes = await asyncio.gather(*(_query(recognition) for _, recognition in pollable))
+        results.update(await asyncio.to_thread(self._apply_query_results, pollable, outcomes))
+        return [results[index] for index in range(len(recognition_ids))]
+
+    def _apply_query_results(
+        self,
+        pollable: Sequence[tuple[int, AsrRecognitionData]],
+        outcomes: Sequence[AsrQueryResult | Exception],
+    ) -> dict[int, JobRunResult]:
+        results: dict[int, JobRunResult] = {}
+        pending: list[AsrPollUpdate] = []
+        for (index, recognition), outcome in zip(pollable, outcomes):
+            if isinstance(outcome, Exception):
+                results[index] = self._mark_query_error(recognition, outcome)
+            elif outcome.status in (AsrJobStatus.QUEUED, AsrJobStatus.PROCESSING):
+                next_poll_at = self._next_poll_time(poll_count=int(recognition.poll_count) + 1)
+                pending.append(
+                    AsrPollUpdate(
+                        recognition_id=recognition.recognition_id,
+                        provider_status_code=outcome.provider_status_code,
+                        provider_message=outcome.provider_message,
+                        x_tt_logid=outcome.x_tt_logid,
+                        next_poll_at=next_poll_at,
+                    )
+                )
+                results[index] = JobRunResult(status=JobStatus.RUNNING, progress=50, next_run_at=next_poll_at)
+            else:
+                results[index] = self._apply_query_result(recognition, outcome)
+        called_back = self._repository.mark_processing_many(items=pending)
+        if called_back:
+            now = datetime.now(timezone.utc)
+            for index, recognition in pollable:
+                if recognition.recognition_id in called_back:
+                    results[index] = JobRunResult(status=JobStatus.RUNNING, progress=50, next_run_at=now)
+        return results
+
+    async def _query_provider_async(self, query_ref: AsrJobRef) -> AsrQueryResult:
+        query_async = getattr(self._provider, "query_async", None)
+        if query_async is not None:
+            return await query_async(query_ref)
+        return await asyncio.to_thread(self._provider.query, query_ref)
+
     def _query_recognition(self, recognition: AsrRecognitionData) -> JobRunResult:
-        query_ref = AsrJobRef(
+        try:
+            query_result = self._provider.query(self._build_query_ref(recognition))
+        except Exception as exc:
+            return self._mark_query_error(recognition, exc)
+        return self._apply_query_result(recognition, query_result)
+
+    @staticmethod
+    def _build_query_ref(recognition: AsrRecognitionData) -> AsrJobRef:
+        return AsrJobRef(
             recognition_id=recognition.recognition_id,
             provider=recognition.provider,
             provider_request_id=recognition.provider_request_id or "",
             provider_resource_id=recognition.provider_resource_id,
             x_tt_logid=recognition.x_tt_logid,
         )
-        try:
-            query_result = self._provider.query(query_ref)
-        except Exception as exc:
-            self._repository.mark_failed(
-                recognition_id=recognition.recognition_id,
-                error_code="PROVIDER_QUERY_ERROR",
-                error_message=str(exc),
-            )
-            self._transcript_service.mark_failed(
-                transcript_id=recognition.transcript_id,
-                error_code="PROVIDER_QUERY_ERROR",
-                error_message=str(exc),
-            )
-            return JobRunResult(status=JobStatus.FAILED, error_code="PROVIDER_QUERY_ERROR", error_message=str(exc))
 
+    def _mark_query_error(self, recognition: AsrRecognitionData, exc: Exception) -> JobRunResult:
+        return self._mark_recognition_failed(recognition, error_code="PROVIDER_QUERY_ERROR", error_message=str(exc))
+
+    def _apply_query_result(self, recognition: AsrRecognitionData, query_result: AsrQueryResult) -> JobRunResult:
         if query_result.status in (AsrJobStatus.QUEUED, AsrJobStatus.PROCESSING):
-            next_poll_at = self._next_poll_time(poll_count=int(recognition.poll_count) + 1)
-            self._repository.mark_processing(
+            row = self._repository.mark_processing(
                 recognition_id=recognition.recognition_id,
                 provider_status_code=query_result.provider_status_code,
                 provider_message=query_result.provider_message,
                 x_tt_logid=query_result.x_tt_logid,
-                next_poll_at=next_poll_at,
+                next_poll_at=self._next_poll_time(poll_count=int(recognition.poll_count) + 1),
             )
+            # 轮询期间回调已到时，repo 已把 next_poll_at 改为现在。
+            next_poll_at = row["next_poll_at"]
+            if next_poll_at.tzinfo is None:
+                next_poll_at = next_poll_at.replace(tzinfo=timezone.utc)
             return JobRunResult(status=JobStatus.RUNNING, progress=50, next_run_at=next_poll_at)
 
         if query_result.status == AsrJobStatus.FAILED:
             error_code = query_result.error_code or "PROVIDER_RECOGNITION_FAILED"
             error_message = query_result.error_message or query_result.provider_message
-            self._repository.mark_failed(
-                recognition_id=recognition.recognition_id,
+            return self._mark_recognition_failed(
+                recognition,
                 error_code=error_code,
                 error_message=error_message,
                 provider_status_code=query_result.provider_status_code,
                 provider_message=query_result.provider_message,
                 x_tt_logid=query_result.x_tt_logid,
             )
-            self._transcript_service.mark_failed(
-                transcript_id=recognition.transcript_id,
-                error_code=error_code,
-                error_message=error_message,
-            )
-            return JobRunResult(status=JobStatus.FAILED, error_code=error_code, error_message=error_message)
 
         if query_result.raw_result is None:
-            error_message = "raw_result is missing on succeeded status"
-            self._repository.mark_failed(
-                recognition_id=recognition.recognition_id,
+            return self._mark_recognition_failed(
+                recognition,
                 error_code="INVALID_PROVIDER_RESULT",
-                error_message=error_message,
+                error_message="raw_result is missing on succeeded status",
                 provider_status_code=query_result.provider_status_code,
                 provider_message=query_result.provider_message,
                 x_tt_logid=query_result.x_tt_logid,
             )
-            self._transcript_service.mark_failed(
-                transcript_id=recognition.transcript_id,
-                error_code="INVALID_PROVIDER_RESULT",
-                error_message=error_message,
-            )
-            return JobRunResult(status=JobStatus.FAILED, error_code="INVALID_PROVIDER_RESULT", error_message=error_message)
 
         self._transcript_service.mark_completed(
             transcript_id=recognition.transcript_id,
@@ -243,6 +661,10 @@ class AsrService:
             full_text=query_result.full_text,
             duration_ms=query_result.duration_ms,
             raw_result=query_result.raw_result,
+            # 同一 transcript 可能被再次完成（写入 transcript 后丢失租约、job 重试重新识别），
+            # 按 seq 只改动变化的行；新 transcript 没有旧行，等同批量插入。
+            diff=True,
+            include_utterances=False,
         )
         self._repository.mark_completed(
             recognition_id=recognition.recognition_id,
@@ -250,15 +672,48 @@ class AsrService:
             provider_message=query_result.provider_message,
             x_tt_logid=query_result.x_tt_logid,
         )
-        return JobRunResult(status=JobStatus.COMPLETED, progress=100)
+        self._publish_transcript_changed(recognition.transcript_id)
+        # transcript_id 供 follow-up（自动 revision）定位 session。
+        return JobRunResult(status=JobStatus.COMPLETED, progress=100, result={"transcript_id": recognition.transcript_id})
+
+    def _publish_transcript_changed(self, transcript_id: str) -> None:
+        if self._event_broadcaster is not None:
+            self._event_broadcaster.publish_entity_changed(entity_type="transcript", entity_id=transcript_id)
 
     def _provider_name(self) -> str:
         return getattr(self._provider, "provider_name", "unknown")
 
     @staticmethod
-    def _next_poll_time(*, poll_count: int) -> datetime:
-        interval_sec = min(2 * max(1, poll_count + 1), 15)
-        return datetime.now(timezone.utc) + timedelta(seconds=interval_sec)
+    def _is_terminal(recognition: AsrRecognitionData) -> bool:
+        return recognition.status in (int(AsrRecognitionStatus.COMPLETED), int(AsrRecognitionStatus.FAILED))
+
+    def _callback_url_for(self, recognition_id: str) -> str | None:
+        if not self.callback_enabled:
+            return None
+        return f"{self._callback_url}/{recognition_id}?token={self._callback_token(recognition_id)}"
+
+    def _callback_token(self, recognition_id: str) -> str:
+        # 每个 recognition 单独签名，回调 URL 泄露也只能影响这一条。
+        return hmac.new(self._callback_secret.encode(), recognition_id.encode(), hashlib.sha256).hexdigest()
+
+    def _next_poll_time(self, *, poll_count: int) -> datetime:
+        if self.callback_enabled:
+            interval_sec: float = self._callback_fallback_poll_seconds
+        else:
+            interval_sec = self._poll_backoff_seconds(poll_count)
+        return self._align_poll_time(datetime.now(timezone.utc) + timedelta(seconds=interval_sec))
+
+    @staticmethod
+    def _poll_backoff_seconds(poll_count: int) -> float:
+        return min(2 * max(1, poll_count + 1), 15)
+
+    def _align_poll_time(self, next_poll_at: datetime) -> datetime:
+        if self._poll_window_seconds <= 0:
+            return next_poll_at
+        # 向上对齐到轮询窗口：同一窗口内到期的 recognition 由 scheduler 一次 claim、合成一批查询。
+        window = self._poll_window_seconds
+        aligned = math.ceil(next_poll_at.timestamp() / window) * window
+        return datetime.fromtimestamp(aligned, tz=timezone.utc)
 
 
 class AsrJobHandler:
@@ -268,11 +723,34 @@ class AsrJobHandler:
         self._asr_service = asr_service
 
     def run(self, job: JobData) -> JobRunResult:
-        recognition_id = str(job.payload.get("recognition_id") or job.entity_id or "").strip()
+        recognition_id = self._recognition_id(job)
         if not recognition_id:
-            return JobRunResult(
-                status=JobStatus.FAILED,
-                error_code="MISSING_RECOGNITION_ID",
-                error_message="recognition_id is required",
-            )
+            return self._missing_recognition_id()
         return self._asr_service.run_recognition_job(recognition_id=recognition_id)
+
+    async def run_async(self, job: JobData) -> JobRunResult:
+        recognition_id = self._recognition_id(job)
+        if not recognition_id:
+            return self._missing_recognition_id()
+        return await self._asr_service.run_recognition_job_async(recognition_id=recognition_id)
+
+    async def run_batch_async(self, jobs: Sequence[JobData]) -> list[JobRunResult]:
+        recognition_ids = [self._recognition_id(job) for job in jobs]
+        valid_ids = [recognition_id for recognition_id in recognition_ids if recognition_id]
+        batch_results = iter(await self._asr_service.run_recognition_jobs_async(recognition_ids=valid_ids))
+        return [
+            next(batch_results) if recognition_id else self._missing_recognition_id()
+            for recognition_id in recognition_ids
+        ]
+
+    @staticmethod
+    def _recognition_id(job: JobData) -> str:
+        return str(job.payload.get("recognition_id") or job.entity_id or "").strip()
+
+    @staticmethod
+    def _missing_recognition_id() -> JobRunResult:
+        return JobRunResult(
+            status=JobStatus.FAILED,
+            error_code="MISSING_RECOGNITION_ID",
+            error_message="recognition_id is required",
+        )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import datetime
 from enum import Enum, IntEnum
 from typing import Any, Protocol
 
@@ -35,6 +36,20 @@ class AsrProvider(Protocol):
         ...
 
 
+class AsyncAsrProvider(Protocol):
+    """可选的异步查询能力；AsrService 在事件循环上轮询时优先使用。"""
+
+    async def query_async(self, ref: AsrJobRef) -> AsrQueryResult:
+        ...
+
+
+class CallbackAsrProvider(Protocol):
+    """可选的回调解析能力：把 provider 推送到回调接口的请求体转换为查询结果。"""
+
+    def parse_callback(self, payload: dict[str, Any]) -> AsrQueryResult:
+        ...
+
+
 class AsrJobStatus(str, Enum):
     QUEUED = "queued"
     PROCESSING = "processing"
@@ -46,6 +61,8 @@ class AsrSubmitRequest(BaseModel):
     recognition_id: str
     audio_url: str
     language: str | None = None
+    # 识别完成后 provider 推送结果的地址；为空时只靠轮询。
+    callback_url: str | None = None
 
 
 class AsrJobRef(BaseModel):
@@ -78,6 +95,16 @@ class AsrQueryResult(BaseModel):
     x_tt_logid: str | None = None
 
 
+class AsrPollUpdate(BaseModel):
+    """批量轮询后仍未完成的 recognition，供 AsrRepository.mark_processing_many 批量写回。"""
+
+    recognition_id: str
+    provider_status_code: str | None = None
+    provider_message: str | None = None
+    x_tt_logid: str | None = None
+    next_poll_at: datetime
+
+
 class NoopAsrProvider:
     provider_name = "noop"
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
-from sqlalchemy import BigInteger, DateTime, Integer, SmallInteger, String, Text, text
+from sqlalchemy import BigInteger, DateTime, Index, Integer, SmallInteger, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from lsl.core.db import Base
@@ -10,6 +10,7 @@ from lsl.core.db import Base
 
 class AssetModel(Base):
     __tablename__ = "asset_assets"
+    __table_args__ = (Index("idx_asset_assets_content_fingerprint", "content_fingerprint"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     object_key: Mapped[str] = mapped_column(Text, nullable=False, unique=True)
@@ -19,6 +20,8 @@ class AssetModel(Base):
     content_type: Mapped[str | None] = mapped_column(String(128), nullable=True)
     file_size: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
     etag: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    # 内容指纹（sha256 hex），相同内容的重复上传据此复用 ASR 结果。
+    content_fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True)
     storage_provider: Mapped[str] = mapped_column(String(32), nullable=False)
     upload_status: Mapped[int] = mapped_column(
         SmallInteger,
@@ -35,6 +35,7 @@ class AssetRepository:
         etag: str | None,
         storage_provider: str,
         upload_status: int,
+        content_fingerprint: str | None = None,
     ) -> None:
         stmt = select(AssetModel).where(AssetModel.object_key == object_key).limit(1)
         try:
@@ -50,6 +51,8 @@ class AssetRepository:
                 model.content_type = content_type or model.content_type
                 model.file_size = file_size if file_size is not None else model.file_size
                 model.etag = etag or model.etag
+                # 内容可能已被重新上传覆盖，不沿用旧指纹。
+                model.content_fingerprint = content_fingerprint
                 model.storage_provider = storage_provider
                 model.upload_status = int(upload_status)
                 db.commit()
@@ -108,6 +111,7 @@ class AssetRepository:
             "content_type": model.content_type,
             "file_size": model.file_size,
             "etag": model.etag,
+            "content_fingerprint": model.content_fingerprint,
             "upload_status": int(model.upload_status),
             "created_at": model.created_at,
         }
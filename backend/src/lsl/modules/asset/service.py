@@ -1,3 +1,4 @@
+import hashlib
 import logging
 import time
 import uuid
@@ -6,9 +7,8 @@ from pathlib import Path
 from typing import Any, Optional
 from urllib.parse import urlsplit
 
-import requests
-
 from lsl.core.config import Settings
+from lsl.core.http import get_http_client
 from lsl.modules.asset.repo import AssetRepository
 from lsl.modules.asset.types import StorageProvider
 
@@ -82,7 +82,12 @@ class AssetService:
         content_type: Optional[str],
         file_size: Optional[int],
         etag: Optional[str],
+        content_fingerprint: Optional[str] = None,
     ) -> None:
+        """
+        记录上传完成的 asset。content_fingerprint 只接受服务端自己算出的值（save_generated_asset 对内容取 sha256），
+        供 ASR 识别相同内容的重复上传；客户端上报的 ETag 和文件大小可以伪造，只原样记录，不用于生成指纹。
+        """
         if self._repository is None:
             raise RuntimeError("Asset repository is not configured. Set DATABASE_URL to enable persistence.")
 
@@ -108,8 +113,16 @@ class AssetService:
             etag=etag,
             storage_provider=self._settings.STORAGE_PROVIDER,
             upload_status=0,
+            content_fingerprint=content_fingerprint,
         )
 
+    def get_content_fingerprint(self, *, object_key: str) -> Optional[str]:
+        """asset 的内容指纹；未持久化、asset 不存在或不是服务端生成的文件时返回 None。"""
+        if self._repository is None:
+            return None
+        row = self._repository.get_asset_by_object_key(object_key=object_key)
+        return row.get("content_fingerprint") if row is not None else None
+
     def save_generated_asset(
         self,
         *,
@@ -142,11 +155,10 @@ class AssetService:
                 upload_host,
             )
             try:
-                response = requests.put(
+                response = get_http_client("asset_upload", timeout=self._settings.ASSET_PUT_TIMEOUT).put(
                     upload_url,
-                    data=data,
+                    content=data,
                     headers={"Content-Type": normalized_content_type},
-                    timeout=self._settings.ASSET_PUT_TIMEOUT,
                 )
             except Exception as exc:
                 logger.exception(
@@ -181,6 +193,7 @@ class AssetService:
             content_type=normalized_content_type,
             file_size=len(data),
             etag=etag,
+            content_fingerprint=hashlib.sha256(data).hexdigest(),
         )
         logger.info(
             "Generated asset saved object_key=%s storage_provider=%s size=%s content_type=%s",
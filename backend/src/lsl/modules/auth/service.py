@@ -9,6 +9,7 @@ from urllib.parse import urlencode
 import httpx
 
 from lsl.core.config import Settings
+from lsl.core.http import get_http_client
 from lsl.modules.auth.model import UserModel
 from lsl.modules.auth.repo import UserRepository
 from lsl.modules.auth.schema import AuthUser
@@ -121,6 +122,9 @@ class AuthService:
         if missing:
             raise RuntimeError(f"Auth is not configured: missing {', '.join(missing)}")
 
+    def _http_client(self) -> httpx.Client:
+        return get_http_client("casdoor", timeout=self._settings.CASDOOR_HTTP_TIMEOUT, trust_env=False)
+
     def _exchange_code(self, *, code: str, code_verifier: str) -> dict[str, Any]:
         payload = {
             "grant_type": "authorization_code",
@@ -131,8 +135,7 @@ class AuthService:
             "redirect_uri": self._settings.CASDOOR_REDIRECT_URI,
             "code_verifier": code_verifier,
         }
-        with httpx.Client(timeout=self._settings.CASDOOR_HTTP_TIMEOUT, trust_env=False) as client:
-            response = client.post(f"{self._casdoor_endpoint}/api/login/oauth/access_token", data=payload)
+        response = self._http_client().post(f"{self._casdoor_endpoint}/api/login/oauth/access_token", data=payload)
         if response.status_code >= 400:
             raise RuntimeError(f"Casdoor token exchange failed with status {response.status_code}")
         data = response.json()
@@ -142,11 +145,10 @@ class AuthService:
 
     def _fetch_userinfo(self, token_data: dict[str, Any]) -> dict[str, Any]:
         access_token = str(token_data["access_token"])
-        with httpx.Client(timeout=self._settings.CASDOOR_HTTP_TIMEOUT, trust_env=False) as client:
-            response = client.get(
-                f"{self._casdoor_endpoint}/api/userinfo",
-                headers={"Authorization": f"Bearer {access_token}"},
-            )
+        response = self._http_client().get(
+            f"{self._casdoor_endpoint}/api/userinfo",
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
         if response.status_code >= 400:
             raise RuntimeError(f"Casdoor userinfo request failed with status {response.status_code}")
         data = response.json()
@@ -0,0 +1,18 @@
+from lsl.modules.event.api import router
+from lsl.modules.event.broadcaster import (
+    EventBroadcaster,
+    InProcessEventBroadcaster,
+    PostgresEventBroadcaster,
+    create_event_broadcaster,
+)
+from lsl.modules.event.types import EventData, EventListener
+
+__all__ = [
+    "EventBroadcaster",
+    "EventData",
+    "EventListener",
+    "InProcessEventBroadcaster",
+    "PostgresEventBroadcaster",
+    "create_event_broadcaster",
+    "router",
+]
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from typing import cast
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+
+from lsl.core.config import Settings
+from lsl.modules.event.broadcaster import EventBroadcaster
+from lsl.modules.event.stream import stream_events
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+
+def get_event_broadcaster(request: Request) -> EventBroadcaster:
+    broadcaster = getattr(request.app.state, "event_broadcaster", None)
+    if broadcaster is None:
+        raise HTTPException(status_code=500, detail="Event broadcaster is not initialized")
+    return cast(EventBroadcaster, broadcaster)
+
+
+@router.get("")
+async def subscribe_events(
+    request: Request,
+    session_id: str | None = Query(default=None, max_length=64),
+    transcript_id: str | None = Query(default=None, max_length=64),
+    cursor: str | None = Query(default=None, max_length=64),
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID", max_length=64),
+    broadcaster: EventBroadcaster = Depends(get_event_broadcaster),
+):
+    settings = cast(Settings, request.app.state.settings)
+    # 浏览器自动重连时带 Last-Event-ID；手动重建连接时前端用 ?cursor= 传上次收到的 id。
+    resume_from = (last_event_id or cursor or "").strip() or None
+    return StreamingResponse(
+        stream_events(
+            broadcaster=broadcaster,
+            last_event_id=resume_from,
+            session_id=(session_id or "").strip() or None,
+            transcript_id=(transcript_id or "").strip() or None,
+            heartbeat_seconds=settings.EVENT_STREAM_HEARTBEAT_SECONDS,
+            queue_size=settings.EVENT_STREAM_QUEUE_SIZE,
+            is_disconnected=request.is_disconnected,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
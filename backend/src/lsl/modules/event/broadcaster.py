@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Callable, Protocol
+
+from lsl.core.config import Settings
+from lsl.modules.event.types import EventData, EventListener
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+EVENT_NOTIFY_CHANNEL = "lsl_events"
+
+# pg_notify 的 payload 上限约 8000 字节，长文本字段截断后再广播。
+_MAX_TEXT_LENGTH = 500
+
+
+class EventBroadcaster(Protocol):
+    def publish(
+        self,
+        *,
+        event_type: str,
+        data: dict[str, Any],
+        session_id: str | None = None,
+        entity_type: str | None = None,
+        entity_id: str | None = None,
+    ) -> None:
+        ...
+
+    def publish_entity_changed(
+        self,
+        *,
+        entity_type: str,
+        entity_id: str | None,
+        session_id: str | None = None,
+        action: str = "updated",
+    ) -> None:
+        ...
+
+    def subscribe(self, listener: EventListener) -> Callable[[], None]:
+        ...
+
+    def replay(self, after_event_id: str) -> list[EventData] | None:
+        ...
+
+    def close(self) -> None:
+        ...
+
+
+class InProcessEventBroadcaster:
+    """
+    进程内事件广播：
+    - SQLite / 单副本部署使用
+    - 保留最近 buffer_size 条事件，重连时按 Last-Event-ID 补发；游标已被挤出缓冲区时返回 None，前端整页重新拉取
+    - publish 永不抛异常，不影响业务流程
+    """
+
+    def __init__(self, *, buffer_size: int = 1000) -> None:
+        self._lock = threading.Lock()
+        self._listeners: list[EventListener] = []
+        self._buffer: deque[EventData] = deque(maxlen=max(1, buffer_size))
+
+    def publish(
+        self,
+        *,
+        event_type: str,
+        data: dict[str, Any],
+        session_id: str | None = None,
+        entity_type: str | None = None,
+        entity_id: str | None = None,
+    ) -> None:
+        try:
+            self._send(
+                EventData(
+                    event_id=_next_event_id(),
+                    event_type=event_type,
+                    session_id=session_id,
+                    entity_type=entity_type,
+                    entity_id=entity_id,
+                    data={key: _truncate(value) for key, value in data.items()},
+                    created_at=datetime.now(timezone.utc).isoformat(),
+                )
+            )
+        except Exception:
+            logger.exception("Failed to publish event event_type=%s", event_type)
+
+    def publish_entity_changed(
+        self,
+        *,
+        entity_type: str,
+        entity_id: str | None,
+        session_id: str | None = None,
+        action: str = "updated",
+    ) -> None:
+        self.publish(
+            event_type="entity",
+            data={"action": action},
+            session_id=session_id,
+            entity_type=entity_type,
+            entity_id=entity_id,
+        )
+
+    def subscribe(self, listener: EventListener) -> Callable[[], None]:
+        with self._lock:
+            self._listeners.append(listener)
+
+        def _unsubscribe() -> None:
+            with self._lock:
+                if listener in self._listeners:
+                    self._listeners.remove(listener)
+
+        return _unsubscribe
+
+    def replay(self, after_event_id: str) -> list[EventData] | None:
+        with self._lock:
+            events = list(self._buffer)
+        for index, event in enumerate(events):
+            if event.event_id == after_event_id:
+                return events[index + 1 :]
+        return None
+
+    def close(self) -> None:
+        with self._lock:
+            self._listeners.clear()
+
+    def _send(self, event: EventData) -> None:
+        self._dispatch(event)
+
+    def _dispatch(self, event: EventData) -> None:
+        with self._lock:
+            self._buffer.append(event)
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(event)
+            except Exception:
+                logger.exception("Event listener failed event_type=%s", event.event_type)
+
+
+class PostgresEventBroadcaster(InProcessEventBroadcaster):
+    """
+    基于 Postgres LISTEN/NOTIFY 的跨副本事件广播：
+    - publish 只入队；后台线程每 flush_interval_seconds 把队列按实体合并（同一 job / 实体只保留最新一条），
+      在一个事务里用一条 pg_notify 语句发出，不会每个事件占一次连接和事务
+    - 所有 API 副本（包括自己）按提交顺序收到并写入各自的缓冲区
+    - 独立 worker 只 publish 不 subscribe，不会启动监听线程
+    - NOTIFY 失败时退化为进程内广播
+    """
+
+    def __init__(
+        self,
+        *,
+        engine: Engine,
+        conninfo: str,
+        buffer_size: int = 1000,
+        channel: str = EVENT_NOTIFY_CHANNEL,
+        reconnect_delay_seconds: float = 5.0,
+        flush_interval_seconds: float = 0.05,
+    ) -> None:
+        super().__init__(buffer_size=buffer_size)
+        self._engine = engine
+        self._conninfo = conninfo
+        self._channel = channel
+        self._reconnect_delay_seconds = reconnect_delay_seconds
+        self._flush_interval_seconds = flush_interval_seconds
+        self._stop_event = threading.Event()
+        self._listen_thread: threading.Thread | None = None
+        self._pending_lock = threading.Lock()
+        self._pending: dict[tuple[Any, ...], EventData] = {}
+        self._flush_wakeup = threading.Event()
+        self._flush_stop = threading.Event()
+        self._flush_thread: threading.Thread | None = None
+
+    def subscribe(self, listener: EventListener) -> Callable[[], None]:
+        unsubscribe = super().subscribe(listener)
+        with self._lock:
+            if self._listen_thread is None:
+                self._stop_event.clear()
+                self._listen_thread = threading.Thread(
+                    target=self._listen_loop,
+                    name="event-notify-listener",
+                    daemon=True,
+                )
+                self._listen_thread.start()
+        return unsubscribe
+
+    def close(self) -> None:
+        self._flush_stop.set()
+        self._flush_wakeup.set()
+        flush_thread = self._flush_thread
+        if flush_thread is not None:
+            flush_thread.join(timeout=self._reconnect_delay_seconds)
+        self._flush_thread = None
+        # 关闭前把还没发出的事件发掉，避免 worker 退出时丢最后一批状态。
+        self._flush()
+        self._stop_event.set()
+        thread = self._listen_thread
+        if thread is not None:
+            thread.join(timeout=self._reconnect_delay_seconds)
+        self._listen_thread = None
+        super().close()
+
+    def _send(self, event: EventData) -> None:
+        key = _coalesce_key(event)
+        with self._pending_lock:
+            # 先删后插：合并后的事件排到队尾，保持“最新状态最后发出”的顺序。
+            self._pending.pop(key, None)
+            self._pending[key] = event
+            if self._flush_thread is None and not self._flush_stop.is_set():
+                self._flush_thread = threading.Thread(
+                    target=self._flush_loop,
+                    name="event-notify-flusher",
+                    daemon=True,
+                )
+                self._flush_thread.start()
+        self._flush_wakeup.set()
+
+    def _flush_loop(self) -> None:
+        while not self._flush_stop.is_set():
+            self._flush_wakeup.wait()
+            # 收到第一条事件后再攒一个窗口，同一实体的连续进度只发最后一次。
+            self._flush_stop.wait(self._flush_interval_seconds)
+            self._flush_wakeup.clear()
+            self._flush()
+
+    def _flush(self) -> None:
+        from sqlalchemy import text
+
+        with self._pending_lock:
+            events = list(self._pending.values())
+            self._pending.clear()
+        if not events:
+            return
+        try:
+            with self._engine.begin() as conn:
+                # unnest 保持数组顺序，一次往返发出整批 NOTIFY。
+                conn.execute(
+                    text("SELECT pg_notify(:channel, payload) FROM unnest(CAST(:payloads AS text[])) AS payload"),
+                    {"channel": self._channel, "payloads": [encode_event_payload(event) for event in events]},
+                )
+        except Exception as exc:
+            logger.warning("Failed to send event notify count=%s: %s", len(events), exc)
+            for event in events:
+                self._dispatch(event)
+
+    def _listen_loop(self) -> None:
+        import psycopg
+
+        while not self._stop_event.is_set():
+            try:
+                with psycopg.connect(self._conninfo, autocommit=True) as conn:
+                    conn.execute(f"LISTEN {self._channel}")
+                    logger.info("Event notify listener started channel=%s", self._channel)
+                    while not self._stop_event.is_set():
+                        for notify in conn.notifies(timeout=1.0):
+                            event = decode_event_payload(notify.payload)
+                            if event is not None:
+                                self._dispatch(event)
+            except Exception as exc:
+                logger.warning("Event notify listener disconnected channel=%s: %s", self._channel, exc)
+                self._stop_event.wait(self._reconnect_delay_seconds)
+
+
+def encode_event_payload(event: EventData) -> str:
+    return json.dumps(event.to_dict(), separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def decode_event_payload(payload: str) -> EventData | None:
+    try:
+        data: Any = json.loads(payload)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(data, dict) or not data.get("event_id") or not data.get("event_type"):
+        return None
+    return EventData(
+        event_id=str(data["event_id"]),
+        event_type=str(data["event_type"]),
+        session_id=data.get("session_id"),
+        entity_type=data.get("entity_type"),
+        entity_id=data.get("entity_id"),
+        data=data.get("data") if isinstance(data.get("data"), dict) else {},
+        created_at=str(data.get("created_at") or ""),
+    )
+
+
+def create_event_broadcaster(settings: Settings, engine: Engine | None) -> EventBroadcaster:
+    if engine is not None and engine.dialect.name == "postgresql":
+        conninfo = settings.DATABASE_URL
+        if conninfo.startswith("postgresql+"):
+            # psycopg 只认 postgresql://，去掉 SQLAlchemy driver 后缀。
+            conninfo = "postgresql://" + conninfo.partition("://")[2]
+        return PostgresEventBroadcaster(
+            engine=engine,
+            conninfo=conninfo,
+            buffer_size=settings.EVENT_STREAM_BUFFER_SIZE,
+            flush_interval_seconds=settings.EVENT_NOTIFY_FLUSH_SECONDS,
+        )
+    return InProcessEventBroadcaster(buffer_size=settings.EVENT_STREAM_BUFFER_SIZE)
+
+
+def _next_event_id() -> str:
+    # 纳秒时间戳（定长十六进制）+ 随机后缀：同一毫秒内多个副本发布也不会冲突。
+    return f"{time.time_ns():016x}-{uuid.uuid4().hex[:8]}"
+
+
+def _coalesce_key(event: EventData) -> tuple[Any, ...]:
+    # job 事件按 job_id 合并，实体事件按实体 + action 合并；无法定位实体的事件不合并。
+    if event.event_type == "job" and event.data.get("job_id"):
+        return ("job", event.data["job_id"])
+    if event.entity_type and event.entity_id:
+        return (event.event_type, event.entity_type, event.entity_id, event.session_id, event.data.get("action"))
+    return ("event", event.event_id)
+
+
+def _truncate(value: Any) -> Any:
+    if isinstance(value, str) and len(value) > _MAX_TEXT_LENGTH:
+        return value[:_MAX_TEXT_LENGTH]
+    return value
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from typing import AsyncIterator, Awaitable, Callable
+
+from lsl.modules.event.broadcaster import EventBroadcaster
+from lsl.modules.event.types import EventData
+
+logger = logging.getLogger(__name__)
+
+# 浏览器 EventSource 断线后的重连间隔，单位毫秒。
+SSE_RETRY_MILLISECONDS = 3000
+
+
+def format_sse(event: EventData) -> str:
+    payload = json.dumps(event.to_dict(), separators=(",", ":"), ensure_ascii=False, default=str)
+    return f"id: {event.event_id}\nevent: {event.event_type}\ndata: {payload}\n\n"
+
+
+def matches_filter(event: EventData, *, session_id: str | None, transcript_id: str | None) -> bool:
+    """未指定过滤条件时推送全部事件；同时指定时满足任一即推送。"""
+    if session_id is None and transcript_id is None:
+        return True
+    if session_id is not None and event.session_id == session_id:
+        return True
+    if transcript_id is not None and event.entity_type == "transcript" and event.entity_id == transcript_id:
+        return True
+    return False
+
+
+async def stream_events(
+    *,
+    broadcaster: EventBroadcaster,
+    last_event_id: str | None = None,
+    session_id: str | None = None,
+    transcript_id: str | None = None,
+    heartbeat_seconds: float = 15.0,
+    queue_size: int = 256,
+    is_disconnected: Callable[[], Awaitable[bool]] | None = None,
+) -> AsyncIterator[str]:
+    """
+    生成 SSE 帧：
+    - 先订阅再补发 last_event_id 之后的缓冲事件，两者重叠的事件按 event_id 去重
+    - 游标已不在缓冲区时先发一条 `reset`，前端整页重新拉取
+    - 广播回调来自任意线程，经 call_soon_threadsafe 投递到当前事件循环
+    - 队列溢出（客户端消费过慢）时结束流，由浏览器带 Last-Event-ID 重连
+    """
+    loop = asyncio.get_running_loop()
+    # 多留一个位置放溢出哨兵。
+    queue: asyncio.Queue[EventData | None] = asyncio.Queue(maxsize=queue_size + 1)
+    overflowed = False
+
+    def _enqueue(event: EventData) -> None:
+        nonlocal overflowed
+        if overflowed:
+            return
+        if queue.qsize() >= queue_size:
+            overflowed = True
+            queue.put_nowait(None)
+            return
+        queue.put_nowait(event)
+
+    def _listener(event: EventData) -> None:
+        if not matches_filter(event, session_id=session_id, transcript_id=transcript_id):
+            return
+        try:
+            loop.call_soon_threadsafe(_enqueue, event)
+        except RuntimeError:
+            # 事件循环已关闭，连接即将清理。
+            pass
+
+    unsubscribe = broadcaster.subscribe(_listener)
+    try:
+        yield f"retry: {SSE_RETRY_MILLISECONDS}\n\n"
+        replayed_ids: set[str] = set()
+        if last_event_id:
+            replayed = broadcaster.replay(last_event_id)
+            if replayed is None:
+                yield "event: reset\ndata: {}\n\n"
+            else:
+                for event in replayed:
+                    if matches_filter(event, session_id=session_id, transcript_id=transcript_id):
+                        replayed_ids.add(event.event_id)
+                        yield format_sse(event)
+
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=heartbeat_seconds)
+            except asyncio.TimeoutError:
+                if is_disconnected is not None and await is_disconnected():
+                    return
+                yield ": ping\n\n"
+                continue
+            if event is None:
+                logger.warning("Event stream queue overflowed, closing connection session_id=%s", session_id)
+                return
+            if event.event_id in replayed_ids:
+                replayed_ids.discard(event.event_id)
+                continue
+            yield format_sse(event)
+    finally:
+        unsubscribe()
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable
+
+
+@dataclass(frozen=True, slots=True)
+class EventData:
+    """
+    推送给前端的一条事件：
+    - event_type：`job`（job 状态 / 进度）或 `entity`（业务实体已变化，前端按需重新拉取）
+    - event_id：单调递增的游标，断线重连时通过 Last-Event-ID 续传
+    """
+
+    event_id: str
+    event_type: str
+    session_id: str | None = None
+    entity_type: str | None = None
+    entity_id: str | None = None
+    data: dict[str, Any] = field(default_factory=dict)
+    created_at: str = ""
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+EventListener = Callable[[EventData], None]
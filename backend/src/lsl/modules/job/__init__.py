@@ -1,15 +1,33 @@
 from lsl.modules.job import model as _model
 from lsl.modules.job.api import router
+from lsl.modules.job.notifier import InProcessJobNotifier, JobNotifier, PostgresJobNotifier, create_job_notifier
 from lsl.modules.job.repo import JobRepository
 from lsl.modules.job.service import JobService
-from lsl.modules.job.types import JobData, JobHandler, JobRunResult, JobStatus
+from lsl.modules.job.types import (
+    AsyncJobHandler,
+    BatchJobHandler,
+    JobData,
+    JobHandler,
+    JobLeaseLostError,
+    JobRunResult,
+    JobSpec,
+    JobStatus,
+)
 
 __all__ = [
+    "AsyncJobHandler",
+    "BatchJobHandler",
+    "InProcessJobNotifier",
     "JobData",
     "JobHandler",
+    "JobLeaseLostError",
+    "JobNotifier",
     "JobRepository",
     "JobRunResult",
     "JobService",
+    "JobSpec",
     "JobStatus",
+    "PostgresJobNotifier",
+    "create_job_notifier",
     "router",
 ]
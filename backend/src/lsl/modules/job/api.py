@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import cast
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
 
 from lsl.modules.job.schema import (
     ApiResponse,
@@ -27,8 +27,19 @@ def get_job_service(request: Request) -> JobService:
 @router.post("", response_model=ApiResponse[JobData])
 def create_job(
     payload: CreateJobRequest,
+    idempotency_key: str | None = Header(default=None, alias="Idempotency-Key", max_length=255),
     job_service: JobService = Depends(get_job_service),
 ):
+    dedup_key: str | None = None
+    if idempotency_key and idempotency_key.strip():
+        dedup_key = JobService.build_dedup_key(job_type=payload.job_type, idempotency_key=idempotency_key.strip())
+    elif payload.dedup:
+        dedup_key = JobService.build_dedup_key(
+            job_type=payload.job_type,
+            entity_type=payload.entity_type,
+            entity_id=payload.entity_id,
+            payload=payload.payload,
+        )
     try:
         job = job_service.create_job(
             job_type=payload.job_type,
@@ -38,6 +49,8 @@ def create_job(
             priority=payload.priority,
             max_attempts=payload.max_attempts,
             next_run_at=payload.next_run_at,
+            dedup_key=dedup_key,
+            depends_on=payload.depends_on,
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable
+
+from lsl.core.metrics import REGISTRY
+
+if TYPE_CHECKING:
+    from lsl.modules.job.service import JobService
+
+# 长任务（TTS / Revision）可达数分钟，run 时长 bucket 覆盖到 30 分钟。
+RUN_DURATION_BUCKETS: tuple[float, ...] = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0)
+
+JOB_CLAIM_DURATION = REGISTRY.histogram(
+    "lsl_job_claim_duration_seconds",
+    "Latency of the due job claim query per scheduler lane.",
+    ("lane",),
+)
+JOB_CLAIMED = REGISTRY.counter(
+    "lsl_job_claimed_total",
+    "Jobs claimed by the scheduler.",
+    ("lane", "job_type"),
+)
+JOB_RUN_DURATION = REGISTRY.histogram(
+    "lsl_job_run_duration_seconds",
+    "Wall time of one handler run including the state transition.",
+    ("job_type",),
+    buckets=RUN_DURATION_BUCKETS,
+)
+JOB_OUTCOMES = REGISTRY.counter(
+    "lsl_job_outcomes_total",
+    "Handler run outcomes: completed, failed, canceled, superseded, rescheduled, lease_lost.",
+    ("job_type", "outcome"),
+)
+JOB_RUNNER_IN_FLIGHT = REGISTRY.gauge(
+    "lsl_job_runner_in_flight",
+    "Jobs currently executing per scheduler lane.",
+    ("lane",),
+)
+JOB_RUNNER_CAPACITY = REGISTRY.gauge(
+    "lsl_job_runner_capacity",
+    "Maximum concurrent jobs per scheduler lane; saturation = in_flight / capacity.",
+    ("lane",),
+)
+
+# 队列深度 / lag 在抓取时从数据库读取，由 bootstrap 绑定当前进程的 JobService。
+_queue_source: JobService | None = None
+
+
+def bind_job_queue_metrics(job_service: JobService | None) -> None:
+    global _queue_source
+    _queue_source = job_service
+
+
+def _collect_queue_depth() -> Iterable[tuple[dict[str, str], float]]:
+    source = _queue_source
+    if source is None:
+        return []
+    return [
+        ({"job_type": job_type, "status": status_name}, float(count))
+        for job_type, status_name, count in source.queue_depth()
+    ]
+
+
+def _collect_queue_lag() -> Iterable[tuple[dict[str, str], float]]:
+    source = _queue_source
+    if source is None:
+        return []
+    return [({"job_type": job_type}, seconds) for job_type, seconds in source.queue_lag_seconds().items()]
+
+
+JOB_QUEUE_DEPTH = REGISTRY.gauge(
+    "lsl_job_queue_depth",
+    "Non-terminal jobs per job_type and status.",
+    ("job_type", "status"),
+    collector=_collect_queue_depth,
+)
+JOB_QUEUE_LAG = REGISTRY.gauge(
+    "lsl_job_queue_lag_seconds",
+    "Age of the oldest due and unclaimed job per job_type.",
+    ("job_type",),
+    collector=_collect_queue_lag,
+)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, Index, Integer, SmallInteger, String, Text, text
+from sqlalchemy import Boolean, DateTime, Index, Integer, SmallInteger, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from lsl.core.db import Base
@@ -16,6 +16,22 @@ class JobModel(Base):
         Index("idx_job_jobs_type_status_next_run_at", "job_type", "x_status", "next_run_at"),
         Index("idx_job_jobs_entity", "entity_type", "entity_id"),
         Index("idx_job_jobs_created_at", "created_at"),
+        # 只索引终态 job，retention 按 finished_at 分批扫描时不触碰可运行 job。
+        Index(
+            "idx_job_jobs_terminal_finished_at",
+            "finished_at",
+            postgresql_where=text("x_status IN (2, 3, 4)"),
+            sqlite_where=text("x_status IN (2, 3, 4)"),
+        ),
+        # 同一 job_type 下同一 dedup_key 最多只有一个可运行 job，并发重复创建由数据库兜底。
+        Index(
+            "uq_job_jobs_type_dedup_key_active",
+            "job_type",
+            "dedup_key",
+            unique=True,
+            postgresql_where=text("x_status IN (0, 1) AND dedup_key IS NOT NULL"),
+            sqlite_where=text("x_status IN (0, 1) AND dedup_key IS NOT NULL"),
+        ),
     )
 
     job_id: Mapped[str] = mapped_column(UUIDHexString(), primary_key=True)
@@ -27,6 +43,11 @@ class JobModel(Base):
     progress: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
     attempts: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
     max_attempts: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("3"))
+    dedup_key: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    # 尚未完成的上游 job 数；大于 0 时 scheduler 不会 claim。
+    pending_dependencies: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default=text("0"))
+    # 是否有下游 job 依赖本 job；只有为 true 时终态迁移才去处理依赖表。
+    has_dependents: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False, server_default=text("false"))
     payload_json: Mapped[dict] = mapped_column(
         JSONString(),
         nullable=False,
@@ -54,3 +75,61 @@ class JobModel(Base):
         onupdate=lambda: datetime.now(timezone.utc),
         server_default=text("CURRENT_TIMESTAMP"),
     )
+
+
+class JobDependencyModel(Base):
+    """
+    job 依赖边：job_id 在 parent_job_id 完成后才可运行。
+    - 上游完成时下游 pending_dependencies 减一，减到 0 即到期
+    - 上游失败 / 取消时仍在排队的下游级联取消
+    """
+
+    __tablename__ = "job_job_dependencies"
+    __table_args__ = (Index("idx_job_job_dependencies_parent_job_id", "parent_job_id"),)
+
+    job_id: Mapped[str] = mapped_column(UUIDHexString(), primary_key=True)
+    parent_job_id: Mapped[str] = mapped_column(UUIDHexString(), primary_key=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        server_default=text("CURRENT_TIMESTAMP"),
+    )
+
+
+class JobArchiveModel(Base):
+    """
+    已归档的终态 job：
+    - retention 从 job_jobs 分批搬入，热表只保留近期和可运行的 job
+    - Postgres 部署使用 initdb 中按 finished_at 分区的同名表，过期分区可直接 DROP
+    """
+
+    __tablename__ = "job_jobs_archive"
+    __table_args__ = (
+        Index("idx_job_jobs_archive_finished_at", "finished_at"),
+        Index("idx_job_jobs_archive_entity", "entity_type", "entity_id"),
+    )
+
+    job_id: Mapped[str] = mapped_column(UUIDHexString(), primary_key=True)
+    job_type: Mapped[str] = mapped_column(String(64), nullable=False)
+    status: Mapped[int] = mapped_column("x_status", SmallInteger, nullable=False)
+    entity_type: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    entity_id: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    priority: Mapped[int] = mapped_column(Integer, nullable=False)
+    progress: Mapped[int] = mapped_column(Integer, nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False)
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False)
+    payload_json: Mapped[dict] = mapped_column(JSONString(), nullable=False)
+    result_json: Mapped[dict | None] = mapped_column(JSONString(), nullable=True)
+    error_code: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        server_default=text("CURRENT_TIMESTAMP"),
+    )
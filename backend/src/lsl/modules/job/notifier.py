@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable, Protocol
+
+from lsl.core.config import Settings
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+JOB_NOTIFY_CHANNEL = "lsl_job_wakeup"
+
+JobWakeupListener = Callable[[str, datetime | None], None]
+
+
+class JobNotifier(Protocol):
+    def notify(self, *, job_type: str, next_run_at: datetime | None = None) -> None:
+        ...
+
+    def subscribe(self, listener: JobWakeupListener) -> Callable[[], None]:
+        ...
+
+    def close(self) -> None:
+        ...
+
+
+class InProcessJobNotifier:
+    """
+    进程内 job 唤醒通知：
+    - SQLite / 测试环境使用
+    - notify 同步回调当前进程内所有订阅者
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._listeners: list[JobWakeupListener] = []
+
+    def notify(self, *, job_type: str, next_run_at: datetime | None = None) -> None:
+        self._dispatch(job_type, next_run_at)
+
+    def subscribe(self, listener: JobWakeupListener) -> Callable[[], None]:
+        with self._lock:
+            self._listeners.append(listener)
+
+        def _unsubscribe() -> None:
+            with self._lock:
+                if listener in self._listeners:
+                    self._listeners.remove(listener)
+
+        return _unsubscribe
+
+    def close(self) -> None:
+        with self._lock:
+            self._listeners.clear()
+
+    def _dispatch(self, job_type: str, next_run_at: datetime | None) -> None:
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(job_type, next_run_at)
+            except Exception:
+                logger.exception("Job wakeup listener failed job_type=%s", job_type)
+
+
+class PostgresJobNotifier(InProcessJobNotifier):
+    """
+    基于 Postgres LISTEN/NOTIFY 的跨副本 job 唤醒：
+    - notify 通过 pg_notify 广播，所有副本（包括自己）都会收到
+    - 首次 subscribe 时启动后台线程，用独立连接 LISTEN
+    - NOTIFY 失败时退化为进程内通知，其余副本依赖兜底轮询
+    """
+
+    def __init__(
+        self,
+        *,
+        engine: Engine,
+        conninfo: str,
+        channel: str = JOB_NOTIFY_CHANNEL,
+        reconnect_delay_seconds: float = 5.0,
+    ) -> None:
+        super().__init__()
+        self._engine = engine
+        self._conninfo = conninfo
+        self._channel = channel
+        self._reconnect_delay_seconds = reconnect_delay_seconds
+        self._stop_event = threading.Event()
+        self._listen_thread: threading.Thread | None = None
+
+    def notify(self, *, job_type: str, next_run_at: datetime | None = None) -> None:
+        from sqlalchemy import text
+
+        payload = encode_job_notify_payload(job_type=job_type, next_run_at=next_run_at)
+        try:
+            with self._engine.begin() as conn:
+                conn.execute(
+                    text("SELECT pg_notify(:channel, :payload)"),
+                    {"channel": self._channel, "payload": payload},
+                )
+        except Exception as exc:
+            logger.warning("Failed to send job notify job_type=%s: %s", job_type, exc)
+            self._dispatch(job_type, next_run_at)
+
+    def subscribe(self, listener: JobWakeupListener) -> Callable[[], None]:
+        unsubscribe = super().subscribe(listener)
+        with self._lock:
+            if self._listen_thread is None:
+                self._stop_event.clear()
+                self._listen_thread = threading.Thread(
+                    target=self._listen_loop,
+                    name="job-notify-listener",
+                    daemon=True,
+                )
+                self._listen_thread.start()
+        return unsubscribe
+
+    def close(self) -> None:
+        self._stop_event.set()
+        thread = self._listen_thread
+        if thread is not None:
+            thread.join(timeout=self._reconnect_delay_seconds)
+        self._listen_thread = None
+        super().close()
+
+    def _listen_loop(self) -> None:
+        import psycopg
+
+        while not self._stop_event.is_set():
+            try:
+                with psycopg.connect(self._conninfo, autocommit=True) as conn:
+                    conn.execute(f"LISTEN {self._channel}")
+                    logger.info("Job notify listener started channel=%s", self._channel)
+                    while not self._stop_event.is_set():
+                        for notify in conn.notifies(timeout=1.0):
+                            job_type, next_run_at = decode_job_notify_payload(notify.payload)
+                            self._dispatch(job_type, next_run_at)
+            except Exception as exc:
+                logger.warning("Job notify listener disconnected channel=%s: %s", self._channel, exc)
+                self._stop_event.wait(self._reconnect_delay_seconds)
+
+
+def encode_job_notify_payload(*, job_type: str, next_run_at: datetime | None) -> str:
+    return json.dumps(
+        {
+            "job_type": job_type,
+            "next_run_at": next_run_at.isoformat() if next_run_at is not None else None,
+        },
+        separators=(",", ":"),
+    )
+
+
+def decode_job_notify_payload(payload: str) -> tuple[str, datetime | None]:
+    try:
+        data: Any = json.loads(payload)
+    except json.JSONDecodeError:
+        return "", None
+    if not isinstance(data, dict):
+        return "", None
+    raw_next_run_at = data.get("next_run_at")
+    next_run_at = None
+    if isinstance(raw_next_run_at, str) and raw_next_run_at:
+        try:
+            next_run_at = datetime.fromisoformat(raw_next_run_at)
+        except ValueError:
+            next_run_at = None
+    return str(data.get("job_type") or ""), next_run_at
+
+
+def create_job_notifier(settings: Settings, engine: Engine | None) -> JobNotifier:
+    if engine is not None and engine.dialect.name == "postgresql":
+        conninfo = settings.DATABASE_URL
+        if conninfo.startswith("postgresql+"):
+            # psycopg 只认 postgresql://，去掉 SQLAlchemy driver 后缀。
+            conninfo = "postgresql://" + conninfo.partition("://")[2]
+        return PostgresJobNotifier(engine=engine, conninfo=conninfo)
+    return InProcessJobNotifier()
@@ -2,16 +2,52 @@ from __future__ import annotations
 
 from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
-from typing import Any, Iterator
+import threading
+from typing import Any, Callable, Iterator, Sequence
 import uuid
 
-from sqlalchemy import or_, select
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import Select, bindparam, case, delete, func, insert, literal, or_, select, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session as OrmSession
 from sqlalchemy.orm import sessionmaker
 
-from lsl.modules.job.model import JobModel
-from lsl.modules.job.types import JobStatus, job_status_to_name
+from lsl.modules.job.model import JobArchiveModel, JobDependencyModel, JobModel
+from lsl.modules.job.types import JobSpec, JobStatus, job_status_to_name
+
+
+# SQLite 没有行级锁，同进程内的 claim 通过这把锁串行化；跨进程仍由条件 UPDATE 兜底。
+_SQLITE_CLAIM_LOCK = threading.Lock()
+
+_RUNNABLE_STATUSES = (int(JobStatus.QUEUED), int(JobStatus.RUNNING))
+_TERMINAL_STATUSES = (int(JobStatus.COMPLETED), int(JobStatus.FAILED), int(JobStatus.CANCELED))
+
+# 归档时从 job_jobs 复制的列；锁和调度相关的列对终态 job 没有意义，不保留。
+_ARCHIVE_COLUMNS = (
+    "job_id",
+    "job_type",
+    "status",
+    "entity_type",
+    "entity_id",
+    "priority",
+    "progress",
+    "attempts",
+    "max_attempts",
+    "payload_json",
+    "result_json",
+    "error_code",
+    "error_message",
+    "started_at",
+    "finished_at",
+    "created_at",
+    "updated_at",
+)
+
+
+def _epoch_seconds(column: Any, *, dialect_name: str) -> Any:
+    if dialect_name == "postgresql":
+        return func.extract("epoch", column)
+    # SQLite 把时间存成 ISO 文本，julianday 可直接解析。
+    return func.julianday(column) * 86400.0
 
 
 class JobRepository:
@@ -37,30 +73,191 @@ class JobRepository:
         priority: int,
         max_attempts: int,
         next_run_at: datetime | None,
-    ) -> dict[str, Any]:
+        dedup_key: str | None = None,
+        depends_on: Sequence[str] = (),
+    ) -> dict[str, Any] | None:
+        """
+        插入一个 queued job。
+        带 dedup_key 时若已有同 job_type、同 key 的可运行 job（唯一索引冲突）返回 None，由调用方复用已有 job。
+        带 depends_on 时在同一事务内写入依赖边，上游全部完成前不会被 claim。
+        """
         normalized_job_id = self._require_uuid(job_id, field_name="job_id")
-        model = JobModel(
-            job_id=normalized_job_id,
+        parent_job_ids = self._normalize_parent_job_ids(depends_on)
+        spec = JobSpec(
             job_type=job_type,
-            status=int(JobStatus.QUEUED),
             entity_type=entity_type,
             entity_id=entity_id,
+            payload=payload,
             priority=priority,
-            progress=0,
-            attempts=0,
             max_attempts=max_attempts,
-            payload_json=payload,
-            next_run_at=next_run_at,
+            dedup_key=dedup_key,
+            depends_on=tuple(parent_job_ids),
         )
         try:
             with self._session_scope() as db:
-                db.add(model)
-                db.commit()
+                model = self._insert_job(db, job_id=normalized_job_id, spec=spec, next_run_at=next_run_at)
+                if not self._commit_insert(db, dedup_key=dedup_key):
+                    return None
                 db.refresh(model)
                 return self._to_row(model)
         except SQLAlchemyError as exc:  # pragma: no cover
             raise RuntimeError(f"Failed to create job: {exc}") from exc
 
+    @staticmethod
+    def _commit_insert(db: OrmSession, *, dedup_key: str | None) -> bool:
+        try:
+            db.commit()
+        except IntegrityError:
+            if dedup_key is None:
+                raise
+            db.rollback()
+            return False
+        return True
+
+    def _insert_job(
+        self,
+        db: OrmSession,
+        *,
+        job_id: str,
+        spec: JobSpec,
+        next_run_at: datetime | None,
+    ) -> JobModel:
+        model = JobModel(
+            job_id=job_id,
+            job_type=spec.job_type,
+            status=int(JobStatus.QUEUED),
+            entity_type=spec.entity_type,
+            entity_id=spec.entity_id,
+            priority=spec.priority,
+            progress=0,
+            attempts=0,
+            max_attempts=spec.max_attempts,
+            payload_json=spec.payload,
+            next_run_at=next_run_at,
+            dedup_key=spec.dedup_key,
+            pending_dependencies=0,
+            has_dependents=False,
+        )
+        if spec.depends_on:
+            parent_statuses = self._mark_parents(db, spec.depends_on)
+            broken = [
+                parent_id
+                for parent_id in spec.depends_on
+                if parent_statuses.get(parent_id) not in (*_RUNNABLE_STATUSES, int(JobStatus.COMPLETED))
+            ]
+            if broken:
+                # 上游不存在或已失败 / 取消：直接以取消状态落库，不会再被调度。
+                model.status = int(JobStatus.CANCELED)
+                model.error_code = "DEPENDENCY_FAILED"
+                model.error_message = f"dependency job is not runnable: {broken[0]}"
+                model.dedup_key = None
+                model.finished_at = datetime.now(timezone.utc)
+            else:
+                model.pending_dependencies = sum(
+                    1 for parent_id in spec.depends_on if parent_statuses[parent_id] in _RUNNABLE_STATUSES
+                )
+            db.add_all(JobDependencyModel(job_id=job_id, parent_job_id=parent_id) for parent_id in spec.depends_on)
+        db.add(model)
+        return model
+
+    @staticmethod
+    def _mark_parents(db: OrmSession, parent_job_ids: Sequence[str]) -> dict[str, int]:
+        """
+        标记上游 has_dependents 并读取其状态。
+        先 UPDATE 再读：Postgres 的行锁 / SQLite 的写锁保证上游不会在本事务提交前完成而漏掉减计数。
+        """
+        stmt = (
+            update(JobModel)
+            .where(JobModel.job_id.in_(list(parent_job_ids)))
+            .values(has_dependents=True)
+            .execution_options(synchronize_session=False)
+        )
+        if db.get_bind().dialect.update_returning:
+            rows = db.execute(stmt.returning(JobModel.job_id, JobModel.status)).all()
+        else:
+            db.execute(stmt)
+            rows = db.execute(
+                select(JobModel.job_id, JobModel.status).where(JobModel.job_id.in_(list(parent_job_ids)))
+            ).all()
+        return {str(job_id): int(status) for job_id, status in rows}
+
+    def list_ready_dependent_job_types(self, parent_job_id: str) -> list[str]:
+        """上游完成后已解除阻塞的下游 job_type，用于唤醒对应 scheduler。"""
+        normalized_job_id = self._parse_uuid_str(parent_job_id)
+        if normalized_job_id is None:
+            return []
+        stmt = (
+            select(JobModel.job_type)
+            .join(JobDependencyModel, JobDependencyModel.job_id == JobModel.job_id)
+            .where(JobDependencyModel.parent_job_id == normalized_job_id)
+            .where(JobModel.status == int(JobStatus.QUEUED))
+            .where(JobModel.pending_dependencies == 0)
+            .distinct()
+        )
+        try:
+            with self._session_scope() as db:
+                return sorted(str(job_type) for job_type in db.execute(stmt).scalars().all())
+        except SQLAlchemyError as exc:  # pragma: no cover
+            raise RuntimeError(f"Failed to query dependent jobs: {exc}") from exc
+
+    def list_dependencies(self, job_id: str) -> list[str]:
+        normalized_job_id = self._parse_uuid_str(job_id)
+        if normalized_job_id is None:
+            return []
+        stmt = (
+            select(JobDependencyModel.parent_job_id)
+            .where(JobDependencyModel.job_id == normalized_job_id)
+            .order_by(JobDependencyModel.parent_job_id)
+        )
+        try:
+            with self._session_scope() as db:
+                return [str(value) for value in db.execute(stmt).scalars().all()]
+        except SQLAlchemyError as exc:  # pragma: no cover
+            raise RuntimeError(f"Failed to query job dependencies: {exc}") from exc
+
+    def get_active_job_by_dedup_key(
+        self,
+        *,
+        job_type: str,
+        dedup_key: str,
+        created_after: datetime | None = None,
+    ) -> dict[str, Any] | None:
+        stmt = select(JobModel).where(
+            JobModel.job_type == job_type,
+            JobModel.dedup_key == dedup_key,
+            JobModel.status.in_(_RUNNABLE_STATUSES),
+        )
+        if created_after is not None:
+            stmt = stmt.where(JobModel.created_at >= created_after)
+        stmt = stmt.limit(1)
+        try:
+            with self._session_scope() as db:
+                model = db.execute(stmt).scalar_one_or_none()
+                return self._to_row(model) if model is not None else None
+        except SQLAlchemyError as exc:  # pragma: no cover
+            raise RuntimeError(f"Failed to query job by dedup key: {exc}") from exc
+
+    def release_dedup_key(self, *, job_type: str, dedup_key: str, created_before: datetime) -> int:
+        """清空超出去重窗口的可运行 job 的 dedup_key，让新请求可以重新入队；旧 job 本身不受影响。"""
+        stmt = (
+            update(JobModel)
+            .where(
+                JobModel.job_type == job_type,
+                JobModel.dedup_key == dedup_key,
+                JobModel.status.in_(_RUNNABLE_STATUSES),
+                JobModel.created_at < created_before,
+            )
+            .values(dedup_key=None, updated_at=datetime.now(timezone.utc))
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            with self._session_scope() as db:
+                result = db.execute(stmt)
+                db.commit()
+                return int(result.rowcount or 0)
+        except SQLAlchemyError as exc:  # pragma: no cover
+            raise RuntimeError(f"Failed to release job dedup key: {exc}") from exc
+
     def get_job_by_id(self, job_id: str) -> dict[str, Any] | None:
         normalized_job_id = self._parse_uuid_str(job_id)
         if normalized_job_id is None:
@@ -101,6 +298,64 @@ class JobRepository:
         except SQLAlchemyError as exc:  # pragma: no cover
             raise RuntimeError(f"Failed to list jobs: {exc}") from exc
 
+    def count_jobs_by_type_and_status(self, *, statuses: Sequence[int]) -> list[tuple[str, int, int]]:
+        stmt = (
+            select(JobModel.job_type, JobModel.status, func.count())
+            .where(JobModel.status.in_([int(status) for status in statuses]))
+            .group_by(JobModel.job_type, JobModel.status)
+        )
+        try:
+            with self._session_scope() as db:
+                return [(job_type, int(status), int(count)) for job_type, status, count in db.execute(stmt).all()]
+        except SQLAlchemyError as exc:  # pragma: no cover
+            raise RuntimeError(f"Failed to count jobs: {exc}") from exc
+
+    def oldest_due_by_type(self, now: datetime) -> list[tuple[str, datetime]]:
+        """每个 job_type 最早一条已到期但未被 claim 的 job 的到期时间（无 next_run_at 时取 created_at）。"""
+        due_since = func.coalesce(JobModel.next_run_at, JobModel.created_at)
+        stmt = (
+            select(JobModel.job_type, func.min(due_since))
+            .where(JobModel.status.in_(_RUNNABLE_STATUSES))
+            .where(JobModel.pending_dependencies == 0)
+            .where(or_(JobModel.next_run_at.is_(None), JobModel.next_run_at <= now))
+            .where(or_(JobModel.locked_until.is_(None), JobModel.locked_until <= now))
+            .group_by(JobModel.job_type)
+        )
+        try:
+            with self._session_scope() as db:
+                return [(job_type, value) for job_type, value in db.execute(stmt).all() if value is not None]
+        except SQLAlchemyError as exc:  # pragma: no cover
+            raise RuntimeError(f"Failed to query oldest due jobs: {exc}") from exc
+
+    def list_upcoming_jobs(
+        self,
+        *,
+        now: datetime,
+        until: datetime,
+        limit: int,
+        job_types: Sequence[str] | None = None,
+        exclude_job_types: Sequence[str] | None = None,
+    ) -> list[tuple[str, str, datetime]]:
+        """(now, until] 内到期的可运行 job，按到期时间升序返回 (job_id, job_type, next_run_at)，供 scheduler 预加载定时器。"""
+        stmt = (
+            select(JobModel.job_id, JobModel.job_type, JobModel.next_run_at)
+            .where(JobModel.status.in_(_RUNNABLE_STATUSES))
+            .where(JobModel.pending_dependencies == 0)
+            .where(JobModel.next_run_at > now)
+            .where(JobModel.next_run_at <= until)
+            .order_by(JobModel.next_run_at.asc())
+            .limit(limit)
+        )
+        if job_types:
+            stmt = stmt.where(JobModel.job_type.in_(list(job_types)))
+        if exclude_job_types:
+            stmt = stmt.where(JobModel.job_type.not_in(list(exclude_job_types)))
+        try:
+            with self._session_scope() as db:
+                return [(job_id, job_type, next_run_at) for job_id, job_type, next_run_at in db.execute(stmt).all()]
+        except SQLAlchemyError as exc:  # pragma: no cover
+            raise RuntimeError(f"Failed to list upcoming jobs: {exc}") from exc
+
     def claim_job(
         self,
         *,
@@ -114,21 +369,22 @@ class JobRepository:
 
         now = datetime.now(timezone.utc)
         stmt = (
-            select(JobModel)
+            update(JobModel)
             .where(JobModel.job_id == normalized_job_id)
-            .where(JobModel.status.in_([int(JobStatus.QUEUED), int(JobStatus.RUNNING)]))
+            .where(JobModel.status.in_(_RUNNABLE_STATUSES))
+            .where(JobModel.pending_dependencies == 0)
             .where(or_(JobModel.locked_until.is_(None), JobModel.locked_until <= now))
-            .limit(1)
+            .values(**self._claim_values(worker_id=worker_id, lock_ttl_seconds=lock_ttl_seconds, now=now))
+            .execution_options(synchronize_session=False)
         )
         try:
             with self._session_scope() as db:
-                model = db.execute(stmt).scalar_one_or_none()
-                if model is None:
-                    return None
-                self._claim_model(model, worker_id=worker_id, lock_ttl_seconds=lock_ttl_seconds, now=now)
+                claimed = db.execute(stmt).rowcount
                 db.commit()
-                db.refresh(model)
-                return self._to_row(model)
+                if not claimed:
+                    return None
+                model = db.get(JobModel, normalized_job_id)
+                return self._to_row(model) if model is not None else None
         except SQLAlchemyError as exc:  # pragma: no cover
             raise RuntimeError(f"Failed to claim job: {exc}") from exc
 
@@ -138,27 +394,139 @@ class JobRepository:
         worker_id: str,
         limit: int,
         lock_ttl_seconds: int,
+        job_types: Sequence[str] | None = None,
+        exclude_job_types: Sequence[str] | None = None,
+        priority_aging_seconds: int = 0,
+        job_ids: Sequence[str] | None = None,
     ) -> list[dict[str, Any]]:
+        """
+        按优先级 claim 到期 job。传入 job_ids 时为定向 claim（scheduler 定时器到期）：
+        只按主键检查这些 job，仍校验到期 / 锁 / 依赖条件，已被其他副本 claim 或改期的直接跳过。
+        """
+        normalized_job_ids: list[str] | None = None
+        if job_ids is not None:
+            normalized_job_ids = [job_id for job_id in (self._parse_uuid_str(item) for item in job_ids) if job_id]
+            if not normalized_job_ids:
+                return []
         now = datetime.now(timezone.utc)
+        try:
+            with self._session_scope() as db:
+                dialect_name = db.get_bind().dialect.name
+                candidates = (
+                    self._due_jobs_query(
+                        now,
+                        dialect_name=dialect_name,
+                        job_types=job_types,
+                        exclude_job_types=exclude_job_types,
+                        priority_aging_seconds=priority_aging_seconds,
+                    )
+                    .with_only_columns(JobModel.job_id)
+                    .limit(limit)
+                )
+                if normalized_job_ids is not None:
+                    candidates = candidates.where(JobModel.job_id.in_(normalized_job_ids))
+                values = self._claim_values(worker_id=worker_id, lock_ttl_seconds=lock_ttl_seconds, now=now)
+                if dialect_name == "postgresql":
+                    models = self._claim_due_jobs_skip_locked(db, candidates=candidates, values=values)
+                else:
+                    with _SQLITE_CLAIM_LOCK:
+                        models = self._claim_due_jobs_serialized(db, candidates=candidates, values=values, now=now)
+                models.sort(
+                    key=lambda model: self._claim_sort_key(model, now=now, priority_aging_seconds=priority_aging_seconds)
+                )
+                return [self._to_row(model) for model in models]
+        except SQLAlchemyError as exc:  # pragma: no cover
+            raise RuntimeError(f"Failed to claim due jobs: {exc}") from exc
+
+    def _claim_due_jobs_skip_locked(
+        self,
+        db: OrmSession,
+        *,
+        candidates: Select,
+        values: dict[str, Any],
+    ) -> list[JobModel]:
+        # 一次往返完成“挑选 + 加锁 + 更新”，被其他 runner 锁住的行直接跳过。
+        stmt = (
+            update(JobModel)
+            .where(JobModel.job_id.in_(candidates.with_for_update(skip_locked=True).scalar_subquery()))
+            .values(**values)
+            .returning(JobModel)
+            .execution_options(synchronize_session=False)
+        )
+        models = list(db.execute(stmt).scalars().all())
+        db.commit()
+        return models
+
+    def _claim_due_jobs_serialized(
+        self,
+        db: OrmSession,
+        *,
+        candidates: Select,
+        values: dict[str, Any],
+        now: datetime,
+    ) -> list[JobModel]:
+        candidate_ids = list(db.execute(candidates).scalars().all())
+        if not candidate_ids:
+            return []
+
+        claimed_ids: list[str] = []
+        for job_id in candidate_ids:
+            # 条件 UPDATE 重新校验锁状态，另一个进程先抢到时 rowcount 为 0。
+            stmt = (
+                update(JobModel)
+                .where(JobModel.job_id == job_id)
+                .where(JobModel.status.in_(_RUNNABLE_STATUSES))
+                .where(or_(JobModel.locked_until.is_(None), JobModel.locked_until <= now))
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            if db.execute(stmt).rowcount:
+                claimed_ids.append(job_id)
+        db.commit()
+        if not claimed_ids:
+            return []
+
+        return list(db.execute(select(JobModel).where(JobModel.job_id.in_(claimed_ids))).scalars().all())
+
+    @staticmethod
+    def _due_jobs_query(
+        now: datetime,
+        *,
+        dialect_name: str,
+        job_types: Sequence[str] | None,
+        exclude_job_types: Sequence[str] | None,
+        priority_aging_seconds: int,
+    ) -> Select:
         stmt = (
             select(JobModel)
-            .where(JobModel.status.in_([int(JobStatus.QUEUED), int(JobStatus.RUNNING)]))
+            .where(JobModel.status.in_(_RUNNABLE_STATUSES))
+            .where(JobModel.pending_dependencies == 0)
             .where(or_(JobModel.next_run_at.is_(None), JobModel.next_run_at <= now))
             .where(or_(JobModel.locked_until.is_(None), JobModel.locked_until <= now))
-            .order_by(JobModel.priority.desc(), JobModel.next_run_at.asc(), JobModel.created_at.asc())
-            .limit(limit)
         )
-        try:
-            with self._session_scope() as db:
-                rows = db.execute(stmt).scalars().all()
-                for model in rows:
-                    self._claim_model(model, worker_id=worker_id, lock_ttl_seconds=lock_ttl_seconds, now=now)
-                db.commit()
-                for model in rows:
-                    db.refresh(model)
-                return [self._to_row(model) for model in rows]
-        except SQLAlchemyError as exc:  # pragma: no cover
-            raise RuntimeError(f"Failed to claim due jobs: {exc}") from exc
+        if job_types:
+            stmt = stmt.where(JobModel.job_type.in_(list(job_types)))
+        if exclude_job_types:
+            stmt = stmt.where(JobModel.job_type.not_in(list(exclude_job_types)))
+        if priority_aging_seconds > 0:
+            # 有效优先级 = priority + 等待秒数 / aging；now 对所有行相同，排序时可以消掉。
+            aged_priority = JobModel.priority * priority_aging_seconds - _epoch_seconds(
+                JobModel.created_at,
+                dialect_name=dialect_name,
+            )
+            return stmt.order_by(aged_priority.desc(), JobModel.created_at.asc())
+        return stmt.order_by(JobModel.priority.desc(), JobModel.next_run_at.asc(), JobModel.created_at.asc())
+
+    @staticmethod
+    def _claim_sort_key(model: JobModel, *, now: datetime, priority_aging_seconds: int) -> tuple[float, datetime]:
+        # RETURNING / IN 查询不保证顺序，按 claim 时的有效优先级顺序返回。
+        created_at = model.created_at
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        effective_priority = float(model.priority)
+        if priority_aging_seconds > 0:
+            effective_priority += max(0.0, (now - created_at).total_seconds()) / priority_aging_seconds
+        return -effective_priority, created_at
 
     def mark_running(
         self,
@@ -168,27 +536,93 @@ class JobRepository:
         next_run_at: datetime | None,
         entity_type: str | None,
         entity_id: str | None,
-    ) -> dict[str, Any]:
+        worker_id: str | None = None,
+    ) -> dict[str, Any] | None:
+        values: dict[str, Any] = {
+            "status": int(JobStatus.RUNNING),
+            "next_run_at": next_run_at,
+            "locked_by": None,
+            "locked_until": None,
+            "error_code": None,
+            "error_message": None,
+        }
+        if progress is not None:
+            values["progress"] = self._normalize_progress(progress)
+        self._set_entity_values(values, entity_type=entity_type, entity_id=entity_id)
+        return self._transition(job_id=job_id, worker_id=worker_id, values=values, action="mark job as running")
+
+    def mark_running_many(
+        self,
+        *,
+        items: Sequence[tuple[str, int | None, datetime | None]],
+        worker_id: str,
+    ) -> list[dict[str, Any]]:
+        """
+        批量改期 (job_id, progress, next_run_at)：一个事务内先锁住仍由 worker_id 持有的行，
+        再用一条 executemany UPDATE 释放锁并写入各自的 next_run_at。
+        返回更新后的行；不在结果里的 job 已丢失 lease。
+        """
+        targets: dict[str, tuple[int | None, datetime | None]] = {}
+        for job_id, progress, next_run_at in items:
+            normalized = self._parse_uuid_str(job_id)
+            if normalized is not None:
+                targets[normalized] = (progress, next_run_at)
+        if not targets:
+            return []
+
+        now = datetime.now(timezone.utc)
+        # 用 Core 语句做 executemany；ORM 的 update(JobModel) 传参数列表会走按主键批量更新，不支持锁持有者条件。
+        stmt = (
+            update(JobModel.__table__)
+            .where(JobModel.job_id == bindparam("b_job_id"))
+            .where(JobModel.locked_by == worker_id)
+            .values(
+                {
+                    JobModel.status: int(JobStatus.RUNNING),
+                    JobModel.progress: func.coalesce(bindparam("b_progress"), JobModel.progress),
+                    JobModel.next_run_at: bindparam("b_next_run_at"),
+                    JobModel.locked_by: None,
+                    JobModel.locked_until: None,
+                    JobModel.error_code: None,
+                    JobModel.error_message: None,
+                    JobModel.updated_at: now,
+                }
+            )
+        )
+        owned_stmt = (
+            select(JobModel.job_id)
+            .where(JobModel.job_id.in_(list(targets)))
+            .where(JobModel.locked_by == worker_id)
+        )
         try:
             with self._session_scope() as db:
-                model = self._get_required_job(db, job_id)
-                model.status = int(JobStatus.RUNNING)
-                if progress is not None:
-                    model.progress = self._normalize_progress(progress)
-                if entity_type is not None:
-                    model.entity_type = entity_type
-                if entity_id is not None:
-                    model.entity_id = entity_id
-                model.next_run_at = next_run_at
-                model.locked_by = None
-                model.locked_until = None
-                model.error_code = None
-                model.error_message = None
+                if db.get_bind().dialect.name == "postgresql":
+                    owned_stmt = owned_stmt.with_for_update()
+                owned = list(db.execute(owned_stmt).scalars().all())
+                if not owned:
+                    db.commit()
+                    return []
+                db.execute(
+                    stmt,
+                    [
+                        {
+                            "b_job_id": job_id,
+                            "b_progress": (
+                                self._normalize_progress(targets[job_id][0])
+                                if targets[job_id][0] is not None
+                                else None
+                            ),
+                            "b_next_run_at": targets[job_id][1],
+                        }
+                        for job_id in owned
+                    ],
+                )
+                models = db.execute(select(JobModel).where(JobModel.job_id.in_(owned))).scalars().all()
+                rows = [self._to_row(model) for model in models]
                 db.commit()
-                db.refresh(model)
-                return self._to_row(model)
+                return rows
         except SQLAlchemyError as exc:  # pragma: no cover
-            raise RuntimeError(f"Failed to mark job as running: {exc}") from exc
+            raise RuntimeError(f"Failed to mark jobs as running: {exc}") from exc
 
     def mark_completed(
         self,
@@ -198,28 +632,38 @@ class JobRepository:
         result: dict[str, Any] | None,
         entity_type: str | None,
         entity_id: str | None,
-    ) -> dict[str, Any]:
-        try:
-            with self._session_scope() as db:
-                model = self._get_required_job(db, job_id)
-                model.status = int(JobStatus.COMPLETED)
-                model.progress = self._normalize_progress(progress if progress is not None else 100)
-                model.result_json = result
-                if entity_type is not None:
-                    model.entity_type = entity_type
-                if entity_id is not None:
-                    model.entity_id = entity_id
-                model.error_code = None
-                model.error_message = None
-                model.locked_by = None
-                model.locked_until = None
-                model.next_run_at = None
-                model.finished_at = datetime.now(timezone.utc)
-                db.commit()
-                db.refresh(model)
-                return self._to_row(model)
-        except SQLAlchemyError as exc:  # pragma: no cover
-            raise RuntimeError(f"Failed to mark job as completed: {exc}") from exc
+        worker_id: str | None = None,
+        follow_ups: Sequence[JobSpec] = (),
+    ) -> dict[str, Any] | None:
+        """
+        完成 job；同一事务内解除下游阻塞并写入 follow_ups，job 完成与后续 job 入队要么都生效要么都不生效。
+        """
+        values: dict[str, Any] = {
+            "status": int(JobStatus.COMPLETED),
+            "progress": self._normalize_progress(progress if progress is not None else 100),
+            "result_json": result,
+            "error_code": None,
+            "error_message": None,
+            "locked_by": None,
+            "locked_until": None,
+            "next_run_at": None,
+            "finished_at": datetime.now(timezone.utc),
+        }
+        self._set_entity_values(values, entity_type=entity_type, entity_id=entity_id)
+
+        def _after(db: OrmSession, model: JobModel) -> None:
+            if model.has_dependents:
+                self._release_dependents(db, parent_job_id=model.job_id)
+            for spec in follow_ups:
+                self._insert_follow_up(db, spec=spec)
+
+        return self._transition(
+            job_id=job_id,
+            worker_id=worker_id,
+            values=values,
+            action="mark job as completed",
+            after=_after,
+        )
 
     def mark_failed(
         self,
@@ -228,64 +672,314 @@ class JobRepository:
         error_code: str | None,
         error_message: str | None,
         progress: int | None = None,
-    ) -> dict[str, Any]:
+        worker_id: str | None = None,
+    ) -> dict[str, Any] | None:
+        values: dict[str, Any] = {
+            "status": int(JobStatus.FAILED),
+            "error_code": error_code,
+            "error_message": error_message,
+            "locked_by": None,
+            "locked_until": None,
+            "next_run_at": None,
+            "finished_at": datetime.now(timezone.utc),
+        }
+        if progress is not None:
+            values["progress"] = self._normalize_progress(progress)
+        return self._transition(
+            job_id=job_id,
+            worker_id=worker_id,
+            values=values,
+            action="mark job as failed",
+            after=self._cancel_dependents,
+        )
+
+    def mark_canceled(
+        self,
+        *,
+        job_id: str,
+        error_message: str | None = None,
+        worker_id: str | None = None,
+    ) -> dict[str, Any] | None:
+        values: dict[str, Any] = {
+            "status": int(JobStatus.CANCELED),
+            "error_code": "JOB_CANCELED",
+            "error_message": error_message,
+            "locked_by": None,
+            "locked_until": None,
+            "next_run_at": None,
+            "finished_at": datetime.now(timezone.utc),
+        }
+        return self._transition(
+            job_id=job_id,
+            worker_id=worker_id,
+            values=values,
+            action="cancel job",
+            after=self._cancel_dependents,
+        )
+
+    def _transition(
+        self,
+        *,
+        job_id: str,
+        worker_id: str | None,
+        values: dict[str, Any],
+        action: str,
+        after: Callable[[OrmSession, JobModel], None] | None = None,
+    ) -> dict[str, Any] | None:
+        """
+        单条 `UPDATE ... RETURNING` 完成状态迁移，不再 load + 修改 + refresh。
+        传入 worker_id 时只更新仍由该 worker 持有锁的行，lease 已丢失返回 None。
+        after 在迁移成功后、提交前执行（处理依赖 / follow-up），与迁移同一事务。
+        """
+        normalized_job_id = self._require_uuid(job_id, field_name="job_id")
+        stmt = update(JobModel).where(JobModel.job_id == normalized_job_id)
+        if worker_id is not None:
+            stmt = stmt.where(JobModel.locked_by == worker_id)
+        stmt = stmt.values(updated_at=datetime.now(timezone.utc), **values)
         try:
             with self._session_scope() as db:
-                model = self._get_required_job(db, job_id)
-                model.status = int(JobStatus.FAILED)
-                if progress is not None:
-                    model.progress = self._normalize_progress(progress)
-                model.error_code = error_code
-                model.error_message = error_message
-                model.locked_by = None
-                model.locked_until = None
-                model.next_run_at = None
-                model.finished_at = datetime.now(timezone.utc)
+                model = self._update_one_returning(db, stmt, job_id=normalized_job_id)
+                row = self._to_row(model) if model is not None else None
+                if model is not None and after is not None:
+                    after(db, model)
                 db.commit()
-                db.refresh(model)
-                return self._to_row(model)
         except SQLAlchemyError as exc:  # pragma: no cover
-            raise RuntimeError(f"Failed to mark job as failed: {exc}") from exc
+            raise RuntimeError(f"Failed to {action}: {exc}") from exc
+
+        if row is None and worker_id is None:
+            raise RuntimeError("Job not found")
+        return row
 
-    def mark_canceled(self, *, job_id: str, error_message: str | None = None) -> dict[str, Any]:
+    def purge_finished_jobs(self, *, finished_before: datetime, limit: int, archive: bool) -> int:
+        """
+        单批清理 finished_before 之前结束的终态 job，返回本批处理的行数。
+        每批一个短事务：挑选 -> （归档）-> 删除，避免长时间持锁。
+        """
+        now = datetime.now(timezone.utc)
+        candidates = (
+            select(JobModel.job_id)
+            .where(JobModel.status.in_(_TERMINAL_STATUSES))
+            .where(JobModel.finished_at < finished_before)
+            .order_by(JobModel.finished_at.asc())
+            .limit(limit)
+        )
         try:
             with self._session_scope() as db:
-                model = self._get_required_job(db, job_id)
-                model.status = int(JobStatus.CANCELED)
-                model.error_code = "JOB_CANCELED"
-                model.error_message = error_message
-                model.locked_by = None
-                model.locked_until = None
-                model.next_run_at = None
-                model.finished_at = datetime.now(timezone.utc)
-                db.commit()
-                db.refresh(model)
-                return self._to_row(model)
+                if db.get_bind().dialect.name == "postgresql":
+                    # 多个实例同时清理时跳过彼此锁住的行。
+                    return self._purge_batch(
+                        db,
+                        candidates=candidates.with_for_update(skip_locked=True),
+                        archive=archive,
+                        now=now,
+                    )
+                with _SQLITE_CLAIM_LOCK:
+                    return self._purge_batch(db, candidates=candidates, archive=archive, now=now)
         except SQLAlchemyError as exc:  # pragma: no cover
-            raise RuntimeError(f"Failed to cancel job: {exc}") from exc
+            raise RuntimeError(f"Failed to purge finished jobs: {exc}") from exc
 
-    def _claim_model(
+    @staticmethod
+    def _purge_batch(db: OrmSession, *, candidates: Select, archive: bool, now: datetime) -> int:
+        job_ids = list(db.execute(candidates).scalars().all())
+        if not job_ids:
+            return 0
+        if archive:
+            source_columns = [getattr(JobModel, name) for name in _ARCHIVE_COLUMNS]
+            db.execute(
+                insert(JobArchiveModel).from_select(
+                    [*(getattr(JobArchiveModel, name) for name in _ARCHIVE_COLUMNS), JobArchiveModel.archived_at],
+                    select(*source_columns, literal(now, type_=JobArchiveModel.archived_at.type)).where(
+                        JobModel.job_id.in_(job_ids)
+                    ),
+                )
+            )
+        db.execute(
+            delete(JobDependencyModel)
+            .where(or_(JobDependencyModel.job_id.in_(job_ids), JobDependencyModel.parent_job_id.in_(job_ids)))
+            .execution_options(synchronize_session=False)
+        )
+        db.execute(
+            delete(JobModel)
+            .where(JobModel.job_id.in_(job_ids))
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        return len(job_ids)
+
+    def renew_leases(
         self,
-        model: JobModel,
+        *,
+        job_ids: Sequence[str],
+        worker_id: str,
+        lock_ttl_seconds: int,
+        progress: int | None = None,
+    ) -> list[str]:
+        """延长当前 worker 持有的锁，返回续约成功的 job_id；不在结果里的 job 已丢失 lease。"""
+        normalized_job_ids = [job_id for job_id in (self._parse_uuid_str(item) for item in job_ids) if job_id]
+        if not normalized_job_ids:
+            return []
+
+        now = datetime.now(timezone.utc)
+        values: dict[str, Any] = {
+            "locked_until": now + timedelta(seconds=lock_ttl_seconds),
+            "updated_at": now,
+        }
+        if progress is not None:
+            values["progress"] = self._normalize_progress(progress)
+        stmt = (
+            update(JobModel)
+            .where(JobModel.job_id.in_(normalized_job_ids))
+            .where(JobModel.status == int(JobStatus.RUNNING))
+            .where(JobModel.locked_by == worker_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            with self._session_scope() as db:
+                if db.get_bind().dialect.update_returning:
+                    renewed = list(db.execute(stmt.returning(JobModel.job_id)).scalars().all())
+                else:
+                    # 续约不修改 WHERE 里的列，同一事务内按相同条件回查即为续约成功的行。
+                    db.execute(stmt)
+                    renewed = list(db.execute(select(JobModel.job_id).where(stmt.whereclause)).scalars().all())
+                db.commit()
+                return renewed
+        except SQLAlchemyError as exc:  # pragma: no cover
+            raise RuntimeError(f"Failed to renew job leases: {exc}") from exc
+
+    def release_leases(self, *, job_ids: Sequence[str], worker_id: str) -> int:
+        """释放当前 worker 持有的锁，job 保持可运行状态并立即可被其他 runner claim。"""
+        normalized_job_ids = [job_id for job_id in (self._parse_uuid_str(item) for item in job_ids) if job_id]
+        if not normalized_job_ids:
+            return 0
+
+        now = datetime.now(timezone.utc)
+        stmt = (
+            update(JobModel)
+            .where(JobModel.job_id.in_(normalized_job_ids))
+            .where(JobModel.status.in_(_RUNNABLE_STATUSES))
+            .where(JobModel.locked_by == worker_id)
+            .values(locked_by=None, locked_until=None, next_run_at=None, updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            with self._session_scope() as db:
+                released = db.execute(stmt).rowcount
+                db.commit()
+                return int(released or 0)
+        except SQLAlchemyError as exc:  # pragma: no cover
+            raise RuntimeError(f"Failed to release job leases: {exc}") from exc
+
+    @staticmethod
+    def _release_dependents(db: OrmSession, *, parent_job_id: str) -> None:
+        # 减到 0 的下游从此刻起算到期时间，queue lag 不把等待上游的时间算进去。
+        now = datetime.now(timezone.utc)
+        children = select(JobDependencyModel.job_id).where(JobDependencyModel.parent_job_id == parent_job_id)
+        db.execute(
+            update(JobModel)
+            .where(JobModel.job_id.in_(children.scalar_subquery()))
+            .where(JobModel.status == int(JobStatus.QUEUED))
+            .where(JobModel.pending_dependencies > 0)
+            .values(
+                pending_dependencies=JobModel.pending_dependencies - 1,
+                next_run_at=case(
+                    (JobModel.pending_dependencies == 1, func.coalesce(JobModel.next_run_at, now)),
+                    else_=JobModel.next_run_at,
+                ),
+                updated_at=now,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def _cancel_dependents(db: OrmSession, model: JobModel) -> None:
+        """上游失败 / 取消时逐层取消仍在等待的下游。"""
+        if not model.has_dependents:
+            return
+        now = datetime.now(timezone.utc)
+        frontier = [model.job_id]
+        while frontier:
+            rows = db.execute(
+                select(JobModel.job_id, JobModel.has_dependents)
+                .join(JobDependencyModel, JobDependencyModel.job_id == JobModel.job_id)
+                .where(JobDependencyModel.parent_job_id.in_(frontier))
+                .where(JobModel.status == int(JobStatus.QUEUED))
+                .distinct()
+            ).all()
+            if not rows:
+                return
+            db.execute(
+                update(JobModel)
+                .where(JobModel.job_id.in_([job_id for job_id, _ in rows]))
+                .values(
+                    status=int(JobStatus.CANCELED),
+                    error_code="DEPENDENCY_FAILED",
+                    error_message=f"dependency job {model.job_id} did not complete",
+                    next_run_at=None,
+                    finished_at=now,
+                    updated_at=now,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            frontier = [job_id for job_id, has_dependents in rows if has_dependents]
+
+    def _insert_follow_up(self, db: OrmSession, *, spec: JobSpec) -> None:
+        parent_job_ids = self._normalize_parent_job_ids(spec.depends_on)
+        follow_up = JobSpec(
+            job_type=spec.job_type,
+            entity_type=spec.entity_type,
+            entity_id=spec.entity_id,
+            payload=dict(spec.payload),
+            priority=spec.priority,
+            max_attempts=spec.max_attempts,
+            dedup_key=spec.dedup_key,
+            depends_on=tuple(parent_job_ids),
+        )
+        job_id = uuid.uuid4().hex
+        if spec.dedup_key is None:
+            self._insert_job(db, job_id=job_id, spec=follow_up, next_run_at=None)
+            db.flush()
+            return
+        try:
+            # 已有同 key 的可运行 job 时只跳过这个 follow-up，不影响上游的完成。
+            with db.begin_nested():
+                self._insert_job(db, job_id=job_id, spec=follow_up, next_run_at=None)
+        except IntegrityError:
+            pass
+
+    @staticmethod
+    def _update_one_returning(db: OrmSession, stmt: Any, *, job_id: str) -> JobModel | None:
+        stmt = stmt.execution_options(synchronize_session=False)
+        if db.get_bind().dialect.update_returning:
+            return db.execute(stmt.returning(JobModel)).scalar_one_or_none()
+        # 不支持 RETURNING 的 SQLite（< 3.35）：同一事务内 UPDATE 后按主键回查。
+        if not db.execute(stmt).rowcount:
+            return None
+        return db.execute(select(JobModel).where(JobModel.job_id == job_id)).scalar_one_or_none()
+
+    @staticmethod
+    def _set_entity_values(values: dict[str, Any], *, entity_type: str | None, entity_id: str | None) -> None:
+        if entity_type is not None:
+            values["entity_type"] = entity_type
+        if entity_id is not None:
+            values["entity_id"] = entity_id
+
+    @staticmethod
+    def _claim_values(
         *,
         worker_id: str,
         lock_ttl_seconds: int,
         now: datetime,
-    ) -> None:
-        model.status = int(JobStatus.RUNNING)
-        model.attempts = int(model.attempts) + 1
-        model.locked_by = worker_id
-        model.locked_until = now + timedelta(seconds=lock_ttl_seconds)
-        model.next_run_at = None
-        if model.started_at is None:
-            model.started_at = now
-
-    def _get_required_job(self, db: OrmSession, job_id: str) -> JobModel:
-        normalized_job_id = self._require_uuid(job_id, field_name="job_id")
-        model = db.get(JobModel, normalized_job_id)
-        if model is None:
-            raise RuntimeError("Job not found")
-        return model
+    ) -> dict[str, Any]:
+        return {
+            "status": int(JobStatus.RUNNING),
+            "attempts": JobModel.attempts + 1,
+            "locked_by": worker_id,
+            "locked_until": now + timedelta(seconds=lock_ttl_seconds),
+            "next_run_at": None,
+            "started_at": func.coalesce(JobModel.started_at, now),
+            "updated_at": now,
+        }
 
     @staticmethod
     def _to_row(model: JobModel) -> dict[str, Any]:
@@ -301,6 +995,9 @@ class JobRepository:
             "progress": int(model.progress),
             "attempts": int(model.attempts),
             "max_attempts": int(model.max_attempts),
+            "dedup_key": model.dedup_key,
+            "pending_dependencies": int(model.pending_dependencies or 0),
+            "has_dependents": bool(model.has_dependents),
             "payload": model.payload_json or {},
             "result": model.result_json,
             "error_code": model.error_code,
@@ -325,6 +1022,15 @@ class JobRepository:
         except (TypeError, ValueError):
             return None
 
+    @staticmethod
+    def _normalize_parent_job_ids(depends_on: Sequence[str]) -> list[str]:
+        parent_job_ids: list[str] = []
+        for item in depends_on:
+            parent_job_id = JobRepository._require_uuid(item, field_name="depends_on")
+            if parent_job_id not in parent_job_ids:
+                parent_job_ids.append(parent_job_id)
+        return parent_job_ids
+
     @staticmethod
     def _require_uuid(value: str, *, field_name: str) -> str:
         parsed = JobRepository._parse_uuid_str(value)
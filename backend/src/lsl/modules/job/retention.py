@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import timedelta
+from functools import partial
+
+from lsl.core.config import Settings
+from lsl.modules.job.service import JobService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class JobRetentionConfig:
+    retention_days: int
+    batch_size: int
+    interval_seconds: float
+    # False 表示直接删除，不写 job_jobs_archive。
+    archive: bool = True
+    # 批次之间的间隔，让出数据库给 claim / 状态迁移。
+    pause_seconds: float = 0.1
+
+    def __post_init__(self) -> None:
+        # 在启动时校验，避免清理循环每轮都因参数非法抛错。
+        if self.retention_days <= 0:
+            raise ValueError("retention_days must be greater than 0")
+        if self.batch_size <= 0:
+            raise ValueError("batch_size must be greater than 0")
+        if self.interval_seconds <= 0:
+            raise ValueError("interval_seconds must be greater than 0")
+        if self.pause_seconds < 0:
+            raise ValueError("pause_seconds must be greater than or equal to 0")
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> JobRetentionConfig:
+        return cls(
+            retention_days=settings.JOB_RETENTION_DAYS,
+            batch_size=settings.JOB_RETENTION_BATCH_SIZE,
+            interval_seconds=settings.JOB_RETENTION_INTERVAL_SECONDS,
+            archive=settings.JOB_RETENTION_ARCHIVE,
+        )
+
+
+async def run_job_retention(*, job_service: JobService, config: JobRetentionConfig) -> None:
+    """周期性把过期终态 job 从 job_jobs 搬走；多实例同时运行时由 repository 保证不重复处理。"""
+    loop = asyncio.get_running_loop()
+    older_than = timedelta(days=config.retention_days)
+    try:
+        while True:
+            try:
+                await loop.run_in_executor(
+                    None,
+                    partial(
+                        job_service.purge_finished_jobs,
+                        older_than=older_than,
+                        batch_size=config.batch_size,
+                        archive=config.archive,
+                        pause_seconds=config.pause_seconds,
+                    ),
+                )
+            except Exception:
+                logger.exception("Job retention failed")
+            await asyncio.sleep(config.interval_seconds)
+    except asyncio.CancelledError:
+        logger.info("Job retention stopped")
+        raise
@@ -0,0 +1,455 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import socket
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from functools import partial
+
+from lsl.modules.job.metrics import (
+    JOB_CLAIM_DURATION,
+    JOB_CLAIMED,
+    JOB_RUNNER_CAPACITY,
+    JOB_RUNNER_IN_FLIGHT,
+)
+from lsl.modules.job.service import JobService
+from lsl.modules.job.timer import DelayedJobEntry, DelayedJobTimer
+from lsl.modules.job.types import JobData, JobStatus
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class JobSchedulerConfig:
+    worker_id: str
+    max_workers: int
+    batch_size: int
+    interval_seconds: float
+    # 为空表示 claim 所有 job_type；非空时只 claim 列出的类型。
+    job_types: tuple[str, ...] = ()
+    thread_name_prefix: str = "job-runner"
+    # interactive lane 处理的短任务类型，使用独立线程池，不会被长任务占满。
+    interactive_job_types: tuple[str, ...] = ()
+    # interactive lane 线程数；0 表示不拆分 lane，所有类型共用 batch lane。
+    interactive_max_workers: int = 0
+    # 单进程内每个 job_type 同时执行的上限；未配置的类型只受 lane 线程数限制。
+    job_type_limits: dict[str, int] = field(default_factory=dict)
+    # async lane 同时在事件循环上执行的 run_async job 数；0 表示 async handler 也走线程池。
+    async_max_concurrency: int = 0
+    # 在途 job 的锁续约间隔，需小于 JobService 的 lock_ttl_seconds；0 表示不自动续约。
+    heartbeat_interval_seconds: float = 0.0
+    # 每次兜底轮询时预加载到进程内定时器的即将到期 job 数；0 表示不预加载，只跟踪本进程改期的 job。
+    timer_prefetch_limit: int = 500
+
+
+def build_worker_id(prefix: str) -> str:
+    # 每个进程使用唯一 worker_id，多副本 / 多进程时便于区分锁持有者。
+    return f"{prefix}-{socket.gethostname()}-{os.getpid()}"
+
+
+def parse_job_types(raw: str) -> tuple[str, ...]:
+    return tuple(item.strip() for item in raw.split(",") if item.strip())
+
+
+def parse_job_type_limits(raw: str) -> dict[str, int]:
+    """解析 `tts_synthesis=2,revision_generation=2` 形式的并发上限配置。"""
+    limits: dict[str, int] = {}
+    for item in parse_job_types(raw):
+        job_type, sep, value = item.partition("=")
+        job_type = job_type.strip()
+        if not sep or not job_type:
+            raise ValueError(f"invalid job type limit: {item!r}, expected <job_type>=<limit>")
+        try:
+            limit = int(value)
+        except ValueError as exc:
+            raise ValueError(f"job type limit must be an integer: {item!r}") from exc
+        if limit <= 0:
+            raise ValueError(f"job type limit must be greater than 0: {item!r}")
+        limits[job_type] = limit
+    return limits
+
+
+@dataclass(slots=True)
+class _Lane:
+    name: str
+    # None 表示 async lane：job 作为协程直接跑在事件循环上。
+    executor: ThreadPoolExecutor | None
+    max_workers: int
+    # None 表示不限制 job_type（再排除 exclude_job_types）。
+    include_job_types: tuple[str, ...] | None
+    exclude_job_types: tuple[str, ...] = ()
+    in_flight: dict[asyncio.Future, JobData] = field(default_factory=dict)
+
+    def handles(self, job_type: str) -> bool:
+        if self.include_job_types is not None:
+            return job_type in self.include_job_types
+        return job_type not in self.exclude_job_types
+
+
+def _build_lanes(config: JobSchedulerConfig, async_job_types: tuple[str, ...]) -> list[_Lane]:
+    allowed = config.job_types
+    async_types = async_job_types if config.async_max_concurrency > 0 else ()
+    interactive = config.interactive_job_types if config.interactive_max_workers > 0 else ()
+    if allowed:
+        async_types = tuple(job_type for job_type in async_types if job_type in allowed)
+        interactive = tuple(job_type for job_type in interactive if job_type in allowed)
+    interactive = tuple(job_type for job_type in interactive if job_type not in async_types)
+
+    lanes: list[_Lane] = []
+    if async_types:
+        lanes.append(
+            _Lane(
+                name="async",
+                executor=None,
+                max_workers=config.async_max_concurrency,
+                include_job_types=async_types,
+            )
+        )
+    if interactive:
+        lanes.append(
+            _Lane(
+                name="interactive",
+                executor=ThreadPoolExecutor(
+                    max_workers=config.interactive_max_workers,
+                    thread_name_prefix=f"{config.thread_name_prefix}-interactive",
+                ),
+                max_workers=config.interactive_max_workers,
+                include_job_types=interactive,
+            )
+        )
+
+    owned = (*async_types, *interactive)
+    batch_include: tuple[str, ...] | None = None
+    if allowed:
+        batch_include = tuple(job_type for job_type in allowed if job_type not in owned)
+    if batch_include is None or batch_include:
+        lanes.append(
+            _Lane(
+                name="batch",
+                executor=ThreadPoolExecutor(
+                    max_workers=config.max_workers,
+                    thread_name_prefix=config.thread_name_prefix,
+                ),
+                max_workers=config.max_workers,
+                include_job_types=batch_include,
+                exclude_job_types=owned,
+            )
+        )
+    return lanes
+
+
+async def run_job_scheduler(
+    *,
+    job_service: JobService,
+    config: JobSchedulerConfig,
+) -> None:
+    lanes = _build_lanes(config, tuple(job_service.async_job_types()))
+    # 实现了 run_batch_async 的类型在 async lane 上按 claim 批次合并执行。
+    batch_job_types = frozenset(job_service.batch_job_types())
+    loop = asyncio.get_running_loop()
+    wakeup = asyncio.Event()
+    # 延时 job（ASR 轮询、重试）的到期时间：到期时按 job_id 定向 claim，不再等下一轮全表 claim。
+    timer = DelayedJobTimer()
+    # 定时器装载的窗口：覆盖到下一次兜底轮询之后，轮询间隙里不会漏掉到期 job。
+    timer_horizon = timedelta(seconds=config.interval_seconds * 2)
+
+    def _schedule_wakeup(job_type: str, next_run_at: datetime | None) -> None:
+        delay = 0.0
+        if next_run_at is not None:
+            delay = (next_run_at - datetime.now(timezone.utc)).total_seconds()
+        if delay <= 0:
+            wakeup.set()
+        elif delay < timer_horizon.total_seconds():
+            timer.schedule(due_at=next_run_at, job_type=job_type)
+
+    def _on_job_wakeup(job_type: str, next_run_at: datetime | None) -> None:
+        # notifier 回调可能来自请求线程、job 线程或 LISTEN 线程，统一切回事件循环。
+        try:
+            loop.call_soon_threadsafe(_schedule_wakeup, job_type, next_run_at)
+        except RuntimeError:
+            pass
+
+    def _track_rescheduled(job: JobData) -> None:
+        # 本进程刚跑完、返回 running / queued 并改期的 job（例如 ASR 下一次轮询），直接记下 job_id。
+        if job.status not in (int(JobStatus.QUEUED), int(JobStatus.RUNNING)) or job.locked_by is not None:
+            return
+        if job.next_run_at is None:
+            return
+        next_run_at = job.next_run_at
+        if next_run_at.tzinfo is None:
+            next_run_at = next_run_at.replace(tzinfo=timezone.utc)
+        if next_run_at - datetime.now(timezone.utc) < timer_horizon:
+            timer.schedule(due_at=next_run_at, job_type=job.job_type, job_id=job.job_id)
+
+    def _running_by_type() -> Counter[str]:
+        counts: Counter[str] = Counter()
+        for lane in lanes:
+            counts.update(job.job_type for job in lane.in_flight.values())
+        return counts
+
+    def _in_flight_jobs() -> list[JobData]:
+        return [job for lane in lanes for job in lane.in_flight.values()]
+
+    def _log_done(lane: _Lane, future: asyncio.Future) -> None:
+        lane.in_flight.pop(future, None)
+        JOB_RUNNER_IN_FLIGHT.set(len(lane.in_flight), lane=lane.name)
+        # 有空闲线程后立即尝试下一轮 claim。
+        wakeup.set()
+        if future.cancelled():
+            logger.warning("Job runner canceled in-flight job lane=%s", lane.name)
+            return
+        try:
+            job = future.result()
+            logger.info(
+                "Job runner completed job_id=%s job_type=%s status=%s lane=%s",
+                job.job_id,
+                job.job_type,
+                job.status_name,
+                lane.name,
+            )
+            _track_rescheduled(job)
+        except Exception:
+            logger.exception("Job runner worker failed lane=%s", lane.name)
+
+    def _submit_batch(jobs: list[JobData]) -> dict[str, asyncio.Future]:
+        """
+        同类型的一批 job 合成一个任务执行（见 BatchJobHandler），每个 job 仍有自己的 future，
+        在途计数、改期跟踪和 lease 丢失取消都按 job 处理；全部 job 被取消时才取消批任务。
+        """
+        task = asyncio.ensure_future(job_service.run_claimed_jobs_batch_async(jobs))
+        futures = {job.job_id: loop.create_future() for job in jobs}
+
+        def _resolve(done: asyncio.Future) -> None:
+            for index, job in enumerate(jobs):
+                future = futures[job.job_id]
+                if future.done():
+                    continue
+                if done.cancelled():
+                    future.cancel()
+                elif done.exception() is not None:
+                    future.set_exception(done.exception())
+                else:
+                    future.set_result(done.result()[index])
+
+        def _cancel_task(future: asyncio.Future) -> None:
+            if future.cancelled() and all(item.cancelled() for item in futures.values()):
+                task.cancel()
+
+        task.add_done_callback(_resolve)
+        for future in futures.values():
+            future.add_done_callback(_cancel_task)
+        logger.info("Job runner submitting batch job_type=%s count=%s", jobs[0].job_type, len(jobs))
+        return futures
+
+    async def _claim_for_lane(lane: _Lane, job_ids: list[str] | None = None) -> bool:
+        """
+        claim 并提交一批 job；返回 True 表示本轮 claim 满额，队列里可能还有 due job。
+        传入 job_ids 时只定向 claim 这些 job（定时器到期），不扫描其他 due job。
+        """
+        capacity = max(0, lane.max_workers - len(lane.in_flight))
+        if capacity <= 0:
+            return False
+
+        running = _running_by_type()
+        saturated: list[str] = []
+        limit = min(config.batch_size, capacity)
+        if job_ids is not None:
+            limit = min(limit, len(job_ids))
+        for job_type, type_limit in config.job_type_limits.items():
+            if not lane.handles(job_type):
+                continue
+            remaining = type_limit - running[job_type]
+            if remaining <= 0:
+                saturated.append(job_type)
+            else:
+                # 按优先级统一 claim，单批不超过最紧张类型的剩余额度，保证不会超发。
+                limit = min(limit, remaining)
+
+        include = lane.include_job_types
+        if include is not None:
+            include = tuple(job_type for job_type in include if job_type not in saturated)
+            if not include:
+                return False
+
+        try:
+            claim_started_at = time.monotonic()
+            jobs: list[JobData] = await loop.run_in_executor(
+                None,
+                partial(
+                    job_service.claim_due_jobs,
+                    limit=limit,
+                    worker_id=config.worker_id,
+                    job_types=include,
+                    exclude_job_types=[*lane.exclude_job_types, *saturated] or None,
+                    job_ids=job_ids,
+                ),
+            )
+            claim_elapsed = time.monotonic() - claim_started_at
+            JOB_CLAIM_DURATION.observe(claim_elapsed, lane=lane.name)
+            if jobs:
+                logger.info(
+                    "Job runner claimed jobs lane=%s count=%s capacity=%s elapsed_ms=%s",
+                    lane.name,
+                    len(jobs),
+                    capacity,
+                    int(claim_elapsed * 1000),
+                )
+        except Exception:
+            logger.exception("Job runner failed to claim due jobs lane=%s", lane.name)
+            return False
+
+        batches: dict[str, list[JobData]] = {}
+        if lane.executor is None:
+            for job in jobs:
+                if job.job_type in batch_job_types:
+                    batches.setdefault(job.job_type, []).append(job)
+        batch_futures: dict[str, asyncio.Future] = {}
+        for batch in batches.values():
+            if len(batch) > 1:
+                batch_futures.update(_submit_batch(batch))
+
+        for job in jobs:
+            logger.info(
+                "Job runner submitting job_id=%s job_type=%s entity_type=%s entity_id=%s lane=%s",
+                job.job_id,
+                job.job_type,
+                job.entity_type,
+                job.entity_id,
+                lane.name,
+            )
+            future = batch_futures.get(job.job_id)
+            if future is None and lane.executor is None:
+                future = asyncio.ensure_future(job_service.run_claimed_job_async(job))
+            elif future is None:
+                future = loop.run_in_executor(
+                    lane.executor,
+                    partial(job_service.run_claimed_job, job),
+                )
+            lane.in_flight[future] = job
+            JOB_CLAIMED.inc(lane=lane.name, job_type=job.job_type)
+            future.add_done_callback(partial(_log_done, lane))
+        JOB_RUNNER_IN_FLIGHT.set(len(lane.in_flight), lane=lane.name)
+
+        return len(jobs) >= limit and len(lane.in_flight) < lane.max_workers
+
+    async def _claim_timer_entries(entries: list[DelayedJobEntry]) -> None:
+        targeted_types = {entry.job_type for entry in entries if entry.job_id is not None}
+        # 只知道 job_type 的条目：同类型已有定向条目时（通常是本进程自己的改期通知）不再重复 claim。
+        typed_only = {entry.job_type for entry in entries if entry.job_id is None} - targeted_types
+        for lane in lanes:
+            job_ids = [entry.job_id for entry in entries if entry.job_id is not None and lane.handles(entry.job_type)]
+            # 同一时刻到期的条目（如对齐到同一轮询窗口的 ASR 查询）按 batch_size 分块 claim，每块在 async lane 上合成一批。
+            for start in range(0, len(job_ids), config.batch_size):
+                await _claim_for_lane(lane, job_ids[start : start + config.batch_size])
+            if any(lane.handles(job_type) for job_type in typed_only):
+                if await _claim_for_lane(lane):
+                    wakeup.set()
+
+    async def _refill_timer() -> None:
+        if config.timer_prefetch_limit <= 0:
+            return
+        try:
+            upcoming = await loop.run_in_executor(
+                None,
+                partial(
+                    job_service.list_upcoming_jobs,
+                    within=timer_horizon,
+                    limit=config.timer_prefetch_limit,
+                    job_types=config.job_types or None,
+                ),
+            )
+        except Exception:
+            logger.exception("Job runner failed to load upcoming jobs")
+            return
+        for job_id, job_type, next_run_at in upcoming:
+            if any(lane.handles(job_type) for lane in lanes):
+                timer.schedule(due_at=next_run_at, job_type=job_type, job_id=job_id)
+
+    async def _heartbeat_loop() -> None:
+        while True:
+            await asyncio.sleep(config.heartbeat_interval_seconds)
+            jobs = _in_flight_jobs()
+            if not jobs:
+                continue
+            try:
+                lost = set(await loop.run_in_executor(None, job_service.renew_leases, jobs))
+            except Exception:
+                logger.exception("Job runner failed to renew leases count=%s", len(jobs))
+                continue
+            if not lost:
+                continue
+            logger.warning("Job runner lost leases job_ids=%s", ",".join(sorted(lost)))
+            for lane in lanes:
+                if lane.executor is not None:
+                    # 线程里的 handler 无法强制中断，依赖 heartbeat 抛 JobLeaseLostError 及落库前的锁校验。
+                    continue
+                for future, job in list(lane.in_flight.items()):
+                    if job.job_id in lost:
+                        future.cancel()
+
+    def _release_in_flight() -> None:
+        jobs = _in_flight_jobs()
+        if not jobs:
+            return
+        try:
+            released = job_service.release_leases(jobs)
+            logger.info("Job runner released leases count=%s in_flight=%s", released, len(jobs))
+        except Exception:
+            logger.exception("Job runner failed to release leases count=%s", len(jobs))
+
+    for lane in lanes:
+        JOB_RUNNER_CAPACITY.set(lane.max_workers, lane=lane.name)
+        JOB_RUNNER_IN_FLIGHT.set(0, lane=lane.name)
+
+    heartbeat_task: asyncio.Task | None = None
+    if config.heartbeat_interval_seconds > 0:
+        heartbeat_task = asyncio.create_task(_heartbeat_loop())
+
+    unsubscribe = job_service.subscribe_wakeups(_on_job_wakeup)
+    next_poll_at = 0.0
+    try:
+        while True:
+            poll_due = time.monotonic() >= next_poll_at
+            if poll_due or wakeup.is_set():
+                wakeup.clear()
+                for lane in lanes:
+                    if await _claim_for_lane(lane):
+                        wakeup.set()
+                if poll_due:
+                    next_poll_at = time.monotonic() + config.interval_seconds
+                    await _refill_timer()
+
+            due_entries = timer.pop_due(datetime.now(timezone.utc))
+            if due_entries:
+                await _claim_timer_entries(due_entries)
+
+            # 新 job 立即唤醒，延时 job 在定时器到期时唤醒；interval_seconds 只是兜底轮询。
+            timeout = max(0.0, next_poll_at - time.monotonic())
+            until_timer = timer.seconds_until_next(datetime.now(timezone.utc))
+            if until_timer is not None:
+                timeout = min(timeout, until_timer)
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+    except asyncio.CancelledError:
+        logger.info("Job runner scheduler stopped")
+        raise
+    finally:
+        unsubscribe()
+        if heartbeat_task is not None:
+            heartbeat_task.cancel()
+        # 释放在途 job 的锁，其他副本立即可以接手，不必等 locked_until 过期。
+        _release_in_flight()
+        for lane in lanes:
+            if lane.executor is None:
+                for future in list(lane.in_flight):
+                    future.cancel()
+            else:
+                lane.executor.shutdown(wait=False, cancel_futures=False)
+            JOB_RUNNER_CAPACITY.set(0, lane=lane.name)
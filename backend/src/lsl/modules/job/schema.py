@@ -25,6 +25,10 @@ class CreateJobRequest(BaseModel):
     priority: int = Field(default=0)
     max_attempts: int = Field(default=3, ge=1, le=100)
     next_run_at: datetime | None = None
+    # true 时按 (job_type, entity_type, entity_id, payload) 去重，窗口内重复提交返回已有 job。
+    dedup: bool = False
+    # 上游 job_id 列表；全部完成后才会被 claim，任一失败 / 取消时级联取消。
+    depends_on: list[str] = Field(default_factory=list, max_length=32)
 
     @field_validator("job_type", "entity_type", "entity_id")
     @classmethod
@@ -1,15 +1,36 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import logging
+import threading
+import time
 import uuid
-from datetime import datetime
-from typing import Any
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Sequence
 
+from lsl.modules.event.broadcaster import EventBroadcaster
+from lsl.modules.job.metrics import JOB_OUTCOMES, JOB_RUN_DURATION
+from lsl.modules.job.notifier import InProcessJobNotifier, JobNotifier, JobWakeupListener
 from lsl.modules.job.repo import JobRepository
-from lsl.modules.job.types import JobData, JobHandler, JobRunResult, JobStatus
+from lsl.modules.job.types import (
+    AsyncJobHandler,
+    BatchJobHandler,
+    JobData,
+    JobHandler,
+    JobLeaseLostError,
+    JobRunResult,
+    JobSpec,
+    JobStatus,
+    job_status_to_name,
+)
 
 logger = logging.getLogger(__name__)
 
+# 上游 job 完成后生成后续 job 的钩子：(已完成的 job, handler 结果) -> 后续 job 列表。
+FollowUpBuilder = Callable[[JobData, JobRunResult], Sequence[JobSpec]]
+
 
 class JobService:
     """
@@ -17,6 +38,12 @@ class JobService:
     - 管理 job 生命周期与锁
     - 通过 job_type 分发到业务模块注册的 handler
     - 不持久化业务主结果，只保存 job 状态和轻量元数据
+    - job 变为可运行时通过 notifier 唤醒 scheduler
+    - 长任务通过 heartbeat 续约锁；lease 丢失后当前副本的结果不再落库
+    - 带 dedup_key 创建时，去重窗口内的重复请求复用已有 queued / running job
+    - job 可声明上游依赖；完成时在同一事务内解除下游阻塞并写入 follow-up job，流水线不需要前端串联
+    - 状态 / 进度变化通过 event_broadcaster 推送到 SSE，前端无需轮询
+    - 实现 run_batch_async 的 handler 按批执行，改期结果用一条批量 UPDATE 写回
     """
 
     def __init__(
@@ -24,12 +51,28 @@ class JobService:
         *,
         repository: JobRepository,
         lock_ttl_seconds: int = 300,
+        notifier: JobNotifier | None = None,
+        priority_aging_seconds: int = 0,
+        dedup_window_seconds: int = 600,
+        event_broadcaster: EventBroadcaster | None = None,
     ) -> None:
         self._repository = repository
+        self._event_broadcaster = event_broadcaster
         self._lock_ttl_seconds = lock_ttl_seconds
-        self._handlers: dict[str, JobHandler] = {}
+        self._dedup_window_seconds = max(0, int(dedup_window_seconds))
+        self._priority_aging_seconds = max(0, int(priority_aging_seconds))
+        self._notifier: JobNotifier = notifier or InProcessJobNotifier()
+        self._handlers: dict[str, JobHandler | AsyncJobHandler | BatchJobHandler] = {}
+        self._follow_up_builders: dict[str, list[FollowUpBuilder]] = {}
+        self._lease_lock = threading.Lock()
+        self._running_job_ids: set[str] = set()
+        self._lost_lease_job_ids: set[str] = set()
+
+    @property
+    def lock_ttl_seconds(self) -> int:
+        return self._lock_ttl_seconds
 
-    def register_handler(self, handler: JobHandler) -> None:
+    def register_handler(self, handler: JobHandler | AsyncJobHandler | BatchJobHandler) -> None:
         job_type = handler.job_type.strip()
         if not job_type:
             raise ValueError("job_type is required")
@@ -37,6 +80,28 @@ class JobService:
             raise ValueError(f"job handler already registered: {job_type}")
         self._handlers[job_type] = handler
 
+    def register_follow_up(self, job_type: str, builder: FollowUpBuilder) -> None:
+        """job_type 的 job 完成时调用 builder，返回的 job 与完成状态同一事务入队。"""
+        normalized_job_type = job_type.strip()
+        if not normalized_job_type:
+            raise ValueError("job_type is required")
+        self._follow_up_builders.setdefault(normalized_job_type, []).append(builder)
+
+    def registered_job_types(self) -> list[str]:
+        return sorted(self._handlers)
+
+    def async_job_types(self) -> list[str]:
+        return sorted(job_type for job_type, handler in self._handlers.items() if self._is_async_handler(handler))
+
+    def batch_job_types(self) -> list[str]:
+        return sorted(job_type for job_type, handler in self._handlers.items() if self._is_batch_handler(handler))
+
+    def subscribe_wakeups(self, listener: JobWakeupListener) -> Callable[[], None]:
+        return self._notifier.subscribe(listener)
+
+    def close(self) -> None:
+        self._notifier.close()
+
     def create_job(
         self,
         *,
@@ -47,24 +112,109 @@ class JobService:
         priority: int = 0,
         max_attempts: int = 3,
         next_run_at: datetime | None = None,
+        dedup_key: str | None = None,
+        depends_on: Sequence[str] | None = None,
     ) -> JobData:
+        """
+        创建 job。传入 dedup_key（见 build_dedup_key）时：
+        - 去重窗口内已有同 job_type、同 key 的 queued / running job，直接返回该 job
+        - 已有 job 超出窗口时释放其 key 后正常入队，旧 job 继续由业务侧的 supersede 逻辑处理
+        传入 depends_on 时，上游全部完成后才会被 claim；任一上游失败 / 取消时本 job 被级联取消。
+        """
         normalized_job_type = job_type.strip()
         if not normalized_job_type:
             raise ValueError("job_type is required")
         if max_attempts <= 0:
             raise ValueError("max_attempts must be greater than 0")
+        parent_job_ids = [item.strip() for item in depends_on or () if item.strip()]
+        for parent_job_id in parent_job_ids:
+            try:
+                uuid.UUID(parent_job_id)
+            except ValueError as exc:
+                raise ValueError(f"invalid depends_on job_id: {parent_job_id}") from exc
+        normalized_dedup_key = self._normalize_optional(dedup_key)
+        if normalized_dedup_key is not None:
+            existing = self.find_active_job(job_type=normalized_job_type, dedup_key=normalized_dedup_key)
+            if existing is not None:
+                logger.info(
+                    "Job deduplicated job_id=%s job_type=%s dedup_key=%s",
+                    existing.job_id,
+                    normalized_job_type,
+                    normalized_dedup_key,
+                )
+                return existing
 
-        row = self._repository.create_job(
-            job_id=uuid.uuid4().hex,
-            job_type=normalized_job_type,
-            entity_type=self._normalize_optional(entity_type),
-            entity_id=self._normalize_optional(entity_id),
-            payload=dict(payload or {}),
-            priority=int(priority),
-            max_attempts=int(max_attempts),
-            next_run_at=next_run_at,
+        def _insert() -> dict[str, Any] | None:
+            return self._repository.create_job(
+                job_id=uuid.uuid4().hex,
+                job_type=normalized_job_type,
+                entity_type=self._normalize_optional(entity_type),
+                entity_id=self._normalize_optional(entity_id),
+                payload=dict(payload or {}),
+                priority=int(priority),
+                max_attempts=int(max_attempts),
+                next_run_at=next_run_at,
+                dedup_key=normalized_dedup_key,
+                depends_on=parent_job_ids,
+            )
+
+        row = _insert()
+        if row is None and normalized_dedup_key is not None:
+            # 并发请求先插入，或占用 key 的 job 已超出窗口：前者复用，后者释放 key 后重试一次。
+            existing = self.find_active_job(job_type=normalized_job_type, dedup_key=normalized_dedup_key)
+            if existing is not None:
+                return existing
+            self._repository.release_dedup_key(
+                job_type=normalized_job_type,
+                dedup_key=normalized_dedup_key,
+                created_before=self._dedup_window_start(),
+            )
+            row = _insert()
+        if row is None:
+            raise RuntimeError("Failed to create job: dedup key is held by another job")
+        data = self._to_data(row)
+        self._publish_job_event(data)
+        if data.status == int(JobStatus.QUEUED) and data.pending_dependencies == 0:
+            self._notify_wakeup(job_type=normalized_job_type, next_run_at=next_run_at)
+        return data
+
+    def list_dependencies(self, *, job_id: str) -> list[str]:
+        return self._repository.list_dependencies(job_id)
+
+    def find_active_job(self, *, job_type: str, dedup_key: str) -> JobData | None:
+        """返回去重窗口内同 job_type、同 dedup_key 的 queued / running job；业务侧可在产生副作用前先检查。"""
+        row = self._repository.get_active_job_by_dedup_key(
+            job_type=job_type.strip(),
+            dedup_key=dedup_key,
+            created_after=self._dedup_window_start() if self._dedup_window_seconds > 0 else None,
         )
-        return self._to_data(row)
+        return self._to_data(row) if row is not None else None
+
+    @staticmethod
+    def build_dedup_key(
+        *,
+        job_type: str,
+        entity_type: str | None = None,
+        entity_id: str | None = None,
+        payload: dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
+    ) -> str:
+        """
+        生成 dedup_key：
+        - 默认对 (job_type, entity_type, entity_id, payload) 的规范化 JSON 取 sha256
+        - 传入 idempotency_key（例如客户端的 Idempotency-Key 请求头）时只按 (job_type, idempotency_key) 计算
+        """
+        if idempotency_key is not None:
+            source: dict[str, Any] = {"job_type": job_type, "idempotency_key": idempotency_key}
+        else:
+            source = {
+                "job_type": job_type,
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "payload": payload or {},
+            }
+        encoded = json.dumps(source, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
 
     def get_job(self, *, job_id: str) -> JobData:
         row = self._repository.get_job_by_id(job_id)
@@ -94,6 +244,64 @@ class JobService:
         )
         return [self._to_data(row) for row in rows]
 
+    def purge_finished_jobs(
+        self,
+        *,
+        older_than: timedelta,
+        batch_size: int = 500,
+        archive: bool = True,
+        max_batches: int | None = None,
+        pause_seconds: float = 0.0,
+    ) -> int:
+        """
+        分批清理 older_than 之前结束的终态 job；archive=True 时先搬入 job_jobs_archive。
+        返回清理的总行数。
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be greater than 0")
+        if older_than.total_seconds() <= 0:
+            raise ValueError("older_than must be greater than 0")
+        finished_before = datetime.now(timezone.utc) - older_than
+        total = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            purged = self._repository.purge_finished_jobs(
+                finished_before=finished_before,
+                limit=batch_size,
+                archive=archive,
+            )
+            total += purged
+            batches += 1
+            if purged < batch_size:
+                break
+            if pause_seconds > 0:
+                # 批次之间让出数据库，避免清理挤占 claim / 状态迁移。
+                time.sleep(pause_seconds)
+        if total:
+            logger.info(
+                "Job retention purged jobs count=%s batches=%s archive=%s finished_before=%s",
+                total,
+                batches,
+                archive,
+                finished_before.isoformat(),
+            )
+        return total
+
+    def queue_depth(self) -> list[tuple[str, str, int]]:
+        """非终态 job 数，按 (job_type, status_name, count) 返回，供 /metrics 使用。"""
+        rows = self._repository.count_jobs_by_type_and_status(statuses=(JobStatus.QUEUED, JobStatus.RUNNING))
+        return [(job_type, job_status_to_name(status), count) for job_type, status, count in rows]
+
+    def queue_lag_seconds(self) -> dict[str, float]:
+        """每个 job_type 最早一条已到期未被 claim 的 job 已等待的秒数。"""
+        now = datetime.now(timezone.utc)
+        lag: dict[str, float] = {}
+        for job_type, due_since in self._repository.oldest_due_by_type(now):
+            if due_since.tzinfo is None:
+                due_since = due_since.replace(tzinfo=timezone.utc)
+            lag[job_type] = max(0.0, (now - due_since).total_seconds())
+        return lag
+
     def run_job(self, *, job_id: str, worker_id: str | None = None) -> JobData:
         resolved_worker_id = self._resolve_worker_id(worker_id)
         row = self._repository.claim_job(
@@ -103,12 +311,45 @@ class JobService:
         )
         if row is None:
             raise ValueError("job not found or not runnable")
-        return self._run_claimed_job(self._to_data(row))
+        data = self._to_data(row)
+        self._publish_job_event(data)
+        return self._run_claimed_job(data)
+
+    def run_job_with(
+        self,
+        *,
+        job_id: str,
+        runner: Callable[[JobData], JobRunResult],
+        worker_id: str | None = None,
+    ) -> JobData | None:
+        """
+        外部事件（如 provider 回调）直接推进 job：按主键 claim 后在当前线程用 runner 代替 handler 执行，
+        结果照常落库（follow-up、事件推送不变）。job 正被其他 worker 持有或已结束时返回 None。
+        """
+        row = self._repository.claim_job(
+            job_id=job_id,
+            worker_id=self._resolve_worker_id(worker_id),
+            lock_ttl_seconds=self._lock_ttl_seconds,
+        )
+        if row is None:
+            return None
+        data = self._to_data(row)
+        self._publish_job_event(data)
+        return self._run_claimed_job(data, runner=runner)
 
     def run_due_jobs(self, *, limit: int = 10, worker_id: str | None = None) -> list[JobData]:
         return [self.run_claimed_job(job) for job in self.claim_due_jobs(limit=limit, worker_id=worker_id)]
 
-    def claim_due_jobs(self, *, limit: int = 10, worker_id: str | None = None) -> list[JobData]:
+    def claim_due_jobs(
+        self,
+        *,
+        limit: int = 10,
+        worker_id: str | None = None,
+        job_types: Sequence[str] | None = None,
+        exclude_job_types: Sequence[str] | None = None,
+        job_ids: Sequence[str] | None = None,
+    ) -> list[JobData]:
+        """claim 到期 job；传入 job_ids 时只按主键 claim 这些 job（scheduler 定时器到期后的定向 claim）。"""
         if limit <= 0:
             raise ValueError("limit must be greater than 0")
         if limit > 100:
@@ -118,45 +359,244 @@ class JobService:
             worker_id=resolved_worker_id,
             limit=limit,
             lock_ttl_seconds=self._lock_ttl_seconds,
+            job_types=self._normalize_job_types(job_types),
+            exclude_job_types=self._normalize_job_types(exclude_job_types),
+            priority_aging_seconds=self._priority_aging_seconds,
+            job_ids=job_ids,
         )
-        return [self._to_data(row) for row in rows]
+        jobs = [self._to_data(row) for row in rows]
+        for job in jobs:
+            self._publish_job_event(job)
+        return jobs
+
+    def list_upcoming_jobs(
+        self,
+        *,
+        within: timedelta,
+        limit: int = 500,
+        job_types: Sequence[str] | None = None,
+        exclude_job_types: Sequence[str] | None = None,
+    ) -> list[tuple[str, str, datetime]]:
+        """接下来 within 内到期的 (job_id, job_type, next_run_at)，scheduler 用来装载定时器。"""
+        if limit <= 0:
+            raise ValueError("limit must be greater than 0")
+        now = datetime.now(timezone.utc)
+        items: list[tuple[str, str, datetime]] = []
+        for job_id, job_type, next_run_at in self._repository.list_upcoming_jobs(
+            now=now,
+            until=now + within,
+            limit=limit,
+            job_types=self._normalize_job_types(job_types),
+            exclude_job_types=self._normalize_job_types(exclude_job_types),
+        ):
+            if next_run_at.tzinfo is None:
+                next_run_at = next_run_at.replace(tzinfo=timezone.utc)
+            items.append((job_id, job_type, next_run_at))
+        return items
 
     def run_claimed_job(self, job: JobData) -> JobData:
         return self._run_claimed_job(job)
 
-    def _run_claimed_job(self, job: JobData) -> JobData:
+    async def run_claimed_job_async(self, job: JobData) -> JobData:
+        """在事件循环上执行 async handler；状态落库仍走线程，避免阻塞事件循环。"""
         handler = self._handlers.get(job.job_type)
-        if handler is None:
+        if handler is None or not self._is_async_handler(handler):
+            return await asyncio.to_thread(self._run_claimed_job, job)
+
+        self._track_running(job.job_id)
+        started_at = time.monotonic()
+        try:
+            try:
+                result = await handler.run_async(job)
+            except JobLeaseLostError:
+                return await asyncio.to_thread(self._lease_lost_result, job)
+            except Exception as exc:
+                logger.exception("Job handler failed job_id=%s job_type=%s", job.job_id, job.job_type)
+                return await asyncio.to_thread(self._mark_handler_error, job, exc)
+
+            return await asyncio.to_thread(self._apply_run_result, job=job, result=result)
+        finally:
+            self._untrack_running(job.job_id)
+            JOB_RUN_DURATION.observe(time.monotonic() - started_at, job_type=job.job_type)
+
+    async def run_claimed_jobs_batch_async(self, jobs: Sequence[JobData]) -> list[JobData]:
+        """
+        把同一 job_type 的一批 job 交给 handler.run_batch_async 一次执行；
+        handler 不支持批量时逐个走 run_claimed_job_async。返回顺序与 jobs 一致。
+        """
+        if not jobs:
+            return []
+        handler = self._handlers.get(jobs[0].job_type)
+        if (
+            handler is None
+            or not self._is_batch_handler(handler)
+            or any(job.job_type != jobs[0].job_type for job in jobs)
+        ):
+            return list(await asyncio.gather(*(self.run_claimed_job_async(job) for job in jobs)))
+
+        for job in jobs:
+            self._track_running(job.job_id)
+        started_at = time.monotonic()
+        try:
+            try:
+                results = await handler.run_batch_async(jobs)
+                if len(results) != len(jobs):
+                    raise RuntimeError(f"batch handler returned {len(results)} results for {len(jobs)} jobs")
+            except Exception as exc:
+                logger.exception("Job batch handler failed job_type=%s count=%s", jobs[0].job_type, len(jobs))
+                return await asyncio.to_thread(lambda: [self._mark_handler_error(job, exc) for job in jobs])
+
+            return await asyncio.to_thread(self._apply_run_results, jobs, results)
+        finally:
+            elapsed = time.monotonic() - started_at
+            for job in jobs:
+                self._untrack_running(job.job_id)
+                JOB_RUN_DURATION.observe(elapsed, job_type=job.job_type)
+
+    def heartbeat(self, job: JobData, *, progress: int | None = None) -> None:
+        """
+        handler 在长任务中定期调用：续约 job 锁，可顺带更新进度。
+        lease 已丢失（锁过期后被其他 worker 接管，或关闭时已释放）时抛 JobLeaseLostError，
+        handler 应停止后续的外部调用。
+        """
+        if job.locked_by is None or self._is_lease_lost(job.job_id):
+            raise JobLeaseLostError(f"job lease lost: {job.job_id}")
+        renewed = self._repository.renew_leases(
+            job_ids=[job.job_id],
+            worker_id=job.locked_by,
+            lock_ttl_seconds=self._lock_ttl_seconds,
+            progress=progress,
+        )
+        if not renewed:
+            self._mark_leases_lost([job.job_id])
+            raise JobLeaseLostError(f"job lease lost: {job.job_id}")
+        if progress is not None:
+            self._publish_job_event(job, progress=progress)
+
+    def renew_leases(self, jobs: Sequence[JobData]) -> list[str]:
+        """scheduler 定期为在途 job 续约；返回已丢失 lease 的 job_id。"""
+        lost: list[str] = []
+        for worker_id, job_ids in self._group_by_worker(jobs).items():
+            renewed = set(
+                self._repository.renew_leases(
+                    job_ids=job_ids,
+                    worker_id=worker_id,
+                    lock_ttl_seconds=self._lock_ttl_seconds,
+                )
+            )
+            lost.extend(job_id for job_id in job_ids if job_id not in renewed)
+        self._mark_leases_lost(lost)
+        return lost
+
+    def release_leases(self, jobs: Sequence[JobData]) -> int:
+        """优雅关闭时释放在途 job 的锁，其他 runner 无需等 TTL 过期即可接手。"""
+        # 先在本地标记 lease 丢失：仍在执行的 handler 下次 heartbeat 即停止，结果也不会再落库。
+        self._mark_leases_lost([job.job_id for job in jobs])
+        released = 0
+        for worker_id, job_ids in self._group_by_worker(jobs).items():
+            released += self._repository.release_leases(job_ids=job_ids, worker_id=worker_id)
+        if released:
+            for job_type in sorted({job.job_type for job in jobs}):
+                self._notify_wakeup(job_type=job_type, next_run_at=None)
+        return released
+
+    def _run_claimed_job(self, job: JobData, *, runner: Callable[[JobData], JobRunResult] | None = None) -> JobData:
+        handler = self._handlers.get(job.job_type)
+        if handler is None and runner is None:
             row = self._repository.mark_failed(
                 job_id=job.job_id,
                 error_code="JOB_HANDLER_NOT_FOUND",
                 error_message=f"job handler is not registered: {job.job_type}",
+                worker_id=job.locked_by,
             )
-            return self._to_data(row)
+            return self._row_or_lease_lost(job, row, outcome="failed")
 
+        self._track_running(job.job_id)
+        started_at = time.monotonic()
         try:
-            result = handler.run(job)
-        except Exception as exc:
-            logger.exception("Job handler failed job_id=%s job_type=%s", job.job_id, job.job_type)
-            row = self._repository.mark_failed(
-                job_id=job.job_id,
-                error_code="JOB_HANDLER_ERROR",
-                error_message=str(exc),
-            )
-            return self._to_data(row)
+            try:
+                if runner is not None:
+                    result = runner(job)
+                elif hasattr(handler, "run"):
+                    result = handler.run(job)
+                else:
+                    # 只实现了 run_async 的 handler（例如 POST /jobs/{id}/run 调试入口）在当前线程跑一个事件循环。
+                    result = asyncio.run(handler.run_async(job))
+            except JobLeaseLostError:
+                return self._lease_lost_result(job)
+            except Exception as exc:
+                logger.exception("Job handler failed job_id=%s job_type=%s", job.job_id, job.job_type)
+                return self._mark_handler_error(job, exc)
+
+            return self._apply_run_result(job=job, result=result)
+        finally:
+            self._untrack_running(job.job_id)
+            JOB_RUN_DURATION.observe(time.monotonic() - started_at, job_type=job.job_type)
+
+    def _mark_handler_error(self, job: JobData, exc: Exception) -> JobData:
+        row = self._repository.mark_failed(
+            job_id=job.job_id,
+            error_code="JOB_HANDLER_ERROR",
+            error_message=str(exc),
+            worker_id=job.locked_by,
+        )
+        return self._row_or_lease_lost(job, row, outcome="failed")
+
+    def _row_or_lease_lost(self, job: JobData, row: dict[str, Any] | None, *, outcome: str) -> JobData:
+        if row is None:
+            return self._lease_lost_result(job)
+        JOB_OUTCOMES.inc(job_type=job.job_type, outcome=outcome)
+        data = self._to_data(row)
+        self._publish_job_event(data)
+        return data
+
+    def _lease_lost_result(self, job: JobData) -> JobData:
+        # 锁已归其他 worker（或已释放），丢弃本副本的结果，返回库里的最新状态。
+        logger.warning(
+            "Job lease lost, result discarded job_id=%s job_type=%s worker_id=%s",
+            job.job_id,
+            job.job_type,
+            job.locked_by,
+        )
+        JOB_OUTCOMES.inc(job_type=job.job_type, outcome="lease_lost")
+        row = self._repository.get_job_by_id(job.job_id)
+        return self._to_data(row) if row is not None else job
+
+    def _track_running(self, job_id: str) -> None:
+        with self._lease_lock:
+            self._running_job_ids.add(job_id)
+            self._lost_lease_job_ids.discard(job_id)
 
-        return self._apply_run_result(job=job, result=result)
+    def _untrack_running(self, job_id: str) -> None:
+        with self._lease_lock:
+            self._running_job_ids.discard(job_id)
+            self._lost_lease_job_ids.discard(job_id)
+
+    def _mark_leases_lost(self, job_ids: Sequence[str]) -> None:
+        with self._lease_lock:
+            # 只记录仍在本进程执行的 job，已结束的 job 不需要通知。
+            self._lost_lease_job_ids.update(job_id for job_id in job_ids if job_id in self._running_job_ids)
+
+    def _is_lease_lost(self, job_id: str) -> bool:
+        with self._lease_lock:
+            return job_id in self._lost_lease_job_ids
 
     def _apply_run_result(self, *, job: JobData, result: JobRunResult) -> JobData:
         if result.status == JobStatus.COMPLETED:
+            follow_ups = self._collect_follow_ups(job, result)
             row = self._repository.mark_completed(
                 job_id=job.job_id,
                 progress=result.progress,
                 result=result.result,
                 entity_type=result.entity_type,
                 entity_id=result.entity_id,
+                worker_id=job.locked_by,
+                follow_ups=follow_ups,
             )
-            return self._to_data(row)
+            data = self._row_or_lease_lost(job, row, outcome="completed")
+            if row is not None:
+                self._notify_downstream(data, follow_ups)
+            return data
 
         if result.status == JobStatus.FAILED:
             row = self._repository.mark_failed(
@@ -164,12 +604,19 @@ class JobService:
                 progress=result.progress,
                 error_code=result.error_code or "JOB_FAILED",
                 error_message=result.error_message,
+                worker_id=job.locked_by,
             )
-            return self._to_data(row)
+            return self._row_or_lease_lost(job, row, outcome="failed")
 
         if result.status == JobStatus.CANCELED:
-            row = self._repository.mark_canceled(job_id=job.job_id, error_message=result.error_message)
-            return self._to_data(row)
+            row = self._repository.mark_canceled(
+                job_id=job.job_id,
+                error_message=result.error_message,
+                worker_id=job.locked_by,
+            )
+            # 业务模块被新 job 取代时以 "... superseded" 取消，单独计数便于观察重复触发。
+            outcome = "superseded" if "superseded" in (result.error_message or "") else "canceled"
+            return self._row_or_lease_lost(job, row, outcome=outcome)
 
         if result.status in (JobStatus.QUEUED, JobStatus.RUNNING):
             row = self._repository.mark_running(
@@ -178,15 +625,123 @@ class JobService:
                 next_run_at=result.next_run_at,
                 entity_type=result.entity_type,
                 entity_id=result.entity_id,
+                worker_id=job.locked_by,
             )
-            return self._to_data(row)
+            data = self._row_or_lease_lost(job, row, outcome="rescheduled")
+            if row is not None:
+                self._notify_wakeup(job_type=job.job_type, next_run_at=result.next_run_at)
+            return data
 
         row = self._repository.mark_failed(
             job_id=job.job_id,
             error_code="INVALID_JOB_RESULT",
             error_message=f"unsupported job result status: {result.status}",
+            worker_id=job.locked_by,
         )
-        return self._to_data(row)
+        return self._row_or_lease_lost(job, row, outcome="failed")
+
+    def _apply_run_results(self, jobs: Sequence[JobData], results: Sequence[JobRunResult]) -> list[JobData]:
+        """
+        批量落库：只改期、不改实体的结果（轮询类 job 的常态）按 worker 合并成一次 mark_running_many，
+        其余结果逐个走 _apply_run_result。
+        """
+        applied: dict[str, JobData] = {}
+        rescheduled: dict[str, list[tuple[JobData, JobRunResult]]] = {}
+        for job, result in zip(jobs, results):
+            if (
+                result.status in (JobStatus.QUEUED, JobStatus.RUNNING)
+                and result.entity_type is None
+                and result.entity_id is None
+                and job.locked_by is not None
+                and not self._is_lease_lost(job.job_id)
+            ):
+                rescheduled.setdefault(job.locked_by, []).append((job, result))
+            else:
+                applied[job.job_id] = self._apply_run_result(job=job, result=result)
+
+        for worker_id, pairs in rescheduled.items():
+            rows = self._repository.mark_running_many(
+                items=[(job.job_id, result.progress, result.next_run_at) for job, result in pairs],
+                worker_id=worker_id,
+            )
+            rows_by_id = {row["job_id"]: row for row in rows}
+            due_times: dict[str, list[datetime | None]] = {}
+            for job, result in pairs:
+                row = rows_by_id.get(job.job_id)
+                applied[job.job_id] = self._row_or_lease_lost(job, row, outcome="rescheduled")
+                if row is not None:
+                    due_times.setdefault(job.job_type, []).append(result.next_run_at)
+            # 同类型只发一次唤醒（取最早的到期时间），批量改期不会放大成 N 条 NOTIFY。
+            for job_type, values in due_times.items():
+                next_run_at = None if None in values else min(value for value in values if value is not None)
+                self._notify_wakeup(job_type=job_type, next_run_at=next_run_at)
+
+        return [applied[job.job_id] for job in jobs]
+
+    def _collect_follow_ups(self, job: JobData, result: JobRunResult) -> list[JobSpec]:
+        follow_ups = list(result.follow_ups)
+        for builder in self._follow_up_builders.get(job.job_type, []):
+            try:
+                follow_ups.extend(builder(job, result))
+            except Exception:
+                # 后续 job 生成失败不影响当前 job 的完成，用户仍可手动触发下一步。
+                logger.exception("Failed to build follow-up jobs job_id=%s job_type=%s", job.job_id, job.job_type)
+        return follow_ups
+
+    def _notify_downstream(self, job: JobData, follow_ups: Sequence[JobSpec]) -> None:
+        job_types = {spec.job_type for spec in follow_ups}
+        if job.has_dependents:
+            job_types.update(self._repository.list_ready_dependent_job_types(job.job_id))
+        for job_type in sorted(job_types):
+            self._notify_wakeup(job_type=job_type, next_run_at=None)
+
+    def _notify_wakeup(self, *, job_type: str, next_run_at: datetime | None) -> None:
+        try:
+            self._notifier.notify(job_type=job_type, next_run_at=next_run_at)
+        except Exception:
+            # 通知失败不影响 job 本身，scheduler 仍有兜底轮询。
+            logger.exception("Failed to notify job wakeup job_type=%s", job_type)
+
+    def _publish_job_event(self, job: JobData, *, progress: int | None = None) -> None:
+        if self._event_broadcaster is None:
+            return
+        session_id = job.payload.get("session_id") if isinstance(job.payload, dict) else None
+        if not session_id and job.entity_type == "session":
+            session_id = job.entity_id
+        self._event_broadcaster.publish(
+            event_type="job",
+            data={
+                "job_id": job.job_id,
+                "job_type": job.job_type,
+                "status": job.status,
+                "status_name": job.status_name,
+                "progress": job.progress if progress is None else progress,
+                "error_code": job.error_code,
+                "error_message": job.error_message,
+            },
+            session_id=str(session_id) if session_id else None,
+            entity_type=job.entity_type,
+            entity_id=job.entity_id,
+        )
+
+    def _dedup_window_start(self) -> datetime:
+        return datetime.now(timezone.utc) - timedelta(seconds=self._dedup_window_seconds)
+
+    @staticmethod
+    def _is_async_handler(handler: JobHandler | AsyncJobHandler | BatchJobHandler) -> bool:
+        return asyncio.iscoroutinefunction(getattr(handler, "run_async", None))
+
+    @staticmethod
+    def _is_batch_handler(handler: JobHandler | AsyncJobHandler | BatchJobHandler) -> bool:
+        return asyncio.iscoroutinefunction(getattr(handler, "run_batch_async", None))
+
+    @staticmethod
+    def _group_by_worker(jobs: Sequence[JobData]) -> dict[str, list[str]]:
+        grouped: dict[str, list[str]] = {}
+        for job in jobs:
+            if job.locked_by:
+                grouped.setdefault(job.locked_by, []).append(job.job_id)
+        return grouped
 
     @staticmethod
     def _to_data(row: dict[str, Any]) -> JobData:
@@ -199,6 +754,12 @@ class JobService:
         normalized = value.strip()
         return normalized or None
 
+    @staticmethod
+    def _normalize_job_types(job_types: Sequence[str] | None) -> list[str] | None:
+        if not job_types:
+            return None
+        return [item.strip() for item in job_types if item.strip()] or None
+
     @staticmethod
     def _resolve_worker_id(worker_id: str | None) -> str:
         normalized = (worker_id or "").strip()
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+
+@dataclass(order=True, frozen=True, slots=True)
+class DelayedJobEntry:
+    due_at: datetime
+    seq: int
+    job_type: str = field(compare=False)
+    # None 表示只知道 job_type（来自 notifier），到期后对该类型做一次普通 claim。
+    job_id: str | None = field(default=None, compare=False)
+
+
+class DelayedJobTimer:
+    """
+    scheduler 进程内的延时 job 最小堆：
+    - 按 next_run_at 排序，scheduler 只等到最近一条到期，而不是按固定间隔轮询
+    - 同一 job_id 重复装载时只保留最新的到期时间，旧条目在弹出时惰性丢弃
+    - 只在事件循环线程中使用，不加锁
+    """
+
+    def __init__(self, *, max_entries: int = 10000) -> None:
+        self._heap: list[DelayedJobEntry] = []
+        self._seq = itertools.count()
+        self._due_by_job_id: dict[str, datetime] = {}
+        self._max_entries = max(1, max_entries)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def schedule(self, *, due_at: datetime, job_type: str, job_id: str | None = None) -> bool:
+        """装载一条到期时间；堆已满时返回 False，由兜底轮询处理。"""
+        if due_at.tzinfo is None:
+            due_at = due_at.replace(tzinfo=timezone.utc)
+        if job_id is not None:
+            if self._due_by_job_id.get(job_id) == due_at:
+                return True
+            if len(self._heap) >= self._max_entries:
+                return False
+            self._due_by_job_id[job_id] = due_at
+        elif len(self._heap) >= self._max_entries:
+            return False
+        heapq.heappush(self._heap, DelayedJobEntry(due_at=due_at, seq=next(self._seq), job_type=job_type, job_id=job_id))
+        return True
+
+    def pop_due(self, now: datetime) -> list[DelayedJobEntry]:
+        due: list[DelayedJobEntry] = []
+        while self._heap and self._heap[0].due_at <= now:
+            entry = heapq.heappop(self._heap)
+            if entry.job_id is not None:
+                if self._due_by_job_id.get(entry.job_id) != entry.due_at:
+                    # 已被更新的到期时间取代。
+                    continue
+                del self._due_by_job_id[entry.job_id]
+            due.append(entry)
+        return due
+
+    def seconds_until_next(self, now: datetime) -> float | None:
+        if not self._heap:
+            return None
+        return max(0.0, (self._heap[0].due_at - now).total_seconds())
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self._due_by_job_id.clear()
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import IntEnum
-from typing import Any, Protocol
+from typing import Any, Protocol, Sequence
 
 
 class JobStatus(IntEnum):
@@ -27,6 +27,25 @@ def job_status_to_name(status_code: int) -> str:
     return JOB_STATUS_NAME_MAP.get(status_code, "unknown")
 
 
+class JobLeaseLostError(RuntimeError):
+    """job 的锁已过期并被其他 worker 接管（或已在关闭时释放），当前副本应尽快停止。"""
+
+
+@dataclass(frozen=True, slots=True)
+class JobSpec:
+    """待创建 job 的描述；handler 通过 JobRunResult.follow_ups 返回，与当前 job 的完成在同一事务内入队。"""
+
+    job_type: str
+    entity_type: str | None = None
+    entity_id: str | None = None
+    payload: dict[str, Any] = field(default_factory=dict)
+    priority: int = 0
+    max_attempts: int = 3
+    dedup_key: str | None = None
+    # 额外的上游 job；全部完成后才会被 claim。
+    depends_on: tuple[str, ...] = ()
+
+
 @dataclass(frozen=True, slots=True)
 class JobRunResult:
     status: JobStatus
@@ -37,6 +56,8 @@ class JobRunResult:
     error_message: str | None = None
     entity_type: str | None = None
     entity_id: str | None = None
+    # 只在 status 为 COMPLETED 时生效。
+    follow_ups: tuple[JobSpec, ...] = ()
 
 
 @dataclass(frozen=True, slots=True)
@@ -51,6 +72,9 @@ class JobData:
     progress: int = 0
     attempts: int = 0
     max_attempts: int = 3
+    dedup_key: str | None = None
+    pending_dependencies: int = 0
+    has_dependents: bool = False
     payload: dict[str, Any] = field(default_factory=dict)
     result: dict[str, Any] | None = None
     error_code: str | None = None
@@ -69,3 +93,28 @@ class JobHandler(Protocol):
 
     def run(self, job: JobData) -> JobRunResult:
         ...
+
+
+class AsyncJobHandler(Protocol):
+    """
+    可选的异步 handler：实现 run_async 后，scheduler 直接在事件循环上执行，
+    等待外部 HTTP 时不占用 job-runner 线程。
+    """
+
+    job_type: str
+
+    async def run_async(self, job: JobData) -> JobRunResult:
+        ...
+
+
+class BatchJobHandler(Protocol):
+    """
+    可选的批量 handler：实现 run_batch_async 后，async lane 一次 claim 到的同类型 job 合并成一批执行，
+    例如 ASR 轮询把多条 recognition 的 provider 查询并发发出、状态变更批量落库。
+    返回的结果与 jobs 一一对应；改期（RUNNING / QUEUED）的结果由 JobService 用一条批量 UPDATE 写回。
+    """
+
+    job_type: str
+
+    async def run_batch_async(self, jobs: Sequence[JobData]) -> list[JobRunResult]:
+        ...
@@ -0,0 +1,11 @@
+from lsl.modules.overview.api import router
+from lsl.modules.overview.repo import SessionOverviewRepository
+from lsl.modules.overview.service import SessionOverviewService
+from lsl.modules.overview.types import SessionOverviewInclude
+
+__all__ = [
+    "SessionOverviewInclude",
+    "SessionOverviewRepository",
+    "SessionOverviewService",
+    "router",
+]
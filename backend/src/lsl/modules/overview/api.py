@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import cast
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response
+
+from lsl.modules.overview.schema import ApiResponse, SessionOverviewData
+from lsl.modules.overview.service import SessionOverviewService
+
+router = APIRouter(prefix="/sessions", tags=["sessions"])
+
+
+def get_session_overview_service(request: Request) -> SessionOverviewService:
+    service = getattr(request.app.state, "session_overview_service", None)
+    if service is None:
+        raise HTTPException(status_code=500, detail="Session overview service is not initialized")
+    return cast(SessionOverviewService, service)
+
+
+@router.get("/{session_id}/overview", response_model=ApiResponse[SessionOverviewData])
+def get_session_overview(
+    session_id: str,
+    response: Response,
+    include: str | None = None,
+    if_none_match: str | None = Header(default=None, alias="If-None-Match", max_length=1024),
+    overview_service: SessionOverviewService = Depends(get_session_overview_service),
+):
+    try:
+        result = overview_service.get_overview(session_id, include=include, if_none_match=if_none_match)
+    except ValueError as exc:
+        detail = str(exc)
+        status_code = 404 if detail == "session not found" else 400
+        raise HTTPException(status_code=status_code, detail=detail) from exc
+    except RuntimeError as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+    # 弱 ETag：版本号描述的是各实体状态，而不是响应字节。no-cache 让浏览器每次都带 If-None-Match 回源校验。
+    headers = {"ETag": f'W/"{result.version}"', "Cache-Control": "private, no-cache"}
+    if result.data is None:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return ApiResponse(data=result.data)
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import uuid
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from sqlalchemy import ColumnElement, and_, func, or_, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session as OrmSession
+from sqlalchemy.orm import sessionmaker
+
+from lsl.modules.asset.model import AssetModel
+from lsl.modules.job.model import JobModel
+from lsl.modules.job.types import JobStatus
+from lsl.modules.overview.types import ItemsStamp, SessionOverviewInclude, SessionOverviewRecord, build_overview_version
+from lsl.modules.revision.model import UtterancesRevisionItemModel, UtterancesRevisionModel
+from lsl.modules.script.model import ScriptGenerationModel
+from lsl.modules.session.model import SessionModel
+from lsl.modules.transcript.model import TranscriptModel, TranscriptUtteranceModel
+from lsl.modules.translation.model import TranslationModel
+from lsl.modules.tts.model import SpeechSynthesisItemModel, SpeechSynthesisModel
+
+ACTIVE_JOB_STATUSES: tuple[int, ...] = (int(JobStatus.QUEUED), int(JobStatus.RUNNING))
+
+
+class SessionOverviewRepository:
+    def __init__(self, session_factory: sessionmaker[OrmSession]) -> None:
+        self._session_factory = session_factory
+
+    @contextmanager
+    def _session_scope(self) -> Iterator[OrmSession]:
+        db = self._session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def get_overview(
+        self,
+        session_id: str,
+        *,
+        includes: frozenset[SessionOverviewInclude],
+        known_versions: frozenset[str] = frozenset(),
+    ) -> SessionOverviewRecord | None:
+        """
+        在同一个数据库会话里读取 session 详情页需要的全部实体，每类实体一条查询，与 item 数量无关。
+        先读摘要行算出组合版本号；命中 known_versions（客户端已有的版本）时直接返回，不再读取 utterance / revision item。
+        """
+        normalized_session_id = self._parse_uuid_str(session_id)
+        if normalized_session_id is None:
+            return None
+
+        try:
+            with self._session_scope() as db:
+                session = db.get(SessionModel, normalized_session_id)
+                if session is None:
+                    return None
+                record = SessionOverviewRecord(session=session)
+                self._load_summaries(db, record)
+                record.version = build_overview_version(record, includes)
+                if record.version in known_versions:
+                    return record
+
+                if SessionOverviewInclude.UTTERANCES in includes and record.transcript is not None:
+                    record.utterances = list(
+                        db.execute(
+                            select(TranscriptUtteranceModel)
+                            .where(TranscriptUtteranceModel.transcript_id == record.transcript.transcript_id)
+                            .order_by(TranscriptUtteranceModel.seq.asc())
+                        ).scalars()
+                    )
+                if SessionOverviewInclude.REVISION_ITEMS in includes and record.revision is not None:
+                    record.revision_items = list(
+                        db.execute(
+                            select(UtterancesRevisionItemModel)
+                            .where(UtterancesRevisionItemModel.revision_id == record.revision.revision_id)
+                            .order_by(
+                                UtterancesRevisionItemModel.source_seq_start.asc(),
+                                UtterancesRevisionItemModel.source_seq_end.asc(),
+                            )
+                        ).scalars()
+                    )
+                return record
+        except SQLAlchemyError as exc:  # pragma: no cover
+            raise RuntimeError(f"Failed to query session overview: {exc}") from exc
+
+    def _load_summaries(self, db: OrmSession, record: SessionOverviewRecord) -> None:
+        session = record.session
+        session_id = session.session_id
+
+        object_key = (session.asset_object_key or "").strip().lstrip("/")
+        if object_key:
+            record.asset = db.execute(
+                select(AssetModel).where(AssetModel.object_key == object_key)
+            ).scalar_one_or_none()
+        if session.current_transcript_id is not None:
+            record.transcript = db.get(TranscriptModel, session.current_transcript_id)
+
+        record.revision = db.execute(
+            select(UtterancesRevisionModel).where(UtterancesRevisionModel.session_id == session_id).limit(1)
+        ).scalar_one_or_none()
+        if record.revision is not None:
+            record.revision_items_stamp = self._items_stamp(
+                db,
+                UtterancesRevisionItemModel.updated_at,
+                UtterancesRevisionItemModel.revision_id == record.revision.revision_id,
+            )
+
+        record.synthesis = db.execute(
+            select(SpeechSynthesisModel).where(SpeechSynthesisModel.session_id == session_id)
+        ).scalar_one_or_none()
+        if record.synthesis is not None:
+            record.synthesis_items_stamp = self._items_stamp(
+                db,
+                SpeechSynthesisItemModel.updated_at,
+                SpeechSynthesisItemModel.synthesis_id == record.synthesis.synthesis_id,
+            )
+
+        record.translations = list(
+            db.execute(
+                select(TranslationModel)
+                .where(TranslationModel.session_id == session_id)
+                .order_by(TranslationModel.created_at.asc(), TranslationModel.translation_id.asc())
+            ).scalars()
+        )
+
+        # session 相关 job 都挂在这些实体上；只返回排队中 / 运行中的 job。
+        entity_keys: list[tuple[str, str]] = [("session", session_id)]
+        if record.revision is not None:
+            entity_keys.append(("revision", record.revision.revision_id))
+        if record.synthesis is not None:
+            entity_keys.append(("tts_synthesis", record.synthesis.synthesis_id))
+        entity_keys.extend(("translation", translation.translation_id) for translation in record.translations)
+        if record.transcript is not None and record.transcript.source_type == "asr" and record.transcript.source_entity_id:
+            entity_keys.append(("asr_recognition", record.transcript.source_entity_id))
+        generation_ids = db.execute(
+            select(ScriptGenerationModel.generation_id).where(ScriptGenerationModel.session_id == session_id)
+        ).scalars()
+        entity_keys.extend(("script_generation", generation_id) for generation_id in generation_ids)
+        record.jobs = list(
+            db.execute(
+                select(JobModel)
+                .where(
+                    JobModel.status.in_(ACTIVE_JOB_STATUSES),
+                    or_(
+                        *(
+                            and_(JobModel.entity_type == entity_type, JobModel.entity_id == entity_id)
+                            for entity_type, entity_id in entity_keys
+                        )
+                    ),
+                )
+                .order_by(JobModel.created_at.asc(), JobModel.job_id.asc())
+            ).scalars()
+        )
+
+    @staticmethod
+    def _items_stamp(db: OrmSession, updated_at_column: Any, condition: ColumnElement[bool]) -> ItemsStamp:
+        count, max_updated_at = db.execute(
+            select(func.count(), func.max(updated_at_column)).where(condition)
+        ).one()
+        return ItemsStamp(count=int(count or 0), max_updated_at=max_updated_at)
+
+    @staticmethod
+    def _parse_uuid_str(value: str) -> str | None:
+        try:
+            return uuid.UUID(value).hex
+        except (TypeError, ValueError):
+            return None
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel, Field
+
+from lsl.modules.revision.schema import RevisionItemData
+from lsl.modules.session.schema import SessionData
+from lsl.modules.transcript.schema import TranscriptUtteranceData
+
+
+T = TypeVar("T")
+
+
+class ApiResponse(BaseModel, Generic[T]):
+    code: int = 0
+    message: str = "successful"
+    data: T
+
+
+class OverviewRevisionData(BaseModel):
+    revision_id: str
+    transcript_id: str
+    job_id: str | None = None
+    status: int
+    status_name: str
+    item_count: int
+    error_code: str | None = None
+    error_message: str | None = None
+    updated_at: datetime
+    # include=revision_items 时返回，否则为 None。
+    items: list[RevisionItemData] | None = None
+
+
+class OverviewTtsData(BaseModel):
+    synthesis_id: str
+    status: int
+    status_name: str
+    full_asset_url: str | None = None
+    full_duration_ms: int | None = None
+    item_count: int
+    completed_item_count: int
+    failed_item_count: int
+    error_code: str | None = None
+    error_message: str | None = None
+    updated_at: datetime
+
+
+class OverviewTranslationData(BaseModel):
+    translation_id: str
+    source_type: str
+    source_entity_id: str
+    target_language: str
+    status: int
+    status_name: str
+    item_count: int
+    completed_count: int
+    stale_count: int
+    updated_at: datetime
+
+
+class OverviewJobData(BaseModel):
+    job_id: str
+    job_type: str
+    entity_type: str | None = None
+    entity_id: str | None = None
+    status: int
+    status_name: str
+    progress: int
+    updated_at: datetime
+
+
+class SessionOverviewData(BaseModel):
+    # 组合版本号，与响应头 ETag 对应。
+    version: str
+    session: SessionData
+    # include=utterances 时返回当前 transcript 的 utterances，否则为 None。
+    utterances: list[TranscriptUtteranceData] | None = None
+    revision: OverviewRevisionData | None = None
+    tts: OverviewTtsData | None = None
+    translations: list[OverviewTranslationData] = Field(default_factory=list)
+    # 只包含排队中 / 运行中的 job。
+    jobs: list[OverviewJobData] = Field(default_factory=list)
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import uuid
+
+from lsl.modules.asset.service import AssetService
+from lsl.modules.job.types import job_status_to_name
+from lsl.modules.overview.repo import SessionOverviewRepository
+from lsl.modules.overview.schema import (
+    OverviewJobData,
+    OverviewRevisionData,
+    OverviewTranslationData,
+    OverviewTtsData,
+    SessionOverviewData,
+)
+from lsl.modules.overview.types import (
+    SessionOverviewInclude,
+    SessionOverviewRecord,
+    SessionOverviewResult,
+    parse_if_none_match,
+)
+from lsl.modules.revision.schema import RevisionItemData
+from lsl.modules.revision.types import status_code_to_name as revision_status_to_name
+from lsl.modules.session.pipeline import SessionPipelineTracker
+from lsl.modules.session.schema import (
+    AssetSchema,
+    SessionData,
+    SessionPipelineSchema,
+    SessionSchema,
+    TranscriptSchema,
+)
+from lsl.modules.transcript.schema import TranscriptUtteranceData
+from lsl.modules.transcript.types import transcript_status_to_name
+from lsl.modules.translation.types import translation_status_to_name
+from lsl.modules.tts.types import status_code_to_name as tts_status_to_name
+
+
+class SessionOverviewService:
+    def __init__(self, *, repository: SessionOverviewRepository, asset_service: AssetService) -> None:
+        self._repository = repository
+        self._asset_service = asset_service
+
+    def get_overview(
+        self,
+        session_id: str,
+        *,
+        include: str | None = None,
+        if_none_match: str | None = None,
+    ) -> SessionOverviewResult:
+        includes = self._parse_includes(include)
+        known_versions = parse_if_none_match(if_none_match)
+        record = self._repository.get_overview(session_id, includes=includes, known_versions=known_versions)
+        if record is None:
+            raise ValueError("session not found")
+        if record.version in known_versions:
+            return SessionOverviewResult(version=record.version)
+        return SessionOverviewResult(version=record.version, data=self._to_overview_data(record))
+
+    @staticmethod
+    def _parse_includes(include: str | None) -> frozenset[SessionOverviewInclude]:
+        if not include:
+            return frozenset()
+        includes: set[SessionOverviewInclude] = set()
+        for raw_value in include.split(","):
+            value = raw_value.strip()
+            if not value:
+                continue
+            try:
+                includes.add(SessionOverviewInclude(value))
+            except ValueError as exc:
+                allowed = ", ".join(item.value for item in SessionOverviewInclude)
+                raise ValueError(f"include must be a comma-separated list of: {allowed}") from exc
+        return frozenset(includes)
+
+    def _to_overview_data(self, record: SessionOverviewRecord) -> SessionOverviewData:
+        asset = record.asset
+        transcript = record.transcript
+        session_data = SessionData(
+            session=SessionSchema.model_validate(record.session),
+            asset=(
+                AssetSchema(
+                    filename=asset.filename,
+                    object_key=asset.object_key,
+                    category=asset.category,
+                    entity_id=asset.entity_id,
+                    content_type=asset.content_type,
+                    file_size=asset.file_size,
+                    etag=asset.etag,
+                    upload_status=int(asset.upload_status),
+                    created_at=asset.created_at,
+                    asset_url=self._asset_service.build_asset_url(asset.object_key),
+                )
+                if asset is not None
+                else None
+            ),
+            transcript=(
+                TranscriptSchema(
+                    transcript_id=transcript.transcript_id,
+                    source_type=transcript.source_type,
+                    source_entity_id=transcript.source_entity_id,
+                    duration_ms=transcript.duration_ms,
+                    duration_sec=(transcript.duration_ms / 1000) if transcript.duration_ms is not None else None,
+                    status=int(transcript.status),
+                    status_name=transcript_status_to_name(int(transcript.status)),
+                    language=transcript.language,
+                    error_code=transcript.error_code,
+                    error_message=transcript.error_message,
+                    created_at=transcript.created_at,
+                    updated_at=transcript.updated_at,
+                )
+                if transcript is not None
+                else None
+            ),
+            pipeline=SessionPipelineSchema.model_validate(SessionPipelineTracker.to_summary(record.session)),
+        )
+
+        utterances = (
+            [
+                TranscriptUtteranceData(
+                    seq=int(row.seq),
+                    text=row.text,
+                    speaker=row.speaker,
+                    start_time=int(row.start_time),
+                    end_time=int(row.end_time),
+                    additions=row.additions_json or {},
+                )
+                for row in record.utterances
+            ]
+            if record.utterances is not None
+            else None
+        )
+
+        revision = record.revision
+        revision_data = (
+            OverviewRevisionData(
+                revision_id=revision.revision_id,
+                transcript_id=revision.transcript_id,
+                job_id=revision.job_id,
+                status=int(revision.status),
+                status_name=revision_status_to_name(int(revision.status)),
+                item_count=int(revision.item_count),
+                error_code=revision.error_code,
+                error_message=revision.error_message,
+                updated_at=revision.updated_at,
+                items=(
+                    [RevisionItemData.model_validate(item, from_attributes=True) for item in record.revision_items]
+                    if record.revision_items is not None
+                    else None
+                ),
+            )
+            if revision is not None
+            else None
+        )
+
+        synthesis = record.synthesis
+        tts_data = (
+            OverviewTtsData(
+                # 与 GET /tts 返回的 synthesis_id 格式保持一致。
+                synthesis_id=f"tts_{uuid.UUID(synthesis.synthesis_id).hex}",
+                status=int(synthesis.status),
+                status_name=tts_status_to_name(int(synthesis.status)),
+                full_asset_url=(
+                    self._asset_service.build_asset_url(synthesis.full_asset_object_key)
+                    if synthesis.full_asset_object_key
+                    else None
+                ),
+                full_duration_ms=synthesis.full_duration_ms,
+                item_count=int(synthesis.item_count),
+                completed_item_count=int(synthesis.completed_item_count),
+                failed_item_count=int(synthesis.failed_item_count),
+                error_code=synthesis.error_code,
+                error_message=synthesis.error_message,
+                updated_at=synthesis.updated_at,
+            )
+            if synthesis is not None
+            else None
+        )
+
+        return SessionOverviewData(
+            version=record.version,
+            session=session_data,
+            utterances=utterances,
+            revision=revision_data,
+            tts=tts_data,
+            translations=[
+                OverviewTranslationData(
+                    translation_id=translation.translation_id,
+                    source_type=translation.source_type,
+                    source_entity_id=translation.source_entity_id,
+                    target_language=translation.target_language,
+                    status=int(translation.status),
+                    status_name=translation_status_to_name(int(translation.status)),
+                    item_count=int(translation.item_count),
+                    completed_count=int(translation.completed_count),
+                    stale_count=int(translation.stale_count),
+                    updated_at=translation.updated_at,
+                )
+                for translation in record.translations
+            ],
+            jobs=[
+                OverviewJobData(
+                    job_id=job.job_id,
+                    job_type=job.job_type,
+                    entity_type=job.entity_type,
+                    entity_id=job.entity_id,
+                    status=int(job.status),
+                    status_name=job_status_to_name(int(job.status)),
+                    progress=int(job.progress),
+                    updated_at=job.updated_at,
+                )
+                for job in record.jobs
+            ],
+        )
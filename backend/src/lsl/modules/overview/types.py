@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from lsl.modules.asset.model import AssetModel
+    from lsl.modules.job.model import JobModel
+    from lsl.modules.overview.schema import SessionOverviewData
+    from lsl.modules.revision.model import UtterancesRevisionItemModel, UtterancesRevisionModel
+    from lsl.modules.session.model import SessionModel
+    from lsl.modules.transcript.model import TranscriptModel, TranscriptUtteranceModel
+    from lsl.modules.translation.model import TranslationModel
+    from lsl.modules.tts.model import SpeechSynthesisModel
+
+
+class SessionOverviewInclude(StrEnum):
+    """按需附带的大字段；不传时只返回各实体的状态摘要。"""
+
+    UTTERANCES = "utterances"
+    REVISION_ITEMS = "revision_items"
+
+
+@dataclass(slots=True)
+class ItemsStamp:
+    """子表的 (行数, 最大 updated_at)，子项单独更新时父行的 updated_at 不一定变化。"""
+
+    count: int = 0
+    max_updated_at: datetime | None = None
+
+
+@dataclass(slots=True)
+class SessionOverviewRecord:
+    session: SessionModel
+    asset: AssetModel | None = None
+    transcript: TranscriptModel | None = None
+    revision: UtterancesRevisionModel | None = None
+    revision_items_stamp: ItemsStamp = field(default_factory=ItemsStamp)
+    synthesis: SpeechSynthesisModel | None = None
+    synthesis_items_stamp: ItemsStamp = field(default_factory=ItemsStamp)
+    translations: list[TranslationModel] = field(default_factory=list)
+    jobs: list[JobModel] = field(default_factory=list)
+    version: str = ""
+    # 版本与 If-None-Match 一致时不加载大字段，保持为 None。
+    utterances: list[TranscriptUtteranceModel] | None = None
+    revision_items: list[UtterancesRevisionItemModel] | None = None
+
+
+def build_overview_version(record: SessionOverviewRecord, includes: frozenset[SessionOverviewInclude]) -> str:
+    """
+    由各实体的 id / 状态 / 计数 / updated_at 拼出组合版本号；任一实体变化或 include 不同都会得到新版本。
+    只依赖摘要行，不需要读取 utterance 等大字段。
+    """
+    parts: list[Any] = [sorted(includes)]
+    parts.append(("session", record.session.session_id, record.session.updated_at))
+    if record.asset is not None:
+        parts.append(("asset", record.asset.object_key, record.asset.upload_status, record.asset.updated_at))
+    if record.transcript is not None:
+        transcript = record.transcript
+        parts.append(("transcript", transcript.transcript_id, transcript.status, transcript.updated_at))
+    if record.revision is not None:
+        revision = record.revision
+        parts.append(("revision", revision.revision_id, revision.status, revision.item_count, revision.updated_at))
+        parts.append(("revision_items", record.revision_items_stamp.count, record.revision_items_stamp.max_updated_at))
+    if record.synthesis is not None:
+        synthesis = record.synthesis
+        parts.append(
+            (
+                "tts",
+                synthesis.synthesis_id,
+                synthesis.status,
+                synthesis.completed_item_count,
+                synthesis.failed_item_count,
+                synthesis.updated_at,
+            )
+        )
+        parts.append(("tts_items", record.synthesis_items_stamp.count, record.synthesis_items_stamp.max_updated_at))
+    for translation in record.translations:
+        parts.append(
+            (
+                "translation",
+                translation.translation_id,
+                translation.status,
+                translation.completed_count,
+                translation.stale_count,
+                translation.updated_at,
+            )
+        )
+    for job in record.jobs:
+        parts.append(("job", job.job_id, job.status, job.progress, job.updated_at))
+    return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()[:32]
+
+
+@dataclass(slots=True)
+class SessionOverviewResult:
+    # 不带引号的版本号；API 层包装成弱 ETag。
+    version: str
+    # If-None-Match 命中时为 None，API 返回 304。
+    data: SessionOverviewData | None = None
+
+
+def parse_if_none_match(value: str | None) -> frozenset[str]:
+    """解析 If-None-Match 中的 entity-tag 列表，去掉 W/ 前缀和引号；按弱比较处理。"""
+    if not value:
+        return frozenset()
+    versions: set[str] = set()
+    for raw_tag in value.split(","):
+        tag = raw_tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        tag = tag.strip('"')
+        if tag:
+            versions.add(tag)
+    return frozenset(versions)
@@ -10,7 +10,6 @@ from queue import Empty, Queue
 from time import perf_counter
 from typing import Any
 
-import httpx
 from json_repair import repair_json
 from openai import OpenAI
 from openai.types.chat import ChatCompletionMessageParam
@@ -18,6 +17,7 @@ from openai.types.chat.chat_completion_system_message_param import ChatCompletio
 from openai.types.chat.chat_completion_user_message_param import ChatCompletionUserMessageParam
 
 from lsl.core.config import Settings
+from lsl.core.http import get_http_client
 from lsl.modules.revision.types import (
     RevisionGenerateRequest,
     RevisionGenerator,
@@ -1004,11 +1004,10 @@ class LLMRevisionGenerator:
         if not self._model:
             raise RuntimeError("REVISION_LLM_MODEL is not configured")
 
-        http_client = httpx.Client(timeout=self._timeout, trust_env=False)
         self._client = OpenAI(
             api_key=self._api_key,
             base_url=self._base_url,
-            http_client=http_client,
+            http_client=get_http_client("revision_llm", timeout=self._timeout, trust_env=False),
         )
         return self._client
 
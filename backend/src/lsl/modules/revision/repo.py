@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import uuid
 from contextlib import contextmanager
-from typing import Any, Iterator
+from typing import TYPE_CHECKING, Any, Iterator
 
 from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
@@ -12,10 +12,24 @@ from sqlalchemy.orm import selectinload, sessionmaker
 from lsl.modules.revision.model import UtterancesRevisionItemModel, UtterancesRevisionModel
 from lsl.modules.revision.types import GeneratedRevisionItem
 
+if TYPE_CHECKING:
+    from lsl.modules.search.indexer import SearchIndexer
+    from lsl.modules.session.pipeline import SessionPipelineTracker
+
 
 class RevisionRepository:
-    def __init__(self, session_factory: sessionmaker[OrmSession]) -> None:
+    def __init__(
+        self,
+        session_factory: sessionmaker[OrmSession],
+        *,
+        search_indexer: SearchIndexer | None = None,
+        session_pipeline: SessionPipelineTracker | None = None,
+    ) -> None:
         self._session_factory = session_factory
+        # 不为 None 时，revision item 文本在同一事务内同步到全文检索索引。
+        self._search_indexer = search_indexer
+        # 不为 None 时，revision 状态变化在同一事务内刷新 session 的 pipeline 列。
+        self._session_pipeline = session_pipeline
 
     @contextmanager
     def _session_scope(self) -> Iterator[OrmSession]:
@@ -108,6 +122,11 @@ class RevisionRepository:
                 model.error_code = error_code
                 model.error_message = error_message
                 model.item_count = len(items)
+                previous_documents = (
+                    self._search_indexer.revision_item_documents(model.items)
+                    if self._search_indexer is not None
+                    else {}
+                )
 
                 existing_items_by_span = {
                     (
@@ -173,6 +192,14 @@ class RevisionRepository:
                     model_item.issue_tags = item.issue_tags
                     model_item.explanations = item.explanations
 
+                if self._search_indexer is not None:
+                    self._search_indexer.sync_revision_items(
+                        db,
+                        previous=previous_documents,
+                        current=self._search_indexer.revision_item_documents(model.items),
+                    )
+                if self._session_pipeline is not None:
+                    self._session_pipeline.sync_revision(db, normalized_session_id)
                 db.commit()
                 db.refresh(model)
                 _ = list(model.items)
@@ -244,8 +271,19 @@ class RevisionRepository:
                 if model is None:
                     return None
 
+                previous_documents = (
+                    self._search_indexer.revision_item_documents([model])
+                    if self._search_indexer is not None
+                    else {}
+                )
                 for key, value in updates.items():
                     setattr(model, key, value)
+                if self._search_indexer is not None:
+                    self._search_indexer.sync_revision_items(
+                        db,
+                        previous=previous_documents,
+                        current=self._search_indexer.revision_item_documents([model]),
+                    )
                 db.commit()
                 db.refresh(model)
                 return model
@@ -4,8 +4,9 @@ import logging
 from time import perf_counter
 from typing import TYPE_CHECKING
 
+from lsl.modules.event.broadcaster import EventBroadcaster
 from lsl.modules.job.service import JobService
-from lsl.modules.job.types import JobData, JobRunResult, JobStatus
+from lsl.modules.job.types import JobData, JobRunResult, JobSpec, JobStatus
 from lsl.modules.revision.model import UtterancesRevisionItemModel, UtterancesRevisionModel
 from lsl.modules.revision.repo import RevisionRepository
 from lsl.modules.revision.schema import (
@@ -44,12 +45,14 @@ class RevisionService:
         transcript_service: TranscriptService,
         job_service: JobService | None = None,
         translation_service: TranslationService | None = None,
+        event_broadcaster: EventBroadcaster | None = None,
     ) -> None:
         self._repository = repository
         self._generator = generator
         self._session_service = session_service
         self._transcript_service = transcript_service
         self._job_service = job_service
+        self._event_broadcaster = event_broadcaster
 
     def shutdown(self) -> None:
         return None
@@ -92,6 +95,23 @@ class RevisionService:
         if self._job_service is None:
             raise RuntimeError("Job service is not initialized")
 
+        # Double clicks and frontend retries (force included) reuse the job that
+        # is still queued/running instead of resetting the revision and superseding it.
+        dedup_key = self._job_service.build_dedup_key(
+            job_type=RevisionJobHandler.job_type,
+            entity_type="revision",
+            entity_id=session_id,
+            payload={
+                "transcript_id": transcript_id,
+                "user_prompt": user_prompt,
+                "cue_language": cue_language,
+                "force": force,
+            },
+        )
+        active_job = self._job_service.find_active_job(job_type=RevisionJobHandler.job_type, dedup_key=dedup_key)
+        if existing is not None and active_job is not None and str(existing.job_id or "") == active_job.job_id:
+            return self._to_revision_data(existing)
+
         # Revision job flow 2/5: store an empty generating revision first.
         # This hides old cards while the job progressively fills revision_items.
         model = self._repository.save_revision(
@@ -119,6 +139,7 @@ class RevisionService:
                 "transcript_id": transcript_id,
                 "revision_id": revision.revision_id,
             },
+            dedup_key=dedup_key,
         )
 
         # The revision row points to the active job so stale jobs can be ignored.
@@ -133,6 +154,60 @@ class RevisionService:
 
         return self._to_revision_data(model)
 
+    def build_asr_follow_ups(self, job: JobData, result: JobRunResult) -> list[JobSpec]:
+        """
+        Pipeline hook registered for asr_recognition: once ASR completes, queue the
+        revision for the session that uses the transcript in the same transaction.
+        """
+        transcript_id = str((result.result or {}).get("transcript_id") or "").strip()
+        if not transcript_id:
+            return []
+        session_id = self._session_service.get_session_id_by_transcript_id(transcript_id)
+        if session_id is None:
+            # The session is created after the recognition; if ASR wins the race the
+            # frontend still requests the revision on first visit.
+            return []
+        return [
+            JobSpec(
+                job_type=RevisionJobHandler.job_type,
+                entity_type="session",
+                entity_id=session_id,
+                payload={"session_id": session_id, "transcript_id": transcript_id, "pipeline": True},
+                dedup_key=JobService.build_dedup_key(
+                    job_type=RevisionJobHandler.job_type,
+                    entity_type="session",
+                    entity_id=session_id,
+                    payload={"transcript_id": transcript_id, "pipeline": True},
+                ),
+            )
+        ]
+
+    def run_pipeline_generation_job(self, *, session_id: str, transcript_id: str, job_id: str) -> JobRunResult:
+        # Pipeline jobs never replace a revision the user already requested or edited.
+        existing = self._repository.get_revision_by_session_id(session_id)
+        if existing is not None:
+            return JobRunResult(status=JobStatus.COMPLETED, progress=100, result={"skipped": "revision exists"})
+        self._repository.save_revision(
+            session_id=session_id,
+            transcript_id=transcript_id,
+            user_prompt=None,
+            status=int(RevisionStatus.GENERATING),
+            items=[],
+            cue_language=None,
+            preserve_existing_drafts=False,
+            error_code=None,
+            error_message=None,
+            plan_sections=[],
+        )
+        self._repository.set_job_id(session_id=session_id, job_id=job_id)
+        logger.info(
+            "Revision pipeline job started session_id=%s transcript_id=%s job_id=%s",
+            session_id,
+            transcript_id,
+            job_id,
+        )
+        return self.run_generation_job(session_id=session_id, transcript_id=transcript_id, job_id=job_id)
+
     def create_generated_revision(
         self,
         *,
@@ -273,6 +348,7 @@ class RevisionService:
                     error_code=None,
                     error_message=None,
                 )
+                self._publish_revision_changed(session_id)
                 if not first_batch_logged:
                     first_batch_logged = True
                     logger.info(
@@ -311,6 +387,7 @@ class RevisionService:
                 error_code=None,
                 error_message=None,
             )
+            self._publish_revision_changed(session_id)
             logger.info(
                 "Revision generation job completed session_id=%s transcript_id=%s job_id=%s total_items=%s elapsed_ms=%s",
                 session_id,
@@ -334,8 +411,17 @@ class RevisionService:
                     error_code="revision_generation_failed",
                     error_message=str(exc),
                 )
+                self._publish_revision_changed(session_id)
             return JobRunResult(status=JobStatus.FAILED, error_code="REVISION_GENERATION_FAILED", error_message=str(exc))
 
+    def _publish_revision_changed(self, session_id: str) -> None:
+        if self._event_broadcaster is not None:
+            self._event_broadcaster.publish_entity_changed(
+                entity_type="revision",
+                entity_id=session_id,
+                session_id=session_id,
+            )
+
     def _build_prompt_utterances(
         self,
         utterances: list[TranscriptUtteranceData],
@@ -625,6 +711,12 @@ class RevisionJobHandler:
                 error_code="MISSING_REVISION_JOB_PAYLOAD",
                 error_message="session_id and transcript_id are required",
             )
+        if job.payload.get("pipeline"):
+            return self._revision_service.run_pipeline_generation_job(
+                session_id=session_id,
+                transcript_id=transcript_id,
+                job_id=job.job_id,
+            )
         return self._revision_service.run_generation_job(
             session_id=session_id,
             transcript_id=transcript_id,
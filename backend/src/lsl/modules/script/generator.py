@@ -11,6 +11,7 @@ from json_repair import repair_json
 from openai import OpenAI
 
 from lsl.core.config import Settings
+from lsl.core.http import get_http_client
 from lsl.modules.script.types import GeneratedScript, GeneratedScriptTurn, ScriptGenerateRequest, ScriptGenerator, ScriptSection
 
 logger = logging.getLogger(__name__)
@@ -744,6 +745,7 @@ class LlmScriptGenerator:
             api_key=self._api_key,
             base_url=self._base_url,
             timeout=self._timeout,
+            http_client=get_http_client("script_llm", timeout=self._timeout),
         )
         return self._client
 
@@ -263,7 +263,8 @@ class ScriptService:
             self._repository.mark_completed(
                 generation_id=generation_id,
                 transcript_id=transcript.transcript_id,
-                raw_result_json=raw_result,
+                # 完整生成结果随 transcript 单独存放（include_raw=true 时读取），这里只保留阶段标记。
+                raw_result_json={"provider": raw_result["provider"], "stage": "completed"},
             )
             self._revision_service.create_generated_revision(
                 session_id=generation.session_id,
@@ -0,0 +1,14 @@
+from lsl.modules.search import model as _model
+from lsl.modules.search.api import router
+from lsl.modules.search.indexer import SearchIndexer
+from lsl.modules.search.repo import SearchRepository
+from lsl.modules.search.service import SearchService
+from lsl.modules.search.types import SearchDocumentType
+
+__all__ = [
+    "SearchDocumentType",
+    "SearchIndexer",
+    "SearchRepository",
+    "SearchService",
+    "router",
+]
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from typing import cast
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+
+from lsl.modules.search.schema import ApiResponse, SearchResponseData
+from lsl.modules.search.service import SearchService
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+def get_search_service(request: Request) -> SearchService:
+    service = getattr(request.app.state, "search_service", None)
+    if service is None:
+        raise HTTPException(status_code=500, detail="Search service is not initialized")
+    return cast(SearchService, service)
+
+
+@router.get("", response_model=ApiResponse[SearchResponseData])
+def search(
+    q: str,
+    limit: int = 20,
+    session_id: str | None = None,
+    search_service: SearchService = Depends(get_search_service),
+):
+    try:
+        result = search_service.search(query=q, limit=limit, session_id=session_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except RuntimeError as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+    return ApiResponse(data=result)
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any, Iterable, Sequence
+
+from sqlalchemy import bindparam, delete, insert, literal, or_, select, update
+from sqlalchemy.orm import Session as OrmSession
+
+from lsl.modules.search.model import SearchDocumentModel
+from lsl.modules.search.types import SEARCH_SKIPPED_SOURCE_TYPES, SearchDocumentType, revision_item_search_text
+
+
+class SearchIndexer:
+    """
+    在调用方的数据库事务内增量维护 search_documents：
+    - transcript 完成时整体替换或按 diff 只改动变化的 utterance
+    - revision 保存时只写入新增、删除和文本变化的 item
+    不自己提交，和业务写入一起 commit / rollback。
+    """
+
+    @staticmethod
+    def indexes_source_type(source_type: str) -> bool:
+        return source_type not in SEARCH_SKIPPED_SOURCE_TYPES
+
+    def replace_utterances(self, db: OrmSession, transcript_id: str, rows: Sequence[dict[str, Any]]) -> None:
+        db.execute(self._delete_documents(transcript_id, SearchDocumentType.UTTERANCE))
+        self._insert_documents(
+            db,
+            transcript_id,
+            SearchDocumentType.UTTERANCE,
+            [(row["seq"], row["text"]) for row in rows],
+        )
+
+    def apply_utterance_diff(
+        self,
+        db: OrmSession,
+        transcript_id: str,
+        *,
+        seq_range: tuple[int, int] | None,
+        updated_rows: Sequence[dict[str, Any]],
+        inserted_rows: Sequence[dict[str, Any]],
+    ) -> None:
+        """seq_range 之外的文档删除（None 表示全部删除），updated_rows 改写文本，inserted_rows 新增。"""
+        document = SearchDocumentModel
+        stmt = self._delete_documents(transcript_id, SearchDocumentType.UTTERANCE)
+        if seq_range is not None:
+            stmt = stmt.where(or_(document.seq < seq_range[0], document.seq > seq_range[1]))
+        db.execute(stmt)
+        if updated_rows:
+            now = datetime.now(timezone.utc)
+            db.execute(
+                update(document.__table__)
+                .where(document.transcript_id == bindparam("b_transcript_id"))
+                .where(document.doc_type == SearchDocumentType.UTTERANCE.value)
+                .where(document.seq == bindparam("b_seq"))
+                .values({document.text: bindparam("b_text"), document.updated_at: bindparam("b_updated_at")}),
+                [
+                    {"b_transcript_id": transcript_id, "b_seq": row["seq"], "b_text": row["text"], "b_updated_at": now}
+                    for row in updated_rows
+                ],
+            )
+        self._insert_documents(
+            db,
+            transcript_id,
+            SearchDocumentType.UTTERANCE,
+            [(row["seq"], row["text"]) for row in inserted_rows],
+        )
+
+    def copy_utterances(self, db: OrmSession, *, source_transcript_id: str, transcript_id: str) -> None:
+        document = SearchDocumentModel
+        db.execute(self._delete_documents(transcript_id, SearchDocumentType.UTTERANCE))
+        db.execute(
+            insert(document).from_select(
+                [document.transcript_id, document.doc_type, document.seq, document.text, document.updated_at],
+                select(
+                    literal(transcript_id, document.transcript_id.type),
+                    document.doc_type,
+                    document.seq,
+                    document.text,
+                    literal(datetime.now(timezone.utc), document.updated_at.type),
+                ).where(
+                    document.transcript_id == source_transcript_id,
+                    document.doc_type == SearchDocumentType.UTTERANCE.value,
+                ),
+            )
+        )
+
+    def sync_revision_items(
+        self,
+        db: OrmSession,
+        *,
+        previous: dict[tuple[str, int], str],
+        current: dict[tuple[str, int], str],
+    ) -> None:
+        """
+        按 (transcript_id, source_seq_start) 对比保存前后的 revision item 检索文本，
+        只删除消失的文档、重写新增或文本变化的文档。
+        """
+        removed = [key for key in previous if key not in current]
+        upserts = [(key, text) for key, text in current.items() if previous.get(key) != text]
+        keys = [*removed, *[key for key, _ in upserts]]
+        if keys:
+            document = SearchDocumentModel
+            db.execute(
+                delete(document.__table__)
+                .where(document.transcript_id == bindparam("b_transcript_id"))
+                .where(document.doc_type == SearchDocumentType.REVISION_ITEM.value)
+                .where(document.seq == bindparam("b_seq")),
+                [{"b_transcript_id": transcript_id, "b_seq": seq} for transcript_id, seq in keys],
+            )
+        by_transcript: dict[str, list[tuple[int, str]]] = {}
+        for (transcript_id, seq), text in upserts:
+            by_transcript.setdefault(transcript_id, []).append((seq, text))
+        for transcript_id, documents in by_transcript.items():
+            self._insert_documents(db, transcript_id, SearchDocumentType.REVISION_ITEM, documents)
+
+    @staticmethod
+    def revision_item_documents(items: Iterable[Any]) -> dict[tuple[str, int], str]:
+        """revision item（ORM 对象）到检索文档的映射，供 sync_revision_items 对比。"""
+        return {
+            (str(item.transcript_id), int(item.source_seq_start)): revision_item_search_text(
+                item.suggested_text,
+                item.draft_text,
+            )
+            for item in items
+        }
+
+    @staticmethod
+    def _delete_documents(transcript_id: str, doc_type: SearchDocumentType) -> Any:
+        document = SearchDocumentModel
+        return delete(document).where(document.transcript_id == transcript_id, document.doc_type == doc_type.value)
+
+    @staticmethod
+    def _insert_documents(
+        db: OrmSession,
+        transcript_id: str,
+        doc_type: SearchDocumentType,
+        documents: Sequence[tuple[int, str]],
+    ) -> None:
+        if not documents:
+            return
+        now = datetime.now(timezone.utc)
+        db.execute(
+            insert(SearchDocumentModel),
+            [
+                {
+                    "transcript_id": transcript_id,
+                    "doc_type": doc_type.value,
+                    "seq": int(seq),
+                    "text": text,
+                    "updated_at": now,
+                }
+                for seq, text in documents
+            ],
+        )
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from sqlalchemy import DDL, DateTime, Index, Integer, String, Text, UniqueConstraint, event, text as sql_text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from lsl.core.db import Base
+from lsl.core.sql_types import UUIDHexString
+
+# Postgres 全文检索使用的 text search 配置；索引表达式与查询表达式必须一致才能命中 GIN 索引。
+SEARCH_TS_CONFIG = "simple"
+
+
+class SearchDocumentModel(Base):
+    """
+    全文检索文档：每条 utterance、每个 revision item 一行，由 transcript / revision 写入时在同一事务内增量维护。
+    - Postgres：x_text 上的 to_tsvector GIN 表达式索引
+    - SQLite：search_documents_fts（FTS5 external content 表），由触发器与本表保持同步
+    """
+
+    __tablename__ = "search_documents"
+    __table_args__ = (
+        UniqueConstraint("transcript_id", "doc_type", "seq", name="uq_search_documents_transcript_doc_seq"),
+        Index(
+            "idx_search_documents_tsv",
+            sql_text(f"to_tsvector('{SEARCH_TS_CONFIG}', x_text)"),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    transcript_id: Mapped[str] = mapped_column(UUIDHexString(), nullable=False)
+    # utterance / revision_item
+    doc_type: Mapped[str] = mapped_column(String(16), nullable=False)
+    # utterance 的 seq；revision item 的 source_seq_start。
+    seq: Mapped[int] = mapped_column(Integer, nullable=False)
+    text: Mapped[str] = mapped_column("x_text", Text, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        server_default=sql_text("CURRENT_TIMESTAMP"),
+    )
+
+
+_SQLITE_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS search_documents_fts USING fts5("
+    "x_text, content='search_documents', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS trg_search_documents_fts_insert AFTER INSERT ON search_documents BEGIN "
+    "INSERT INTO search_documents_fts (rowid, x_text) VALUES (new.id, new.x_text); END",
+    "CREATE TRIGGER IF NOT EXISTS trg_search_documents_fts_delete AFTER DELETE ON search_documents BEGIN "
+    "INSERT INTO search_documents_fts (search_documents_fts, rowid, x_text) VALUES ('delete', old.id, old.x_text); END",
+    "CREATE TRIGGER IF NOT EXISTS trg_search_documents_fts_update AFTER UPDATE OF x_text ON search_documents BEGIN "
+    "INSERT INTO search_documents_fts (search_documents_fts, rowid, x_text) VALUES ('delete', old.id, old.x_text); "
+    "INSERT INTO search_documents_fts (rowid, x_text) VALUES (new.id, new.x_text); END",
+)
+
+for _statement in _SQLITE_FTS_DDL:
+    event.listen(SearchDocumentModel.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
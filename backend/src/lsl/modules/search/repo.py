@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import re
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Iterator
+
+from sqlalchemy import case, delete, func, insert, literal, literal_column, select, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session as OrmSession
+from sqlalchemy.orm import sessionmaker
+
+from lsl.modules.revision.model import UtterancesRevisionItemModel
+from lsl.modules.search.model import SEARCH_TS_CONFIG, SearchDocumentModel
+from lsl.modules.search.types import SEARCH_SKIPPED_SOURCE_TYPES, SearchDocumentType
+from lsl.modules.session.model import SessionModel
+from lsl.modules.transcript.model import TranscriptModel, TranscriptUtteranceModel
+
+SNIPPET_START = "<mark>"
+SNIPPET_STOP = "</mark>"
+
+_SQLITE_SEARCH_SQL = text(
+    f"""
+    SELECT d.doc_type, d.transcript_id, d.seq, s.session_id, s.title,
+           -bm25(search_documents_fts) AS score,
+           snippet(search_documents_fts, 0, '{SNIPPET_START}', '{SNIPPET_STOP}', '…', 16) AS snippet
+    FROM search_documents_fts
+    JOIN search_documents AS d ON d.id = search_documents_fts.rowid
+    JOIN session_sessions AS s ON s.current_transcript_id = d.transcript_id
+    WHERE search_documents_fts MATCH :query
+      AND (:session_id IS NULL OR s.session_id = :session_id)
+    ORDER BY bm25(search_documents_fts)
+    LIMIT :limit
+    """
+)
+
+
+class SearchRepository:
+    def __init__(self, session_factory: sessionmaker[OrmSession]) -> None:
+        self._session_factory = session_factory
+
+    @contextmanager
+    def _session_scope(self) -> Iterator[OrmSession]:
+        db = self._session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def search(self, *, query: str, limit: int, session_id: str | None = None) -> list[dict[str, Any]]:
+        """
+        按相关度返回命中的 utterance / revision item，只包含仍是某个 session 当前 transcript 的文档。
+        Postgres 先在 GIN 索引上取 top N 再对这 N 行生成 ts_headline；SQLite 走 FTS5 的 bm25 / snippet。
+        """
+        try:
+            with self._session_scope() as db:
+                if db.get_bind().dialect.name == "postgresql":
+                    rows = self._search_postgres(db, query=query, limit=limit, session_id=session_id)
+                else:
+                    fts_query = self._to_fts5_query(query)
+                    if not fts_query:
+                        return []
+                    rows = db.execute(
+                        _SQLITE_SEARCH_SQL,
+                        {"query": fts_query, "session_id": session_id, "limit": int(limit)},
+                    ).all()
+                return [
+                    {
+                        "doc_type": doc_type,
+                        "transcript_id": transcript_id,
+                        "seq": int(seq),
+                        "session_id": row_session_id,
+                        "session_title": title,
+                        "score": float(score),
+                        "snippet": snippet,
+                    }
+                    for doc_type, transcript_id, seq, row_session_id, title, score, snippet in rows
+                ]
+        except SQLAlchemyError as exc:  # pragma: no cover
+            raise RuntimeError(f"Failed to search documents: {exc}") from exc
+
+    def rebuild(self) -> int:
+        """从 transcript_utterances / revision_items 全量重建索引，用于首次上线或索引损坏后的修复；返回文档数。"""
+        document = SearchDocumentModel
+        utterance = TranscriptUtteranceModel
+        item = UtterancesRevisionItemModel
+        now = literal(datetime.now(timezone.utc), document.updated_at.type)
+        columns = [document.transcript_id, document.doc_type, document.seq, document.text, document.updated_at]
+        utterance_select = (
+            select(
+                utterance.transcript_id,
+                literal(SearchDocumentType.UTTERANCE.value),
+                utterance.seq,
+                utterance.text,
+                now,
+            )
+            .join(TranscriptModel, TranscriptModel.transcript_id == utterance.transcript_id)
+            .where(TranscriptModel.source_type.not_in(SEARCH_SKIPPED_SOURCE_TYPES))
+        )
+        item_text = case(
+            (
+                (item.draft_text.is_not(None)) & (item.draft_text != "") & (item.draft_text != item.suggested_text),
+                item.suggested_text + "\n" + item.draft_text,
+            ),
+            else_=item.suggested_text,
+        )
+        item_select = select(
+            item.transcript_id,
+            literal(SearchDocumentType.REVISION_ITEM.value),
+            item.source_seq_start,
+            item_text,
+            now,
+        )
+        try:
+            with self._session_scope() as db:
+                db.execute(delete(document))
+                db.execute(insert(document).from_select(columns, utterance_select))
+                db.execute(insert(document).from_select(columns, item_select))
+                db.commit()
+                return int(db.execute(select(func.count()).select_from(document)).scalar_one())
+        except SQLAlchemyError as exc:  # pragma: no cover
+            raise RuntimeError(f"Failed to rebuild search index: {exc}") from exc
+
+    @staticmethod
+    def _search_postgres(
+        db: OrmSession,
+        *,
+        query: str,
+        limit: int,
+        session_id: str | None,
+    ) -> list[Any]:
+        document = SearchDocumentModel
+        config = literal_column(f"'{SEARCH_TS_CONFIG}'")
+        tsquery = func.websearch_to_tsquery(config, query)
+        # 与 idx_search_documents_tsv 的表达式一致，才能走 GIN 索引。
+        vector = func.to_tsvector(config, document.text)
+        score = func.ts_rank(vector, tsquery).label("score")
+        ranked_stmt = (
+            select(document.id, SessionModel.session_id, SessionModel.title, score)
+            .join(SessionModel, SessionModel.current_transcript_id == document.transcript_id)
+            .where(vector.op("@@")(tsquery))
+        )
+        if session_id is not None:
+            ranked_stmt = ranked_stmt.where(SessionModel.session_id == session_id)
+        ranked = ranked_stmt.order_by(score.desc()).limit(int(limit)).subquery()
+        headline = func.ts_headline(
+            config,
+            document.text,
+            tsquery,
+            f'StartSel="{SNIPPET_START}", StopSel="{SNIPPET_STOP}", MaxWords=32, MinWords=8',
+        )
+        stmt = (
+            select(
+                document.doc_type,
+                document.transcript_id,
+                document.seq,
+                ranked.c.session_id,
+                ranked.c.title,
+                ranked.c.score,
+                headline,
+            )
+            .join(ranked, ranked.c.id == document.id)
+            .order_by(ranked.c.score.desc())
+        )
+        return list(db.execute(stmt).all())
+
+    @staticmethod
+    def _to_fts5_query(query: str) -> str:
+        # 用户输入按词拆开后逐个加引号，避免 FTS5 语法字符（" * : ^ 等）导致解析错误；词之间为 AND。
+        terms = re.findall(r"\w+", query)
+        return " ".join(f'"{term}"' for term in terms)
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel, Field
+
+
+T = TypeVar("T")
+
+
+class ApiResponse(BaseModel, Generic[T]):
+    code: int = 0
+    message: str = "successful"
+    data: T
+
+
+class SearchHitData(BaseModel):
+    session_id: str
+    session_title: str
+    transcript_id: str
+    doc_type: str
+    seq: int
+    score: float
+    # 命中词用 <mark></mark> 包裹，其余部分为原文，前端渲染时需先转义。
+    snippet: str
+
+
+class SearchResponseData(BaseModel):
+    items: list[SearchHitData] = Field(default_factory=list)
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import uuid
+
+from lsl.modules.search.repo import SearchRepository
+from lsl.modules.search.schema import SearchHitData, SearchResponseData
+
+MAX_SEARCH_QUERY_LENGTH = 200
+MAX_SEARCH_LIMIT = 100
+
+
+class SearchService:
+    def __init__(self, *, repository: SearchRepository) -> None:
+        self._repository = repository
+
+    def search(self, *, query: str, limit: int = 20, session_id: str | None = None) -> SearchResponseData:
+        normalized_query = query.strip()
+        if not normalized_query:
+            raise ValueError("query is required")
+        if len(normalized_query) > MAX_SEARCH_QUERY_LENGTH:
+            raise ValueError(f"query must be at most {MAX_SEARCH_QUERY_LENGTH} characters")
+        if limit < 1 or limit > MAX_SEARCH_LIMIT:
+            raise ValueError(f"limit must be between 1 and {MAX_SEARCH_LIMIT}")
+        normalized_session_id = None
+        if session_id:
+            try:
+                normalized_session_id = uuid.UUID(session_id).hex
+            except ValueError as exc:
+                raise ValueError("invalid session_id") from exc
+
+        rows = self._repository.search(query=normalized_query, limit=limit, session_id=normalized_session_id)
+        return SearchResponseData(items=[SearchHitData.model_validate(row) for row in rows])
+
+    def rebuild_index(self) -> int:
+        return self._repository.rebuild()
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from enum import StrEnum
+
+
+class SearchDocumentType(StrEnum):
+    UTTERANCE = "utterance"
+    REVISION_ITEM = "revision_item"
+
+
+# 长音频分段识别的单段 transcript 会拼进父 transcript，不单独建索引。
+SEARCH_SKIPPED_SOURCE_TYPES: frozenset[str] = frozenset({"asr_chunk"})
+
+
+def revision_item_search_text(suggested_text: str, draft_text: str | None) -> str:
+    """revision item 的检索文本：建议文本，加上与之不同的用户草稿。"""
+    if draft_text and draft_text != suggested_text:
+        return f"{suggested_text}\n{draft_text}"
+    return suggested_text
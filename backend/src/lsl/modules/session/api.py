@@ -43,20 +43,22 @@ def list_sessions(
     offset: int = 0,
     query: str | None = None,
     status: int | None = None,
+    cursor: str | None = None,
     session_service: SessionService = Depends(get_session_service),
 ):
     try:
-        items = session_service.list_sessions(
+        page = session_service.list_session_page(
             limit=limit,
             offset=offset,
             query=query,
             status=status,
+            cursor=cursor,
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except RuntimeError as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
-    return ApiResponse(data=SessionListResponseData(items=items))
+    return ApiResponse(data=page)
 
 
 @router.get("/{session_id}", response_model=ApiResponse[SessionData])
@@ -2,15 +2,32 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, SmallInteger, String, Text, text
+from sqlalchemy import DDL, DateTime, Index, Integer, SmallInteger, String, Text, event, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from lsl.core.db import Base
 from lsl.core.sql_types import UUIDHexString
 
 
+# 列表搜索匹配的文本；Postgres 在同一表达式上建 pg_trgm GIN 索引，查询表达式必须与之一致。
+SESSION_SEARCH_TEXT_SQL = (
+    "lower(title || ' ' || coalesce(x_description, '') || ' ' || coalesce(asset_object_key, ''))"
+)
+
+
 class SessionModel(Base):
     __tablename__ = "session_sessions"
+    __table_args__ = (
+        # 列表按 (created_at, session_id) 倒序做 keyset 分页。
+        Index("idx_session_sessions_created_at_session_id", "created_at", "session_id"),
+        # transcript 状态变化时按 current_transcript_id 找到要刷新 pipeline 列的 session。
+        Index("idx_session_sessions_current_transcript_id", "current_transcript_id"),
+        Index(
+            "idx_session_sessions_search_trgm",
+            text(f"{SESSION_SEARCH_TEXT_SQL} gin_trgm_ops"),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
 
     session_id: Mapped[str] = mapped_column(UUIDHexString(), primary_key=True)
     title: Mapped[str] = mapped_column(String(200), nullable=False)
@@ -32,3 +49,20 @@ class SessionModel(Base):
         onupdate=lambda: datetime.now(timezone.utc),
         server_default=text("CURRENT_TIMESTAMP"),
     )
+    # Pipeline 状态冗余列：由 SessionPipelineTracker 在各模块写入状态的同一事务内刷新，列表页只读本表。
+    # 为 NULL 表示对应阶段尚未开始；progress 为 0-100。
+    transcript_status: Mapped[int | None] = mapped_column(SmallInteger, nullable=True)
+    transcript_duration_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    revision_status: Mapped[int | None] = mapped_column(SmallInteger, nullable=True)
+    tts_status: Mapped[int | None] = mapped_column(SmallInteger, nullable=True)
+    tts_progress: Mapped[int | None] = mapped_column(SmallInteger, nullable=True)
+    translation_status: Mapped[int | None] = mapped_column(SmallInteger, nullable=True)
+    translation_progress: Mapped[int | None] = mapped_column(SmallInteger, nullable=True)
+    pipeline_updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+event.listen(
+    SessionModel.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any, Iterable
+
+from sqlalchemy import case, select, update
+from sqlalchemy.orm import Session as OrmSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from lsl.modules.revision.model import UtterancesRevisionModel
+from lsl.modules.revision.types import status_code_to_name as revision_status_to_name
+from lsl.modules.session.model import SessionModel
+from lsl.modules.transcript.model import TranscriptModel
+from lsl.modules.transcript.types import transcript_status_to_name
+from lsl.modules.translation.model import TranslationModel
+from lsl.modules.translation.types import translation_status_to_name
+from lsl.modules.tts.model import SpeechSynthesisModel
+from lsl.modules.tts.types import status_code_to_name as tts_status_to_name
+
+
+class SessionPipelineTracker:
+    """
+    在调用方的数据库事务内刷新 session_sessions 上的 pipeline 冗余列：
+    - 每次刷新是一条 UPDATE，状态由相关子查询从 transcript / revision / TTS / 翻译表读出，不信任调用方传值
+    - 各阶段只刷新自己的列：不同阶段并发写入时，一方读到的旧快照不会覆盖另一方刚写入的列
+    - transcript 经 current_transcript_id 关联；翻译取该 session 下最近更新的一条
+    不自己提交，和业务写入一起 commit / rollback。
+    """
+
+    def sync_transcript(
+        self,
+        db: OrmSession,
+        *,
+        transcript_id: str | None = None,
+        session_id: str | None = None,
+    ) -> None:
+        if transcript_id is not None:
+            self._refresh(db, SessionModel.current_transcript_id == transcript_id, self._transcript_values())
+        if session_id is not None:
+            self._refresh(db, SessionModel.session_id == session_id, self._transcript_values())
+
+    def sync_revision(self, db: OrmSession, session_id: str) -> None:
+        self._refresh(db, SessionModel.session_id == session_id, self._revision_values())
+
+    def sync_tts(self, db: OrmSession, session_id: str) -> None:
+        self._refresh(db, SessionModel.session_id == session_id, self._tts_values())
+
+    def sync_translation(self, db: OrmSession, session_id: str | None) -> None:
+        if session_id is None:
+            return
+        self._refresh(db, SessionModel.session_id == session_id, self._translation_values())
+
+    def sync_all(self, db: OrmSession, session_ids: Iterable[str]) -> int:
+        """一次刷新多个 session 的全部阶段，用于回填；返回更新的行数。"""
+        normalized = sorted(set(session_ids))
+        if not normalized:
+            return 0
+        values = {
+            **self._transcript_values(),
+            **self._revision_values(),
+            **self._tts_values(),
+            **self._translation_values(),
+        }
+        return self._refresh(db, SessionModel.session_id.in_(normalized), values)
+
+    @staticmethod
+    def to_summary(session: SessionModel) -> dict[str, Any]:
+        def name(status: int | None, to_name: Any) -> str | None:
+            return to_name(int(status)) if status is not None else None
+
+        return {
+            "transcript_status": session.transcript_status,
+            "transcript_status_name": name(session.transcript_status, transcript_status_to_name),
+            "transcript_duration_ms": session.transcript_duration_ms,
+            "revision_status": session.revision_status,
+            "revision_status_name": name(session.revision_status, revision_status_to_name),
+            "tts_status": session.tts_status,
+            "tts_status_name": name(session.tts_status, tts_status_to_name),
+            "tts_progress": session.tts_progress,
+            "translation_status": session.translation_status,
+            "translation_status_name": name(session.translation_status, translation_status_to_name),
+            "translation_progress": session.translation_progress,
+            "updated_at": session.pipeline_updated_at,
+        }
+
+    @staticmethod
+    def _refresh(db: OrmSession, condition: ColumnElement[bool], values: dict[str, Any]) -> int:
+        # Session 关闭了 autoflush，先把本事务里挂起的改动写下去，子查询才能读到。
+        db.flush()
+        # pipeline 列是冗余状态，不算 session 被修改：显式写回原值，ORM 就不会套用 updated_at 的 onupdate。
+        stmt = (
+            update(SessionModel)
+            .where(condition)
+            .values(
+                **values,
+                pipeline_updated_at=datetime.now(timezone.utc),
+                updated_at=SessionModel.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return int(db.execute(stmt).rowcount or 0)
+
+    @staticmethod
+    def _transcript_values() -> dict[str, Any]:
+        transcript = select(TranscriptModel).where(
+            TranscriptModel.transcript_id == SessionModel.current_transcript_id
+        )
+        return {
+            "transcript_status": transcript.with_only_columns(TranscriptModel.status).scalar_subquery(),
+            "transcript_duration_ms": transcript.with_only_columns(TranscriptModel.duration_ms).scalar_subquery(),
+        }
+
+    @staticmethod
+    def _revision_values() -> dict[str, Any]:
+        revision = UtterancesRevisionModel
+        return {
+            "revision_status": select(revision.status)
+            .where(revision.session_id == SessionModel.session_id)
+            .order_by(revision.updated_at.desc(), revision.revision_id.desc())
+            .limit(1)
+            .scalar_subquery(),
+        }
+
+    @staticmethod
+    def _tts_values() -> dict[str, Any]:
+        synthesis = SpeechSynthesisModel
+        progress = case(
+            (synthesis.item_count > 0, synthesis.completed_item_count * 100 // synthesis.item_count),
+            else_=None,
+        )
+        row = select(synthesis).where(synthesis.session_id == SessionModel.session_id)
+        return {
+            "tts_status": row.with_only_columns(synthesis.status).scalar_subquery(),
+            "tts_progress": row.with_only_columns(progress).scalar_subquery(),
+        }
+
+    @staticmethod
+    def _translation_values() -> dict[str, Any]:
+        translation = TranslationModel
+        progress = case(
+            (translation.item_count > 0, translation.completed_count * 100 // translation.item_count),
+            else_=None,
+        )
+        latest = (
+            select(translation)
+            .where(translation.session_id == SessionModel.session_id)
+            .order_by(translation.updated_at.desc(), translation.translation_id.desc())
+            .limit(1)
+        )
+        return {
+            "translation_status": latest.with_only_columns(translation.status).scalar_subquery(),
+            "translation_progress": latest.with_only_columns(progress).scalar_subquery(),
+        }
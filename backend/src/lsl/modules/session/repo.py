@@ -2,19 +2,30 @@ from __future__ import annotations
 
 import uuid
 from contextlib import contextmanager
-from typing import Any, Iterator
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Iterator
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import literal, literal_column, select, tuple_
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session as OrmSession
 from sqlalchemy.orm import sessionmaker
 
-from lsl.modules.session.model import SessionModel
+from lsl.modules.session.model import SESSION_SEARCH_TEXT_SQL, SessionModel
+
+if TYPE_CHECKING:
+    from lsl.modules.session.pipeline import SessionPipelineTracker
 
 
 class SessionRepository:
-    def __init__(self, session_factory: sessionmaker[OrmSession]) -> None:
+    def __init__(
+        self,
+        session_factory: sessionmaker[OrmSession],
+        *,
+        session_pipeline: SessionPipelineTracker | None = None,
+    ) -> None:
         self._session_factory = session_factory
+        # 不为 None 时，创建会话或切换 current_transcript_id 后在同一事务内刷新 transcript 的 pipeline 列。
+        self._session_pipeline = session_pipeline
 
     @contextmanager
     def _session_scope(self) -> Iterator[OrmSession]:
@@ -55,6 +66,8 @@ class SessionRepository:
         try:
             with self._session_scope() as db:
                 db.add(model)
+                if self._session_pipeline is not None and normalized_transcript_id is not None:
+                    self._session_pipeline.sync_transcript(db, session_id=normalized_session_id)
                 db.commit()
         except SQLAlchemyError as exc:  # pragma: no cover
             raise RuntimeError(f"Failed to create session: {exc}") from exc
@@ -76,22 +89,34 @@ class SessionRepository:
         self,
         *,
         limit: int,
-        offset: int,
+        offset: int = 0,
         query: str | None = None,
+        before: tuple[datetime, str] | None = None,
     ) -> list[SessionModel]:
+        """
+        按 (created_at, session_id) 倒序列出会话：
+        - before 为上一页最后一行的 (created_at, session_id)，keyset 分页不随页数变慢；offset 仅为兼容旧调用保留
+        - query 对标题、描述、object_key 拼接后的小写文本做子串匹配；Postgres 上该表达式有 pg_trgm GIN 索引，
+          SQLite 退化为顺序扫描
+        """
         stmt = select(SessionModel)
 
         if query:
-            like_value = f"%{query}%"
+            pattern = f"%{self._escape_like(query.lower())}%"
+            stmt = stmt.where(literal_column(SESSION_SEARCH_TEXT_SQL).like(pattern, escape="\\"))
+        if before is not None:
+            before_created_at, before_session_id = before
             stmt = stmt.where(
-                or_(
-                    SessionModel.title.ilike(like_value),
-                    func.coalesce(SessionModel.description, "").ilike(like_value),
-                    func.coalesce(SessionModel.asset_object_key, "").ilike(like_value),
+                tuple_(SessionModel.created_at, SessionModel.session_id)
+                < tuple_(
+                    literal(before_created_at, SessionModel.created_at.type),
+                    literal(before_session_id, SessionModel.session_id.type),
                 )
             )
 
-        stmt = stmt.order_by(SessionModel.created_at.desc()).limit(limit).offset(offset)
+        stmt = stmt.order_by(SessionModel.created_at.desc(), SessionModel.session_id.desc()).limit(limit)
+        if offset:
+            stmt = stmt.offset(offset)
 
         try:
             with self._session_scope() as db:
@@ -126,10 +151,38 @@ class SessionRepository:
                     else:
                         setattr(model, key, value)
 
+                if self._session_pipeline is not None and "current_transcript_id" in updates:
+                    self._session_pipeline.sync_transcript(db, session_id=normalized_session_id)
                 db.commit()
         except SQLAlchemyError as exc:  # pragma: no cover
             raise RuntimeError(f"Failed to update session: {exc}") from exc
 
+    def backfill_pipeline_status(self, *, batch_size: int = 500) -> int:
+        """
+        按 session_id 顺序分批重算全部 session 的 pipeline 列，每批一个事务，不长时间锁整表；
+        用于上线冗余列后回填已有数据，或修复不一致。返回处理的 session 数。
+        """
+        if self._session_pipeline is None:
+            raise RuntimeError("Session pipeline tracker is not configured")
+
+        total = 0
+        last_session_id: str | None = None
+        try:
+            while True:
+                stmt = select(SessionModel.session_id).order_by(SessionModel.session_id.asc()).limit(batch_size)
+                if last_session_id is not None:
+                    stmt = stmt.where(SessionModel.session_id > last_session_id)
+                with self._session_scope() as db:
+                    session_ids = [str(value) for value in db.execute(stmt).scalars().all()]
+                    if not session_ids:
+                        return total
+                    self._session_pipeline.sync_all(db, session_ids)
+                    db.commit()
+                total += len(session_ids)
+                last_session_id = session_ids[-1]
+        except SQLAlchemyError as exc:  # pragma: no cover
+            raise RuntimeError(f"Failed to backfill session pipeline status: {exc}") from exc
+
     def get_session_id_by_asset_object_key(self, object_key: str) -> str | None:
         stmt = select(SessionModel.session_id).where(SessionModel.asset_object_key == object_key).limit(1)
 
@@ -154,6 +207,10 @@ class SessionRepository:
         except SQLAlchemyError as exc:  # pragma: no cover
             raise RuntimeError(f"Failed to query session by current_transcript_id: {exc}") from exc
 
+    @staticmethod
+    def _escape_like(value: str) -> str:
+        return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
     @staticmethod
     def _parse_uuid_str(value: str) -> str | None:
         try:
@@ -145,11 +145,32 @@ class TranscriptSchema(BaseModel):
     updated_at: datetime
 
 
+class SessionPipelineSchema(BaseModel):
+    """session_sessions 上冗余的各阶段状态；为 null 表示该阶段尚未开始，progress 为 0-100。"""
+
+    transcript_status: int | None = None
+    transcript_status_name: str | None = None
+    transcript_duration_ms: int | None = None
+    revision_status: int | None = None
+    revision_status_name: str | None = None
+    tts_status: int | None = None
+    tts_status_name: str | None = None
+    tts_progress: int | None = None
+    translation_status: int | None = None
+    translation_status_name: str | None = None
+    translation_progress: int | None = None
+    updated_at: datetime | None = None
+
+
 class SessionData(BaseModel):
     session: SessionSchema
     asset: AssetSchema | None = None
+    # 列表项带按页批量读出的 transcript 元数据（不含 utterances）和 pipeline；详情接口返回完整 transcript。
     transcript: TranscriptSchema | None = None
+    pipeline: SessionPipelineSchema | None = None
 
 
 class SessionListResponseData(BaseModel):
     items: list[SessionData]
+    # 下一页游标，原样传回 cursor 参数；None 表示没有更多。
+    next_cursor: str | None = None
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import base64
+import binascii
+import json
 import uuid
-from typing import Any
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
 
 from lsl.modules.asset.service import AssetService
 from lsl.modules.session.model import SessionModel
@@ -10,6 +14,8 @@ from lsl.modules.session.schema import (
     AssetSchema,
     CreateSessionRequest,
     SessionData,
+    SessionListResponseData,
+    SessionPipelineSchema,
     SessionSchema,
     TranscriptSchema,
     UpdateSessionRequest,
@@ -17,6 +23,9 @@ from lsl.modules.session.schema import (
 from lsl.modules.transcript.schema import TranscriptData
 from lsl.modules.transcript.service import TranscriptService
 
+if TYPE_CHECKING:
+    from lsl.modules.session.pipeline import SessionPipelineTracker
+
 
 class SessionService:
     def __init__(
@@ -25,10 +34,13 @@ class SessionService:
         repository: SessionRepository,
         asset_service: AssetService,
         transcript_service: TranscriptService,
+        session_pipeline: SessionPipelineTracker | None = None,
     ) -> None:
         self._repository = repository
         self._asset_service = asset_service
         self._transcript_service = transcript_service
+        # 不为 None 时，响应附带 session 行上冗余的 pipeline 状态。
+        self._session_pipeline = session_pipeline
 
     def create_session(self, payload: CreateSessionRequest) -> SessionData:
         session_id = uuid.uuid4().hex
@@ -78,6 +90,9 @@ class SessionService:
 
         return self._to_session_data(session, asset=asset, transcript=transcript)
 
+    def get_session_id_by_transcript_id(self, transcript_id: str) -> str | None:
+        return self._repository.get_session_id_by_current_transcript_id(transcript_id)
+
     def list_sessions(
         self,
         *,
@@ -85,22 +100,42 @@ class SessionService:
         offset: int = 0,
         query: str | None = None,
         status: int | None = None,
+        cursor: str | None = None,
     ) -> list[SessionData]:
+        return self.list_session_page(limit=limit, offset=offset, query=query, status=status, cursor=cursor).items
+
+    def list_session_page(
+        self,
+        *,
+        limit: int = 20,
+        offset: int = 0,
+        query: str | None = None,
+        status: int | None = None,
+        cursor: str | None = None,
+    ) -> SessionListResponseData:
+        """与 list_sessions 相同，额外返回 keyset 分页的 next_cursor。"""
         if limit <= 0:
             raise ValueError("limit must be greater than 0")
         if limit > 100:
             raise ValueError("limit must be less than or equal to 100")
         if offset < 0:
             raise ValueError("offset must be greater than or equal to 0")
+        if cursor and offset:
+            raise ValueError("cursor and offset cannot be used together")
         if status is not None and status not in (0, 1, 2, 3, 4):
             raise ValueError("status must be one of 0,1,2,3,4")
 
-        sessions = self._repository.list_sessions(
-            limit=limit,
+        # 多取一行判断是否还有下一页。
+        rows = self._repository.list_sessions(
+            limit=limit + 1,
             offset=offset,
-            query=query,
+            query=query.strip() if query else None,
+            before=self._decode_cursor(cursor) if cursor else None,
         )
+        sessions = rows[:limit]
+        next_cursor = self._encode_cursor(sessions[-1]) if len(rows) > limit else None
 
+        # 各阶段状态取自 session 行上的 pipeline 列；素材和 transcript（不含 utterances）各批量读一次。
         assets = self._load_assets_by_sessions(sessions)
         transcripts = self._load_transcripts_by_sessions(sessions)
 
@@ -110,14 +145,28 @@ class SessionService:
             asset_object_key = self._normalize_object_key(session.asset_object_key)
             asset = assets.get(asset_object_key) if asset_object_key else None
             transcript = transcripts.get(transcript_id) if transcript_id else None
-            session_data = self._to_session_data(
-                session,
-                asset=asset,
-                transcript=transcript,
-            )
-            items.append(session_data)
+            items.append(self._to_session_data(session, asset=asset, transcript=transcript))
+
+        return SessionListResponseData(items=items, next_cursor=next_cursor)
+
+    def backfill_pipeline_status(self, *, batch_size: int = 500) -> int:
+        if batch_size <= 0:
+            raise ValueError("batch_size must be greater than 0")
+        return self._repository.backfill_pipeline_status(batch_size=batch_size)
 
-        return items
+    @staticmethod
+    def _encode_cursor(session: SessionModel) -> str:
+        payload = json.dumps([session.created_at.isoformat(), session.session_id], separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            created_at_raw, session_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            return datetime.fromisoformat(created_at_raw), uuid.UUID(session_id).hex
+        except (binascii.Error, UnicodeError, TypeError, ValueError) as exc:
+            raise ValueError("invalid cursor") from exc
 
     def update_session(self, *, session_id: str, payload: UpdateSessionRequest) -> SessionData:
         existing = self._repository.get_session_by_id(session_id)
@@ -169,6 +218,11 @@ class SessionService:
                 "session": SessionSchema.model_validate(session),
                 "asset": AssetSchema.model_validate(asset) if asset is not None else None,
                 "transcript": TranscriptSchema.model_validate(transcript) if transcript is not None else None,
+                "pipeline": (
+                    SessionPipelineSchema.model_validate(self._session_pipeline.to_summary(session))
+                    if self._session_pipeline is not None
+                    else None
+                ),
             }
         )
 
@@ -9,6 +9,7 @@ class SessionListFilters:
     offset: int = 0
     query: str | None = None
     status: int | None = None
+    cursor: str | None = None
 
 
 @dataclass(frozen=True, slots=True)
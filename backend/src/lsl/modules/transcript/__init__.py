@@ -2,9 +2,10 @@ from lsl.modules.transcript import model as _model
 from lsl.modules.transcript.api import router
 from lsl.modules.transcript.repo import TranscriptRepository
 from lsl.modules.transcript.service import TranscriptService
-from lsl.modules.transcript.types import TranscriptStatus, TranscriptUtterance
+from lsl.modules.transcript.types import TranscriptChunk, TranscriptStatus, TranscriptUtterance
 
 __all__ = [
+    "TranscriptChunk",
     "TranscriptRepository",
     "TranscriptService",
     "TranscriptStatus",
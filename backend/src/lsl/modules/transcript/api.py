@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typing import cast
+from typing import Literal, cast
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 
 from lsl.modules.transcript.schema import (
     ApiResponse,
@@ -48,10 +48,15 @@ def list_transcripts(
 def get_transcript(
     transcript_id: str,
     include_raw: bool = False,
+    include_utterances: bool = True,
     transcript_service: TranscriptService = Depends(get_transcript_service),
 ):
     try:
-        transcript = transcript_service.get_transcript(transcript_id=transcript_id, include_raw=include_raw)
+        transcript = transcript_service.get_transcript(
+            transcript_id=transcript_id,
+            include_raw=include_raw,
+            include_utterances=include_utterances,
+        )
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
     except RuntimeError as exc:
@@ -62,12 +67,25 @@ def get_transcript(
 @router.get("/{transcript_id}/utterances", response_model=ApiResponse[TranscriptUtteranceListResponseData])
 def get_transcript_utterances(
     transcript_id: str,
+    after_seq: int | None = None,
+    start_seq: int | None = None,
+    end_seq: int | None = None,
+    limit: int | None = None,
+    response_format: Literal["full", "compact"] = Query("full", alias="format"),
     transcript_service: TranscriptService = Depends(get_transcript_service),
 ):
     try:
-        items = transcript_service.list_utterances(transcript_id=transcript_id)
+        page = transcript_service.list_utterance_page(
+            transcript_id=transcript_id,
+            after_seq=after_seq,
+            start_seq=start_seq,
+            end_seq=end_seq,
+            limit=limit,
+        )
     except ValueError as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
+        detail = str(exc)
+        status_code = 404 if detail == "transcript not found" else 400
+        raise HTTPException(status_code=status_code, detail=detail) from exc
     except RuntimeError as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
-    return ApiResponse(data=TranscriptUtteranceListResponseData(items=items))
+    return ApiResponse(data=page.to_response(compact=response_format == "compact"))
@@ -6,7 +6,7 @@ from sqlalchemy import DateTime, Index, Integer, SmallInteger, String, Text, Uni
 from sqlalchemy.orm import Mapped, mapped_column
 
 from lsl.core.db import Base
-from lsl.core.sql_types import JSONString, UUIDHexString
+from lsl.core.sql_types import CompressedJSON, JSONString, UUIDHexString
 
 
 class TranscriptModel(Base):
@@ -22,7 +22,6 @@ class TranscriptModel(Base):
     language: Mapped[str | None] = mapped_column("x_language", String(16), nullable=True)
     duration_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
     full_text: Mapped[str | None] = mapped_column(Text, nullable=True)
-    raw_result_json: Mapped[dict | None] = mapped_column(JSONString(), nullable=True)
     status: Mapped[int] = mapped_column("x_status", SmallInteger, nullable=False, server_default=sql_text("0"))
     error_code: Mapped[str | None] = mapped_column(String(64), nullable=True)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -41,6 +40,21 @@ class TranscriptModel(Base):
     )
 
 
+class TranscriptRawResultModel(Base):
+    """provider / 生成器的原始结果，可达 MB 级，单独存放并压缩，只在 include_raw 时读取。"""
+
+    __tablename__ = "transcript_raw_results"
+
+    transcript_id: Mapped[str] = mapped_column(UUIDHexString(), primary_key=True)
+    raw_result: Mapped[dict | None] = mapped_column(CompressedJSON(), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        server_default=sql_text("CURRENT_TIMESTAMP"),
+    )
+
+
 class TranscriptUtteranceModel(Base):
     __tablename__ = "transcript_utterances"
     __table_args__ = (
@@ -2,20 +2,35 @@ from __future__ import annotations
 
 import uuid
 from contextlib import contextmanager
-from typing import Any, Iterator
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Iterator, Sequence
 
-from sqlalchemy import delete, select
+from sqlalchemy import bindparam, delete, insert, literal, or_, select, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session as OrmSession
 from sqlalchemy.orm import sessionmaker
 
-from lsl.modules.transcript.model import TranscriptModel, TranscriptUtteranceModel
+from lsl.modules.transcript.model import TranscriptModel, TranscriptRawResultModel, TranscriptUtteranceModel
 from lsl.modules.transcript.types import TranscriptStatus, transcript_status_to_name
 
+if TYPE_CHECKING:
+    from lsl.modules.search.indexer import SearchIndexer
+    from lsl.modules.session.pipeline import SessionPipelineTracker
+
 
 class TranscriptRepository:
-    def __init__(self, session_factory: sessionmaker[OrmSession]) -> None:
+    def __init__(
+        self,
+        session_factory: sessionmaker[OrmSession],
+        *,
+        search_indexer: SearchIndexer | None = None,
+        session_pipeline: SessionPipelineTracker | None = None,
+    ) -> None:
         self._session_factory = session_factory
+        # 不为 None 时，utterance 写入在同一事务内同步到全文检索索引。
+        self._search_indexer = search_indexer
+        # 不为 None 时，状态变化在同一事务内刷新引用该 transcript 的 session 的 pipeline 列。
+        self._session_pipeline = session_pipeline
 
     @contextmanager
     def _session_scope(self) -> Iterator[OrmSession]:
@@ -60,7 +75,13 @@ class TranscriptRepository:
         except SQLAlchemyError as exc:  # pragma: no cover
             raise RuntimeError(f"Failed to update transcript source entity: {exc}") from exc
 
-    def get_transcript_by_id(self, transcript_id: str, *, include_utterances: bool = True) -> dict[str, Any] | None:
+    def get_transcript_by_id(
+        self,
+        transcript_id: str,
+        *,
+        include_utterances: bool = True,
+        include_raw: bool = False,
+    ) -> dict[str, Any] | None:
         normalized_transcript_id = self._parse_uuid_str(transcript_id)
         if normalized_transcript_id is None:
             return None
@@ -72,10 +93,50 @@ class TranscriptRepository:
                 if model is None:
                     return None
                 utterances = self._load_utterances(db, normalized_transcript_id) if include_utterances else []
-                return self._to_row(model, utterances=utterances)
+                raw_result = None
+                if include_raw:
+                    raw_model = db.get(TranscriptRawResultModel, normalized_transcript_id)
+                    raw_result = raw_model.raw_result if raw_model is not None else None
+                return self._to_row(model, utterances=utterances, raw_result=raw_result)
         except SQLAlchemyError as exc:  # pragma: no cover
             raise RuntimeError(f"Failed to query transcript by id: {exc}") from exc
 
+    def list_utterances(
+        self,
+        transcript_id: str,
+        *,
+        after_seq: int | None = None,
+        start_seq: int | None = None,
+        end_seq: int | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]] | None:
+        """
+        按 seq 读取一段 utterances，走 (transcript_id, seq) 索引的范围扫描，耗时只取决于返回的行数：
+        - after_seq：keyset 游标，只返回 seq 大于它的行
+        - start_seq / end_seq：可见窗口，左闭右开
+        transcript 不存在时返回 None。
+        """
+        normalized_transcript_id = self._parse_uuid_str(transcript_id)
+        if normalized_transcript_id is None:
+            return None
+        exists_stmt = select(TranscriptModel.transcript_id).where(
+            TranscriptModel.transcript_id == normalized_transcript_id
+        )
+        try:
+            with self._session_scope() as db:
+                if db.execute(exists_stmt).first() is None:
+                    return None
+                return self._load_utterances(
+                    db,
+                    normalized_transcript_id,
+                    after_seq=after_seq,
+                    start_seq=start_seq,
+                    end_seq=end_seq,
+                    limit=limit,
+                )
+        except SQLAlchemyError as exc:  # pragma: no cover
+            raise RuntimeError(f"Failed to list transcript utterances: {exc}") from exc
+
     def list_transcripts(
         self,
         *,
@@ -121,42 +182,220 @@ class TranscriptRepository:
         full_text: str | None,
         raw_result_json: dict[str, Any] | None,
         utterances: list[dict[str, Any]],
+        diff: bool = False,
+        include_utterances: bool = True,
     ) -> dict[str, Any]:
+        """
+        完成 transcript 并写入 utterances：
+        - 默认整表替换：删除旧行后一条 executemany INSERT 批量写入，不逐个构造 ORM 对象
+        - diff=True 时按 seq 对比已有行，只更新内容变化的行、插入新增的行、删除范围外的行；
+          适合重新完成一条大部分内容不变的 transcript。utterances 的 seq 须连续（由 service 保证）
+        - 返回的 utterances 直接由入参构造，不再回读；include_utterances=False 时不返回
+        """
         normalized_transcript_id = self._require_uuid(transcript_id, field_name="transcript_id")
+        rows = [self._utterance_row(item) for item in utterances]
         try:
             with self._session_scope() as db:
                 model = self._get_required_transcript(db, normalized_transcript_id)
                 model.status = int(TranscriptStatus.COMPLETED)
                 model.duration_ms = duration_ms
                 model.full_text = full_text
-                model.raw_result_json = raw_result_json
                 model.error_code = None
                 model.error_message = None
+                # utterances 没有自己的 updated_at；diff 只改了 utterance 时上面几列可能都不变，显式刷新供版本号使用。
+                model.updated_at = datetime.now(timezone.utc)
 
                 db.execute(
-                    delete(TranscriptUtteranceModel).where(
-                        TranscriptUtteranceModel.transcript_id == normalized_transcript_id
+                    delete(TranscriptRawResultModel).where(
+                        TranscriptRawResultModel.transcript_id == normalized_transcript_id
                     )
                 )
-                for item in utterances:
-                    db.add(
-                        TranscriptUtteranceModel(
-                            transcript_id=normalized_transcript_id,
-                            seq=int(item["seq"]),
-                            text=item["text"],
-                            speaker=item.get("speaker"),
-                            start_time=int(item["start_time"]),
-                            end_time=int(item["end_time"]),
-                            additions_json=item.get("additions") or {},
+                if raw_result_json is not None:
+                    db.add(TranscriptRawResultModel(transcript_id=normalized_transcript_id, raw_result=raw_result_json))
+                indexer = self._search_indexer
+                if indexer is not None and not indexer.indexes_source_type(model.source_type):
+                    indexer = None
+                if diff:
+                    self._apply_utterance_diff(db, normalized_transcript_id, rows, indexer=indexer)
+                else:
+                    db.execute(
+                        delete(TranscriptUtteranceModel).where(
+                            TranscriptUtteranceModel.transcript_id == normalized_transcript_id
                         )
                     )
+                    self._insert_utterances(db, normalized_transcript_id, rows)
+                    if indexer is not None:
+                        indexer.replace_utterances(db, normalized_transcript_id, rows)
+                self._sync_session_pipeline(db, normalized_transcript_id)
                 db.commit()
                 db.refresh(model)
-                loaded = self._load_utterances(db, normalized_transcript_id)
-                return self._to_row(model, utterances=loaded)
+                return self._to_row(model, utterances=rows if include_utterances else [], raw_result=raw_result_json)
         except SQLAlchemyError as exc:  # pragma: no cover
             raise RuntimeError(f"Failed to complete transcript: {exc}") from exc
 
+    def _apply_utterance_diff(
+        self,
+        db: OrmSession,
+        transcript_id: str,
+        rows: Sequence[dict[str, Any]],
+        *,
+        indexer: SearchIndexer | None = None,
+    ) -> None:
+        utterance = TranscriptUtteranceModel
+        existing = {row["seq"]: row for row in self._load_utterances(db, transcript_id)}
+        incoming = {row["seq"]: row for row in rows}
+        if incoming:
+            db.execute(
+                delete(utterance).where(
+                    utterance.transcript_id == transcript_id,
+                    or_(utterance.seq < min(incoming), utterance.seq > max(incoming)),
+                )
+            )
+        else:
+            db.execute(delete(utterance).where(utterance.transcript_id == transcript_id))
+
+        changed = [row for seq, row in incoming.items() if seq in existing and existing[seq] != row]
+        if changed:
+            # Core 语句做 executemany；列名带 x_ 前缀，用 ORM 属性作为 key 映射到真实列。
+            stmt = (
+                update(utterance.__table__)
+                .where(utterance.transcript_id == bindparam("b_transcript_id"))
+                .where(utterance.seq == bindparam("b_seq"))
+                .values(
+                    {
+                        utterance.text: bindparam("b_text"),
+                        utterance.speaker: bindparam("b_speaker"),
+                        utterance.start_time: bindparam("b_start_time"),
+                        utterance.end_time: bindparam("b_end_time"),
+                        utterance.additions_json: bindparam("b_additions"),
+                    }
+                )
+            )
+            db.execute(
+                stmt,
+                [
+                    {
+                        "b_transcript_id": transcript_id,
+                        "b_seq": row["seq"],
+                        "b_text": row["text"],
+                        "b_speaker": row["speaker"],
+                        "b_start_time": row["start_time"],
+                        "b_end_time": row["end_time"],
+                        "b_additions": row["additions"],
+                    }
+                    for row in changed
+                ],
+            )
+        inserted = [row for seq, row in incoming.items() if seq not in existing]
+        self._insert_utterances(db, transcript_id, inserted)
+        if indexer is not None:
+            indexer.apply_utterance_diff(
+                db,
+                transcript_id,
+                seq_range=(min(incoming), max(incoming)) if incoming else None,
+                updated_rows=[row for row in changed if row["text"] != existing[row["seq"]]["text"]],
+                inserted_rows=inserted,
+            )
+
+    @staticmethod
+    def _insert_utterances(db: OrmSession, transcript_id: str, rows: Sequence[dict[str, Any]]) -> None:
+        if not rows:
+            return
+        now = datetime.now(timezone.utc)
+        # ORM bulk INSERT：按属性名传参，SQLite 走 executemany，Postgres 合并成多行 VALUES。
+        db.execute(
+            insert(TranscriptUtteranceModel),
+            [
+                {
+                    "transcript_id": transcript_id,
+                    "seq": row["seq"],
+                    "text": row["text"],
+                    "speaker": row["speaker"],
+                    "start_time": row["start_time"],
+                    "end_time": row["end_time"],
+                    "additions_json": row["additions"],
+                    "created_at": now,
+                }
+                for row in rows
+            ],
+        )
+
+    def copy_completed(
+        self,
+        *,
+        source_transcript_id: str,
+        transcript_id: str,
+        include_utterances: bool = True,
+    ) -> dict[str, Any] | None:
+        """
+        把已完成 transcript 的结果复制到另一条 transcript：utterances 和原始结果都用 INSERT ... SELECT 在库内复制，
+        不经过应用层。source 不存在或未完成时返回 None；include_utterances=False 时不回读复制出的 utterances。
+        """
+        normalized_source_id = self._require_uuid(source_transcript_id, field_name="source_transcript_id")
+        normalized_transcript_id = self._require_uuid(transcript_id, field_name="transcript_id")
+        utterance = TranscriptUtteranceModel
+        copy_stmt = insert(utterance).from_select(
+            [
+                utterance.transcript_id,
+                utterance.seq,
+                utterance.text,
+                utterance.speaker,
+                utterance.start_time,
+                utterance.end_time,
+                utterance.additions_json,
+                utterance.created_at,
+            ],
+            select(
+                literal(normalized_transcript_id, utterance.transcript_id.type),
+                utterance.seq,
+                utterance.text,
+                utterance.speaker,
+                utterance.start_time,
+                utterance.end_time,
+                utterance.additions_json,
+                literal(datetime.now(timezone.utc), utterance.created_at.type),
+            ).where(utterance.transcript_id == normalized_source_id),
+        )
+        raw = TranscriptRawResultModel
+        copy_raw_stmt = insert(raw).from_select(
+            [raw.transcript_id, raw.raw_result, raw.created_at],
+            select(
+                literal(normalized_transcript_id, raw.transcript_id.type),
+                raw.raw_result,
+                literal(datetime.now(timezone.utc), raw.created_at.type),
+            ).where(raw.transcript_id == normalized_source_id),
+        )
+        try:
+            with self._session_scope() as db:
+                source = db.get(TranscriptModel, normalized_source_id)
+                if source is None or int(source.status) != int(TranscriptStatus.COMPLETED):
+                    return None
+                model = self._get_required_transcript(db, normalized_transcript_id)
+                model.status = int(TranscriptStatus.COMPLETED)
+                model.duration_ms = source.duration_ms
+                model.full_text = source.full_text
+                model.error_code = None
+                model.error_message = None
+                model.updated_at = datetime.now(timezone.utc)
+
+                db.execute(delete(utterance).where(utterance.transcript_id == normalized_transcript_id))
+                db.execute(copy_stmt)
+                db.execute(delete(raw).where(raw.transcript_id == normalized_transcript_id))
+                db.execute(copy_raw_stmt)
+                if self._search_indexer is not None and self._search_indexer.indexes_source_type(model.source_type):
+                    self._search_indexer.copy_utterances(
+                        db,
+                        source_transcript_id=normalized_source_id,
+                        transcript_id=normalized_transcript_id,
+                    )
+                self._sync_session_pipeline(db, normalized_transcript_id)
+                db.commit()
+                db.refresh(model)
+                utterances = self._load_utterances(db, normalized_transcript_id) if include_utterances else []
+                return self._to_row(model, utterances=utterances)
+        except SQLAlchemyError as exc:  # pragma: no cover
+            raise RuntimeError(f"Failed to copy transcript: {exc}") from exc
+
     def mark_failed(
         self,
         *,
@@ -170,12 +409,17 @@ class TranscriptRepository:
                 model.status = int(TranscriptStatus.FAILED)
                 model.error_code = error_code
                 model.error_message = error_message
+                self._sync_session_pipeline(db, model.transcript_id)
                 db.commit()
                 db.refresh(model)
                 return self._to_row(model, utterances=[])
         except SQLAlchemyError as exc:  # pragma: no cover
             raise RuntimeError(f"Failed to mark transcript as failed: {exc}") from exc
 
+    def _sync_session_pipeline(self, db: OrmSession, transcript_id: str) -> None:
+        if self._session_pipeline is not None:
+            self._session_pipeline.sync_transcript(db, transcript_id=transcript_id)
+
     def _get_required_transcript(self, db: OrmSession, transcript_id: str) -> TranscriptModel:
         normalized_transcript_id = self._require_uuid(transcript_id, field_name="transcript_id")
         model = db.get(TranscriptModel, normalized_transcript_id)
@@ -184,16 +428,63 @@ class TranscriptRepository:
         return model
 
     @staticmethod
-    def _load_utterances(db: OrmSession, transcript_id: str) -> list[TranscriptUtteranceModel]:
-        stmt = (
-            select(TranscriptUtteranceModel)
-            .where(TranscriptUtteranceModel.transcript_id == transcript_id)
-            .order_by(TranscriptUtteranceModel.seq.asc())
-        )
-        return list(db.execute(stmt).scalars().all())
+    def _load_utterances(
+        db: OrmSession,
+        transcript_id: str,
+        *,
+        after_seq: int | None = None,
+        start_seq: int | None = None,
+        end_seq: int | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        utterance = TranscriptUtteranceModel
+        stmt = select(
+            utterance.seq,
+            utterance.text,
+            utterance.speaker,
+            utterance.start_time,
+            utterance.end_time,
+            utterance.additions_json,
+        ).where(utterance.transcript_id == transcript_id)
+        if after_seq is not None:
+            stmt = stmt.where(utterance.seq > int(after_seq))
+        if start_seq is not None:
+            stmt = stmt.where(utterance.seq >= int(start_seq))
+        if end_seq is not None:
+            stmt = stmt.where(utterance.seq < int(end_seq))
+        stmt = stmt.order_by(utterance.seq.asc())
+        if limit is not None:
+            stmt = stmt.limit(int(limit))
+        return [
+            {
+                "seq": int(seq),
+                "text": text,
+                "speaker": speaker,
+                "start_time": int(start_time),
+                "end_time": int(end_time),
+                "additions": additions or {},
+            }
+            for seq, text, speaker, start_time, end_time, additions in db.execute(stmt)
+        ]
 
     @staticmethod
-    def _to_row(model: TranscriptModel, *, utterances: list[TranscriptUtteranceModel]) -> dict[str, Any]:
+    def _utterance_row(item: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "seq": int(item["seq"]),
+            "text": item["text"],
+            "speaker": item.get("speaker"),
+            "start_time": int(item["start_time"]),
+            "end_time": int(item["end_time"]),
+            "additions": item.get("additions") or {},
+        }
+
+    @staticmethod
+    def _to_row(
+        model: TranscriptModel,
+        *,
+        utterances: list[dict[str, Any]],
+        raw_result: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
         status = int(model.status)
         return {
             "transcript_id": model.transcript_id,
@@ -202,24 +493,14 @@ class TranscriptRepository:
             "language": model.language,
             "duration_ms": model.duration_ms,
             "full_text": model.full_text,
-            "raw_result": model.raw_result_json,
+            "raw_result": raw_result,
             "status": status,
             "status_name": transcript_status_to_name(status),
             "error_code": model.error_code,
             "error_message": model.error_message,
             "created_at": model.created_at,
             "updated_at": model.updated_at,
-            "utterances": [
-                {
-                    "seq": int(item.seq),
-                    "text": item.text,
-                    "speaker": item.speaker,
-                    "start_time": int(item.start_time),
-                    "end_time": int(item.end_time),
-                    "additions": item.additions_json or {},
-                }
-                for item in utterances
-            ],
+            "utterances": utterances,
         }
 
     @staticmethod
@@ -79,4 +79,36 @@ class TranscriptListResponseData(BaseModel):
 
 
 class TranscriptUtteranceListResponseData(BaseModel):
+    items: list[TranscriptUtteranceData] = Field(default_factory=list)
+    # format=compact 时 items 为空，按 columns 的顺序把每条 utterance 编成一个数组放在 rows 里，字段名不再逐条重复。
+    columns: list[str] | None = None
+    rows: list[list[Any]] | None = None
+    # 还有后续行时，把 next_after_seq 作为下一页的 after_seq。
+    next_after_seq: int | None = None
+    has_more: bool = False
+
+
+TRANSCRIPT_UTTERANCE_COMPACT_COLUMNS: list[str] = ["seq", "start_time", "end_time", "speaker", "text", "additions"]
+
+
+class TranscriptUtterancePage(BaseModel):
     items: list[TranscriptUtteranceData]
+    next_after_seq: int | None = None
+    has_more: bool = False
+
+    def to_response(self, *, compact: bool = False) -> TranscriptUtteranceListResponseData:
+        if not compact:
+            return TranscriptUtteranceListResponseData(
+                items=self.items,
+                next_after_seq=self.next_after_seq,
+                has_more=self.has_more,
+            )
+        return TranscriptUtteranceListResponseData(
+            columns=TRANSCRIPT_UTTERANCE_COMPACT_COLUMNS,
+            rows=[
+                [item.seq, item.start_time, item.end_time, item.speaker, item.text, item.additions or None]
+                for item in self.items
+            ],
+            next_after_seq=self.next_after_seq,
+            has_more=self.has_more,
+        )
@@ -2,11 +2,11 @@ from __future__ import annotations
 
 import re
 import uuid
-from typing import Any
+from typing import Any, Sequence
 
 from lsl.modules.transcript.repo import TranscriptRepository
-from lsl.modules.transcript.schema import TranscriptData, TranscriptUtteranceData
-from lsl.modules.transcript.types import TranscriptStatus, TranscriptUtterance
+from lsl.modules.transcript.schema import TranscriptData, TranscriptUtteranceData, TranscriptUtterancePage
+from lsl.modules.transcript.types import TranscriptChunk, TranscriptStatus, TranscriptUtterance
 
 
 class TranscriptService:
@@ -67,7 +67,13 @@ class TranscriptService:
         full_text: str | None = None,
         duration_ms: int | None = None,
         raw_result: dict[str, Any] | None = None,
+        diff: bool = False,
+        include_utterances: bool = True,
     ) -> TranscriptData:
+        """
+        diff=True 时只改动 seq 内容有变化的 utterance 行（重新完成一条已有结果的 transcript）；
+        调用方不需要返回的 utterances 时传 include_utterances=False。
+        """
         normalized = self._normalize_utterances(utterances)
         if not normalized:
             raise ValueError("utterances are required")
@@ -79,9 +85,69 @@ class TranscriptService:
             full_text=resolved_full_text,
             raw_result_json=raw_result,
             utterances=[item.model_dump() for item in normalized],
+            diff=diff,
+            include_utterances=include_utterances,
         )
         return TranscriptData.from_row(row, include_raw=True)
 
+    def mark_completed_from_chunks(
+        self,
+        *,
+        transcript_id: str,
+        chunks: Sequence[TranscriptChunk],
+        raw_result: dict[str, Any] | None = None,
+    ) -> TranscriptData:
+        """
+        把分段识别的结果拼成一条完整 transcript：各段时间加上段起点偏移；
+        相邻两段的重叠区以中点为界，utterance 按时间中点归属其中一段，避免重复。
+        """
+        ordered = sorted(chunks, key=lambda item: item.start_ms)
+        if not ordered:
+            raise ValueError("chunks are required")
+        utterances: list[TranscriptUtterance] = []
+        for index, chunk in enumerate(ordered):
+            lower = (ordered[index - 1].end_ms + chunk.start_ms) // 2 if index > 0 else None
+            upper = (chunk.end_ms + ordered[index + 1].start_ms) // 2 if index + 1 < len(ordered) else None
+            for item in self.list_utterances(transcript_id=chunk.transcript_id):
+                start_time = chunk.start_ms + int(item.start_time)
+                end_time = chunk.start_ms + int(item.end_time)
+                midpoint = (start_time + end_time) // 2
+                if (lower is not None and midpoint < lower) or (upper is not None and midpoint >= upper):
+                    continue
+                utterances.append(
+                    TranscriptUtterance(
+                        seq=len(utterances),
+                        text=item.text,
+                        speaker=item.speaker,
+                        start_time=start_time,
+                        end_time=end_time,
+                        additions=dict(item.additions or {}),
+                    )
+                )
+        # 汇总 job 重试时重新拼接同一条 transcript，只改动变化的行。
+        return self.mark_completed(
+            transcript_id=transcript_id,
+            utterances=utterances,
+            duration_ms=ordered[-1].end_ms,
+            raw_result=raw_result,
+            diff=True,
+        )
+
+    def copy_completed(
+        self,
+        *,
+        source_transcript_id: str,
+        transcript_id: str,
+        include_utterances: bool = True,
+    ) -> TranscriptData | None:
+        """用已完成 transcript 的结果完成另一条 transcript（相同音频复用识别结果）；source 未完成时返回 None。"""
+        row = self._repository.copy_completed(
+            source_transcript_id=source_transcript_id,
+            transcript_id=transcript_id,
+            include_utterances=include_utterances,
+        )
+        return TranscriptData.from_row(row) if row is not None else None
+
     def mark_failed(
         self,
         *,
@@ -96,8 +162,19 @@ class TranscriptService:
         )
         return TranscriptData.from_row(row)
 
-    def get_transcript(self, *, transcript_id: str, include_raw: bool = False) -> TranscriptData:
-        row = self._repository.get_transcript_by_id(transcript_id, include_utterances=True)
+    def get_transcript(
+        self,
+        *,
+        transcript_id: str,
+        include_raw: bool = False,
+        include_utterances: bool = True,
+    ) -> TranscriptData:
+        # 原始结果单独存放，只在需要时多读一次；只要元数据时不读 utterances，分段读取见 list_utterance_page。
+        row = self._repository.get_transcript_by_id(
+            transcript_id,
+            include_utterances=include_utterances,
+            include_raw=include_raw,
+        )
         if row is None:
             raise ValueError("transcript not found")
         return TranscriptData.from_row(row, include_raw=include_raw)
@@ -130,7 +207,47 @@ class TranscriptService:
         return {str(row["transcript_id"]): TranscriptData.from_row(row) for row in rows}
 
     def list_utterances(self, *, transcript_id: str) -> list[TranscriptUtteranceData]:
-        return self.get_transcript(transcript_id=transcript_id).utterances
+        rows = self._repository.list_utterances(transcript_id)
+        if rows is None:
+            raise ValueError("transcript not found")
+        return [TranscriptUtteranceData(**row) for row in rows]
+
+    def list_utterance_page(
+        self,
+        *,
+        transcript_id: str,
+        after_seq: int | None = None,
+        start_seq: int | None = None,
+        end_seq: int | None = None,
+        limit: int | None = None,
+    ) -> TranscriptUtterancePage:
+        """
+        分段读取 utterances：after_seq 是 keyset 游标（只取之后的行），start_seq / end_seq 是左闭右开的可见窗口，
+        两者可以同时使用。limit 需显式传入才分页，多读一行判断是否还有下一页，不做 COUNT；
+        不传 limit 时返回范围内全部行（与旧接口一致）。
+        """
+        if limit is not None and limit <= 0:
+            raise ValueError("limit must be greater than 0")
+        if limit is not None and limit > 1000:
+            raise ValueError("limit must be less than or equal to 1000")
+        if start_seq is not None and end_seq is not None and end_seq < start_seq:
+            raise ValueError("end_seq must be greater than or equal to start_seq")
+        rows = self._repository.list_utterances(
+            transcript_id,
+            after_seq=after_seq,
+            start_seq=start_seq,
+            end_seq=end_seq,
+            limit=limit + 1 if limit is not None else None,
+        )
+        if rows is None:
+            raise ValueError("transcript not found")
+        has_more = limit is not None and len(rows) > limit
+        items = [TranscriptUtteranceData(**row) for row in (rows[:limit] if limit is not None else rows)]
+        return TranscriptUtterancePage(
+            items=items,
+            next_after_seq=items[-1].seq if has_more and items else None,
+            has_more=has_more,
+        )
 
     @staticmethod
     def _normalize_utterances(utterances: list[TranscriptUtterance]) -> list[TranscriptUtterance]:
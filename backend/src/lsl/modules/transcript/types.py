@@ -30,3 +30,11 @@ class TranscriptUtterance(BaseModel):
     start_time: int = Field(..., ge=0)
     end_time: int = Field(..., ge=0)
     additions: dict[str, Any] = Field(default_factory=dict)
+
+
+class TranscriptChunk(BaseModel):
+    """长音频分段识别的一段：transcript 中的时间相对本段，start_ms / end_ms 是本段在原音频中的位置。"""
+
+    transcript_id: str
+    start_ms: int = Field(..., ge=0)
+    end_ms: int = Field(..., ge=0)
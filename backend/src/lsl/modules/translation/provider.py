@@ -11,6 +11,7 @@ from openai.types.chat.chat_completion_system_message_param import ChatCompletio
 from openai.types.chat.chat_completion_user_message_param import ChatCompletionUserMessageParam
 
 from lsl.core.config import Settings
+from lsl.core.http import get_http_client
 from lsl.modules.translation.types import TranslationGenerateRequest, TranslationGenerator, TranslationSuggestion
 
 _CODE_FENCE_JSON_RE = re.compile(r"```(?:json)?\s*(.+?)\s*```", re.DOTALL | re.IGNORECASE)
@@ -173,5 +174,9 @@ class LLMTranslationGenerator:
         if self._client is None:
             if not self._api_key:
                 raise RuntimeError("TRANSLATION_LLM_API_KEY is required")
-            self._client = OpenAI(api_key=self._api_key, base_url=self._base_url)
+            self._client = OpenAI(
+                api_key=self._api_key,
+                base_url=self._base_url,
+                http_client=get_http_client("translation_llm", timeout=self._timeout),
+            )
         return self._client
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import uuid
 from contextlib import contextmanager
-from typing import Any, Iterator
+from typing import TYPE_CHECKING, Any, Iterator
 
 from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
@@ -12,10 +12,20 @@ from sqlalchemy.orm import selectinload, sessionmaker
 from lsl.modules.translation.model import TranslationItemModel, TranslationModel
 from lsl.modules.translation.types import TranslationItemStatus, TranslationSourceItem, TranslationStatus
 
+if TYPE_CHECKING:
+    from lsl.modules.session.pipeline import SessionPipelineTracker
+
 
 class TranslationRepository:
-    def __init__(self, session_factory: sessionmaker[OrmSession]) -> None:
+    def __init__(
+        self,
+        session_factory: sessionmaker[OrmSession],
+        *,
+        session_pipeline: SessionPipelineTracker | None = None,
+    ) -> None:
         self._session_factory = session_factory
+        # 不为 None 时，翻译状态和进度在同一事务内刷新到 session 的 pipeline 列。
+        self._session_pipeline = session_pipeline
 
     @contextmanager
     def _session_scope(self) -> Iterator[OrmSession]:
@@ -150,6 +160,7 @@ class TranslationRepository:
                         item.error_message = None
 
                 self._refresh_counts(model)
+                self._sync_session_pipeline(db, model)
                 db.commit()
                 db.refresh(model)
                 _ = list(model.items)
@@ -167,6 +178,7 @@ class TranslationRepository:
                 model.status = int(status)
                 model.error_code = None
                 model.error_message = None
+                self._sync_session_pipeline(db, model)
                 db.commit()
                 db.refresh(model)
                 _ = list(model.items)
@@ -189,6 +201,7 @@ class TranslationRepository:
                         item.error_message = None
                 self._refresh_counts(model)
                 model.status = int(TranslationStatus.GENERATING)
+                self._sync_session_pipeline(db, model)
                 db.commit()
         except SQLAlchemyError as exc:  # pragma: no cover
             raise RuntimeError(f"Failed to mark translation items generating: {exc}") from exc
@@ -212,6 +225,7 @@ class TranslationRepository:
                     item.error_code = None
                     item.error_message = None
                 self._refresh_counts(model)
+                self._sync_session_pipeline(db, model)
                 db.commit()
                 db.refresh(model)
                 _ = list(model.items)
@@ -238,6 +252,7 @@ class TranslationRepository:
                         item.error_code = error_code
                         item.error_message = error_message
                 self._refresh_counts(model)
+                self._sync_session_pipeline(db, model)
                 db.commit()
                 db.refresh(model)
                 _ = list(model.items)
@@ -306,6 +321,7 @@ class TranslationRepository:
                         model.error_message = "translation completed without all items"
                 else:
                     model.status = int(status)
+                self._sync_session_pipeline(db, model)
                 db.commit()
                 db.refresh(model)
                 _ = list(model.items)
@@ -313,6 +329,10 @@ class TranslationRepository:
         except SQLAlchemyError as exc:  # pragma: no cover
             raise RuntimeError(f"Failed to mark translation terminal: {exc}") from exc
 
+    def _sync_session_pipeline(self, db: OrmSession, model: TranslationModel) -> None:
+        if self._session_pipeline is not None:
+            self._session_pipeline.sync_translation(db, model.session_id)
+
     def _get_required_translation(self, db: OrmSession, translation_id: str) -> TranslationModel:
         model = db.get(TranslationModel, self._require_uuid(translation_id, field_name="translation_id"))
         if model is None:
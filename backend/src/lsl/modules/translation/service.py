@@ -3,6 +3,7 @@ from __future__ import annotations
 import uuid
 from typing import TYPE_CHECKING
 
+from lsl.modules.event.broadcaster import EventBroadcaster
 from lsl.modules.job.service import JobService
 from lsl.modules.job.types import JobData, JobRunResult, JobStatus
 from lsl.modules.translation.repo import TranslationRepository
@@ -31,8 +32,10 @@ class TranslationService:
         revision_repository: RevisionRepository,
         job_service: JobService | None = None,
         default_target_language: str = "zh-CN",
+        event_broadcaster: EventBroadcaster | None = None,
     ) -> None:
         self._repository = repository
+        self._event_broadcaster = event_broadcaster
         self._generator = generator
         self._transcript_service = transcript_service
         self._revision_repository = revision_repository
@@ -88,6 +91,17 @@ class TranslationService:
             source_entity_id=source_entity_id,
             target_language=target,
         )
+        dedup_key = self._job_service.build_dedup_key(
+            job_type=TranslationJobHandler.job_type,
+            entity_type="translation",
+            entity_id=source_entity_id,
+            payload={"source_type": normalized_source_type, "target_language": target, "force": force},
+        )
+        if existing is not None and existing.get("job_id"):
+            # 去重窗口内的重复请求（包括 force）直接返回进行中的 job，不重新 upsert / 入队。
+            active_job = self._job_service.find_active_job(job_type=TranslationJobHandler.job_type, dedup_key=dedup_key)
+            if active_job is not None and active_job.job_id == existing["job_id"]:
+                return TranslationData.from_row(existing)
         row = self._repository.upsert_translation(
             translation_id=existing["translation_id"] if existing else uuid.uuid4().hex,
             session_id=session_id or source.session_id,
@@ -120,6 +134,7 @@ class TranslationService:
                 "source_entity_id": source_entity_id,
                 "target_language": target,
             },
+            dedup_key=dedup_key,
         )
         row = self._repository.set_job_id(
             translation_id=data.translation_id,
@@ -275,21 +290,25 @@ class TranslationService:
                 for item in pending_items
             ],
         )
+        session_id = row.get("session_id")
         try:
             all_suggestions: dict[str, str] = {}
             for suggestions in self._generator.generate_progressively(req):
                 batch = {item.source_item_key: item.translated_text for item in suggestions}
                 all_suggestions.update(batch)
                 self._repository.apply_suggestions(translation_id=translation_id, suggestions=batch)
+                self._publish_translation_changed(translation_id=translation_id, session_id=session_id)
 
             final_row = self._repository.get_translation_by_id(translation_id)
             if final_row is None:
                 return JobRunResult(status=JobStatus.FAILED, error_code="TRANSLATION_NOT_FOUND", error_message="translation not found")
             if int(final_row["completed_count"]) == int(final_row["item_count"]):
                 self._repository.mark_completed(translation_id=translation_id, raw_result={"translated_count": len(all_suggestions)})
+                self._publish_translation_changed(translation_id=translation_id, session_id=session_id)
                 return JobRunResult(status=JobStatus.COMPLETED, progress=100)
 
             self._repository.mark_partial(translation_id=translation_id, error_message="some items were not translated")
+            self._publish_translation_changed(translation_id=translation_id, session_id=session_id)
             return JobRunResult(status=JobStatus.COMPLETED, progress=100)
         except Exception as exc:
             self._repository.mark_failed(
@@ -297,6 +316,7 @@ class TranslationService:
                 error_code="translation_generation_failed",
                 error_message=str(exc),
             )
+            self._publish_translation_changed(translation_id=translation_id, session_id=session_id)
             return JobRunResult(status=JobStatus.FAILED, error_code="TRANSLATION_GENERATION_FAILED", error_message=str(exc))
 
     def _load_source_items(self, *, source_type: str, source_entity_id: str) -> "_TranslationSource":
@@ -352,6 +372,14 @@ class TranslationService:
             raise ValueError(f"unsupported translation source_type: {value}")
         return normalized
 
+    def _publish_translation_changed(self, *, translation_id: str, session_id: str | None) -> None:
+        if self._event_broadcaster is not None:
+            self._event_broadcaster.publish_entity_changed(
+                entity_type="translation",
+                entity_id=translation_id,
+                session_id=session_id,
+            )
+
     def _provider_name(self) -> str:
         return getattr(self._generator, "provider_name", "unknown")
 
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from bisect import bisect_right
+from dataclasses import dataclass
 from math import floor
+from typing import Iterator
 
 
 _BITRATES_KBPS: dict[tuple[str, str], list[int | None]] = {
@@ -27,9 +30,20 @@ def estimate_audio_duration_ms(*, audio_bytes: bytes, format_name: str) -> int |
 
 
 def estimate_mp3_duration_ms(audio_bytes: bytes) -> int | None:
-    offset = _skip_id3v2(audio_bytes)
     total_seconds = 0.0
     frame_count = 0
+    for _, _, frame_seconds in iter_mp3_frames(audio_bytes):
+        total_seconds += frame_seconds
+        frame_count += 1
+
+    if frame_count == 0:
+        return None
+    return int(round(total_seconds * 1000))
+
+
+def iter_mp3_frames(audio_bytes: bytes) -> Iterator[tuple[int, int, float]]:
+    """逐帧返回 (offset, frame_size, 帧时长秒)；跳过 ID3v2 标签和无法识别的字节。"""
+    offset = _skip_id3v2(audio_bytes)
 
     while offset + 4 <= len(audio_bytes):
         header = int.from_bytes(audio_bytes[offset : offset + 4], "big")
@@ -42,13 +56,67 @@ def estimate_mp3_duration_ms(audio_bytes: bytes) -> int | None:
         if frame_size <= 0 or offset + frame_size > len(audio_bytes):
             break
 
-        total_seconds += samples_per_frame / sample_rate
-        frame_count += 1
+        yield offset, frame_size, samples_per_frame / sample_rate
         offset += frame_size
 
-    if frame_count == 0:
-        return None
-    return int(round(total_seconds * 1000))
+
+@dataclass(frozen=True, slots=True)
+class Mp3Chunk:
+    data: bytes
+    # 在原音频中的实际起止时间（按帧边界），单位毫秒。
+    start_ms: int
+    end_ms: int
+
+
+def split_mp3(audio_bytes: bytes, *, chunk_ms: int, overlap_ms: int) -> list[Mp3Chunk]:
+    """
+    按帧边界把 MP3 切成约 chunk_ms 长的片段，相邻片段重叠 overlap_ms，每个片段都是可独立解码的帧序列。
+    首帧是 Xing / Info / VBRI 等 VBR 头时丢弃，它记录的是整段音频的帧数。无法解析时返回空列表。
+    """
+    if chunk_ms <= 0 or overlap_ms < 0 or overlap_ms >= chunk_ms:
+        raise ValueError("chunk_ms must be greater than overlap_ms and overlap_ms must not be negative")
+
+    offsets: list[int] = []
+    sizes: list[int] = []
+    starts_ms: list[float] = []
+    elapsed_ms = 0.0
+    for offset, frame_size, frame_seconds in iter_mp3_frames(audio_bytes):
+        if not offsets and _is_vbr_header_frame(audio_bytes[offset : offset + frame_size]):
+            continue
+        offsets.append(offset)
+        sizes.append(frame_size)
+        starts_ms.append(elapsed_ms)
+        elapsed_ms += frame_seconds * 1000
+    if not offsets:
+        return []
+
+    total_ms = elapsed_ms
+    stride_ms = chunk_ms - overlap_ms
+    chunks: list[Mp3Chunk] = []
+    chunk_start_ms = 0.0
+    while True:
+        # 剩余部分不足一个片段时并入最后一段，不产生过短的尾片段。
+        is_last = total_ms - chunk_start_ms <= chunk_ms
+        chunk_end_ms = total_ms if is_last else chunk_start_ms + chunk_ms
+        first = max(0, bisect_right(starts_ms, chunk_start_ms) - 1)
+        last = max(first, bisect_right(starts_ms, chunk_end_ms - 1e-6) - 1)
+        end_ms = starts_ms[last + 1] if last + 1 < len(starts_ms) else total_ms
+        chunks.append(
+            Mp3Chunk(
+                data=audio_bytes[offsets[first] : offsets[last] + sizes[last]],
+                start_ms=int(round(starts_ms[first])),
+                end_ms=int(round(end_ms)),
+            )
+        )
+        if is_last:
+            return chunks
+        chunk_start_ms += stride_ms
+
+
+def _is_vbr_header_frame(frame: bytes) -> bool:
+    # Xing / Info / VBRI 标签位于 side information 之后，不同版本、声道数的偏移不同，只在帧头部附近查找。
+    head = frame[:64]
+    return b"Xing" in head or b"Info" in head or b"VBRI" in head
 
 
 def _skip_id3v2(audio_bytes: bytes) -> int:
@@ -8,9 +8,10 @@ import uuid
 from dataclasses import dataclass
 from typing import Any
 
-import requests
+import httpx
 
 from lsl.core.config import Settings
+from lsl.core.http import get_http_client
 from lsl.modules.tts.audio_duration import estimate_audio_duration_ms
 from lsl.modules.tts.types import TtsSpeaker, TtsSynthesizeRequest, TtsSynthesizeResult
 
@@ -293,12 +294,10 @@ class VolcTtsProvider:
             len(req.cue_texts),
         )
 
-        response = requests.post(
-            self._url,
-            headers=headers,
-            json=payload,
+        client = get_http_client("volc_tts", timeout=self._timeout)
+        response = client.send(
+            client.build_request("POST", self._url, headers=headers, json=payload),
             stream=True,
-            timeout=self._timeout,
         )
         try:
             log_id = response.headers.get("X-Tt-Logid")
@@ -311,6 +310,7 @@ class VolcTtsProvider:
                 int((time.monotonic() - request_started_at) * 1000),
             )
             if response.status_code != 200:
+                response.read()
                 response_text = response.text[:400]
                 logger.error(
                     "Volc TTS non-200 request_id=%s status=%s x_tt_logid=%s body=%s",
@@ -488,10 +488,10 @@ class VolcTtsProvider:
         return f"{normalized[:limit]}..."
 
     @staticmethod
-    def _iter_response_events(response: requests.Response) -> list[tuple[str | None, dict[str, Any]]]:
+    def _iter_response_events(response: httpx.Response) -> list[tuple[str | None, dict[str, Any]]]:
         current_event: str | None = None
         events: list[tuple[str | None, dict[str, Any]]] = []
-        for chunk in response.iter_lines(decode_unicode=True):
+        for chunk in response.iter_lines():
             if not chunk:
                 continue
             line = chunk.strip()
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import uuid
 from contextlib import contextmanager
-from typing import Iterator
+from typing import TYPE_CHECKING, Iterator
 
 from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
@@ -16,10 +16,20 @@ from lsl.modules.tts.model import (
 )
 from lsl.modules.tts.types import StoredSynthesisItem, TtsSynthesisStatus
 
+if TYPE_CHECKING:
+    from lsl.modules.session.pipeline import SessionPipelineTracker
+
 
 class TtsRepository:
-    def __init__(self, session_factory: sessionmaker[OrmSession]) -> None:
+    def __init__(
+        self,
+        session_factory: sessionmaker[OrmSession],
+        *,
+        session_pipeline: SessionPipelineTracker | None = None,
+    ) -> None:
         self._session_factory = session_factory
+        # 不为 None 时，合成状态和进度在同一事务内刷新到 session 的 pipeline 列。
+        self._session_pipeline = session_pipeline
 
     @contextmanager
     def _session_scope(self) -> Iterator[OrmSession]:
@@ -179,6 +189,8 @@ class TtsRepository:
                     model_item.error_code = item.error_code
                     model_item.error_message = item.error_message
 
+                if self._session_pipeline is not None:
+                    self._session_pipeline.sync_tts(db, normalized_session_id)
                 db.commit()
                 db.refresh(model)
                 _ = list(model.items)
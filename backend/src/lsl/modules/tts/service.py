@@ -13,8 +13,9 @@ from threading import Lock
 
 from lsl.core.config import Settings
 from lsl.modules.asset.service import AssetService
+from lsl.modules.event.broadcaster import EventBroadcaster
 from lsl.modules.job.service import JobService
-from lsl.modules.job.types import JobData, JobRunResult, JobStatus
+from lsl.modules.job.types import JobData, JobLeaseLostError, JobRunResult, JobSpec, JobStatus
 from lsl.modules.revision.schema import RevisionData, RevisionItemData
 from lsl.modules.revision.service import RevisionService
 from lsl.modules.session.service import SessionService
@@ -60,8 +61,10 @@ class TtsService:
         asset_service: AssetService,
         job_service: JobService,
         settings: Settings,
+        event_broadcaster: EventBroadcaster | None = None,
     ) -> None:
         self._repository = repository
+        self._event_broadcaster = event_broadcaster
         self._provider = provider
         self._cache = cache
         self._session_service = session_service
@@ -227,22 +230,7 @@ class TtsService:
 
     def create_synthesis(self, *, session_id: str, force: bool = False) -> CreateTtsSynthesisData:
         self._session_service.get_session(session_id, auto_refresh=False)
-        revision = self._revision_service.get_revision(session_id=session_id)
-        settings_value = self._settings_value_from_model(
-            session_id=session_id,
-            model=self._repository.get_settings_by_session_id(session_id),
-        )
-        available_speakers = self._provider.get_speakers()
-        items = self._build_synthesis_items(
-            revision=revision,
-            settings_value=settings_value,
-            speakers=available_speakers,
-        )
-        full_content_hash = self._build_full_content_hash(
-            provider=self._provider.provider_name,
-            settings_value=settings_value,
-            items=items,
-        )
+        _, items, full_content_hash = self._prepare_synthesis(session_id)
         existing = self._repository.get_synthesis_by_session_id(session_id)
         if existing is not None and not force and existing.full_content_hash == full_content_hash:
             if int(existing.status) == int(TtsSynthesisStatus.COMPLETED) and existing.full_asset_object_key:
@@ -250,6 +238,12 @@ class TtsService:
             if int(existing.status) == int(TtsSynthesisStatus.GENERATING):
                 return CreateTtsSynthesisData(synthesis=self._to_synthesis_data(existing), job=None)
 
+        # 重复点击 / 前端重试（包括 force）在去重窗口内复用进行中的 job，不重置 items、不 supersede 旧 job。
+        dedup_key = self._synthesis_dedup_key(session_id=session_id, full_content_hash=full_content_hash, force=force)
+        active_job = self._job_service.find_active_job(job_type=TtsJobHandler.job_type, dedup_key=dedup_key)
+        if existing is not None and active_job is not None:
+            return CreateTtsSynthesisData(synthesis=self._to_synthesis_data(existing), job=active_job)
+
         pending_items = [
             StoredSynthesisItem(
                 source_item_id=item.source_item_id,
@@ -284,10 +278,35 @@ class TtsService:
             entity_type="tts_synthesis",
             entity_id=str(model.synthesis_id),
             payload={"session_id": session_id, "force": force},
+            dedup_key=dedup_key,
         )
         return CreateTtsSynthesisData(synthesis=self._to_synthesis_data(model), job=job)
 
-    def run_synthesis_job(self, *, session_id: str, force: bool = False) -> JobRunResult:
+    def build_revision_follow_ups(self, job: JobData, result: JobRunResult) -> list[JobSpec]:
+        """流水线钩子（revision_generation 完成时）：自动生成的 revision 完成后，同一事务内排队整段 TTS。"""
+        if not job.payload.get("pipeline") or (result.result or {}).get("skipped"):
+            return []
+        session_id = str(job.payload.get("session_id") or "").strip()
+        if not session_id:
+            return []
+        # 与 create_synthesis 使用同一个 dedup_key：流水线运行期间用户点击合成会复用这个 job，而不是再跑一遍。
+        _, _, full_content_hash = self._prepare_synthesis(session_id)
+        existing = self._repository.get_synthesis_by_session_id(session_id)
+        return [
+            JobSpec(
+                job_type=TtsJobHandler.job_type,
+                entity_type="tts_synthesis" if existing is not None else "session",
+                entity_id=str(existing.synthesis_id) if existing is not None else session_id,
+                payload={"session_id": session_id, "force": False, "pipeline": True},
+                dedup_key=self._synthesis_dedup_key(
+                    session_id=session_id,
+                    full_content_hash=full_content_hash,
+                    force=False,
+                ),
+            )
+        ]
+
+    def _prepare_synthesis(self, session_id: str) -> tuple[TtsSettingsValue, list[StoredSynthesisItem], str]:
         revision = self._revision_service.get_revision(session_id=session_id)
         settings_value = self._settings_value_from_model(
             session_id=session_id,
@@ -303,6 +322,24 @@ class TtsService:
             settings_value=settings_value,
             items=items,
         )
+        return settings_value, items, full_content_hash
+
+    def _synthesis_dedup_key(self, *, session_id: str, full_content_hash: str, force: bool) -> str:
+        return self._job_service.build_dedup_key(
+            job_type=TtsJobHandler.job_type,
+            entity_type="tts_synthesis",
+            entity_id=session_id,
+            payload={"full_content_hash": full_content_hash, "force": force},
+        )
+
+    def run_synthesis_job(
+        self,
+        *,
+        session_id: str,
+        force: bool = False,
+        job: JobData | None = None,
+    ) -> JobRunResult:
+        settings_value, items, full_content_hash = self._prepare_synthesis(session_id)
         job_token = self._register_job(session_id)
         self._run_synthesis_job(
             session_id,
@@ -311,6 +348,7 @@ class TtsService:
             settings_value,
             force,
             job_token,
+            job,
         )
         model = self._repository.get_synthesis_by_session_id(session_id)
         if model is None:
@@ -329,6 +367,7 @@ class TtsService:
         settings_value: TtsSettingsValue,
         force: bool,
         job_token: str,
+        job: JobData | None = None,
     ) -> None:
         current_items = [
             StoredSynthesisItem(
@@ -364,6 +403,10 @@ class TtsService:
                 if not self._is_active_job(session_id=session_id, job_token=job_token):
                     logger.info("TTS job superseded session_id=%s", session_id)
                     return
+                # 每个 item 前续约 job 锁；锁已被其他 worker 接管时停止，避免重复调用付费 TTS。
+                if job is not None and not self._renew_job_lease(job, progress=(index - 1) * 100 // len(items)):
+                    logger.warning("TTS job lease lost session_id=%s job_id=%s", session_id, job.job_id)
+                    return
 
                 item_started_at = time.monotonic()
                 try:
@@ -454,6 +497,7 @@ class TtsService:
                     error_code=None,
                     error_message=None,
                 )
+                self._publish_tts_changed(session_id)
 
             completed_count = sum(1 for item in current_items if int(item.status) == int(TtsSynthesisStatus.COMPLETED))
             failed_count = sum(1 for item in current_items if int(item.status) == int(TtsSynthesisStatus.FAILED))
@@ -560,6 +604,16 @@ class TtsService:
             )
         finally:
             self._clear_job(session_id=session_id, job_token=job_token)
+            # 完成 / 部分失败 / 失败都已落库，通知前端刷新最终状态。
+            self._publish_tts_changed(session_id)
+
+    def _publish_tts_changed(self, session_id: str) -> None:
+        if self._event_broadcaster is not None:
+            self._event_broadcaster.publish_entity_changed(
+                entity_type="tts_synthesis",
+                entity_id=session_id,
+                session_id=session_id,
+            )
 
     def _build_synthesis_items(
         self,
@@ -811,6 +865,13 @@ class TtsService:
                 return item
         raise ValueError("tts source item not found")
 
+    def _renew_job_lease(self, job: JobData, *, progress: int) -> bool:
+        try:
+            self._job_service.heartbeat(job, progress=progress)
+        except JobLeaseLostError:
+            return False
+        return True
+
     def _register_job(self, session_id: str) -> str:
         token = uuid.uuid4().hex
         with self._job_tokens_lock:
@@ -935,4 +996,4 @@ class TtsJobHandler:
                 error_message="session_id is required",
             )
         force = bool(job.payload.get("force", False))
-        return self._tts_service.run_synthesis_job(session_id=session_id, force=force)
+        return self._tts_service.run_synthesis_job(session_id=session_id, force=force, job=job)
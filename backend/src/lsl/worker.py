@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import signal
+
+from lsl.bootstrap import build_app_services, close_app_services
+from lsl.core import Settings, configure_logging
+from lsl.core.metrics import start_metrics_server
+from lsl.modules.job.retention import JobRetentionConfig, run_job_retention
+from lsl.modules.job.scheduler import (
+    JobSchedulerConfig,
+    build_worker_id,
+    parse_job_type_limits,
+    parse_job_types,
+    run_job_scheduler,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _build_arg_parser(settings: Settings) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m lsl.worker",
+        description="Run the LSL job scheduler outside the API process.",
+    )
+    parser.add_argument(
+        "--job-types",
+        default=settings.JOB_WORKER_JOB_TYPES,
+        help="Comma separated job types to claim. Empty means all registered handlers.",
+    )
+    parser.add_argument("--max-workers", type=int, default=settings.JOB_WORKER_MAX_WORKERS)
+    parser.add_argument("--batch-size", type=int, default=settings.JOB_WORKER_BATCH_SIZE)
+    parser.add_argument("--interval-seconds", type=float, default=settings.JOB_RUNNER_INTERVAL_SECONDS)
+    parser.add_argument(
+        "--interactive-max-workers",
+        type=int,
+        default=settings.JOB_RUNNER_INTERACTIVE_MAX_WORKERS,
+        help="Threads reserved for JOB_RUNNER_INTERACTIVE_JOB_TYPES. 0 disables the interactive lane.",
+    )
+    parser.add_argument(
+        "--type-concurrency",
+        default=settings.JOB_RUNNER_TYPE_CONCURRENCY,
+        help="Per job type concurrency limits, e.g. tts_synthesis=2,revision_generation=2.",
+    )
+    return parser
+
+
+async def run_worker(settings: Settings, config: JobSchedulerConfig) -> None:
+    services = build_app_services(settings)
+    job_service = services.job_service
+    if job_service is None:
+        close_app_services(services)
+        raise RuntimeError("DATABASE_URL is required to run the job worker")
+
+    unknown_job_types = sorted(set(config.job_types) - set(job_service.registered_job_types()))
+    if unknown_job_types:
+        close_app_services(services)
+        raise ValueError(f"job handler is not registered: {', '.join(unknown_job_types)}")
+
+    metrics_server = None
+    if settings.METRICS_ENABLED and settings.JOB_WORKER_METRICS_PORT > 0:
+        metrics_server = start_metrics_server(settings.JOB_WORKER_METRICS_PORT)
+        logger.info("Job worker metrics listening port=%s", settings.JOB_WORKER_METRICS_PORT)
+
+    loop = asyncio.get_running_loop()
+    scheduler_task = asyncio.create_task(run_job_scheduler(job_service=job_service, config=config))
+    retention_task: asyncio.Task | None = None
+    if settings.JOB_RETENTION_ENABLED:
+        retention_task = asyncio.create_task(
+            run_job_retention(job_service=job_service, config=JobRetentionConfig.from_settings(settings))
+        )
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, scheduler_task.cancel)
+        except NotImplementedError:  # pragma: no cover
+            pass
+
+    logger.info(
+        "Job worker started worker_id=%s job_types=%s max_workers=%s batch_size=%s",
+        config.worker_id,
+        ",".join(config.job_types) or "*",
+        config.max_workers,
+        config.batch_size,
+    )
+    try:
+        await scheduler_task
+    except asyncio.CancelledError:
+        pass
+    finally:
+        if retention_task is not None:
+            retention_task.cancel()
+            try:
+                await retention_task
+            except asyncio.CancelledError:
+                pass
+        if metrics_server is not None:
+            metrics_server.shutdown()
+            metrics_server.server_close()
+        close_app_services(services)
+        logger.info("Job worker stopped worker_id=%s", config.worker_id)
+
+
+def main(argv: list[str] | None = None) -> None:
+    configure_logging()
+    settings = Settings.from_env()
+    args = _build_arg_parser(settings).parse_args(argv)
+    if args.max_workers <= 0:
+        raise SystemExit("--max-workers must be greater than 0")
+    if args.batch_size <= 0:
+        raise SystemExit("--batch-size must be greater than 0")
+    if args.interval_seconds <= 0:
+        raise SystemExit("--interval-seconds must be greater than 0")
+    if args.interactive_max_workers < 0:
+        raise SystemExit("--interactive-max-workers must be greater than or equal to 0")
+
+    config = JobSchedulerConfig(
+        worker_id=build_worker_id("job-worker"),
+        max_workers=args.max_workers,
+        batch_size=args.batch_size,
+        interval_seconds=args.interval_seconds,
+        job_types=parse_job_types(args.job_types),
+        thread_name_prefix="job-worker",
+        interactive_job_types=parse_job_types(settings.JOB_RUNNER_INTERACTIVE_JOB_TYPES),
+        interactive_max_workers=args.interactive_max_workers,
+        job_type_limits=parse_job_type_limits(args.type_concurrency),
+        async_max_concurrency=settings.JOB_RUNNER_ASYNC_MAX_CONCURRENCY,
+        heartbeat_interval_seconds=settings.JOB_HEARTBEAT_INTERVAL_SECONDS,
+        timer_prefetch_limit=settings.JOB_RUNNER_TIMER_PREFETCH_LIMIT,
+    )
+    asyncio.run(run_worker(settings, config))
+
+
+if __name__ == "__main__":
+    main()
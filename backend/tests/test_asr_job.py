@@ -1,14 +1,40 @@
 from __future__ import annotations
 
-from sqlalchemy import create_engine
+import asyncio
+import hashlib
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlsplit
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session as OrmSession
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
+from lsl.core import http as http_module
+from lsl.core.config import Settings
 from lsl.core.db import Base
+from lsl.core.http import HttpClientRegistry
+from lsl.modules.asr.api import callback_router
 from lsl.modules.asr.repo import AsrRepository
+from lsl.modules.asset.providers import FakeStorageProvider
+from lsl.modules.asset.repo import AssetRepository
+from lsl.modules.asset.service import AssetService
 from lsl.modules.asr.service import AsrJobHandler, AsrService
-from lsl.modules.asr.types import AsrJobRef, AsrJobStatus, AsrQueryResult, AsrRecognitionStatus, AsrSubmitRequest
+from lsl.modules.asr.types import (
+    AsrJobRef,
+    AsrJobStatus,
+    AsrQueryResult,
+    AsrRecognitionStatus,
+    AsrSubmitRequest,
+    AsrUtterance,
+)
 from lsl.modules.asr.providers.fake_asr import FakeAsrProvider
+from lsl.modules.asr.providers.volc_asr import VolcAsrProvider
 from lsl.modules.job.repo import JobRepository
 from lsl.modules.job.service import JobService
 from lsl.modules.job.types import JobStatus
@@ -41,8 +67,21 @@ def _build_services() -> tuple[AsrService, JobService, TranscriptService]:
     return _build_services_with_provider(FakeAsrProvider())
 
 
-def _build_services_with_provider(provider) -> tuple[AsrService, JobService, TranscriptService]:
-    engine = create_engine("sqlite:///:memory:")
+def _build_services_with_provider(
+    provider,
+    *,
+    database_url: str | None = None,
+    **service_options,
+) -> tuple[AsrService, JobService, TranscriptService]:
+    if database_url is None:
+        engine = create_engine(
+            "sqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+    else:
+        # 文件 SQLite 走连接池，每个线程各自一条连接，可以并发提交。
+        engine = create_engine(database_url, connect_args={"check_same_thread": False})
     Base.metadata.create_all(engine)
     factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=OrmSession)
     job_service = JobService(repository=JobRepository(factory), lock_ttl_seconds=30)
@@ -52,6 +91,8 @@ def _build_services_with_provider(provider) -> tuple[AsrService, JobService, Tra
         transcript_service=transcript_service,
         job_service=job_service,
         provider=provider,
+        asset_service=AssetService(settings=Settings(), storage=FakeStorageProvider(), repository=AssetRepository(factory)),
+        **service_options,
     )
     job_service.register_handler(AsrJobHandler(asr_service=asr_service))
     return asr_service, job_service, transcript_service
@@ -103,3 +144,537 @@ def test_asr_job_marks_recognition_and_transcript_failed() -> None:
     transcript = transcript_service.get_transcript(transcript_id=data.transcript.transcript_id)
     assert transcript.status == int(TranscriptStatus.FAILED)
     assert transcript.error_code == "FIXTURE_FAILED"
+
+
+class AsyncOnlyQueryProvider(FakeAsrProvider):
+    def __init__(self) -> None:
+        super().__init__()
+        self.async_queries = 0
+
+    def query(self, ref: AsrJobRef) -> AsrQueryResult:
+        raise AssertionError("blocking query must not be used on the async path")
+
+    async def query_async(self, ref: AsrJobRef) -> AsrQueryResult:
+        self.async_queries += 1
+        await asyncio.sleep(0)
+        return FakeAsrProvider.query(self, ref)
+
+
+def test_asr_job_polls_provider_on_event_loop() -> None:
+    provider = AsyncOnlyQueryProvider()
+    asr_service, job_service, transcript_service = _build_services_with_provider(provider)
+    assert job_service.async_job_types() == ["asr_recognition"]
+
+    data = asr_service.create_recognition(
+        object_key="conversation/u/audio.m4a",
+        audio_url="https://example.com/audio.m4a",
+        target_language="en-US",
+    )
+
+    claimed = job_service.claim_due_jobs(limit=1, worker_id="test-worker")
+    running = asyncio.run(job_service.run_claimed_job_async(claimed[0]))
+    assert running.status == int(JobStatus.RUNNING)
+
+    completed = asyncio.run(job_service.run_claimed_job_async(job_service.get_job(job_id=data.job.job_id)))
+    assert completed.status == int(JobStatus.COMPLETED)
+    assert provider.async_queries == 1
+
+    transcript = transcript_service.get_transcript(transcript_id=data.transcript.transcript_id)
+    assert transcript.status == int(TranscriptStatus.COMPLETED)
+
+
+class ProcessingOnceProvider(FakeAsrProvider):
+    """第一次查询返回识别中，之后返回成功；按 recognition 计数。"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.queries: dict[str, int] = {}
+
+    async def query_async(self, ref: AsrJobRef) -> AsrQueryResult:
+        count = self.queries.get(ref.recognition_id, 0)
+        self.queries[ref.recognition_id] = count + 1
+        await asyncio.sleep(0)
+        if count == 0:
+            return AsrQueryResult(
+                status=AsrJobStatus.PROCESSING,
+                provider_status_code="20000002",
+                provider_message="processing",
+                x_tt_logid="log-processing",
+            )
+        return FakeAsrProvider.query(self, ref)
+
+
+def test_asr_batch_poll_bulk_updates_pending_recognitions(tmp_path) -> None:
+    provider = ProcessingOnceProvider()
+    # 批内提交通过 asyncio.to_thread 并发执行；内存库在 StaticPool 下只有一条连接，这里用文件库让每个线程有自己的连接。
+    asr_service, job_service, transcript_service = _build_services_with_provider(
+        provider,
+        database_url=f"sqlite:///{tmp_path / 'asr.db'}",
+    )
+    assert job_service.batch_job_types() == ["asr_recognition"]
+
+    created = [
+        asr_service.create_recognition(
+            object_key=f"conversation/u/audio-{index}.m4a",
+            audio_url=f"https://example.com/audio-{index}.m4a",
+            target_language="en-US",
+        )
+        for index in range(3)
+    ]
+
+    def _run_batch() -> list:
+        claimed = job_service.claim_due_jobs(limit=10, worker_id="test-worker")
+        return asyncio.run(job_service.run_claimed_jobs_batch_async(claimed))
+
+    submitted = _run_batch()
+    assert [job.status for job in submitted] == [int(JobStatus.RUNNING)] * 3
+    assert provider.queries == {}
+
+    # 清空 next_run_at，让下一轮 claim 立即拿到这些 job。
+    for job in submitted:
+        job_service._repository.mark_running(
+            job_id=job.job_id,
+            progress=None,
+            next_run_at=None,
+            entity_type=None,
+            entity_id=None,
+        )
+    polled = _run_batch()
+    assert len(polled) == 3
+    assert all(job.status == int(JobStatus.RUNNING) and job.locked_by is None for job in polled)
+    assert all(job.next_run_at is not None and job.progress == 50 for job in polled)
+    for data in created:
+        recognition = asr_service.get_recognition(recognition_id=data.recognition.recognition_id)
+        assert recognition.status == int(AsrRecognitionStatus.PROCESSING)
+        assert recognition.poll_count == 1
+        assert recognition.provider_status_code == "20000002"
+        assert recognition.next_poll_at is not None
+
+    for job in polled:
+        job_service._repository.mark_running(
+            job_id=job.job_id,
+            progress=None,
+            next_run_at=None,
+            entity_type=None,
+            entity_id=None,
+        )
+    completed = _run_batch()
+    assert [job.status for job in completed] == [int(JobStatus.COMPLETED)] * 3
+    assert all(count == 2 for count in provider.queries.values())
+    for data in created:
+        transcript = transcript_service.get_transcript(transcript_id=data.transcript.transcript_id)
+        assert transcript.status == int(TranscriptStatus.COMPLETED)
+
+
+def test_asr_next_poll_time_aligns_to_window() -> None:
+    asr_service, _, _ = _build_services()
+    asr_service._poll_window_seconds = 2.0
+
+    next_poll_at = asr_service._next_poll_time(poll_count=3)
+
+    assert next_poll_at.timestamp() % 2 == 0
+
+
+class CallbackFixtureProvider(FakeAsrProvider):
+    """模拟火山回调：submit 时记下回调地址，由测试里的本地回调服务推送结果；query 只会返回识别中。"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.callback_urls: dict[str, str] = {}
+        self.query_count = 0
+
+    def submit(self, req: AsrSubmitRequest) -> AsrJobRef:
+        assert req.callback_url is not None
+        self.callback_urls[req.recognition_id] = req.callback_url
+        return super().submit(req)
+
+    def query(self, ref: AsrJobRef) -> AsrQueryResult:
+        self.query_count += 1
+        return AsrQueryResult(status=AsrJobStatus.PROCESSING, provider_status_code="20000002")
+
+    def deliver(self, client: TestClient, recognition_id: str, *, token: str | None = None):
+        url = urlsplit(self.callback_urls[recognition_id])
+        query = url.query if token is None else f"token={token}"
+        return client.post(f"{url.path}?{query}", json=self._fixture)
+
+
+def test_asr_callback_completes_recognition_without_polling() -> None:
+    provider = CallbackFixtureProvider()
+    asr_service, job_service, transcript_service = _build_services_with_provider(
+        provider,
+        callback_url="http://testserver/asr/callbacks/",
+        callback_secret="callback-secret",
+        callback_fallback_poll_seconds=60,
+    )
+    app = FastAPI()
+    app.include_router(callback_router)
+    app.state.asr_service = asr_service
+    client = TestClient(app)
+
+    data = asr_service.create_recognition(
+        object_key="conversation/u/audio.m4a",
+        audio_url="https://example.com/audio.m4a",
+        target_language="en-US",
+    )
+    submitted = job_service.run_job(job_id=data.job.job_id, worker_id="test-worker")
+    recognition_id = data.recognition.recognition_id
+    assert provider.callback_urls[recognition_id].startswith(f"http://testserver/asr/callbacks/{recognition_id}?token=")
+    # 启用回调后轮询退化为慢速兜底。
+    assert submitted.status == int(JobStatus.RUNNING)
+    assert submitted.next_run_at is not None
+    assert submitted.next_run_at.replace(tzinfo=timezone.utc) > datetime.now(timezone.utc) + timedelta(seconds=50)
+
+    assert provider.deliver(client, recognition_id, token="forged").status_code == 403
+
+    response = provider.deliver(client, recognition_id)
+    assert response.status_code == 200
+    assert response.json()["data"]["status"] == int(AsrRecognitionStatus.COMPLETED)
+    assert provider.query_count == 0
+    job = job_service.get_job(job_id=data.job.job_id)
+    assert job.status == int(JobStatus.COMPLETED)
+    assert job.result == {"transcript_id": data.transcript.transcript_id}
+    transcript = transcript_service.get_transcript(transcript_id=data.transcript.transcript_id)
+    assert transcript.status == int(TranscriptStatus.COMPLETED)
+
+    # 重复回调是幂等的。
+    assert provider.deliver(client, recognition_id).status_code == 200
+    assert job_service.get_job(job_id=data.job.job_id).attempts == job.attempts
+
+
+def test_asr_callback_during_poll_reschedules_job_immediately() -> None:
+    provider = CallbackFixtureProvider()
+    asr_service, job_service, _ = _build_services_with_provider(
+        provider,
+        callback_url="http://testserver/asr/callbacks/",
+        callback_secret="callback-secret",
+        callback_fallback_poll_seconds=60,
+    )
+    app = FastAPI()
+    app.include_router(callback_router)
+    app.state.asr_service = asr_service
+    client = TestClient(app)
+
+    data = asr_service.create_recognition(
+        object_key="conversation/u/audio.m4a",
+        audio_url="https://example.com/audio.m4a",
+        target_language="en-US",
+    )
+    job_service.run_job(job_id=data.job.job_id, worker_id="test-worker")
+    recognition_id = data.recognition.recognition_id
+
+    def _poll_with_callback(job):
+        # 回调在轮询持有 job 期间到达：claim 失败，只在 recognition 上留下标记。
+        response = provider.deliver(client, recognition_id)
+        assert response.status_code == 200
+        assert response.json()["data"]["callback_received_at"] is not None
+        return asr_service.run_recognition_job(recognition_id=recognition_id)
+
+    job = job_service.run_job_with(job_id=data.job.job_id, runner=_poll_with_callback)
+    assert job is not None
+    assert job.status == int(JobStatus.RUNNING)
+    # 轮询仍看到“识别中”，但回调已到，下一次查询不等 60 秒兜底间隔。
+    assert job.next_run_at.replace(tzinfo=timezone.utc) <= datetime.now(timezone.utc)
+    recognition = asr_service.get_recognition(recognition_id=recognition_id)
+    assert recognition.callback_received_at is None
+    assert provider.query_count == 1
+
+
+def test_asr_recompletion_only_rewrites_changed_utterances() -> None:
+    asr_service, job_service, transcript_service = _build_services()
+    data = asr_service.create_recognition(
+        object_key="conversation/u/audio.m4a",
+        audio_url="https://example.com/audio.m4a",
+        target_language="en-US",
+    )
+    job_service.run_job(job_id=data.job.job_id, worker_id="test-worker")
+    job_service.run_job(job_id=data.job.job_id, worker_id="test-worker")
+
+    statements: list[str] = []
+    engine = transcript_service._repository._session_factory.kw["bind"]
+    event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+
+    # 写入 transcript 后丢失租约、job 重试重新识别：结果不变时不重写任何 utterance 行。
+    recognition = asr_service.get_recognition(recognition_id=data.recognition.recognition_id)
+    query_result = FakeAsrProvider().query(asr_service._build_query_ref(recognition))
+    asr_service._apply_query_result(recognition, query_result)
+
+    utterance_writes = [
+        statement
+        for statement in statements
+        if statement.startswith(("INSERT INTO transcript_utterances", "UPDATE transcript_utterances"))
+    ]
+    assert utterance_writes == []
+    assert transcript_service.get_transcript(transcript_id=data.transcript.transcript_id).utterances
+
+
+def test_asr_callback_route_is_disabled_without_secret() -> None:
+    asr_service, _, _ = _build_services()
+    app = FastAPI()
+    app.include_router(callback_router)
+    app.state.asr_service = asr_service
+
+    response = TestClient(app).post("/asr/callbacks/any?token=x", json={})
+
+    assert response.status_code == 404
+
+
+def test_volc_provider_parses_callback_payload() -> None:
+    provider = VolcAsrProvider(Settings(VOLC_APP_KEY="app", VOLC_ACCESS_KEY="key"))
+    headers, payload = provider._build_submit_request(
+        AsrSubmitRequest(recognition_id="r1", audio_url="https://example.com/a.mp3", callback_url="https://cb/r1?token=t")
+    )
+    assert payload["callback"] == "https://cb/r1?token=t"
+    assert payload["callback_data"] == "r1"
+
+    succeeded = provider.parse_callback(
+        {
+            "resp": {"code": 20000000, "message": "Success"},
+            "audio_info": {"duration": 1200},
+            "result": {"text": "Hi", "utterances": [{"text": "Hi", "start_time": 0, "end_time": 500}]},
+        }
+    )
+    assert succeeded.status == AsrJobStatus.SUCCEEDED
+    assert succeeded.duration_ms == 1200
+    assert [item.text for item in succeeded.utterances] == ["Hi"]
+
+    failed = provider.parse_callback({"code": 45000001, "message": "invalid audio"})
+    assert failed.status == AsrJobStatus.FAILED
+    assert failed.error_code == "45000001"
+
+
+class CountingAsrProvider(FakeAsrProvider):
+    def __init__(self) -> None:
+        super().__init__()
+        self.submitted: list[str] = []
+
+    def submit(self, req: AsrSubmitRequest) -> AsrJobRef:
+        self.submitted.append(req.recognition_id)
+        return super().submit(req)
+
+
+def test_asr_reuses_completed_recognition_for_identical_audio() -> None:
+    provider = CountingAsrProvider()
+    asr_service, job_service, transcript_service = _build_services_with_provider(provider)
+    asset_service = asr_service._asset_service
+    # 服务端生成的文件按内容取指纹。
+    for object_key in ("conversation/u/first.m4a", "conversation/u/second.m4a", "conversation/u/third.m4a"):
+        asset_service.complete_upload(
+            object_key=object_key,
+            category=None,
+            entity_id=None,
+            filename=None,
+            content_type="audio/mp4",
+            file_size=1024,
+            etag=None,
+            content_fingerprint=hashlib.sha256(b"same audio").hexdigest(),
+        )
+    # 客户端上报的 ETag 即使相同也不参与指纹，不会复用。
+    for object_key in ("conversation/u/client-a.m4a", "conversation/u/client-b.m4a"):
+        asset_service.complete_upload(
+            object_key=object_key,
+            category=None,
+            entity_id=None,
+            filename=None,
+            content_type="audio/mp4",
+            file_size=1024,
+            etag='"ABC123"',
+        )
+
+    def _recognize(object_key: str, language: str):
+        data = asr_service.create_recognition(
+            object_key=object_key,
+            audio_url=f"https://example.com/{object_key}",
+            target_language=language,
+        )
+        job = job_service.run_job(job_id=data.job.job_id, worker_id="test-worker")
+        if job.status == int(JobStatus.RUNNING):
+            job = job_service.run_job(job_id=data.job.job_id, worker_id="test-worker")
+        assert job.status == int(JobStatus.COMPLETED)
+        return data, asr_service.get_recognition(recognition_id=data.recognition.recognition_id)
+
+    first, first_recognition = _recognize("conversation/u/first.m4a", "en-US")
+    second, second_recognition = _recognize("conversation/u/second.m4a", "en-US")
+    _, third_recognition = _recognize("conversation/u/third.m4a", "zh-CN")
+    _, client_a_recognition = _recognize("conversation/u/client-a.m4a", "en-US")
+    _, client_b_recognition = _recognize("conversation/u/client-b.m4a", "en-US")
+
+    assert first_recognition.audio_fingerprint is not None
+    assert second_recognition.audio_fingerprint == first_recognition.audio_fingerprint
+    assert second_recognition.reused_from_recognition_id == first_recognition.recognition_id
+    assert third_recognition.reused_from_recognition_id is None
+    assert client_a_recognition.audio_fingerprint is None
+    assert client_b_recognition.reused_from_recognition_id is None
+    assert provider.submitted == [
+        first_recognition.recognition_id,
+        third_recognition.recognition_id,
+        client_a_recognition.recognition_id,
+        client_b_recognition.recognition_id,
+    ]
+
+    source = transcript_service.get_transcript(transcript_id=first.transcript.transcript_id)
+    reused = transcript_service.get_transcript(transcript_id=second.transcript.transcript_id)
+    assert reused.status == int(TranscriptStatus.COMPLETED)
+    assert reused.full_text == source.full_text
+    assert [(item.seq, item.text, item.speaker) for item in reused.utterances] == [
+        (item.seq, item.text, item.speaker) for item in source.utterances
+    ]
+
+
+class ChunkEchoProvider(FakeAsrProvider):
+    """每段在相对时间 0 / 9000 / 18500 毫秒各识别出一句，只返回落在本段时长内的句子。"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.asr_service: AsrService | None = None
+
+    def query(self, ref: AsrJobRef) -> AsrQueryResult:
+        assert self.asr_service is not None
+        recognition = self.asr_service.get_recognition(recognition_id=ref.recognition_id)
+        chunk_length = int(recognition.chunk_end_ms or 0) - int(recognition.chunk_start_ms or 0)
+        utterances = [
+            AsrUtterance(seq=seq, text=f"{recognition.chunk_index}-{start}", start_time=start, end_time=start + 1000)
+            for seq, start in enumerate(item for item in (0, 9000, 18500) if item + 1000 <= chunk_length)
+        ]
+        return AsrQueryResult(status=AsrJobStatus.SUCCEEDED, utterances=utterances, raw_result={"chunk": recognition.chunk_index})
+
+
+def _mock_long_mp3(monkeypatch: pytest.MonkeyPatch) -> None:
+    # MPEG-1 Layer III 128kbps 44.1kHz：每帧 417 字节、约 26.12 毫秒，2300 帧约 60 秒。
+    frame = (0xFFFB9000).to_bytes(4, "big") + bytes(413)
+    audio = frame * 2300
+    monkeypatch.setattr(
+        http_module,
+        "HTTP_CLIENTS",
+        HttpClientRegistry(transport=httpx.MockTransport(lambda request: httpx.Response(200, content=audio))),
+    )
+
+
+def test_asr_splits_long_mp3_into_parallel_chunks_and_stitches(monkeypatch: pytest.MonkeyPatch) -> None:
+    _mock_long_mp3(monkeypatch)
+    provider = ChunkEchoProvider()
+    asr_service, job_service, transcript_service = _build_services_with_provider(
+        provider,
+        chunk_threshold_seconds=30,
+        chunk_seconds=20,
+        chunk_overlap_seconds=2,
+    )
+    provider.asr_service = asr_service
+
+    created = asr_service.create_recognition(
+        object_key="conversation/u/long.mp3",
+        audio_url="https://example.com/long.mp3",
+        target_language="en-US",
+    )
+    split_job = job_service.run_job(job_id=created.job.job_id, worker_id="test-worker")
+    # 拆分 job 建好各段和汇总 job 后直接结束，不再轮询各段状态。
+    assert split_job.status == int(JobStatus.COMPLETED)
+    assert split_job.result["chunk_count"] == 4
+
+    parent = asr_service.get_recognition(recognition_id=created.recognition.recognition_id)
+    collect_job_id = split_job.result["collect_job_id"]
+    assert parent.job_id == collect_job_id
+    chunks = asr_service._repository.list_chunks(parent.recognition_id)
+    assert parent.chunk_count == 4
+    assert [(item["chunk_start_ms"], item["chunk_end_ms"]) for item in chunks] == [
+        (0, 20010),
+        (17998, 38008),
+        (35997, 56007),
+        (53995, 60082),
+    ]
+    assert all(item["object_key"].startswith(f"asr_chunk/{parent.recognition_id}/") for item in chunks)
+    assert [item.recognition_id for item in asr_service.list_recognitions()] == [parent.recognition_id]
+
+    assert sorted(job_service.list_dependencies(job_id=collect_job_id)) == sorted(item["job_id"] for item in chunks)
+
+    # 各段是独立的 job，可以同时被不同 worker 执行；汇总 job 在全部分段完成前不会被 claim。
+    for item in chunks:
+        assert job_service.get_job(job_id=collect_job_id).pending_dependencies > 0
+        with pytest.raises(ValueError):
+            job_service.run_job(job_id=collect_job_id, worker_id="test-worker")
+        job_service.run_job(job_id=item["job_id"], worker_id="test-worker")
+        assert job_service.run_job(job_id=item["job_id"], worker_id="test-worker").status == int(JobStatus.COMPLETED)
+    assert job_service.get_job(job_id=collect_job_id).pending_dependencies == 0
+    collect_job = job_service.run_job(job_id=collect_job_id, worker_id="test-worker")
+    assert collect_job.status == int(JobStatus.COMPLETED)
+    assert collect_job.result == {"transcript_id": created.transcript.transcript_id}
+
+    transcript = transcript_service.get_transcript(transcript_id=created.transcript.transcript_id)
+    assert transcript.status == int(TranscriptStatus.COMPLETED)
+    assert transcript.duration_ms == 60082
+    # 重叠区内两段都识别到的句子只保留一次。
+    assert [(item.seq, item.text, item.start_time) for item in transcript.utterances] == [
+        (0, "0-0", 0),
+        (1, "0-9000", 9000),
+        (2, "0-18500", 18500),
+        (3, "1-9000", 26998),
+        (4, "1-18500", 36498),
+        (5, "2-9000", 44997),
+        (6, "2-18500", 54497),
+    ]
+
+
+class ChunkFailingProvider(FailingAsrProvider):
+    """第二段识别失败，其余段正常完成。"""
+
+    def __init__(self) -> None:
+        self.asr_service: AsrService | None = None
+
+    def query(self, ref: AsrJobRef) -> AsrQueryResult:
+        assert self.asr_service is not None
+        recognition = self.asr_service.get_recognition(recognition_id=ref.recognition_id)
+        if recognition.chunk_index == 1:
+            return super().query(ref)
+        return AsrQueryResult(status=AsrJobStatus.SUCCEEDED, utterances=[], raw_result={})
+
+
+def test_asr_chunk_failure_fails_parent_and_cancels_collect_job(monkeypatch: pytest.MonkeyPatch) -> None:
+    _mock_long_mp3(monkeypatch)
+    provider = ChunkFailingProvider()
+    asr_service, job_service, transcript_service = _build_services_with_provider(
+        provider,
+        chunk_threshold_seconds=30,
+        chunk_seconds=20,
+        chunk_overlap_seconds=2,
+    )
+    provider.asr_service = asr_service
+    created = asr_service.create_recognition(
+        object_key="conversation/u/long.mp3",
+        audio_url="https://example.com/long.mp3",
+        target_language="en-US",
+    )
+    collect_job_id = job_service.run_job(job_id=created.job.job_id, worker_id="test-worker").result["collect_job_id"]
+
+    failing = asr_service._repository.list_chunks(created.recognition.recognition_id)[1]
+    job_service.run_job(job_id=failing["job_id"], worker_id="test-worker")
+    assert job_service.run_job(job_id=failing["job_id"], worker_id="test-worker").status == int(JobStatus.FAILED)
+
+    parent = asr_service.get_recognition(recognition_id=created.recognition.recognition_id)
+    assert parent.status == int(AsrRecognitionStatus.FAILED)
+    assert parent.error_code == "CHUNK_RECOGNITION_FAILED"
+    assert transcript_service.get_transcript(transcript_id=created.transcript.transcript_id).status == int(
+        TranscriptStatus.FAILED
+    )
+    assert job_service.get_job(job_id=collect_job_id).status == int(JobStatus.CANCELED)
+
+
+def test_asr_chunking_skips_audio_over_download_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    _mock_long_mp3(monkeypatch)
+    asr_service, job_service, _ = _build_services_with_provider(
+        FakeAsrProvider(),
+        chunk_threshold_seconds=30,
+        chunk_seconds=20,
+        chunk_overlap_seconds=2,
+        audio_download_max_bytes=64 * 1024,
+    )
+    created = asr_service.create_recognition(
+        object_key="conversation/u/long.mp3",
+        audio_url="https://example.com/long.mp3",
+        target_language="en-US",
+    )
+
+    # 约 960 KB 的音频超过 64 KB 上限：下载中止，照常整段提交。
+    job = job_service.run_job(job_id=created.job.job_id, worker_id="test-worker")
+    assert job.status == int(JobStatus.RUNNING)
+    recognition = asr_service.get_recognition(recognition_id=created.recognition.recognition_id)
+    assert recognition.chunk_count == 0
+    assert recognition.provider_request_id
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from contextlib import contextmanager
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session as OrmSession
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from lsl.core.db import Base
+from lsl.modules.event.broadcaster import (
+    InProcessEventBroadcaster,
+    PostgresEventBroadcaster,
+    decode_event_payload,
+    encode_event_payload,
+)
+from lsl.modules.event.stream import stream_events
+from lsl.modules.event.types import EventData
+from lsl.modules.job.repo import JobRepository
+from lsl.modules.job.service import JobService
+from lsl.modules.job.types import JobData, JobRunResult, JobStatus
+
+
+class CompletingHandler:
+    job_type = "event_fixture"
+
+    def run(self, job: JobData) -> JobRunResult:
+        return JobRunResult(status=JobStatus.COMPLETED, progress=100)
+
+
+class RecordingEngine:
+    """只记录 execute 调用的 engine 替身，用于验证 NOTIFY 的批量发送。"""
+
+    def __init__(self) -> None:
+        self.transactions: list[list[dict]] = []
+
+    @contextmanager
+    def begin(self):
+        statements: list[dict] = []
+        self.transactions.append(statements)
+
+        class _Conn:
+            def execute(self, statement, params):
+                statements.append(params)
+
+        yield _Conn()
+
+
+def _frames_data(frames: list[str]) -> list[dict]:
+    return [json.loads(frame.split("data: ", 1)[1]) for frame in frames if frame.startswith("id: ")]
+
+
+def test_broadcaster_replays_after_cursor_and_resets_unknown_cursor():
+    broadcaster = InProcessEventBroadcaster(buffer_size=3)
+    received: list[EventData] = []
+    broadcaster.subscribe(received.append)
+
+    for index in range(4):
+        broadcaster.publish(event_type="job", data={"index": index}, session_id="s1")
+
+    assert [event.data["index"] for event in received] == [0, 1, 2, 3]
+    # 缓冲区只保留最近 3 条：第一条的游标已失效，需要前端整页重新拉取。
+    assert broadcaster.replay(received[0].event_id) is None
+    replayed = broadcaster.replay(received[1].event_id)
+    assert replayed is not None
+    assert [event.data["index"] for event in replayed] == [2, 3]
+
+    decoded = decode_event_payload(encode_event_payload(received[3]))
+    assert decoded == received[3]
+    assert decode_event_payload("not-json") is None
+
+
+def test_stream_events_replays_filters_and_forwards_cross_thread_events():
+    broadcaster = InProcessEventBroadcaster()
+    received: list[EventData] = []
+    unsubscribe = broadcaster.subscribe(received.append)
+    broadcaster.publish(event_type="job", data={"step": "before"}, session_id="s1")
+    unsubscribe()
+    first_id = received[0].event_id
+    broadcaster.publish(event_type="job", data={"step": "missed"}, session_id="s1")
+    broadcaster.publish(event_type="job", data={"step": "other"}, session_id="s2")
+
+    async def _collect() -> list[str]:
+        stream = stream_events(
+            broadcaster=broadcaster,
+            last_event_id=first_id,
+            session_id="s1",
+            heartbeat_seconds=0.05,
+        )
+        frames = [await stream.__anext__(), await stream.__anext__()]
+        publisher = threading.Thread(
+            target=broadcaster.publish_entity_changed,
+            kwargs={"entity_type": "revision", "entity_id": "s1", "session_id": "s1"},
+        )
+        publisher.start()
+        publisher.join()
+        frames.append(await stream.__anext__())
+        frames.append(await stream.__anext__())
+        await stream.aclose()
+        return frames
+
+    frames = asyncio.run(_collect())
+
+    assert frames[0].startswith("retry: ")
+    data = _frames_data(frames)
+    assert [item["data"].get("step") for item in data] == ["missed", None]
+    assert data[1]["event_type"] == "entity"
+    assert data[1]["entity_type"] == "revision"
+    assert frames[3] == ": ping\n\n"
+
+
+def test_stream_events_sends_reset_for_expired_cursor_and_heartbeats():
+    broadcaster = InProcessEventBroadcaster()
+
+    async def _collect() -> list[str]:
+        stream = stream_events(broadcaster=broadcaster, last_event_id="expired", heartbeat_seconds=0.01)
+        frames = [await stream.__anext__() for _ in range(3)]
+        await stream.aclose()
+        return frames
+
+    frames = asyncio.run(_collect())
+
+    assert frames[1] == "event: reset\ndata: {}\n\n"
+    assert frames[2] == ": ping\n\n"
+
+
+def test_job_service_publishes_job_status_events():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=OrmSession)
+    broadcaster = InProcessEventBroadcaster()
+    received: list[EventData] = []
+    broadcaster.subscribe(received.append)
+    job_service = JobService(repository=JobRepository(factory), lock_ttl_seconds=30, event_broadcaster=broadcaster)
+    job_service.register_handler(CompletingHandler())
+
+    job = job_service.create_job(
+        job_type=CompletingHandler.job_type,
+        entity_type="session",
+        entity_id="session-1",
+        payload={},
+    )
+    job_service.run_due_jobs(limit=1)
+
+    statuses = [event.data["status_name"] for event in received if event.data.get("job_id") == job.job_id]
+    assert statuses == ["queued", "running", "completed"]
+    assert all(event.session_id == "session-1" for event in received)
+
+
+def test_postgres_broadcaster_coalesces_events_into_one_notify_transaction():
+    engine = RecordingEngine()
+    broadcaster = PostgresEventBroadcaster(engine=engine, conninfo="", flush_interval_seconds=60)
+
+    for progress in (10, 20, 30):
+        broadcaster.publish(event_type="job", data={"job_id": "j1", "progress": progress}, session_id="s1")
+    broadcaster.publish(event_type="job", data={"job_id": "j2", "progress": 5}, session_id="s1")
+    broadcaster.publish_entity_changed(entity_type="revision", entity_id="r1", session_id="s1")
+    broadcaster.publish_entity_changed(entity_type="revision", entity_id="r1", session_id="s1")
+    broadcaster.close()
+
+    assert len(engine.transactions) == 1
+    (params,) = engine.transactions[0]
+    events = [decode_event_payload(payload) for payload in params["payloads"]]
+    assert [(event.event_type, event.data.get("job_id"), event.data.get("progress")) for event in events] == [
+        ("job", "j1", 30),
+        ("job", "j2", 5),
+        ("entity", None, None),
+    ]
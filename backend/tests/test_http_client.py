@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+
+import httpx
+import pytest
+
+from lsl.core import http as http_module
+from lsl.core.config import Settings
+from lsl.core.http import HTTP_CLIENT_DURATION, HTTP_CLIENT_REQUESTS, HttpClientConfig, HttpClientRegistry
+from lsl.modules.tts.providers.volc_tts import VolcTtsProvider
+from lsl.modules.tts.types import TtsSynthesizeRequest
+
+
+def test_registry_reuses_clients_per_provider_and_records_metrics() -> None:
+    seen_urls: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen_urls.append(str(request.url))
+        # 显式传 stream，响应体和真实 transport 一样在读取完毕时才关闭。
+        return httpx.Response(
+            200 if request.url.path == "/ok" else 503,
+            stream=httpx.ByteStream(json.dumps({"path": request.url.path}).encode()),
+        )
+
+    registry = HttpClientRegistry(transport=httpx.MockTransport(_handler))
+    client = registry.client("http_test", timeout=5.0)
+    assert registry.client("http_test", timeout=5.0) is client
+    assert registry.client("http_test_other", timeout=5.0) is not client
+    assert client.timeout.connect == 5.0
+    assert client.timeout.read == 5.0
+
+    ttfb_before = HTTP_CLIENT_DURATION.count(provider="http_test", phase="ttfb")
+    total_before = HTTP_CLIENT_DURATION.count(provider="http_test", phase="total")
+    assert client.get("https://provider.test/ok").json() == {"path": "/ok"}
+    with client.stream("GET", "https://provider.test/down") as response:
+        assert response.status_code == 503
+        # 流式响应在关闭前不记录 total。
+        assert HTTP_CLIENT_DURATION.count(provider="http_test", phase="total") == total_before + 1
+
+    assert HTTP_CLIENT_DURATION.count(provider="http_test", phase="ttfb") == ttfb_before + 2
+    assert HTTP_CLIENT_DURATION.count(provider="http_test", phase="total") == total_before + 2
+    assert HTTP_CLIENT_REQUESTS.value(provider="http_test", status="5xx") >= 1
+    assert seen_urls == ["https://provider.test/ok", "https://provider.test/down"]
+
+    registry.close()
+    assert client.is_closed
+    assert registry.client("http_test", timeout=5.0) is not client
+
+
+def test_registry_async_client_is_bound_to_event_loop() -> None:
+    registry = HttpClientRegistry(transport=httpx.MockTransport(lambda request: httpx.Response(204)))
+
+    async def _request() -> tuple[httpx.AsyncClient, int]:
+        client = registry.async_client("http_test_async", timeout=5.0)
+        assert registry.async_client("http_test_async", timeout=5.0) is client
+        response = await client.post("https://provider.test/query", json={})
+        return client, response.status_code
+
+    first_client, status = asyncio.run(_request())
+    second_client, _ = asyncio.run(_request())
+
+    assert status == 204
+    assert first_client is not second_client
+
+
+def test_registry_falls_back_to_http11_without_h2(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(http_module.importlib.util, "find_spec", lambda name: None)
+    registry = HttpClientRegistry(HttpClientConfig(http2=True, connect_timeout=3.0))
+
+    assert registry._http2 is False
+    assert registry.client("http_test_h2", timeout=30.0).timeout.connect == 3.0
+    registry.close()
+
+
+def test_volc_tts_streams_response_through_shared_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    audio = b"fake-mp3-bytes"
+    lines = [
+        "event: 352",
+        "data: " + json.dumps({"code": 0, "data": base64.b64encode(audio).decode()}),
+        "data: " + json.dumps({"code": 20000000}),
+    ]
+    captured: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        captured.append(request)
+        return httpx.Response(200, content="\n".join(lines).encode(), headers={"X-Tt-Logid": "log-1"})
+
+    monkeypatch.setattr(http_module, "HTTP_CLIENTS", HttpClientRegistry(transport=httpx.MockTransport(_handler)))
+    provider = VolcTtsProvider(Settings(TTS_VOLC_APP_ID="app", TTS_VOLC_ACCESS_KEY="key"))
+
+    result = provider.synthesize(
+        TtsSynthesizeRequest(
+            session_id="session-1",
+            content="Hello",
+            plain_text="Hello",
+            cue_texts=[],
+            provider_speaker_id="speaker",
+            format="mp3",
+            emotion_scale=4,
+            speech_rate=0,
+            loudness_rate=0,
+        )
+    )
+
+    assert result.audio_bytes == audio
+    assert captured[0].headers["X-Api-App-Id"] == "app"
+    assert json.loads(captured[0].content)["req_params"]["speaker"] == "speaker"
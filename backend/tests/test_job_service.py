@@ -1,16 +1,27 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import create_engine
+import pytest
+from sqlalchemy import create_engine, event, select, update
 from sqlalchemy.orm import Session as OrmSession
 from sqlalchemy.orm import sessionmaker
 
 from lsl.core.db import Base
+from lsl.modules.job.metrics import JOB_OUTCOMES, JOB_RUN_DURATION
+from lsl.modules.job.model import JobArchiveModel, JobModel
+from lsl.modules.job.notifier import InProcessJobNotifier, decode_job_notify_payload, encode_job_notify_payload
 from lsl.modules.job.repo import JobRepository
+from lsl.modules.job.retention import JobRetentionConfig
+from lsl.modules.job.scheduler import JobSchedulerConfig, parse_job_type_limits, run_job_scheduler
 from lsl.modules.job.service import JobService
-from lsl.modules.job.types import JobData, JobRunResult, JobStatus
+from lsl.modules.job.timer import DelayedJobTimer
+from lsl.modules.job.types import JobData, JobLeaseLostError, JobRunResult, JobSpec, JobStatus
 
 
 def _build_service() -> JobService:
@@ -93,3 +104,722 @@ def test_job_service_marks_missing_handler_as_failed() -> None:
 
     assert failed.status == int(JobStatus.FAILED)
     assert failed.error_code == "JOB_HANDLER_NOT_FOUND"
+
+
+def test_concurrent_claimers_never_claim_the_same_job(tmp_path) -> None:
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'jobs.db'}",
+        connect_args={"check_same_thread": False, "timeout": 30},
+    )
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=OrmSession)
+    service = JobService(repository=JobRepository(factory), lock_ttl_seconds=300)
+    created_ids = {service.create_job(job_type="test.complete").job_id for _ in range(60)}
+
+    def _claim_until_empty(worker_id: str) -> list[str]:
+        claimed: list[str] = []
+        while True:
+            jobs = service.claim_due_jobs(limit=3, worker_id=worker_id)
+            if not jobs:
+                return claimed
+            claimed.extend(job.job_id for job in jobs)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(_claim_until_empty, [f"worker-{index}" for index in range(8)]))
+
+    claimed_ids = [job_id for batch in results for job_id in batch]
+    assert len(claimed_ids) == len(set(claimed_ids))
+    assert set(claimed_ids) == created_ids
+    for job_id in created_ids:
+        job = service.get_job(job_id=job_id)
+        assert job.status == int(JobStatus.RUNNING)
+        assert job.attempts == 1
+        assert job.locked_by is not None
+    engine.dispose()
+
+
+def test_job_service_notifies_wakeup_on_create_and_reschedule() -> None:
+    notifier = InProcessJobNotifier()
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=OrmSession)
+    service = JobService(repository=JobRepository(factory), lock_ttl_seconds=30, notifier=notifier)
+    service.register_handler(PollingHandler())
+    events: list[tuple[str, datetime | None]] = []
+    unsubscribe = service.subscribe_wakeups(lambda job_type, next_run_at: events.append((job_type, next_run_at)))
+
+    job = service.create_job(job_type="test.poll")
+    running = service.run_job(job_id=job.job_id, worker_id="test-worker")
+
+    assert events[0] == ("test.poll", None)
+    assert events[1][0] == "test.poll"
+    assert events[1][1] is not None
+    assert running.next_run_at is not None
+
+    unsubscribe()
+    service.create_job(job_type="test.poll")
+    assert len(events) == 2
+
+
+def test_job_notify_payload_round_trip() -> None:
+    next_run_at = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+    payload = encode_job_notify_payload(job_type="tts_synthesis", next_run_at=next_run_at)
+
+    assert decode_job_notify_payload(payload) == ("tts_synthesis", next_run_at)
+    assert decode_job_notify_payload("not-json") == ("", None)
+
+
+def test_claim_due_jobs_filters_by_job_types() -> None:
+    service = _build_service()
+    tts_job = service.create_job(job_type="tts_synthesis")
+    service.create_job(job_type="asr_recognition")
+
+    claimed = service.claim_due_jobs(limit=10, worker_id="tts-worker", job_types=["tts_synthesis"])
+
+    assert [job.job_id for job in claimed] == [tts_job.job_id]
+
+
+def test_job_scheduler_wakes_up_on_new_job(tmp_path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=OrmSession)
+    service = JobService(repository=JobRepository(factory), lock_ttl_seconds=30)
+    service.register_handler(CompleteHandler())
+    config = JobSchedulerConfig(worker_id="test-worker", max_workers=2, batch_size=2, interval_seconds=30)
+
+    async def _scenario() -> JobData:
+        scheduler_task = asyncio.create_task(run_job_scheduler(job_service=service, config=config))
+        try:
+            await asyncio.sleep(0.1)
+            job = await asyncio.to_thread(service.create_job, job_type="test.complete")
+            for _ in range(50):
+                await asyncio.sleep(0.05)
+                current = service.get_job(job_id=job.job_id)
+                if current.status == int(JobStatus.COMPLETED):
+                    return current
+            return service.get_job(job_id=job.job_id)
+        finally:
+            scheduler_task.cancel()
+            try:
+                await scheduler_task
+            except asyncio.CancelledError:
+                pass
+
+    completed = asyncio.run(_scenario())
+
+    assert completed.status == int(JobStatus.COMPLETED)
+    engine.dispose()
+
+
+class ShortPollHandler:
+    job_type = "test.short_poll"
+
+    def __init__(self, polls: int) -> None:
+        self.polls = polls
+        self.calls = 0
+
+    def run(self, job: JobData) -> JobRunResult:
+        self.calls += 1
+        if self.calls <= self.polls:
+            return JobRunResult(
+                status=JobStatus.RUNNING,
+                next_run_at=datetime.now(timezone.utc) + timedelta(milliseconds=200),
+            )
+        return JobRunResult(status=JobStatus.COMPLETED)
+
+
+def test_delayed_job_timer_orders_and_replaces_entries() -> None:
+    now = datetime.now(timezone.utc)
+    timer = DelayedJobTimer()
+    timer.schedule(due_at=now + timedelta(seconds=5), job_type="a", job_id="job-1")
+    timer.schedule(due_at=now + timedelta(seconds=1), job_type="b", job_id="job-2")
+    # 同一 job 改期后只保留最新的到期时间。
+    timer.schedule(due_at=now + timedelta(seconds=2), job_type="a", job_id="job-1")
+    timer.schedule(due_at=(now + timedelta(seconds=3)).replace(tzinfo=None), job_type="c")
+
+    assert timer.seconds_until_next(now) == pytest.approx(1.0)
+    assert timer.pop_due(now) == []
+    due = timer.pop_due(now + timedelta(seconds=10))
+    assert [(entry.job_type, entry.job_id) for entry in due] == [("b", "job-2"), ("a", "job-1"), ("c", None)]
+    assert timer.seconds_until_next(now) is None
+
+
+def test_claim_due_jobs_by_job_ids_and_list_upcoming() -> None:
+    service = _build_service()
+    first = service.create_job(job_type="test.poll")
+    second = service.create_job(job_type="test.poll")
+    later = service.create_job(job_type="test.poll", next_run_at=datetime.now(timezone.utc) + timedelta(seconds=30))
+    service.create_job(job_type="test.poll", next_run_at=datetime.now(timezone.utc) + timedelta(hours=1))
+
+    claimed = service.claim_due_jobs(limit=10, worker_id="timer-worker", job_ids=[second.job_id, later.job_id])
+    upcoming = service.list_upcoming_jobs(within=timedelta(minutes=1))
+
+    # 定向 claim 只处理给定的 job，未到期的 job 仍然跳过。
+    assert [job.job_id for job in claimed] == [second.job_id]
+    assert service.get_job(job_id=first.job_id).status == int(JobStatus.QUEUED)
+    assert [(job_id, job_type) for job_id, job_type, _ in upcoming] == [(later.job_id, "test.poll")]
+    assert upcoming[0][2].tzinfo is not None
+    assert service.claim_due_jobs(limit=10, worker_id="timer-worker", job_ids=["not-a-uuid"]) == []
+
+
+def test_job_scheduler_claims_rescheduled_jobs_on_timer(tmp_path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=OrmSession)
+    service = JobService(repository=JobRepository(factory), lock_ttl_seconds=30)
+    handler = ShortPollHandler(polls=2)
+    service.register_handler(handler)
+    targeted_claims: list[list[str]] = []
+    claim_due_jobs = service.claim_due_jobs
+
+    def _recording_claim(**kwargs):
+        if kwargs.get("job_ids") is not None:
+            targeted_claims.append(list(kwargs["job_ids"]))
+        return claim_due_jobs(**kwargs)
+
+    service.claim_due_jobs = _recording_claim  # type: ignore[method-assign]
+    # 兜底轮询间隔远大于轮询间隔，job 只能靠定时器按时被 claim。
+    config = JobSchedulerConfig(worker_id="test-worker", max_workers=2, batch_size=2, interval_seconds=30)
+
+    async def _scenario() -> JobData:
+        scheduler_task = asyncio.create_task(run_job_scheduler(job_service=service, config=config))
+        try:
+            await asyncio.sleep(0.1)
+            job = await asyncio.to_thread(service.create_job, job_type=ShortPollHandler.job_type)
+            for _ in range(60):
+                await asyncio.sleep(0.05)
+                current = service.get_job(job_id=job.job_id)
+                if current.status == int(JobStatus.COMPLETED):
+                    return current
+            return service.get_job(job_id=job.job_id)
+        finally:
+            scheduler_task.cancel()
+            try:
+                await scheduler_task
+            except asyncio.CancelledError:
+                pass
+
+    completed = asyncio.run(_scenario())
+
+    assert completed.status == int(JobStatus.COMPLETED)
+    assert handler.calls == 3
+    assert targeted_claims == [[completed.job_id], [completed.job_id]]
+    engine.dispose()
+
+
+def test_claim_due_jobs_ages_old_low_priority_jobs() -> None:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=OrmSession)
+    aged_service = JobService(repository=JobRepository(factory), lock_ttl_seconds=30, priority_aging_seconds=60)
+    old_job = aged_service.create_job(job_type="test.batch", priority=0)
+    new_job = aged_service.create_job(job_type="test.batch", priority=5)
+    with factory() as db:
+        db.execute(
+            update(JobModel)
+            .where(JobModel.job_id == old_job.job_id)
+            .values(created_at=datetime.now(timezone.utc) - timedelta(minutes=10))
+        )
+        db.commit()
+
+    claimed = aged_service.claim_due_jobs(limit=1, worker_id="test-worker")
+
+    assert [job.job_id for job in claimed] == [old_job.job_id]
+    plain_service = JobService(repository=JobRepository(factory), lock_ttl_seconds=30)
+    assert plain_service.claim_due_jobs(limit=1, worker_id="test-worker")[0].job_id == new_job.job_id
+
+
+def test_claim_due_jobs_excludes_job_types() -> None:
+    service = _build_service()
+    service.create_job(job_type="tts_synthesis")
+    asr_job = service.create_job(job_type="asr_recognition")
+
+    claimed = service.claim_due_jobs(limit=10, worker_id="test-worker", exclude_job_types=["tts_synthesis"])
+
+    assert [job.job_id for job in claimed] == [asr_job.job_id]
+
+
+class BlockingHandler:
+    job_type = "test.slow"
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def run(self, job: JobData) -> JobRunResult:
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        self.release.wait(timeout=5)
+        with self.lock:
+            self.running -= 1
+        return JobRunResult(status=JobStatus.COMPLETED)
+
+
+def test_job_scheduler_respects_type_limits_and_interactive_lane(tmp_path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=OrmSession)
+    service = JobService(repository=JobRepository(factory), lock_ttl_seconds=30)
+    slow_handler = BlockingHandler()
+    service.register_handler(slow_handler)
+    service.register_handler(CompleteHandler())
+    slow_jobs = [service.create_job(job_type="test.slow", priority=10) for _ in range(3)]
+    fast_job = service.create_job(job_type="test.complete")
+    config = JobSchedulerConfig(
+        worker_id="test-worker",
+        max_workers=1,
+        batch_size=10,
+        interval_seconds=30,
+        interactive_job_types=("test.complete",),
+        interactive_max_workers=1,
+        job_type_limits={"test.slow": 1},
+    )
+
+    async def _scenario() -> tuple[JobData, list[JobData]]:
+        scheduler_task = asyncio.create_task(run_job_scheduler(job_service=service, config=config))
+        try:
+            fast = service.get_job(job_id=fast_job.job_id)
+            for _ in range(50):
+                await asyncio.sleep(0.05)
+                fast = service.get_job(job_id=fast_job.job_id)
+                if fast.status == int(JobStatus.COMPLETED):
+                    break
+            slow_handler.release.set()
+            slow = [service.get_job(job_id=job.job_id) for job in slow_jobs]
+            for _ in range(50):
+                if all(job.status == int(JobStatus.COMPLETED) for job in slow):
+                    break
+                await asyncio.sleep(0.05)
+                slow = [service.get_job(job_id=job.job_id) for job in slow_jobs]
+            return fast, slow
+        finally:
+            slow_handler.release.set()
+            scheduler_task.cancel()
+            try:
+                await scheduler_task
+            except asyncio.CancelledError:
+                pass
+
+    fast, slow = asyncio.run(_scenario())
+
+    assert fast.status == int(JobStatus.COMPLETED)
+    assert all(job.status == int(JobStatus.COMPLETED) for job in slow)
+    assert slow_handler.max_running == 1
+    engine.dispose()
+
+
+def test_parse_job_type_limits() -> None:
+    assert parse_job_type_limits("tts_synthesis=2, revision_generation=3") == {
+        "tts_synthesis": 2,
+        "revision_generation": 3,
+    }
+    assert parse_job_type_limits("") == {}
+    with pytest.raises(ValueError):
+        parse_job_type_limits("tts_synthesis")
+
+
+def _expire_lock(service: JobService, job_id: str) -> None:
+    with service._repository._session_scope() as db:
+        db.execute(
+            update(JobModel)
+            .where(JobModel.job_id == job_id)
+            .values(locked_until=datetime.now(timezone.utc) - timedelta(seconds=1))
+        )
+        db.commit()
+
+
+class LeaseStealingHandler:
+    """模拟长任务期间锁过期并被另一个 worker 接管。"""
+
+    job_type = "test.lease"
+
+    def __init__(self, service: JobService, *, heartbeat: bool) -> None:
+        self._service = service
+        self._heartbeat = heartbeat
+        self.after_heartbeat = False
+
+    def run(self, job: JobData) -> JobRunResult:
+        self._service.heartbeat(job, progress=10)
+        _expire_lock(self._service, job.job_id)
+        assert self._service.claim_due_jobs(limit=1, worker_id="worker-b")
+        if self._heartbeat:
+            self._service.heartbeat(job, progress=20)
+            self.after_heartbeat = True
+        return JobRunResult(status=JobStatus.COMPLETED, result={"stale": True})
+
+
+@pytest.mark.parametrize("heartbeat", [True, False])
+def test_stale_job_copy_stops_after_lease_is_lost(heartbeat: bool) -> None:
+    service = _build_service()
+    handler = LeaseStealingHandler(service, heartbeat=heartbeat)
+    service.register_handler(handler)
+    job = service.create_job(job_type="test.lease")
+
+    claimed = service.claim_due_jobs(limit=1, worker_id="worker-a")[0]
+    result = service.run_claimed_job(claimed)
+
+    assert handler.after_heartbeat is False
+    assert result.status == int(JobStatus.RUNNING)
+    assert result.locked_by == "worker-b"
+    assert result.result is None
+    assert service.get_job(job_id=job.job_id).progress == 10
+    with pytest.raises(JobLeaseLostError):
+        service.heartbeat(claimed)
+
+
+def test_job_service_renews_leases_of_running_jobs() -> None:
+    service = _build_service()
+    job = service.create_job(job_type="test.complete")
+    claimed = service.claim_due_jobs(limit=1, worker_id="worker-a")[0]
+    _expire_lock(service, job.job_id)
+
+    assert service.renew_leases([claimed]) == []
+    assert service.claim_due_jobs(limit=1, worker_id="worker-b") == []
+
+    released = service.release_leases([claimed])
+    assert released == 1
+    reclaimed = service.claim_due_jobs(limit=1, worker_id="worker-b")
+    assert [item.job_id for item in reclaimed] == [job.job_id]
+    assert service.renew_leases([claimed]) == [job.job_id]
+
+
+def test_job_scheduler_releases_leases_on_shutdown(tmp_path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=OrmSession)
+    service = JobService(repository=JobRepository(factory), lock_ttl_seconds=30)
+    handler = BlockingHandler()
+    service.register_handler(handler)
+    job = service.create_job(job_type="test.slow")
+    config = JobSchedulerConfig(
+        worker_id="test-worker",
+        max_workers=1,
+        batch_size=1,
+        interval_seconds=30,
+        heartbeat_interval_seconds=0.05,
+    )
+
+    async def _scenario() -> None:
+        scheduler_task = asyncio.create_task(run_job_scheduler(job_service=service, config=config))
+        try:
+            for _ in range(50):
+                await asyncio.sleep(0.05)
+                if handler.running:
+                    break
+            # 至少跑过一次自动续约。
+            await asyncio.sleep(0.15)
+        finally:
+            scheduler_task.cancel()
+            try:
+                await scheduler_task
+            except asyncio.CancelledError:
+                pass
+
+    asyncio.run(_scenario())
+    released = service.get_job(job_id=job.job_id)
+    handler.release.set()
+    for _ in range(50):
+        if not handler.running:
+            break
+        threading.Event().wait(0.05)
+    finished = service.get_job(job_id=job.job_id)
+
+    assert released.status == int(JobStatus.RUNNING)
+    assert released.locked_by is None
+    assert released.locked_until is None
+    # 关闭前仍在执行的副本结束后，结果不会覆盖已释放的 job。
+    assert finished.status == int(JobStatus.RUNNING)
+    assert finished.locked_by is None
+    engine.dispose()
+
+
+def _build_counting_service() -> tuple[JobService, list[str], object]:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=OrmSession)
+    statements: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ANN001
+        statements.append(statement.split(None, 1)[0].upper())
+
+    return JobService(repository=JobRepository(factory), lock_ttl_seconds=30), statements, engine
+
+
+def test_job_transitions_use_a_single_statement() -> None:
+    service, statements, _ = _build_counting_service()
+    service.register_handler(PollingHandler())
+    job = service.create_job(job_type="test.poll", payload={"value": 1})
+    claimed = service.claim_due_jobs(limit=1, worker_id="worker-a")[0]
+
+    statements.clear()
+    running = service.run_claimed_job(claimed)
+
+    assert statements == ["UPDATE"]
+    assert running.status == int(JobStatus.RUNNING)
+    assert running.progress == 50
+    assert running.locked_by is None
+    assert running.next_run_at is not None
+
+    repository = service._repository
+    statements.clear()
+    completed = repository.mark_completed(
+        job_id=job.job_id,
+        progress=None,
+        result={"done": True},
+        entity_type="test_entity",
+        entity_id="entity-1",
+    )
+    assert statements == ["UPDATE"]
+    assert completed is not None
+    assert completed["status"] == int(JobStatus.COMPLETED)
+    assert completed["progress"] == 100
+    assert completed["result"] == {"done": True}
+    assert completed["entity_id"] == "entity-1"
+    assert completed["finished_at"] is not None
+
+
+def test_job_transitions_without_returning_support() -> None:
+    service, statements, engine = _build_counting_service()
+    # 模拟不支持 RETURNING 的 SQLite：退化为同一事务内 UPDATE + SELECT。
+    engine.dialect.update_returning = False
+    repository = service._repository
+    job = service.create_job(job_type="test.complete")
+    claimed = service.claim_due_jobs(limit=1, worker_id="worker-a")[0]
+
+    assert repository.mark_failed(job_id=job.job_id, error_code="E", error_message="x", worker_id="worker-b") is None
+    assert service.renew_leases([claimed]) == []
+
+    statements.clear()
+    failed = repository.mark_failed(job_id=job.job_id, error_code="E", error_message="boom", worker_id="worker-a")
+    assert statements == ["UPDATE", "SELECT"]
+    assert failed is not None
+    assert failed["status"] == int(JobStatus.FAILED)
+    assert failed["error_message"] == "boom"
+    assert failed["locked_by"] is None
+    with pytest.raises(RuntimeError):
+        repository.mark_canceled(job_id=uuid.uuid4().hex)
+
+
+class SupersededHandler:
+    job_type = "test.superseded"
+
+    def run(self, job: JobData) -> JobRunResult:
+        return JobRunResult(status=JobStatus.CANCELED, error_message="test job superseded")
+
+
+def test_job_service_records_queue_and_outcome_metrics() -> None:
+    service = _build_service()
+    service.register_handler(CompleteHandler())
+    service.register_handler(SupersededHandler())
+    completed_before = JOB_OUTCOMES.value(job_type="test.complete", outcome="completed")
+    superseded_before = JOB_OUTCOMES.value(job_type="test.superseded", outcome="superseded")
+    runs_before = JOB_RUN_DURATION.count(job_type="test.complete")
+
+    complete_job = service.create_job(job_type="test.complete")
+    service.create_job(job_type="test.superseded")
+    service.create_job(job_type="test.complete", next_run_at=datetime.now(timezone.utc) + timedelta(hours=1))
+
+    depth = {(job_type, status): count for job_type, status, count in service.queue_depth()}
+    assert depth == {("test.complete", "queued"): 2, ("test.superseded", "queued"): 1}
+    lag = service.queue_lag_seconds()
+    assert set(lag) == {"test.complete", "test.superseded"}
+    assert all(seconds >= 0 for seconds in lag.values())
+
+    service.run_job(job_id=complete_job.job_id)
+    service.run_due_jobs(limit=10)
+
+    assert JOB_OUTCOMES.value(job_type="test.complete", outcome="completed") == completed_before + 1
+    assert JOB_OUTCOMES.value(job_type="test.superseded", outcome="superseded") == superseded_before + 1
+    assert JOB_RUN_DURATION.count(job_type="test.complete") == runs_before + 1
+    assert "test.complete" not in service.queue_lag_seconds()
+
+
+@pytest.mark.parametrize("archive", [True, False])
+def test_purge_finished_jobs_archives_old_terminal_jobs_in_batches(archive: bool) -> None:
+    service = _build_service()
+    service.register_handler(CompleteHandler())
+    old_jobs = [service.create_job(job_type="test.complete", payload={"value": index}) for index in range(5)]
+    service.run_due_jobs(limit=10)
+    recent_job = service.create_job(job_type="test.complete")
+    service.run_job(job_id=recent_job.job_id)
+    queued_job = service.create_job(job_type="test.complete")
+    with service._repository._session_scope() as db:
+        db.execute(
+            update(JobModel)
+            .where(JobModel.job_id.in_([job.job_id for job in old_jobs]))
+            .values(finished_at=datetime.now(timezone.utc) - timedelta(days=40))
+        )
+        db.commit()
+
+    purged = service.purge_finished_jobs(older_than=timedelta(days=30), batch_size=2, archive=archive)
+
+    assert purged == 5
+    remaining = {job.job_id for job in service.list_jobs(limit=100)}
+    assert remaining == {recent_job.job_id, queued_job.job_id}
+    with service._repository._session_scope() as db:
+        archived = db.execute(select(JobArchiveModel).order_by(JobArchiveModel.job_id)).scalars().all()
+    if archive:
+        assert sorted(model.job_id for model in archived) == sorted(job.job_id for job in old_jobs)
+        assert {model.payload_json["value"] for model in archived} == set(range(5))
+        assert all(model.status == int(JobStatus.COMPLETED) and model.result_json for model in archived)
+    else:
+        assert archived == []
+    assert service.purge_finished_jobs(older_than=timedelta(days=30), batch_size=2, archive=archive) == 0
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [{"retention_days": 0}, {"batch_size": 0}, {"interval_seconds": 0}, {"pause_seconds": -1}],
+)
+def test_job_retention_config_rejects_invalid_values(overrides: dict) -> None:
+    values = {"retention_days": 30, "batch_size": 500, "interval_seconds": 3600.0, **overrides}
+    with pytest.raises(ValueError):
+        JobRetentionConfig(**values)
+
+
+def test_create_job_coalesces_duplicates_by_dedup_key() -> None:
+    service = _build_service()
+    service.register_handler(CompleteHandler())
+    dedup_key = JobService.build_dedup_key(
+        job_type="test.complete",
+        entity_type="test_entity",
+        entity_id="entity-1",
+        payload={"value": 1},
+    )
+    assert dedup_key == JobService.build_dedup_key(
+        job_type="test.complete",
+        entity_type="test_entity",
+        entity_id="entity-1",
+        payload={"value": 1},
+    )
+    assert dedup_key != JobService.build_dedup_key(
+        job_type="test.complete",
+        entity_type="test_entity",
+        entity_id="entity-1",
+        payload={"value": 2},
+    )
+
+    first = service.create_job(job_type="test.complete", payload={"value": 1}, dedup_key=dedup_key)
+    duplicate = service.create_job(job_type="test.complete", payload={"value": 1}, dedup_key=dedup_key)
+    other = service.create_job(job_type="test.complete", payload={"value": 2})
+
+    assert duplicate.job_id == first.job_id
+    assert other.job_id != first.job_id
+    assert service.find_active_job(job_type="test.complete", dedup_key=dedup_key).job_id == first.job_id
+
+    # 并发请求绕过 find_active_job 时由唯一索引兜底。
+    assert service._repository.create_job(
+        job_id=uuid.uuid4().hex,
+        job_type="test.complete",
+        entity_type=None,
+        entity_id=None,
+        payload={},
+        priority=0,
+        max_attempts=3,
+        next_run_at=None,
+        dedup_key=dedup_key,
+    ) is None
+
+    service.run_job(job_id=first.job_id)
+    assert service.find_active_job(job_type="test.complete", dedup_key=dedup_key) is None
+    rerun = service.create_job(job_type="test.complete", payload={"value": 1}, dedup_key=dedup_key)
+    assert rerun.job_id != first.job_id
+
+
+def test_create_job_requeues_after_dedup_window() -> None:
+    service = _build_service()
+    dedup_key = JobService.build_dedup_key(job_type="test.complete", idempotency_key="request-1")
+    first = service.create_job(job_type="test.complete", dedup_key=dedup_key)
+    with service._repository._session_scope() as db:
+        db.execute(
+            update(JobModel)
+            .where(JobModel.job_id == first.job_id)
+            .values(created_at=datetime.now(timezone.utc) - timedelta(hours=1))
+        )
+        db.commit()
+
+    second = service.create_job(job_type="test.complete", dedup_key=dedup_key)
+
+    assert second.job_id != first.job_id
+    assert second.dedup_key == dedup_key
+    assert service.get_job(job_id=first.job_id).dedup_key is None
+    assert service.create_job(job_type="test.complete", dedup_key=dedup_key).job_id == second.job_id
+
+
+def test_dependent_job_becomes_due_only_after_all_parents_complete() -> None:
+    service = _build_service()
+    service.register_handler(CompleteHandler())
+    first = service.create_job(job_type="test.complete", payload={"value": 1})
+    second = service.create_job(job_type="test.complete", payload={"value": 2})
+    child = service.create_job(job_type="test.complete", payload={"value": 3}, depends_on=[first.job_id, second.job_id])
+
+    assert child.pending_dependencies == 2
+    assert service.get_job(job_id=first.job_id).has_dependents is True
+    assert sorted(service.list_dependencies(job_id=child.job_id)) == sorted([first.job_id, second.job_id])
+    assert service._repository.claim_job(job_id=child.job_id, worker_id="test-worker", lock_ttl_seconds=30) is None
+
+    ran = service.run_due_jobs(limit=10)
+    assert {job.job_id for job in ran} == {first.job_id, second.job_id}
+    assert service.get_job(job_id=child.job_id).pending_dependencies == 0
+
+    ran = service.run_due_jobs(limit=10)
+    assert [job.job_id for job in ran] == [child.job_id]
+    assert ran[0].status == int(JobStatus.COMPLETED)
+
+
+def test_dependent_jobs_are_canceled_when_parent_fails() -> None:
+    service = _build_service()
+    parent = service.create_job(job_type="test.missing")
+    child = service.create_job(job_type="test.complete", depends_on=[parent.job_id])
+    grandchild = service.create_job(job_type="test.complete", depends_on=[child.job_id])
+
+    failed = service.run_job(job_id=parent.job_id)
+
+    assert failed.status == int(JobStatus.FAILED)
+    for job_id in (child.job_id, grandchild.job_id):
+        job = service.get_job(job_id=job_id)
+        assert job.status == int(JobStatus.CANCELED)
+        assert job.error_code == "DEPENDENCY_FAILED"
+    late_child = service.create_job(job_type="test.complete", depends_on=[parent.job_id])
+    assert late_child.status == int(JobStatus.CANCELED)
+    with pytest.raises(ValueError):
+        service.create_job(job_type="test.complete", depends_on=["not-a-uuid"])
+
+
+class FollowUpHandler:
+    job_type = "test.follow_up"
+
+    def run(self, job: JobData) -> JobRunResult:
+        return JobRunResult(
+            status=JobStatus.COMPLETED,
+            result={"stage": 1},
+            follow_ups=(JobSpec(job_type="test.complete", payload={"value": "from-handler"}),),
+        )
+
+
+def test_completed_job_enqueues_follow_ups_in_the_same_transaction() -> None:
+    service = _build_service()
+    service.register_handler(FollowUpHandler())
+    service.register_handler(CompleteHandler())
+    dedup_key = JobService.build_dedup_key(job_type="test.complete", idempotency_key="pipeline")
+    service.register_follow_up(
+        "test.follow_up",
+        lambda job, result: [JobSpec(job_type="test.complete", payload={"value": "from-hook"}, dedup_key=dedup_key)],
+    )
+    service.register_follow_up("test.follow_up", lambda job, result: [JobSpec(job_type="test.complete", dedup_key=dedup_key)])
+    wakeups: list[str] = []
+    service.subscribe_wakeups(lambda job_type, next_run_at: wakeups.append(job_type))
+
+    parent = service.create_job(job_type="test.follow_up")
+    completed = service.run_job(job_id=parent.job_id)
+
+    assert completed.status == int(JobStatus.COMPLETED)
+    queued = service.list_jobs(job_type="test.complete", status=int(JobStatus.QUEUED))
+    # 第二个 hook 的 job 与第一个同 dedup_key，被跳过而不会让上游的完成失败。
+    assert sorted(job.payload.get("value") for job in queued) == ["from-handler", "from-hook"]
+    assert wakeups.count("test.complete") == 1
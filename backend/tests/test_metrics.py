@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import pytest
+
+from lsl.core.metrics import MetricsRegistry
+
+
+def test_metrics_registry_renders_prometheus_text() -> None:
+    registry = MetricsRegistry()
+    outcomes = registry.counter("demo_outcomes_total", "Outcomes.", ("job_type", "outcome"))
+    in_flight = registry.gauge("demo_in_flight", "In flight.", ("lane",))
+    duration = registry.histogram("demo_duration_seconds", "Duration.", ("job_type",), buckets=(0.1, 1.0))
+    registry.gauge("demo_depth", "Depth.", ("status",), collector=lambda: [({"status": 'qu"eued'}, 3)])
+
+    outcomes.inc(job_type="tts", outcome="completed")
+    outcomes.inc(2, job_type="tts", outcome="completed")
+    in_flight.set(4, lane="batch")
+    in_flight.dec(lane="batch")
+    duration.observe(0.05, job_type="tts")
+    duration.observe(0.5, job_type="tts")
+    duration.observe(5, job_type="tts")
+
+    text = registry.render()
+
+    assert "# TYPE demo_outcomes_total counter" in text
+    assert 'demo_outcomes_total{job_type="tts",outcome="completed"} 3' in text
+    assert 'demo_in_flight{lane="batch"} 3' in text
+    assert 'demo_depth{status="qu\\"eued"} 3' in text
+    assert 'demo_duration_seconds_bucket{job_type="tts",le="0.1"} 1' in text
+    assert 'demo_duration_seconds_bucket{job_type="tts",le="1"} 2' in text
+    assert 'demo_duration_seconds_bucket{job_type="tts",le="+Inf"} 3' in text
+    assert 'demo_duration_seconds_count{job_type="tts"} 3' in text
+    assert 'demo_duration_seconds_sum{job_type="tts"} 5.55' in text
+    with pytest.raises(ValueError):
+        outcomes.inc(job_type="tts")
+    with pytest.raises(ValueError):
+        registry.counter("demo_outcomes_total", "Duplicate.")
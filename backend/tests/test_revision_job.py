@@ -13,7 +13,7 @@ from lsl.modules.asset.repo import AssetRepository
 from lsl.modules.asset.service import AssetService
 from lsl.modules.job.repo import JobRepository
 from lsl.modules.job.service import JobService
-from lsl.modules.job.types import JobStatus
+from lsl.modules.job.types import JobData, JobRunResult, JobStatus
 from lsl.modules.revision.repo import RevisionRepository
 from lsl.modules.revision.service import RevisionJobHandler, RevisionService
 from lsl.modules.revision.types import RevisionGenerateRequest, RevisionGenerator, RevisionSuggestion
@@ -108,6 +108,15 @@ def test_revision_generation_job_updates_revision_items() -> None:
     assert created.items == []
     assert created.plan_sections == []
 
+    # 重复点击（force）复用进行中的 job，不重新入队。
+    duplicate = revision_service.create_revision(
+        session_id=session.session.session_id,
+        user_prompt="make it natural",
+        force=True,
+    )
+    assert duplicate.job_id == created.job_id
+    assert len(job_service.list_jobs(job_type="revision_generation")) == 1
+
     completed = job_service.run_job(job_id=created.job_id, worker_id="test-worker")
     assert completed.status == int(JobStatus.COMPLETED)
 
@@ -136,3 +145,49 @@ def test_revision_prompt_additions_preserve_cue() -> None:
         "cue": "轻松自然地开口",
         "emotion": "happy",
     }
+
+
+class FakeAsrHandler:
+    job_type = "asr_recognition"
+
+    def __init__(self, transcript_id: str) -> None:
+        self.transcript_id = transcript_id
+
+    def run(self, job: JobData) -> JobRunResult:
+        return JobRunResult(status=JobStatus.COMPLETED, progress=100, result={"transcript_id": self.transcript_id})
+
+
+def test_asr_completion_queues_pipeline_revision() -> None:
+    revision_service, job_service, session_service, transcript_service = _build_services()
+    transcript = transcript_service.create_completed_transcript(
+        source_type="asr",
+        source_entity_id=None,
+        language="en-US",
+        utterances=[
+            TranscriptUtterance(seq=0, speaker="A", text="hello there", start_time=0, end_time=1000),
+            TranscriptUtterance(seq=1, speaker="B", text="nice meet you", start_time=1000, end_time=2000),
+        ],
+    )
+    session = session_service.create_session(
+        CreateSessionRequest(
+            title="Pipeline fixture",
+            f_type=2,
+            current_transcript_id=transcript.transcript_id,
+        )
+    )
+    job_service.register_handler(FakeAsrHandler(transcript.transcript_id))
+    job_service.register_follow_up("asr_recognition", revision_service.build_asr_follow_ups)
+
+    asr_job = job_service.create_job(job_type="asr_recognition")
+    job_service.run_job(job_id=asr_job.job_id)
+
+    queued = job_service.list_jobs(job_type="revision_generation")
+    assert len(queued) == 1
+    assert queued[0].payload["pipeline"] is True
+
+    ran = job_service.run_due_jobs(limit=10)
+    assert [job.status for job in ran] == [int(JobStatus.COMPLETED)]
+    revision = revision_service.get_revision(session_id=session.session.session_id)
+    assert revision.status_name == "completed"
+    assert revision.job_id == queued[0].job_id
+    assert [item.suggested_text for item in revision.items] == ["Hello there.", "Nice to meet you."]
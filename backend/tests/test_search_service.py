@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import uuid
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session as OrmSession
+from sqlalchemy.orm import sessionmaker
+
+from lsl.core.db import Base
+from lsl.modules.revision.repo import RevisionRepository
+from lsl.modules.revision.types import GeneratedRevisionItem
+from lsl.modules.search import SearchIndexer, SearchRepository, SearchService
+from lsl.modules.search.model import SearchDocumentModel
+from lsl.modules.session.repo import SessionRepository
+from lsl.modules.transcript.repo import TranscriptRepository
+from lsl.modules.transcript.types import TranscriptStatus
+
+
+def _utterances(texts: list[str]) -> list[dict]:
+    return [
+        {"seq": seq, "text": text, "speaker": "A", "start_time": seq * 1000, "end_time": seq * 1000 + 900}
+        for seq, text in enumerate(texts)
+    ]
+
+
+def _revision_item(transcript_id: str, seq: int, suggested_text: str, draft_text: str | None = None) -> GeneratedRevisionItem:
+    return GeneratedRevisionItem(
+        transcript_id=transcript_id,
+        source_seq_start=seq,
+        source_seq_end=seq,
+        source_seq_count=1,
+        source_seqs=[seq],
+        speaker="A",
+        start_time=seq * 1000,
+        end_time=seq * 1000 + 900,
+        original_text=suggested_text,
+        suggested_text=suggested_text,
+        draft_text=draft_text,
+        score=80,
+    )
+
+
+def test_search_index_is_maintained_incrementally_and_ranked_by_session() -> None:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=OrmSession)
+    indexer = SearchIndexer()
+    transcripts = TranscriptRepository(factory, search_indexer=indexer)
+    revisions = RevisionRepository(factory, search_indexer=indexer)
+    sessions = SessionRepository(factory)
+    search_repository = SearchRepository(factory)
+    service = SearchService(repository=search_repository)
+
+    def _create(title: str, source_type: str = "asr") -> tuple[str, str]:
+        session_id = uuid.uuid4().hex
+        transcript_id = uuid.uuid4().hex
+        transcripts.create_transcript(
+            transcript_id=transcript_id,
+            source_type=source_type,
+            source_entity_id=None,
+            language="en",
+            status=int(TranscriptStatus.PENDING),
+        )
+        sessions.create_session(
+            session_id=session_id,
+            title=title,
+            description=None,
+            target_language="en",
+            f_type=1,
+            asset_object_key=None,
+            current_transcript_id=transcript_id,
+        )
+        return session_id, transcript_id
+
+    def _complete(transcript_id: str, texts: list[str], **options) -> None:
+        transcripts.mark_completed(
+            transcript_id=transcript_id,
+            duration_ms=None,
+            full_text=None,
+            raw_result_json=None,
+            utterances=_utterances(texts),
+            **options,
+        )
+
+    def _document_count() -> int:
+        with factory() as db:
+            return int(db.execute(select(func.count()).select_from(SearchDocumentModel)).scalar_one())
+
+    cafe_session, cafe_transcript = _create("Cafe")
+    airport_session, airport_transcript = _create("Airport")
+    _complete(cafe_transcript, ["Could I get a flat white?", "Sure, anything else?", "A croissant please."])
+    _complete(airport_transcript, ["Where is the gate?", "The gate closes soon.", "Thanks!"])
+    # 分段识别的子 transcript 不进索引。
+    chunk_transcript = uuid.uuid4().hex
+    transcripts.create_transcript(
+        transcript_id=chunk_transcript,
+        source_type="asr_chunk",
+        source_entity_id=None,
+        language="en",
+        status=int(TranscriptStatus.PENDING),
+    )
+    _complete(chunk_transcript, ["gate gate gate"])
+    assert _document_count() == 6
+
+    hits = service.search(query="gate").items
+    assert sorted((hit.session_id, hit.seq) for hit in hits) == [(airport_session, 0), (airport_session, 1)]
+    assert all(hit.session_title == "Airport" and hit.doc_type == "utterance" for hit in hits)
+    assert "<mark>gate</mark>" in hits[0].snippet
+    # FTS5 语法字符不会导致查询报错；多个词之间为 AND。
+    assert [hit.seq for hit in service.search(query='flat "white*').items] == [0]
+    assert service.search(query="gate", session_id=cafe_session).items == []
+
+    # diff 完成只改写变化的行，旧文本不再命中。
+    _complete(cafe_transcript, ["Could I get an oat latte?", "Sure, anything else?"], diff=True)
+    assert service.search(query="flat white").items == []
+    assert [hit.seq for hit in service.search(query="latte").items] == [0]
+    assert service.search(query="croissant").items == []
+
+    revisions.save_revision(
+        session_id=cafe_session,
+        transcript_id=cafe_transcript,
+        user_prompt=None,
+        status=2,
+        items=[
+            _revision_item(cafe_transcript, 0, "Could I get an oat milk latte?"),
+            _revision_item(cafe_transcript, 1, "Sure, anything else?"),
+        ],
+    )
+    revision_hits = service.search(query="milk").items
+    assert [(hit.doc_type, hit.seq) for hit in revision_hits] == [("revision_item", 0)]
+
+    revision = revisions.get_revision_by_session_id(cafe_session)
+    assert revision is not None
+    revisions.update_revision_item(item_id=revision.items[1].item_id, updates={"draft_text": "Sure, any pastries?"})
+    assert [(hit.doc_type, hit.seq) for hit in service.search(query="pastries").items] == [("revision_item", 1)]
+
+    revisions.save_revision(
+        session_id=cafe_session,
+        transcript_id=cafe_transcript,
+        user_prompt=None,
+        status=2,
+        items=[_revision_item(cafe_transcript, 1, "Sure, anything else?")],
+    )
+    assert service.search(query="milk").items == []
+    # 未传 draft_text 时保留已有草稿。
+    assert [hit.seq for hit in service.search(query="pastries").items] == [1]
+
+    # session 换成新 transcript 后，旧 transcript 的文档不再返回。
+    sessions.update_session(session_id=airport_session, updates={"current_transcript_id": uuid.uuid4().hex})
+    assert service.search(query="gate").items == []
+
+    document_count = _document_count()
+    assert search_repository.rebuild() == document_count
+
+    with pytest.raises(ValueError, match="query is required"):
+        service.search(query="   ")
+    with pytest.raises(ValueError, match="limit must be between"):
+        service.search(query="gate", limit=0)
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import uuid
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session as OrmSession
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from lsl.core.config import Settings
+from lsl.core.db import Base
+from lsl.modules.asset.providers import FakeStorageProvider
+from lsl.modules.asset.repo import AssetRepository
+from lsl.modules.asset.service import AssetService
+from lsl.modules.job.repo import JobRepository
+from lsl.modules.job.service import JobService
+from lsl.modules.overview import SessionOverviewRepository, SessionOverviewService, router
+from lsl.modules.revision.repo import RevisionRepository
+from lsl.modules.revision.types import GeneratedRevisionItem
+from lsl.modules.session.repo import SessionRepository
+from lsl.modules.transcript.repo import TranscriptRepository
+from lsl.modules.transcript.types import TranscriptStatus
+
+
+def _revision_item(transcript_id: str, seq: int, text: str) -> GeneratedRevisionItem:
+    return GeneratedRevisionItem(
+        transcript_id=transcript_id,
+        source_seq_start=seq,
+        source_seq_end=seq,
+        source_seq_count=1,
+        source_seqs=[seq],
+        speaker="A",
+        start_time=seq * 1000,
+        end_time=seq * 1000 + 900,
+        original_text=text,
+        suggested_text=text,
+        score=80,
+    )
+
+
+def test_session_overview_aggregates_summaries_and_honours_if_none_match() -> None:
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=OrmSession)
+    asset_repository = AssetRepository(factory)
+    transcripts = TranscriptRepository(factory)
+    revisions = RevisionRepository(factory)
+    job_service = JobService(repository=JobRepository(factory), lock_ttl_seconds=30)
+    asset_service = AssetService(
+        settings=Settings(STORAGE_PROVIDER="fake", ASSET_BASE_URL="http://assets.test"),
+        storage=FakeStorageProvider(),
+        repository=asset_repository,
+    )
+    app = FastAPI()
+    app.state.session_overview_service = SessionOverviewService(
+        repository=SessionOverviewRepository(factory),
+        asset_service=asset_service,
+    )
+    app.include_router(router)
+    client = TestClient(app)
+
+    session_id = uuid.uuid4().hex
+    transcript_id = uuid.uuid4().hex
+    asset_repository.upsert_completed_upload(
+        object_key="uploads/cafe.mp3",
+        category="audio",
+        entity_id=session_id,
+        filename="cafe.mp3",
+        content_type="audio/mpeg",
+        file_size=1024,
+        etag=None,
+        storage_provider="fake",
+        upload_status=1,
+    )
+    transcripts.create_transcript(
+        transcript_id=transcript_id,
+        source_type="asr",
+        source_entity_id=None,
+        language="en",
+        status=int(TranscriptStatus.PENDING),
+    )
+    transcripts.mark_completed(
+        transcript_id=transcript_id,
+        duration_ms=2900,
+        full_text=None,
+        raw_result_json=None,
+        utterances=[
+            {"seq": seq, "text": text, "speaker": "A", "start_time": seq * 1000, "end_time": seq * 1000 + 900}
+            for seq, text in enumerate(["Hello", "A flat white, please", "Thanks"])
+        ],
+    )
+    SessionRepository(factory).create_session(
+        session_id=session_id,
+        title="Cafe",
+        description=None,
+        target_language="en",
+        f_type=1,
+        asset_object_key="uploads/cafe.mp3",
+        current_transcript_id=transcript_id,
+    )
+    revisions.save_revision(
+        session_id=session_id,
+        transcript_id=transcript_id,
+        user_prompt=None,
+        status=2,
+        items=[_revision_item(transcript_id, seq, text) for seq, text in enumerate(["Hello", "A flat white"])],
+    )
+    revision = revisions.get_revision_by_session_id(session_id)
+    assert revision is not None
+    job = job_service.create_job(job_type="revision_generation", entity_type="session", entity_id=session_id)
+    job_service.create_job(job_type="revision_generation", entity_type="session", entity_id=uuid.uuid4().hex)
+
+    url = f"/sessions/{session_id}/overview"
+    response = client.get(url)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"')
+    summary = response.json()["data"]
+    assert etag == f'W/"{summary["version"]}"'
+    assert summary["session"]["session"]["title"] == "Cafe"
+    assert summary["session"]["asset"]["asset_url"] == "http://assets.test/uploads/cafe.mp3"
+    assert summary["session"]["transcript"]["status_name"] == "completed"
+    # 默认不带大字段。
+    assert summary["utterances"] is None
+    assert summary["revision"]["item_count"] == 2
+    assert summary["revision"]["items"] is None
+    assert summary["tts"] is None
+    assert summary["translations"] == []
+    assert [item["job_id"] for item in summary["jobs"]] == [job.job_id]
+
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+    assert client.get(url, headers={"If-None-Match": f'"other", {etag}'}).status_code == 304
+
+    # include 不同，版本号也不同。
+    full = client.get(url, params={"include": "utterances,revision_items"}, headers={"If-None-Match": etag})
+    assert full.status_code == 200
+    full_etag = full.headers["etag"]
+    assert full_etag != etag
+    data = full.json()["data"]
+    assert [item["text"] for item in data["utterances"]] == ["Hello", "A flat white, please", "Thanks"]
+    assert [item["suggested_text"] for item in data["revision"]["items"]] == ["Hello", "A flat white"]
+    assert client.get(url, params={"include": "utterances,revision_items"}, headers={"If-None-Match": full_etag}).status_code == 304
+
+    # 单独修改 revision item 也会让版本号变化。
+    revisions.update_revision_item(item_id=revision.items[1].item_id, updates={"draft_text": "A flat white, please"})
+    edited = client.get(url, params={"include": "revision_items"}, headers={"If-None-Match": full_etag})
+    assert edited.status_code == 200
+    assert edited.json()["data"]["revision"]["items"][1]["draft_text"] == "A flat white, please"
+
+    # diff 重新完成只改了 utterance 的时间，transcript 其余字段不变，版本号也要变化。
+    current = client.get(url, params={"include": "utterances"})
+    transcripts.mark_completed(
+        transcript_id=transcript_id,
+        duration_ms=2900,
+        full_text=None,
+        raw_result_json=None,
+        utterances=[
+            {"seq": seq, "text": text, "speaker": "A", "start_time": seq * 1000 + 500, "end_time": seq * 1000 + 900}
+            for seq, text in enumerate(["Hello", "A flat white, please", "Thanks"])
+        ],
+        diff=True,
+    )
+    retimed = client.get(url, params={"include": "utterances"}, headers={"If-None-Match": current.headers["etag"]})
+    assert retimed.status_code == 200
+    assert retimed.json()["data"]["utterances"][0]["start_time"] == 500
+
+    assert client.get(url, params={"include": "everything"}).status_code == 400
+    assert client.get(f"/sessions/{uuid.uuid4().hex}/overview").status_code == 404
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import uuid
+
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import Session as OrmSession
+from sqlalchemy.orm import sessionmaker
+
+from lsl.core.config import Settings
+from lsl.core.db import Base
+from lsl.modules.asset.providers import FakeStorageProvider
+from lsl.modules.asset.repo import AssetRepository
+from lsl.modules.asset.service import AssetService
+from lsl.modules.revision.repo import RevisionRepository
+from lsl.modules.revision.types import RevisionStatus
+from lsl.modules.session.model import SessionModel
+from lsl.modules.session.pipeline import SessionPipelineTracker
+from lsl.modules.session.repo import SessionRepository
+from lsl.modules.session.service import SessionService
+from lsl.modules.transcript.repo import TranscriptRepository
+from lsl.modules.transcript.service import TranscriptService
+from lsl.modules.transcript.types import TranscriptStatus
+from lsl.modules.translation.repo import TranslationRepository
+from lsl.modules.translation.types import TranslationSourceItem
+from lsl.modules.tts.repo import TtsRepository
+from lsl.modules.tts.types import StoredSynthesisItem, TtsSynthesisStatus
+
+
+def _tts_item(seq: int, status: TtsSynthesisStatus) -> StoredSynthesisItem:
+    return StoredSynthesisItem(
+        source_item_id=uuid.uuid4().hex,
+        source_seq_start=seq,
+        source_seq_end=seq,
+        source_seqs=[seq],
+        conversation_speaker="A",
+        provider_speaker_id="speaker-a",
+        content=f"line {seq}",
+        plain_text=f"line {seq}",
+        cue_texts=[],
+        content_hash=f"hash-{seq}",
+        status=int(status),
+    )
+
+
+def test_stage_writes_refresh_session_pipeline_columns_and_backfill_recomputes_them() -> None:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=OrmSession)
+    pipeline = SessionPipelineTracker()
+    transcripts = TranscriptRepository(factory, session_pipeline=pipeline)
+    sessions = SessionRepository(factory, session_pipeline=pipeline)
+    revisions = RevisionRepository(factory, session_pipeline=pipeline)
+    tts = TtsRepository(factory, session_pipeline=pipeline)
+    translations = TranslationRepository(factory, session_pipeline=pipeline)
+    service = SessionService(
+        repository=sessions,
+        asset_service=AssetService(
+            settings=Settings(STORAGE_PROVIDER="fake", ASSET_BASE_URL="http://assets.test"),
+            storage=FakeStorageProvider(),
+            repository=AssetRepository(factory),
+        ),
+        transcript_service=TranscriptService(repository=transcripts),
+        session_pipeline=pipeline,
+    )
+
+    session_id = uuid.uuid4().hex
+    transcript_id = uuid.uuid4().hex
+    transcripts.create_transcript(
+        transcript_id=transcript_id,
+        source_type="asr",
+        source_entity_id=None,
+        language="en",
+        status=int(TranscriptStatus.PENDING),
+    )
+    sessions.create_session(
+        session_id=session_id,
+        title="Cafe",
+        description=None,
+        target_language="en",
+        f_type=1,
+        asset_object_key=None,
+        current_transcript_id=transcript_id,
+    )
+
+    def pipeline_of(item_session_id: str) -> dict:
+        [item] = [item for item in service.list_sessions() if item.session.session_id == item_session_id]
+        # 列表项仍带 transcript 元数据。
+        assert item.transcript is not None
+        assert item.transcript.transcript_id == item.session.current_transcript_id
+        assert item.pipeline is not None
+        return item.pipeline.model_dump()
+
+    state = pipeline_of(session_id)
+    assert state["transcript_status_name"] == "pending"
+    assert state["revision_status"] is None
+    assert state["updated_at"] is not None
+
+    transcripts.mark_completed(
+        transcript_id=transcript_id,
+        duration_ms=4200,
+        full_text=None,
+        raw_result_json=None,
+        utterances=[{"seq": 0, "text": "Hello", "speaker": "A", "start_time": 0, "end_time": 900}],
+    )
+    revisions.save_revision(
+        session_id=session_id,
+        transcript_id=transcript_id,
+        user_prompt=None,
+        status=int(RevisionStatus.GENERATING),
+        items=[],
+    )
+    tts.save_synthesis(
+        session_id=session_id,
+        provider="fake",
+        full_content_hash="full",
+        status=int(TtsSynthesisStatus.GENERATING),
+        items=[_tts_item(seq, TtsSynthesisStatus.COMPLETED if seq == 0 else TtsSynthesisStatus.PENDING) for seq in range(4)],
+    )
+    translation = translations.upsert_translation(
+        translation_id=uuid.uuid4().hex,
+        session_id=session_id,
+        source_type="transcript",
+        source_entity_id=transcript_id,
+        source_language="en",
+        target_language="zh",
+        provider="fake",
+        model_name=None,
+        source_items=[
+            TranslationSourceItem(source_item_key=str(seq), source_seq=seq, source_text=text)
+            for seq, text in enumerate(["Hello", "Thanks", "Bye"])
+        ],
+    )
+    translations.apply_suggestions(translation_id=translation["translation_id"], suggestions={"0": "你好"})
+
+    state = pipeline_of(session_id)
+    assert state["transcript_status_name"] == "completed"
+    assert state["transcript_duration_ms"] == 4200
+    assert state["revision_status_name"] == "generating"
+    assert (state["tts_status_name"], state["tts_progress"]) == ("generating", 25)
+    assert (state["translation_status_name"], state["translation_progress"]) == ("partial", 33)
+
+    # 切换 current_transcript_id 会刷新 transcript 列。
+    other_transcript_id = uuid.uuid4().hex
+    transcripts.create_transcript(
+        transcript_id=other_transcript_id,
+        source_type="asr",
+        source_entity_id=None,
+        language="en",
+        status=int(TranscriptStatus.PENDING),
+    )
+    transcripts.mark_failed(transcript_id=other_transcript_id, error_code="asr_failed", error_message=None)
+    sessions.update_session(session_id=session_id, updates={"current_transcript_id": other_transcript_id})
+    state = pipeline_of(session_id)
+    assert (state["transcript_status_name"], state["transcript_duration_ms"]) == ("failed", None)
+    assert state["tts_progress"] == 25
+
+    # 清空冗余列后回填能恢复。
+    with factory() as db:
+        db.execute(
+            update(SessionModel).values(
+                transcript_status=None,
+                revision_status=None,
+                tts_status=None,
+                tts_progress=None,
+                translation_status=None,
+                translation_progress=None,
+                pipeline_updated_at=None,
+            )
+        )
+        db.commit()
+    assert pipeline_of(session_id)["tts_status"] is None
+    assert service.backfill_pipeline_status(batch_size=1) == 1
+    assert pipeline_of(session_id) | {"updated_at": None} == state | {"updated_at": None}
+
+
+def test_stage_writes_do_not_touch_session_updated_at() -> None:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=OrmSession)
+    pipeline = SessionPipelineTracker()
+    transcripts = TranscriptRepository(factory, session_pipeline=pipeline)
+    sessions = SessionRepository(factory, session_pipeline=pipeline)
+    tts = TtsRepository(factory, session_pipeline=pipeline)
+
+    session_id = uuid.uuid4().hex
+    transcript_id = uuid.uuid4().hex
+    transcripts.create_transcript(
+        transcript_id=transcript_id,
+        source_type="asr",
+        source_entity_id=None,
+        language="en",
+        status=int(TranscriptStatus.PENDING),
+    )
+    sessions.create_session(
+        session_id=session_id,
+        title="Cafe",
+        description=None,
+        target_language="en",
+        f_type=1,
+        asset_object_key=None,
+        current_transcript_id=transcript_id,
+    )
+
+    def session_times() -> tuple:
+        with factory() as db:
+            row = db.get(SessionModel, session_id)
+            return row.updated_at, row.pipeline_updated_at
+
+    updated_at, pipeline_updated_at = session_times()
+
+    transcripts.mark_failed(transcript_id=transcript_id, error_code="asr_failed", error_message=None)
+    tts.save_synthesis(
+        session_id=session_id,
+        provider="fake",
+        full_content_hash="full",
+        status=int(TtsSynthesisStatus.GENERATING),
+        items=[_tts_item(0, TtsSynthesisStatus.PENDING)],
+    )
+    with factory() as db:
+        assert pipeline.sync_all(db, [session_id]) == 1
+        db.commit()
+
+    after_updated_at, after_pipeline_updated_at = session_times()
+    # pipeline 列照常刷新，session 自身的修改时间不动。
+    assert after_pipeline_updated_at != pipeline_updated_at
+    assert after_updated_at == updated_at
+
+    # 真正修改 session 时 updated_at 仍会前进。
+    sessions.update_session(session_id=session_id, updates={"title": "Cafe 2"})
+    assert session_times()[0] != updated_at
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session as OrmSession
+from sqlalchemy.orm import sessionmaker
+
+from lsl.core.config import Settings
+from lsl.core.db import Base
+from lsl.modules.asset.providers import FakeStorageProvider
+from lsl.modules.asset.repo import AssetRepository
+from lsl.modules.asset.service import AssetService
+from lsl.modules.session.repo import SessionRepository
+from lsl.modules.session.schema import CreateSessionRequest
+from lsl.modules.session.service import SessionService
+from lsl.modules.transcript.repo import TranscriptRepository
+from lsl.modules.transcript.service import TranscriptService
+
+
+def _build_session_service() -> SessionService:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=OrmSession)
+    asset_service = AssetService(
+        settings=Settings(STORAGE_PROVIDER="fake", ASSET_BASE_URL="http://assets.test"),
+        storage=FakeStorageProvider(),
+        repository=AssetRepository(factory),
+    )
+    return SessionService(
+        repository=SessionRepository(factory),
+        asset_service=asset_service,
+        transcript_service=TranscriptService(repository=TranscriptRepository(factory)),
+    )
+
+
+def test_list_sessions_pages_by_cursor_in_created_order() -> None:
+    service = _build_session_service()
+    created = [
+        service.create_session(CreateSessionRequest(title=f"Session {index}", f_type=2)).session.session_id
+        for index in range(5)
+    ]
+
+    seen: list[str] = []
+    cursor: str | None = None
+    pages = 0
+    while True:
+        page = service.list_session_page(limit=2, cursor=cursor)
+        seen.extend(item.session.session_id for item in page.items)
+        pages += 1
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+
+    assert pages == 3
+    assert sorted(seen) == sorted(created)
+    assert len(set(seen)) == len(created)
+    # 游标分页与一次性读取的顺序一致。
+    assert seen == [item.session.session_id for item in service.list_sessions(limit=10)]
+    # offset 仍然可用。
+    assert [item.session.session_id for item in service.list_sessions(limit=2, offset=2)] == seen[2:4]
+
+    with pytest.raises(ValueError, match="invalid cursor"):
+        service.list_sessions(cursor="not-a-cursor")
+    with pytest.raises(ValueError, match="cursor and offset cannot be used together"):
+        service.list_sessions(cursor=cursor, offset=1)
+
+
+def test_list_sessions_query_matches_title_description_and_object_key() -> None:
+    service = _build_session_service()
+    cafe = service.create_session(CreateSessionRequest(title="Cafe Talk", f_type=2)).session.session_id
+    airport = service.create_session(
+        CreateSessionRequest(title="Trip", description="At the AIRPORT gate", f_type=2)
+    ).session.session_id
+    upload = service.create_session(
+        CreateSessionRequest(title="Upload", f_type=1, asset_object_key="uploads/100%_real_take.mp3")
+    ).session.session_id
+
+    def _query(value: str) -> set[str]:
+        return {item.session.session_id for item in service.list_sessions(query=value)}
+
+    assert _query("cafe") == {cafe}
+    assert _query("airport") == {airport}
+    assert _query("REAL_TAKE") == {upload}
+    # % 和 _ 按字面匹配，不作为通配符。
+    assert _query("100%_") == {upload}
+    assert _query("%") == {upload}
+    assert _query("t_p") == set()
+    assert _query("  ") == {cafe, airport, upload}
@@ -1,20 +1,35 @@
 from __future__ import annotations
 
-from sqlalchemy import create_engine
+import json
+import zlib
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import Session as OrmSession
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from lsl.core.db import Base
+from lsl.modules.transcript.api import router
 from lsl.modules.transcript.repo import TranscriptRepository
 from lsl.modules.transcript.service import TranscriptService
 from lsl.modules.transcript.types import TranscriptStatus, TranscriptUtterance
 
 
 def _build_service() -> TranscriptService:
-    engine = create_engine("sqlite:///:memory:")
+    return _build_service_and_factory()[0]
+
+
+def _build_service_and_factory() -> tuple[TranscriptService, sessionmaker[OrmSession]]:
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
     Base.metadata.create_all(engine)
     factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=OrmSession)
-    return TranscriptService(repository=TranscriptRepository(factory))
+    return TranscriptService(repository=TranscriptRepository(factory)), factory
 
 
 def test_transcript_service_creates_completed_transcript() -> None:
@@ -53,3 +68,160 @@ def test_transcript_service_marks_pending_transcript_failed() -> None:
 
     assert failed.status == int(TranscriptStatus.FAILED)
     assert failed.error_code == "provider_error"
+
+
+def test_transcript_copy_completed_can_skip_reading_back_utterances() -> None:
+    service = _build_service()
+    source = service.create_completed_transcript(
+        source_type="asr",
+        source_entity_id=None,
+        language="en-US",
+        utterances=[TranscriptUtterance(seq=0, text="hello", speaker="A", start_time=0, end_time=900)],
+        raw_result={"source": "test"},
+    )
+    target = service.create_pending_transcript(source_type="asr", source_entity_id=None)
+
+    copied = service.copy_completed(
+        source_transcript_id=source.transcript_id,
+        transcript_id=target.transcript_id,
+        include_utterances=False,
+    )
+
+    assert copied is not None
+    assert copied.status == int(TranscriptStatus.COMPLETED)
+    assert copied.utterances == []
+    assert [item.text for item in service.list_utterances(transcript_id=target.transcript_id)] == ["hello"]
+
+
+def test_transcript_raw_result_is_stored_compressed_and_loaded_lazily() -> None:
+    service, factory = _build_service_and_factory()
+    raw_result = {"result": {"words": [{"text": "hello", "start_time": index} for index in range(200)]}}
+
+    transcript = service.create_completed_transcript(
+        source_type="asr",
+        source_entity_id=None,
+        language="en-US",
+        utterances=[TranscriptUtterance(seq=0, text="hello", start_time=0, end_time=100)],
+        raw_result=raw_result,
+    )
+
+    assert service.get_transcript(transcript_id=transcript.transcript_id).raw_result is None
+    assert service.get_transcript(transcript_id=transcript.transcript_id, include_raw=True).raw_result == raw_result
+    with factory() as db:
+        stored = db.execute(text("SELECT raw_result FROM transcript_raw_results")).scalar_one()
+    assert zlib.decompress(stored) == json.dumps(raw_result, separators=(",", ":")).encode()
+    assert len(stored) < len(json.dumps(raw_result))
+
+    # SQL 迁移过来的旧数据是未压缩的 JSON 字节。
+    pending = service.create_pending_transcript(source_type="asr")
+    with factory() as db:
+        db.execute(
+            text("INSERT INTO transcript_raw_results (transcript_id, raw_result, created_at) VALUES (:id, :raw, :now)"),
+            {"id": pending.transcript_id, "raw": b'{"legacy": true}', "now": "2026-01-01 00:00:00"},
+        )
+        db.commit()
+    assert service.get_transcript(transcript_id=pending.transcript_id, include_raw=True).raw_result == {"legacy": True}
+
+
+def test_transcript_diff_completion_only_rewrites_changed_rows() -> None:
+    service, factory = _build_service_and_factory()
+    transcript = service.create_completed_transcript(
+        source_type="manual",
+        source_entity_id=None,
+        language="en-US",
+        utterances=[
+            TranscriptUtterance(seq=index, text=f"line {index}", start_time=index * 1000, end_time=index * 1000 + 900)
+            for index in range(4)
+        ],
+    )
+
+    def _row_ids() -> dict[int, int]:
+        with factory() as db:
+            return dict(db.execute(text("SELECT seq, id FROM transcript_utterances ORDER BY seq")).all())
+
+    before = _row_ids()
+    completed = service.mark_completed(
+        transcript_id=transcript.transcript_id,
+        utterances=[
+            TranscriptUtterance(seq=0, text="line 0", start_time=0, end_time=900),
+            TranscriptUtterance(seq=1, text="line 1 edited", speaker="A", start_time=1000, end_time=1900),
+            TranscriptUtterance(seq=2, text="line 2", start_time=2000, end_time=2900),
+        ],
+        diff=True,
+        include_utterances=False,
+    )
+
+    assert completed.utterances == []
+    after = _row_ids()
+    # 未变化和被修改的行都原地保留，超出范围的 seq=3 被删除。
+    assert after == {seq: before[seq] for seq in (0, 1, 2)}
+    reloaded = service.get_transcript(transcript_id=transcript.transcript_id)
+    assert [(item.seq, item.text, item.speaker) for item in reloaded.utterances] == [
+        (0, "line 0", None),
+        (1, "line 1 edited", "A"),
+        (2, "line 2", None),
+    ]
+
+
+def test_transcript_utterances_are_read_by_keyset_cursor_and_seq_window() -> None:
+    service = _build_service()
+    transcript = service.create_completed_transcript(
+        source_type="manual",
+        source_entity_id=None,
+        language="en-US",
+        utterances=[
+            TranscriptUtterance(seq=index, text=f"line {index}", start_time=index * 1000, end_time=index * 1000 + 900)
+            for index in range(7)
+        ],
+    )
+    app = FastAPI()
+    app.state.transcript_service = service
+    app.include_router(router)
+    client = TestClient(app)
+    url = f"/transcripts/{transcript.transcript_id}/utterances"
+
+    seqs: list[int] = []
+    after_seq = None
+    while True:
+        params = {"limit": 3} if after_seq is None else {"limit": 3, "after_seq": after_seq}
+        page = client.get(url, params=params).json()["data"]
+        seqs.extend(item["seq"] for item in page["items"])
+        if not page["has_more"]:
+            assert page["next_after_seq"] is None
+            break
+        after_seq = page["next_after_seq"]
+    assert seqs == list(range(7))
+
+    window = client.get(url, params={"start_seq": 2, "end_seq": 4, "format": "compact"}).json()["data"]
+    assert window["items"] == []
+    assert window["columns"] == ["seq", "start_time", "end_time", "speaker", "text", "additions"]
+    assert window["rows"] == [[2, 2000, 2900, None, "line 2", None], [3, 3000, 3900, None, "line 3", None]]
+    assert window["has_more"] is False
+
+    metadata = client.get(f"/transcripts/{transcript.transcript_id}", params={"include_utterances": "false"}).json()
+    assert metadata["data"]["utterances"] == []
+    assert client.get(url, params={"limit": 0}).status_code == 400
+    assert client.get("/transcripts/00000000000000000000000000000000/utterances").status_code == 404
+
+
+def test_transcript_utterances_without_paging_params_return_everything() -> None:
+    service = _build_service()
+    transcript = service.create_completed_transcript(
+        source_type="manual",
+        source_entity_id=None,
+        language="en-US",
+        utterances=[
+            TranscriptUtterance(seq=index, text=f"line {index}", start_time=index * 1000, end_time=index * 1000 + 900)
+            for index in range(250)
+        ],
+    )
+    app = FastAPI()
+    app.state.transcript_service = service
+    app.include_router(router)
+    client = TestClient(app)
+
+    # 不传分页参数时与旧接口一致，不会被截断。
+    page = client.get(f"/transcripts/{transcript.transcript_id}/utterances").json()["data"]
+    assert [item["seq"] for item in page["items"]] == list(range(250))
+    assert page["has_more"] is False
+    assert page["next_after_seq"] is None
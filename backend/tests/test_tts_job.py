@@ -13,7 +13,7 @@ from lsl.modules.asset.repo import AssetRepository
 from lsl.modules.asset.service import AssetService
 from lsl.modules.job.repo import JobRepository
 from lsl.modules.job.service import JobService
-from lsl.modules.job.types import JobStatus
+from lsl.modules.job.types import JobRunResult, JobStatus
 from lsl.modules.revision.repo import RevisionRepository
 from lsl.modules.revision.service import RevisionService
 from lsl.modules.revision.types import GeneratedRevisionItem, RevisionGenerateRequest, RevisionSuggestion
@@ -144,3 +144,56 @@ def test_tts_synthesis_job_generates_full_audio_asset() -> None:
     assert synthesis.item_count == 2
     assert synthesis.completed_item_count == 2
     assert synthesis.full_duration_ms == 2000
+
+
+def test_pipeline_tts_job_is_coalesced_with_user_synthesis() -> None:
+    tts_service, job_service, session_service, revision_service, transcript_service = _build_services()
+    transcript = transcript_service.create_completed_transcript(
+        source_type="manual",
+        source_entity_id=None,
+        language="en-US",
+        utterances=[TranscriptUtterance(seq=0, speaker="A", text="Hello there.", start_time=0, end_time=1000)],
+    )
+    session = session_service.create_session(
+        CreateSessionRequest(title="TTS pipeline", f_type=2, current_transcript_id=transcript.transcript_id)
+    )
+    session_id = session.session.session_id
+    revision_service.create_generated_revision(
+        session_id=session_id,
+        transcript_id=transcript.transcript_id,
+        user_prompt=None,
+        items=[
+            GeneratedRevisionItem(
+                transcript_id=transcript.transcript_id,
+                source_seq_start=0,
+                source_seq_end=0,
+                source_seq_count=1,
+                source_seqs=[0],
+                speaker="A",
+                start_time=0,
+                end_time=1000,
+                original_text="Hello there.",
+                suggested_text="Hello there.",
+            )
+        ],
+    )
+
+    revision_job = job_service.create_job(
+        job_type="revision_generation",
+        entity_type="session",
+        entity_id=session_id,
+        payload={"session_id": session_id, "pipeline": True},
+    )
+    [spec] = tts_service.build_revision_follow_ups(revision_job, JobRunResult(status=JobStatus.COMPLETED))
+    pipeline_job = job_service.create_job(
+        job_type=spec.job_type,
+        entity_type=spec.entity_type,
+        entity_id=spec.entity_id,
+        payload=spec.payload,
+        dedup_key=spec.dedup_key,
+    )
+
+    # 流水线 job 还在排队时，用户点击合成复用同一个 job。
+    created = tts_service.create_synthesis(session_id=session_id)
+    assert created.job is not None
+    assert created.job.job_id == pipeline_job.job_id
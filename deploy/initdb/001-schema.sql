@@ -53,6 +53,7 @@ CREATE TABLE IF NOT EXISTS public.asset_assets (
     content_type      VARCHAR(128),                               -- MIME type.
     file_size         BIGINT,                                     -- File size in bytes.
     etag              VARCHAR(128),                               -- Storage-provider ETag when available.
+    content_fingerprint VARCHAR(64),                              -- sha256 of the body for server-generated files; NULL for client uploads.
     storage_provider  VARCHAR(32) NOT NULL,                       -- Storage backend, for example fake or oss.
     upload_status     SMALLINT NOT NULL DEFAULT 0,                -- Upload lifecycle status.
     created_at        TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP, -- Creation timestamp.
@@ -67,6 +68,13 @@ CREATE INDEX IF NOT EXISTS idx_asset_assets_category_entity_created_at
 CREATE INDEX IF NOT EXISTS idx_asset_assets_created_at
     ON public.asset_assets (created_at DESC);
 
+-- Existing databases: add the content fingerprint column.
+ALTER TABLE public.asset_assets ADD COLUMN IF NOT EXISTS content_fingerprint VARCHAR(64);
+
+-- Find identical uploads.
+CREATE INDEX IF NOT EXISTS idx_asset_assets_content_fingerprint
+    ON public.asset_assets (content_fingerprint);
+
 -- ---------------------------------------------------------------------------
 -- Job module
 -- Generic asynchronous lifecycle table. Business results stay in owning modules.
@@ -82,6 +90,9 @@ CREATE TABLE IF NOT EXISTS public.job_jobs (
     progress      INTEGER NOT NULL DEFAULT 0,                      -- Approximate progress from 0 to 100.
     attempts      INTEGER NOT NULL DEFAULT 0,                      -- Number of claim/run attempts.
     max_attempts  INTEGER NOT NULL DEFAULT 3,                      -- Maximum allowed attempts.
+    dedup_key     VARCHAR(64),                                    -- sha256 dedup/idempotency key; NULL means no dedup.
+    pending_dependencies INTEGER NOT NULL DEFAULT 0,              -- Unfinished parent jobs; claimable only at 0.
+    has_dependents BOOLEAN NOT NULL DEFAULT FALSE,                -- Whether job_job_dependencies has children of this job.
     payload_json  TEXT NOT NULL DEFAULT '{}',                      -- Handler input payload JSON.
     result_json   TEXT,                                           -- Lightweight handler result JSON.
     error_code    VARCHAR(64),                                    -- Stable error code when failed/canceled.
@@ -111,6 +122,71 @@ CREATE INDEX IF NOT EXISTS idx_job_jobs_entity
 CREATE INDEX IF NOT EXISTS idx_job_jobs_created_at
     ON public.job_jobs (created_at);
 
+-- Retention scans terminal jobs by finished_at without touching runnable rows.
+CREATE INDEX IF NOT EXISTS idx_job_jobs_terminal_finished_at
+    ON public.job_jobs (finished_at)
+    WHERE x_status IN (2, 3, 4);
+
+-- Existing databases: add the dedup column before creating the index below.
+ALTER TABLE public.job_jobs ADD COLUMN IF NOT EXISTS dedup_key VARCHAR(64);
+
+-- Existing databases: add the dependency columns.
+ALTER TABLE public.job_jobs ADD COLUMN IF NOT EXISTS pending_dependencies INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE public.job_jobs ADD COLUMN IF NOT EXISTS has_dependents BOOLEAN NOT NULL DEFAULT FALSE;
+
+-- At most one queued/running job per (job_type, dedup_key); duplicate creates reuse it.
+CREATE UNIQUE INDEX IF NOT EXISTS uq_job_jobs_type_dedup_key_active
+    ON public.job_jobs (job_type, dedup_key)
+    WHERE x_status IN (0, 1) AND dedup_key IS NOT NULL;
+
+-- Dependency edges: job_id becomes due after every parent_job_id completes.
+CREATE TABLE IF NOT EXISTS public.job_job_dependencies (
+    job_id        VARCHAR(32) NOT NULL,                            -- Dependent (child) job id.
+    parent_job_id VARCHAR(32) NOT NULL,                            -- Upstream job id.
+    created_at    TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP, -- Creation timestamp.
+    PRIMARY KEY (job_id, parent_job_id)
+);
+
+-- Release or cancel children when a parent reaches a terminal status.
+CREATE INDEX IF NOT EXISTS idx_job_job_dependencies_parent_job_id
+    ON public.job_job_dependencies (parent_job_id);
+
+-- Archived terminal jobs moved out of job_jobs by the retention task.
+-- Range partitioned by finished_at; drop whole partitions to expire old history.
+CREATE TABLE IF NOT EXISTS public.job_jobs_archive (
+    job_id        VARCHAR(32) NOT NULL,                            -- Job id, uuid hex.
+    job_type      VARCHAR(64) NOT NULL,                            -- Handler key.
+    x_status      SMALLINT NOT NULL,                               -- 2 completed, 3 failed, 4 canceled.
+    entity_type   VARCHAR(64),                                     -- Owning domain entity type.
+    entity_id     VARCHAR(128),                                    -- Owning domain entity id.
+    priority      INTEGER NOT NULL,                                -- Priority at archive time.
+    progress      INTEGER NOT NULL,                                -- Final progress.
+    attempts      INTEGER NOT NULL,                                -- Number of claim/run attempts.
+    max_attempts  INTEGER NOT NULL,                                -- Maximum allowed attempts.
+    payload_json  TEXT NOT NULL,                                   -- Handler input payload JSON.
+    result_json   TEXT,                                            -- Handler result JSON.
+    error_code    VARCHAR(64),                                     -- Stable error code.
+    error_message TEXT,                                            -- Human-readable error detail.
+    started_at    TIMESTAMPTZ,                                     -- First started timestamp.
+    finished_at   TIMESTAMPTZ NOT NULL,                            -- Terminal timestamp, partition key.
+    created_at    TIMESTAMPTZ NOT NULL,                            -- Original creation timestamp.
+    updated_at    TIMESTAMPTZ NOT NULL,                            -- Last update before archiving.
+    archived_at   TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,  -- Archive timestamp.
+    PRIMARY KEY (job_id, finished_at)
+) PARTITION BY RANGE (finished_at);
+
+-- Catch-all partition; create monthly partitions ahead of time, for example:
+-- CREATE TABLE public.job_jobs_archive_2026_01 PARTITION OF public.job_jobs_archive
+--     FOR VALUES FROM ('2026-01-01') TO ('2026-02-01');
+CREATE TABLE IF NOT EXISTS public.job_jobs_archive_default
+    PARTITION OF public.job_jobs_archive DEFAULT;
+
+CREATE INDEX IF NOT EXISTS idx_job_jobs_archive_finished_at
+    ON public.job_jobs_archive (finished_at);
+
+CREATE INDEX IF NOT EXISTS idx_job_jobs_archive_entity
+    ON public.job_jobs_archive (entity_type, entity_id);
+
 -- ---------------------------------------------------------------------------
 -- Transcript module
 -- Unified utterance stream produced by ASR, AI script generation, manual input,
@@ -124,7 +200,6 @@ CREATE TABLE IF NOT EXISTS public.transcript_transcripts (
     x_language       VARCHAR(16),                                 -- Language tag, for example en-US.
     duration_ms      INTEGER,                                     -- Total duration in milliseconds.
     full_text        TEXT,                                        -- Joined text for quick display/search.
-    raw_result_json  TEXT,                                        -- Provider/raw generation result JSON.
     x_status         SMALLINT NOT NULL DEFAULT 0,                 -- 0 pending, 1 completed, 2 failed.
     error_code       VARCHAR(64),                                 -- Stable failure code.
     error_message    TEXT,                                        -- Failure detail.
@@ -140,6 +215,30 @@ CREATE INDEX IF NOT EXISTS idx_transcript_transcripts_source
 CREATE INDEX IF NOT EXISTS idx_transcript_transcripts_status_created_at
     ON public.transcript_transcripts (x_status, created_at);
 
+-- Provider/raw generation results, kept out of transcript_transcripts so list and
+-- detail queries do not drag megabyte-sized JSON through the buffer cache.
+CREATE TABLE IF NOT EXISTS public.transcript_raw_results (
+    transcript_id    VARCHAR(32) PRIMARY KEY,                     -- Owning transcript id.
+    raw_result       BYTEA,                                       -- zlib-compressed JSON (plain UTF-8 JSON for migrated rows).
+    created_at       TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP -- Creation timestamp.
+);
+
+-- Existing databases: move inline raw results into transcript_raw_results, then drop the column.
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = 'public' AND table_name = 'transcript_transcripts' AND column_name = 'raw_result_json'
+    ) THEN
+        INSERT INTO public.transcript_raw_results (transcript_id, raw_result)
+        SELECT transcript_id, convert_to(raw_result_json, 'UTF8')
+        FROM public.transcript_transcripts
+        WHERE raw_result_json IS NOT NULL AND raw_result_json <> ''
+        ON CONFLICT (transcript_id) DO NOTHING;
+        ALTER TABLE public.transcript_transcripts DROP COLUMN raw_result_json;
+    END IF;
+END $$;
+
 CREATE TABLE IF NOT EXISTS public.transcript_utterances (
     id               BIGSERIAL PRIMARY KEY,                       -- Internal auto-increment row id.
     transcript_id    VARCHAR(32) NOT NULL,                        -- Owning transcript id.
@@ -172,6 +271,13 @@ CREATE TABLE IF NOT EXISTS public.asr_recognitions (
     object_key                TEXT NOT NULL,                       -- Uploaded audio object key.
     audio_url                 TEXT NOT NULL,                       -- Provider-readable audio URL.
     target_language           VARCHAR(16),                         -- ASR target language tag.
+    audio_fingerprint         VARCHAR(64),                         -- Audio content fingerprint from asset_assets.
+    reused_from_recognition_id VARCHAR(32),                        -- Completed recognition whose result was reused.
+    chunk_count               INTEGER NOT NULL DEFAULT 0,          -- Long audio: number of chunk recognitions, 0 when not chunked.
+    parent_recognition_id     VARCHAR(32),                         -- Chunk recognition: the long-audio recognition it belongs to.
+    chunk_index               INTEGER,                             -- Chunk recognition: 0-based chunk order.
+    chunk_start_ms            INTEGER,                             -- Chunk recognition: start offset in the original audio.
+    chunk_end_ms              INTEGER,                             -- Chunk recognition: end offset in the original audio.
     x_provider                VARCHAR(32) NOT NULL,                -- ASR provider name.
     x_status                  SMALLINT NOT NULL DEFAULT 0,         -- 0 pending, 1 submitted, 2 processing, 3 completed, 4 failed.
     x_provider_request_id     VARCHAR(128),                        -- Provider request id.
@@ -184,6 +290,7 @@ CREATE TABLE IF NOT EXISTS public.asr_recognitions (
     poll_count                INTEGER NOT NULL DEFAULT 0,          -- Number of provider query polls.
     last_polled_at            TIMESTAMPTZ,                         -- Last provider query timestamp.
     next_poll_at              TIMESTAMPTZ,                         -- Next provider query timestamp.
+    callback_received_at      TIMESTAMPTZ,                         -- Provider callback deferred while the job was held by a poll.
     created_at                TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP, -- Creation timestamp.
     updated_at                TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP  -- Last update timestamp.
 );
@@ -200,6 +307,28 @@ CREATE INDEX IF NOT EXISTS idx_asr_recognitions_status_created_at
 CREATE INDEX IF NOT EXISTS idx_asr_recognitions_object_key
     ON public.asr_recognitions (object_key);
 
+-- Existing databases: add the result reuse columns.
+ALTER TABLE public.asr_recognitions ADD COLUMN IF NOT EXISTS audio_fingerprint VARCHAR(64);
+ALTER TABLE public.asr_recognitions ADD COLUMN IF NOT EXISTS reused_from_recognition_id VARCHAR(32);
+
+-- Reuse a completed recognition for identical audio and language.
+CREATE INDEX IF NOT EXISTS idx_asr_recognitions_fingerprint
+    ON public.asr_recognitions (audio_fingerprint, target_language, x_status);
+
+-- Existing databases: add the long-audio chunking columns.
+ALTER TABLE public.asr_recognitions ADD COLUMN IF NOT EXISTS chunk_count INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE public.asr_recognitions ADD COLUMN IF NOT EXISTS parent_recognition_id VARCHAR(32);
+ALTER TABLE public.asr_recognitions ADD COLUMN IF NOT EXISTS chunk_index INTEGER;
+ALTER TABLE public.asr_recognitions ADD COLUMN IF NOT EXISTS chunk_start_ms INTEGER;
+ALTER TABLE public.asr_recognitions ADD COLUMN IF NOT EXISTS chunk_end_ms INTEGER;
+
+-- Collect the chunk recognitions of a long-audio recognition.
+CREATE INDEX IF NOT EXISTS idx_asr_recognitions_parent
+    ON public.asr_recognitions (parent_recognition_id, chunk_index);
+
+-- Existing databases: add the deferred callback marker.
+ALTER TABLE public.asr_recognitions ADD COLUMN IF NOT EXISTS callback_received_at TIMESTAMPTZ;
+
 -- ---------------------------------------------------------------------------
 -- Session module
 -- User-facing learning session. It references current transcript and asset.
@@ -214,9 +343,28 @@ CREATE TABLE IF NOT EXISTS public.session_sessions (
     asset_object_key       TEXT UNIQUE,                            -- Uploaded audio object key.
     current_transcript_id  VARCHAR(32) UNIQUE,                     -- Current transcript id.
     created_at             TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP, -- Creation timestamp.
-    updated_at             TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP  -- Last update timestamp.
+    updated_at             TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP, -- Last update timestamp.
+    transcript_status      SMALLINT,                               -- Denormalized current transcript x_status.
+    transcript_duration_ms INTEGER,                                -- Denormalized current transcript duration.
+    revision_status        SMALLINT,                               -- Denormalized revision x_status.
+    tts_status             SMALLINT,                               -- Denormalized TTS synthesis x_status.
+    tts_progress           SMALLINT,                               -- TTS completed items percentage, 0-100.
+    translation_status     SMALLINT,                               -- Denormalized x_status of the latest translation.
+    translation_progress   SMALLINT,                               -- Latest translation completed items percentage, 0-100.
+    pipeline_updated_at    TIMESTAMPTZ                             -- Last pipeline column refresh.
 );
 
+-- Existing databases: add the denormalized pipeline status columns.
+-- They are refreshed by SessionPipelineTracker in the same transaction as each stage write.
+ALTER TABLE public.session_sessions ADD COLUMN IF NOT EXISTS transcript_status SMALLINT;
+ALTER TABLE public.session_sessions ADD COLUMN IF NOT EXISTS transcript_duration_ms INTEGER;
+ALTER TABLE public.session_sessions ADD COLUMN IF NOT EXISTS revision_status SMALLINT;
+ALTER TABLE public.session_sessions ADD COLUMN IF NOT EXISTS tts_status SMALLINT;
+ALTER TABLE public.session_sessions ADD COLUMN IF NOT EXISTS tts_progress SMALLINT;
+ALTER TABLE public.session_sessions ADD COLUMN IF NOT EXISTS translation_status SMALLINT;
+ALTER TABLE public.session_sessions ADD COLUMN IF NOT EXISTS translation_progress SMALLINT;
+ALTER TABLE public.session_sessions ADD COLUMN IF NOT EXISTS pipeline_updated_at TIMESTAMPTZ;
+
 -- Session list pagination.
 CREATE INDEX IF NOT EXISTS idx_session_sessions_created_at
     ON public.session_sessions (created_at DESC);
@@ -225,6 +373,16 @@ CREATE INDEX IF NOT EXISTS idx_session_sessions_created_at
 CREATE INDEX IF NOT EXISTS idx_session_sessions_title_lower
     ON public.session_sessions (lower(title));
 
+-- Session list keyset pagination on (created_at, session_id) DESC.
+CREATE INDEX IF NOT EXISTS idx_session_sessions_created_at_session_id
+    ON public.session_sessions (created_at, session_id);
+
+-- Session list substring search. The expression must match SESSION_SEARCH_TEXT_SQL in the session model.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS idx_session_sessions_search_trgm
+    ON public.session_sessions
+    USING GIN ((lower(title || ' ' || coalesce(x_description, '') || ' ' || coalesce(asset_object_key, ''))) gin_trgm_ops);
+
 -- ---------------------------------------------------------------------------
 -- Revision module
 -- Stores editable revised utterances generated from a transcript.
@@ -302,7 +460,7 @@ CREATE TABLE IF NOT EXISTS public.script_generations (
     must_include_json  TEXT NOT NULL DEFAULT '[]',                 -- Required expressions JSON array.
     preview_items_json TEXT NOT NULL DEFAULT '[]',                 -- Incremental generated utterance preview JSON array.
     plan_sections_json TEXT NOT NULL DEFAULT '[]',                 -- Planned script sections JSON array.
-    raw_result_json    TEXT,                                       -- Raw LLM/generator result JSON.
+    raw_result_json    TEXT,                                       -- Generation stage marker JSON; full output lives in transcript_raw_results.
     x_status           SMALLINT NOT NULL DEFAULT 0,                -- 0 pending, 1 generating, 2 completed, 3 failed.
     error_code         VARCHAR(64),                                -- Stable failure code.
     error_message      TEXT,                                       -- Failure detail.
@@ -318,6 +476,12 @@ CREATE INDEX IF NOT EXISTS idx_script_generations_session_id
 CREATE INDEX IF NOT EXISTS idx_script_generations_transcript_id
     ON public.script_generations (transcript_id);
 
+-- Existing databases: the full generator output is already on the transcript raw result;
+-- keep only the stage marker inline.
+UPDATE public.script_generations
+SET raw_result_json = ((raw_result_json::jsonb) - 'utterances' - 'prompt')::text
+WHERE raw_result_json IS NOT NULL AND raw_result_json LIKE '%"utterances"%';
+
 -- List script generations by lifecycle state.
 CREATE INDEX IF NOT EXISTS idx_script_generations_status_created_at
     ON public.script_generations (x_status, created_at);
@@ -450,6 +614,80 @@ CREATE INDEX IF NOT EXISTS idx_tts_synthesis_items_seq_span
 CREATE UNIQUE INDEX IF NOT EXISTS uq_tts_synthesis_items_source_item
     ON public.tts_synthesis_items (synthesis_id, source_item_id);
 
+-- ---------------------------------------------------------------------------
+-- Search module
+-- Full-text documents for transcript utterances and revision items, maintained
+-- incrementally in the same transaction as transcript completion / revision saves.
+-- ---------------------------------------------------------------------------
+
+CREATE TABLE IF NOT EXISTS public.search_documents (
+    id              BIGSERIAL PRIMARY KEY,                         -- Internal auto-increment row id.
+    transcript_id   VARCHAR(32) NOT NULL,                          -- Transcript the document belongs to.
+    doc_type        VARCHAR(16) NOT NULL,                          -- utterance or revision_item.
+    seq             INTEGER NOT NULL,                              -- Utterance seq or revision item source_seq_start.
+    x_text          TEXT NOT NULL,                                 -- Indexed text.
+    updated_at      TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP -- Last index write timestamp.
+);
+
+-- One document per transcript position; also serves per-transcript deletes.
+CREATE UNIQUE INDEX IF NOT EXISTS uq_search_documents_transcript_doc_seq
+    ON public.search_documents (transcript_id, doc_type, seq);
+
+-- Ranked full-text search. The expression must match the query in SearchRepository.
+CREATE INDEX IF NOT EXISTS idx_search_documents_tsv
+    ON public.search_documents USING GIN (to_tsvector('simple', x_text));
+
+-- Existing databases: backfill the index once from utterances and revision items.
+INSERT INTO public.search_documents (transcript_id, doc_type, seq, x_text)
+SELECT u.transcript_id, 'utterance', u.seq, u.x_text
+FROM public.transcript_utterances AS u
+JOIN public.transcript_transcripts AS t ON t.transcript_id = u.transcript_id
+WHERE t.source_type <> 'asr_chunk'
+  AND NOT EXISTS (SELECT 1 FROM public.search_documents)
+ON CONFLICT (transcript_id, doc_type, seq) DO NOTHING;
+
+INSERT INTO public.search_documents (transcript_id, doc_type, seq, x_text)
+SELECT i.transcript_id,
+       'revision_item',
+       i.source_seq_start,
+       CASE
+           WHEN i.draft_text IS NOT NULL AND i.draft_text <> '' AND i.draft_text <> i.suggested_text
+               THEN i.suggested_text || E'\n' || i.draft_text
+           ELSE i.suggested_text
+       END
+FROM public.revision_items AS i
+WHERE NOT EXISTS (SELECT 1 FROM public.search_documents WHERE doc_type = 'revision_item')
+ON CONFLICT (transcript_id, doc_type, seq) DO NOTHING;
+
+-- Existing databases: backfill the session pipeline columns once.
+-- Same values as SessionPipelineTracker; `python -m lsl.backfill session-pipeline` recomputes them later.
+-- Drop the updated_at trigger first so the backfill keeps each session's updated_at;
+-- it is recreated with the other triggers below.
+DROP TRIGGER IF EXISTS trg_session_sessions_set_updated_at ON public.session_sessions;
+UPDATE public.session_sessions AS s
+SET transcript_status = t.x_status,
+    transcript_duration_ms = t.duration_ms,
+    revision_status = (
+        SELECT r.x_status FROM public.revision_revisions AS r WHERE r.session_id = s.session_id
+    ),
+    tts_status = y.x_status,
+    tts_progress = CASE WHEN y.item_count > 0 THEN y.completed_item_count * 100 / y.item_count END,
+    translation_status = l.x_status,
+    translation_progress = CASE WHEN l.item_count > 0 THEN l.completed_count * 100 / l.item_count END,
+    pipeline_updated_at = CURRENT_TIMESTAMP
+FROM public.session_sessions AS base
+LEFT JOIN public.transcript_transcripts AS t ON t.transcript_id = base.current_transcript_id
+LEFT JOIN public.tts_syntheses AS y ON y.session_id = base.session_id
+LEFT JOIN LATERAL (
+    SELECT tr.x_status, tr.item_count, tr.completed_count
+    FROM public.translation_translations AS tr
+    WHERE tr.session_id = base.session_id
+    ORDER BY tr.updated_at DESC, tr.translation_id DESC
+    LIMIT 1
+) AS l ON TRUE
+WHERE base.session_id = s.session_id
+  AND s.pipeline_updated_at IS NULL;
+
 -- ---------------------------------------------------------------------------
 -- updated_at triggers
 -- Recreate triggers idempotently so rerunning this file keeps definitions fresh.
@@ -494,9 +732,12 @@ FOR EACH ROW
 EXECUTE FUNCTION public.set_updated_at();
 
 -- Keep session update timestamps current.
+-- Pipeline refreshes only touch the pipeline columns and always move pipeline_updated_at;
+-- they are not user edits, so they leave updated_at alone.
 CREATE TRIGGER trg_session_sessions_set_updated_at
 BEFORE UPDATE ON public.session_sessions
 FOR EACH ROW
+WHEN (NEW.pipeline_updated_at IS NOT DISTINCT FROM OLD.pipeline_updated_at)
 EXECUTE FUNCTION public.set_updated_at();
 
 -- Keep revision header update timestamps current.
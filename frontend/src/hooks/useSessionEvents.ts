@@ -0,0 +1,62 @@
+import { useEffect, useRef, useState } from 'react'
+import { openEventStream } from '@/lib/api/events'
+import type { StreamEvent } from '@/types/api'
+
+interface UseSessionEventsParams {
+  sessionId?: string | null
+  transcriptId?: string | null
+  enabled?: boolean
+  // 合并短时间内的多条事件，避免 revision / TTS 逐条落库时频繁重新拉取。
+  debounceMs?: number
+  onChange: (events: StreamEvent[]) => void
+}
+
+export function useSessionEvents({
+  sessionId,
+  transcriptId,
+  enabled = true,
+  debounceMs = 300,
+  onChange,
+}: UseSessionEventsParams) {
+  const [connected, setConnected] = useState(false)
+  const onChangeRef = useRef(onChange)
+
+  useEffect(() => {
+    onChangeRef.current = onChange
+  }, [onChange])
+
+  useEffect(() => {
+    if (!enabled || (!sessionId && !transcriptId) || typeof EventSource === 'undefined') return
+
+    let pending: StreamEvent[] = []
+    let timer: ReturnType<typeof window.setTimeout> | null = null
+    const flush = () => {
+      timer = null
+      const events = pending
+      pending = []
+      onChangeRef.current(events)
+    }
+    const schedule = () => {
+      if (timer === null) timer = window.setTimeout(flush, debounceMs)
+    }
+
+    const close = openEventStream(
+      { sessionId, transcriptId },
+      {
+        onEvent: (event) => {
+          pending.push(event)
+          schedule()
+        },
+        onReset: schedule,
+        onConnectionChange: setConnected,
+      },
+    )
+
+    return () => {
+      if (timer !== null) window.clearTimeout(timer)
+      close()
+    }
+  }, [sessionId, transcriptId, enabled, debounceMs])
+
+  return { connected }
+}
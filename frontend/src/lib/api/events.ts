@@ -0,0 +1,41 @@
+import { buildApiUrl } from '@/lib/api/client'
+import type { StreamEvent } from '@/types/api'
+
+export interface EventStreamFilter {
+  sessionId?: string | null
+  transcriptId?: string | null
+}
+
+export interface EventStreamHandlers {
+  onEvent: (event: StreamEvent) => void
+  // 断线期间的事件已超出服务端缓冲区，需要整页重新拉取。
+  onReset?: () => void
+  onConnectionChange?: (connected: boolean) => void
+}
+
+export function openEventStream(filter: EventStreamFilter, handlers: EventStreamHandlers): () => void {
+  const query: Record<string, string> = {}
+  if (filter.sessionId) query.session_id = filter.sessionId
+  if (filter.transcriptId) query.transcript_id = filter.transcriptId
+
+  // 浏览器自动重连时会带上 Last-Event-ID，服务端据此补发断线期间的事件。
+  const source = new EventSource(buildApiUrl('/events', query), { withCredentials: true })
+  const handleMessage = (message: MessageEvent<string>) => {
+    try {
+      handlers.onEvent(JSON.parse(message.data) as StreamEvent)
+    } catch {
+      // Ignore malformed frames; the next event or fallback poll refreshes the page.
+    }
+  }
+
+  source.addEventListener('job', handleMessage)
+  source.addEventListener('entity', handleMessage)
+  source.addEventListener('reset', () => handlers.onReset?.())
+  source.onopen = () => handlers.onConnectionChange?.(true)
+  source.onerror = () => handlers.onConnectionChange?.(false)
+
+  return () => {
+    source.close()
+    handlers.onConnectionChange?.(false)
+  }
+}
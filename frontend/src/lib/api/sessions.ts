@@ -1,5 +1,12 @@
 import { requestJson } from '@/lib/api/client'
-import type { CreateSessionRequest, SessionItem, SessionListResponse, UpdateSessionRequest } from '@/types/api'
+import type {
+  CreateSessionRequest,
+  SessionItem,
+  SessionListResponse,
+  SessionOverviewInclude,
+  SessionOverviewResponse,
+  UpdateSessionRequest,
+} from '@/types/api'
 
 interface ApiResponse<T> {
   code: number
@@ -12,6 +19,7 @@ interface ListSessionsParams {
   offset?: number
   query?: string
   status?: number
+  cursor?: string
 }
 
 export async function createSession(payload: CreateSessionRequest): Promise<SessionItem> {
@@ -41,6 +49,19 @@ export async function getSession(sessionId: string): Promise<SessionItem> {
   return response.data
 }
 
+// 详情页轮询用：服务端返回弱 ETag，浏览器缓存自动带 If-None-Match 校验，未变化时为 304，不重新传输响应体。
+export async function getSessionOverview(
+  sessionId: string,
+  include: SessionOverviewInclude[] = [],
+): Promise<SessionOverviewResponse> {
+  const response = await requestJson<ApiResponse<SessionOverviewResponse>>(`/sessions/${sessionId}/overview`, {
+    method: 'GET',
+    query: include.length > 0 ? { include: include.join(',') } : undefined,
+  })
+
+  return response.data
+}
+
 export async function updateSession(sessionId: string, payload: UpdateSessionRequest): Promise<SessionItem> {
   const response = await requestJson<ApiResponse<SessionItem>>(`/sessions/${sessionId}`, {
     method: 'PATCH',
@@ -60,12 +81,19 @@ export async function updateSession(sessionId: string, payload: UpdateSessionReq
   return response.data
 }
 
-export async function listSessions({
+export async function listSessions(params: ListSessionsParams = {}): Promise<SessionItem[]> {
+  const page = await listSessionPage(params)
+  return page.items
+}
+
+// next_cursor 原样作为下一页的 cursor 传回；为空表示没有更多。
+export async function listSessionPage({
   limit = 20,
   offset = 0,
   query,
   status,
-}: ListSessionsParams = {}): Promise<SessionItem[]> {
+  cursor,
+}: ListSessionsParams = {}): Promise<SessionListResponse> {
   const safeLimit = Math.min(Math.max(1, limit), 100)
   const safeOffset = Math.max(0, offset)
 
@@ -82,10 +110,14 @@ export async function listSessions({
     queryParams.status = String(status)
   }
 
+  if (cursor) {
+    queryParams.cursor = cursor
+  }
+
   const response = await requestJson<ApiResponse<SessionListResponse>>('/sessions', {
     method: 'GET',
     query: queryParams,
   })
 
-  return response.data.items
+  return response.data
 }
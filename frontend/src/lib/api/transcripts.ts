@@ -1,5 +1,5 @@
 import { requestJson } from '@/lib/api/client'
-import type { TranscriptData } from '@/types/api'
+import type { TranscriptData, TranscriptUtteranceCompactPage, TranscriptUtteranceResponse } from '@/types/api'
 
 interface ApiResponse<T> {
   code: number
@@ -7,12 +7,58 @@ interface ApiResponse<T> {
   data: T
 }
 
-export async function getTranscript(transcriptId: string, includeRaw = false): Promise<TranscriptData> {
+const UTTERANCE_PAGE_LIMIT = 1000
+
+export async function getTranscript(
+  transcriptId: string,
+  includeRaw = false,
+  includeUtterances = true,
+): Promise<TranscriptData> {
   const response = await requestJson<ApiResponse<TranscriptData>>(`/transcripts/${transcriptId}`, {
     method: 'GET',
     query: {
       include_raw: String(includeRaw),
+      include_utterances: String(includeUtterances),
     },
   })
   return response.data
 }
+
+export async function listTranscriptUtterancePage(
+  transcriptId: string,
+  afterSeq?: number | null,
+  limit = UTTERANCE_PAGE_LIMIT,
+): Promise<TranscriptUtteranceCompactPage> {
+  const query: Record<string, string> = { format: 'compact', limit: String(limit) }
+  if (afterSeq !== undefined && afterSeq !== null) {
+    query.after_seq = String(afterSeq)
+  }
+  const response = await requestJson<ApiResponse<TranscriptUtteranceCompactPage>>(
+    `/transcripts/${transcriptId}/utterances`,
+    { method: 'GET', query },
+  )
+  return response.data
+}
+
+// 按 seq 游标逐页读取 compact 格式，长 transcript 不再一次性返回整段 JSON。
+export async function listAllTranscriptUtterances(transcriptId: string): Promise<TranscriptUtteranceResponse[]> {
+  const utterances: TranscriptUtteranceResponse[] = []
+  let afterSeq: number | null | undefined
+  for (;;) {
+    const page = await listTranscriptUtterancePage(transcriptId, afterSeq)
+    for (const [seq, startTime, endTime, speaker, text, additions] of page.rows) {
+      utterances.push({
+        seq,
+        start_time: startTime,
+        end_time: endTime,
+        speaker,
+        text,
+        additions: additions ?? {},
+      })
+    }
+    if (!page.has_more || page.next_after_seq === null || page.next_after_seq === undefined) {
+      return utterances
+    }
+    afterSeq = page.next_after_seq
+  }
+}
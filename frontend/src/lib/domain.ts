@@ -18,8 +18,10 @@ function normalizeStatus(statusName?: string | null): SessionStatus {
 }
 
 function inferSessionStatus(item: SessionItem): SessionStatus {
-  if (item.transcript?.status_name) {
-    return normalizeStatus(item.transcript.status_name);
+  // 列表接口只返回 pipeline，详情接口两者都有。
+  const transcriptStatusName = item.transcript?.status_name ?? item.pipeline?.transcript_status_name;
+  if (transcriptStatusName) {
+    return normalizeStatus(transcriptStatusName);
   }
   if (item.session.current_transcript_id) {
     return 'processing';
@@ -31,13 +33,18 @@ function normalizeSeconds(value: number): number {
   return value > 300 ? value / 1000 : value;
 }
 
+function pipelineDurationSec(item: SessionItem): number | undefined {
+  const durationMs = item.pipeline?.transcript_duration_ms;
+  return typeof durationMs === 'number' ? durationMs / 1000 : undefined;
+}
+
 export function mapSessionItem(item: SessionItem): Session {
   const entity = item.session;
   return {
     id: entity.session_id,
     title: entity.title,
     description: entity.description ?? item.asset?.filename ?? undefined,
-    duration: item.transcript?.duration_sec ?? undefined,
+    duration: item.transcript?.duration_sec ?? pipelineDurationSec(item) ?? undefined,
     status: inferSessionStatus(item),
     type: entity.f_type === 2 ? 'ai_script' : 'audio',
     targetLanguage: entity.target_language ?? undefined,
@@ -47,7 +54,7 @@ export function mapSessionItem(item: SessionItem): Session {
   };
 }
 
-export function mapTranscript(data: TranscriptData): TranscriptItem[] {
+export function mapTranscript(data: Pick<TranscriptData, 'utterances'>): TranscriptItem[] {
   return data.utterances.map((utterance) => ({
     id: String(utterance.seq),
     speaker: utterance.speaker || `user-${(utterance.seq % 2) + 1}`,
@@ -99,7 +106,10 @@ export function applyTtsSettings(session: Session, settings?: TtsSettingsRespons
   };
 }
 
-export function applyTtsSynthesis(session: Session, synthesis?: TtsSynthesisResponse | null): Session {
+export function applyTtsSynthesis(
+  session: Session,
+  synthesis?: Pick<TtsSynthesisResponse, 'full_asset_url' | 'full_duration_ms'> | null,
+): Session {
   if (!synthesis?.full_asset_url) return session;
   return {
     ...session,
@@ -21,13 +21,14 @@ import { getSession } from '@/lib/api/sessions';
 import { ApiRequestError } from '@/lib/api/client';
 import { getJob } from '@/lib/api/jobs';
 import { getScriptGenerationPreview } from '@/lib/api/scripts';
-import { getTranscript } from '@/lib/api/transcripts';
+import { getTranscript, listAllTranscriptUtterances } from '@/lib/api/transcripts';
 import { createRevision, getRevisionPreview, updateRevisionItem } from '@/lib/api/revisions';
 import { createTtsSynthesis, generateTtsItemAudio, getTtsSettings, getTtsSpeakers, getTtsSynthesis, updateTtsSettings } from '@/lib/api/tts';
 import { applyTtsSettings, applyTtsSynthesis, mapRevision, mapSessionItem, mapTranscript } from '@/lib/domain';
 import { getVoiceForSpeaker } from '@/lib/voice';
 import type { RevisionPlanSectionResponse, ScriptGenerationPlanSectionResponse, ScriptGenerationPreviewItemResponse, TtsSynthesisResponse } from '@/types/api';
 import { useTranslation } from '@/hooks/useTranslation';
+import { useSessionEvents } from '@/hooks/useSessionEvents';
 import { TranslationButton } from '@/components/translation/TranslationButton';
 import { useI18n } from '@/i18n';
 
@@ -88,6 +89,26 @@ export function Revise() {
   const dirtyTranslationVersionRef = useRef(0);
   const dirtyTranslationItemVersionsRef = useRef(new Map<string, number>());
   const [dirtyTranslationItemIds, setDirtyTranslationItemIds] = useState<Set<string>>(() => new Set());
+  const reloadRevisionRef = useRef<(() => void) | null>(null);
+  const sessionEventWaitersRef = useRef(new Set<() => void>());
+  const handleSessionEvents = useCallback(() => {
+    reloadRevisionRef.current?.();
+    const waiters = Array.from(sessionEventWaitersRef.current);
+    sessionEventWaitersRef.current.clear();
+    waiters.forEach((resolve) => resolve());
+  }, []);
+  const { connected: eventsConnected } = useSessionEvents({ sessionId: id, onChange: handleSessionEvents });
+  const eventsConnectedRef = useRef(eventsConnected);
+  eventsConnectedRef.current = eventsConnected;
+  const waitForSessionEvent = useCallback((fallbackMs: number) => new Promise<void>((resolve) => {
+    const done = () => {
+      window.clearTimeout(timer);
+      sessionEventWaitersRef.current.delete(done);
+      resolve();
+    };
+    const timer = window.setTimeout(done, fallbackMs);
+    sessionEventWaitersRef.current.add(done);
+  }), []);
   const scriptGenerationId = searchParams.get('generation_id');
   const scriptJobId = searchParams.get('job_id');
   const revisionTranslation = useTranslation({
@@ -133,7 +154,8 @@ export function Revise() {
     }
 
     let cancelled = false;
-    getTranscript(revisionTranscriptId)
+    Promise.all([getTranscript(revisionTranscriptId, false, false), listAllTranscriptUtterances(revisionTranscriptId)])
+      .then(([transcript, utterances]) => ({ ...transcript, utterances }))
       .then((data) => {
         if (!cancelled) {
           setRevisionTranscript(mapTranscript(data));
@@ -338,14 +360,22 @@ export function Revise() {
     async function loadAndSchedule() {
       const shouldKeepPolling = await loadRevision();
       if (!cancelled && shouldKeepPolling) {
-        refreshTimer = window.setTimeout(loadAndSchedule, 2000);
+        if (refreshTimer) window.clearTimeout(refreshTimer);
+        // SSE 连接正常时由事件触发刷新，只保留低频兜底轮询。
+        refreshTimer = window.setTimeout(loadAndSchedule, eventsConnectedRef.current ? 15000 : 2000);
       }
     }
 
+    reloadRevisionRef.current = () => {
+      if (refreshTimer) window.clearTimeout(refreshTimer);
+      refreshTimer = null;
+      void loadAndSchedule();
+    };
     void loadAndSchedule();
     void loadVoices();
     return () => {
       cancelled = true;
+      reloadRevisionRef.current = null;
       if (refreshTimer) window.clearTimeout(refreshTimer);
     };
   }, [id, dispatch, language, scriptGenerationId, scriptJobId, setSearchParams, t]);
@@ -514,9 +544,11 @@ export function Revise() {
         dispatch({ type: 'UPDATE_SESSION', payload: { ...session, revision: nextRevision, userPrompt } });
       }
 
-      // The revision job writes items incrementally, so polling GET /revisions behaves like a stream.
-      for (let attempt = 0; attempt < 120 && isRevisionGenerating(data.status_name); attempt += 1) {
-        await wait(1500);
+      // The revision job writes items incrementally; each SSE revision event triggers a GET /revisions refresh,
+      // with a slower timer as fallback when the event stream is unavailable.
+      const deadline = Date.now() + 180000;
+      while (Date.now() < deadline && isRevisionGenerating(data.status_name)) {
+        await waitForSessionEvent(eventsConnectedRef.current ? 10000 : 1500);
         const preview = await getRevisionPreview(id);
         data = { ...preview.revision, items: preview.items };
         setRevisionId(data.revision_id);
@@ -541,7 +573,7 @@ export function Revise() {
     } finally {
       setIsRevising(false);
     }
-  }, [id, userPrompt, session, dispatch, language, t]);
+  }, [id, userPrompt, session, dispatch, language, t, waitForSessionEvent]);
 
   // Ensure speaker mappings use valid speaker_ids after voices are loaded
   useEffect(() => {
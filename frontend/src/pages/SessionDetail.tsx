@@ -1,4 +1,4 @@
-import { useCallback, useEffect, useMemo, useState } from 'react';
+import { useCallback, useEffect, useMemo, useRef, useState } from 'react';
 import { useParams } from 'react-router-dom';
 import { Mic2, FileText, AudioWaveform, Loader2, RefreshCw } from 'lucide-react';
 import { AudioPlayer } from '@/components/AudioPlayer';
@@ -10,12 +10,11 @@ import { speakerColors } from '@/data/mockData';
 import { useApp } from '@/context/AppContext';
 import { NotFound } from './NotFound';
 import type { RevisionItem, TranscriptItem } from '@/types';
-import { getSession, updateSession } from '@/lib/api/sessions';
+import { getSessionOverview, updateSession } from '@/lib/api/sessions';
 import { createAsrRecognition } from '@/lib/api/asr';
-import { getTranscript } from '@/lib/api/transcripts';
-import { getTtsSynthesis } from '@/lib/api/tts';
 import { applyTtsSynthesis, mapSessionItem, mapTranscript } from '@/lib/domain';
 import { useTranslation } from '@/hooks/useTranslation';
+import { useSessionEvents } from '@/hooks/useSessionEvents';
 import { TranslationButton } from '@/components/translation/TranslationButton';
 import { TranslationLine } from '@/components/translation/TranslationLine';
 import { useI18n } from '@/i18n';
@@ -33,6 +32,15 @@ export function SessionDetail() {
   const [retryError, setRetryError] = useState<string | null>(null);
   const [reloadToken, setReloadToken] = useState(0);
   const { t, language } = useI18n();
+  const handleSessionEvents = useCallback(() => setReloadToken((value) => value + 1), []);
+  const { connected: eventsConnected } = useSessionEvents({
+    sessionId: id,
+    transcriptId: currentTranscriptId,
+    onChange: handleSessionEvents,
+  });
+  const eventsConnectedRef = useRef(eventsConnected);
+  eventsConnectedRef.current = eventsConnected;
+  const overviewVersionRef = useRef<string | null>(null);
 
   const session = useMemo(() => loadedSession || (id ? getSessionById(id) : undefined), [id, getSessionById, loadedSession]);
   const transcriptTranslation = useTranslation({
@@ -56,29 +64,20 @@ export function SessionDetail() {
     async function loadSession(): Promise<boolean> {
       setNotFound(false);
       try {
-        const item = await getSession(sessionId);
-        let nextSession = mapSessionItem(item);
-        if (!cancelled) {
-          setCurrentTranscriptId(item.session.current_transcript_id ?? null);
+        // 一次请求拿到 session / 转写 / TTS 摘要；未变化时浏览器按 ETag 得到 304，版本号相同则不再更新状态。
+        const overview = await getSessionOverview(sessionId, ['utterances']);
+        let nextSession = mapSessionItem(overview.session);
+        if (overview.version === overviewVersionRef.current) {
+          return nextSession.status === 'pending' || nextSession.status === 'processing';
         }
-
-        if (item.session.current_transcript_id) {
-          try {
-            const transcript = await getTranscript(item.session.current_transcript_id);
-            nextSession = { ...nextSession, transcript: mapTranscript(transcript) };
-          } catch {
-            // Transcript may not be ready while the source job is still processing.
-          }
-        }
-
-        try {
-          const synthesis = await getTtsSynthesis(sessionId);
-          nextSession = applyTtsSynthesis(nextSession, synthesis);
-        } catch {
-          // TTS output is optional until step 3.
+        if (overview.utterances) {
+          nextSession = { ...nextSession, transcript: mapTranscript({ utterances: overview.utterances }) };
         }
+        nextSession = applyTtsSynthesis(nextSession, overview.tts);
 
         if (!cancelled) {
+          overviewVersionRef.current = overview.version;
+          setCurrentTranscriptId(overview.session.session.current_transcript_id ?? null);
           setLoadedSession(nextSession);
           dispatch({ type: 'UPDATE_SESSION', payload: nextSession });
         }
@@ -92,7 +91,8 @@ export function SessionDetail() {
     async function loadAndSchedule() {
       const shouldKeepPolling = await loadSession();
       if (!cancelled && shouldKeepPolling) {
-        refreshTimer = window.setTimeout(loadAndSchedule, 3000);
+        // SSE 连接正常时由事件触发刷新，只保留低频兜底轮询。
+        refreshTimer = window.setTimeout(loadAndSchedule, eventsConnectedRef.current ? 30000 : 3000);
       }
     }
 
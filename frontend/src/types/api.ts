@@ -114,14 +114,94 @@ export interface SessionEntity {
   updated_at: string
 }
 
+export interface SessionPipeline {
+  transcript_status?: number | null
+  transcript_status_name?: string | null
+  transcript_duration_ms?: number | null
+  revision_status?: number | null
+  revision_status_name?: string | null
+  tts_status?: number | null
+  tts_status_name?: string | null
+  tts_progress?: number | null
+  translation_status?: number | null
+  translation_status_name?: string | null
+  translation_progress?: number | null
+  updated_at?: string | null
+}
+
 export interface SessionItem {
   session: SessionEntity
   asset?: AssetListItem | null
   transcript?: TranscriptItemResponse | null
+  pipeline?: SessionPipeline | null
 }
 
 export interface SessionListResponse {
   items: SessionItem[]
+  next_cursor?: string | null
+}
+
+export type SessionOverviewInclude = 'utterances' | 'revision_items'
+
+export interface SessionOverviewRevision {
+  revision_id: string
+  transcript_id: string
+  job_id?: string | null
+  status: number
+  status_name: string
+  item_count: number
+  error_code?: string | null
+  error_message?: string | null
+  updated_at: string
+  items?: RevisionItemResponse[] | null
+}
+
+export interface SessionOverviewTts {
+  synthesis_id: string
+  status: number
+  status_name: string
+  full_asset_url?: string | null
+  full_duration_ms?: number | null
+  item_count: number
+  completed_item_count: number
+  failed_item_count: number
+  error_code?: string | null
+  error_message?: string | null
+  updated_at: string
+}
+
+export interface SessionOverviewTranslation {
+  translation_id: string
+  source_type: string
+  source_entity_id: string
+  target_language: string
+  status: number
+  status_name: string
+  item_count: number
+  completed_count: number
+  stale_count: number
+  updated_at: string
+}
+
+export interface SessionOverviewJob {
+  job_id: string
+  job_type: string
+  entity_type?: string | null
+  entity_id?: string | null
+  status: number
+  status_name: string
+  progress: number
+  updated_at: string
+}
+
+export interface SessionOverviewResponse {
+  version: string
+  session: SessionItem
+  utterances?: TranscriptUtteranceResponse[] | null
+  revision?: SessionOverviewRevision | null
+  tts?: SessionOverviewTts | null
+  translations: SessionOverviewTranslation[]
+  jobs: SessionOverviewJob[]
 }
 
 export interface CreateSessionRequest {
@@ -285,6 +365,22 @@ export interface TranscriptUtteranceResponse {
   additions: Record<string, unknown>
 }
 
+export type TranscriptUtteranceCompactRow = [
+  number,
+  number,
+  number,
+  string | null,
+  string,
+  Record<string, unknown> | null,
+]
+
+export interface TranscriptUtteranceCompactPage {
+  columns: string[]
+  rows: TranscriptUtteranceCompactRow[]
+  next_after_seq?: number | null
+  has_more: boolean
+}
+
 export interface TranscriptData {
   transcript_id: string
   source_type: string
@@ -433,3 +529,13 @@ export interface TranslationResponse {
   updated_at: string
   items: TranslationItemResponse[]
 }
+
+export interface StreamEvent {
+  event_id: string
+  event_type: 'job' | 'entity'
+  session_id?: string | null
+  entity_type?: string | null
+  entity_id?: string | null
+  data: Record<string, unknown>
+  created_at: string
+}